@@ -1,6 +1,11 @@
 from manimlib import *
 import numpy as np
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.optimizers import compare, elliptic_bowl, path_mobjects
+
 class ADAM(Scene):
     def construct(self):
 
@@ -97,3 +102,48 @@ class ADAM(Scene):
 
         self.play(Uncreate(rect))
         self.wait(2)
+
+
+class OptimizerComparison(Scene):
+    def construct(self):
+
+        # Same stretched bowl as the zig-zag scenes: L = x^2 + 35y^2
+        loss = elliptic_bowl(1, 35)
+
+        # 200 start points on an ellipse around the minimum
+        angles = np.random.default_rng(0).uniform(0, TAU, 200)
+        starts = np.column_stack([5.5 * np.cos(angles), 1.4 * np.sin(angles)])
+
+        # Every optimizer runs on all start points in one batched pass
+        runs = compare(loss.grad, starts, {
+            "sgd": dict(lr=0.027),
+            "momentum": dict(lr=0.1),
+            "rmsprop": dict(lr=0.15),
+            "adam": dict(lr=0.3),
+        }, steps=40)
+
+        titles = {"sgd": "Gradient Descent", "momentum": "Momentum", "rmsprop": "RMSProp", "adam": "Adam"}
+        colors = {"sgd": RED, "momentum": GREEN, "rmsprop": BLUE, "adam": "#deff07"}
+        centers = [LEFT * 3.6 + UP * 1.9, RIGHT * 3.6 + UP * 1.9, LEFT * 3.6 + DOWN * 1.9, RIGHT * 3.6 + DOWN * 1.9]
+        scale = 0.55
+
+        panels = VGroup()
+        all_paths = VGroup()
+        for (name, paths), center in zip(runs.items(), centers):
+            contours = VGroup(*[
+                Ellipse(width=2 * r * scale, height=2 * r / np.sqrt(35) * scale,
+                        stroke_width=2, stroke_opacity=0.6).set_color(BLUE_E).move_to(center)
+                for r in [1.5, 3, 4.5, 6]
+            ])
+            title = Text(titles[name], font_size=32, weight=BOLD).set_color(colors[name])
+            title.next_to(contours, UP, buff=0.15)
+            lines = path_mobjects(paths, to_scene=lambda p, c=center: np.column_stack([p * scale, np.zeros(len(p))]) + c,
+                                  color=colors[name], stroke_width=1)
+            lines.set_stroke(opacity=0.5)
+            panels.add(VGroup(contours, title))
+            all_paths.add(lines)
+
+        self.play(LaggedStartMap(FadeIn, panels, lag_ratio=0.2), run_time=1.5)
+        self.play(*[ShowCreation(lines, rate_func=linear) for lines in all_paths], run_time=5)
+        self.wait(2)
+
@@ -1,6 +1,11 @@
 from manimlib import *
 import numpy as np
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.curves import ACTIVATIONS, graph
+
 GRAY = GREY
 
 class WhyActivation(Scene):
@@ -351,26 +356,11 @@ class TanhScene(Scene):
         x_label = Tex("z", font_size=48, color=WHITE).next_to(axes.x_axis.get_end(), RIGHT, buff=0.2)
         y_label = Tex("tanh(z)", font_size=48, color=WHITE).next_to(axes.y_axis.get_end(), UP, buff=0.2)
 
-        # Tanh function
-        x_vals = np.linspace(-3, 3, 1000)
-        tanh_points = []
-        for x in x_vals:
-            tanh_val = np.tanh(x)  # Tanh function
-            tanh_points.append(axes.c2p(x, tanh_val))
-
-        tanh_graph = VMobject()
-        tanh_graph.set_points_as_corners(tanh_points)
-        tanh_graph.set_stroke(PURPLE, width=6)
-
-        # Tanh derivative function
-        tanh_derivative_points = []
-        for x in x_vals:
-            derivative_val = 1 - np.tanh(x)**2  # Tanh derivative: sech²(x) = 1 - tanh²(x)
-            tanh_derivative_points.append(axes.c2p(x, derivative_val))
+        # Tanh function (adaptively sampled)
+        tanh_graph = graph(axes, ACTIVATIONS["tanh"], (-3, 3), color=PURPLE, stroke_width=6)
 
-        tanh_derivative_graph = VMobject()
-        tanh_derivative_graph.set_points_as_corners(tanh_derivative_points)
-        tanh_derivative_graph.set_stroke(YELLOW, width=6)
+        # Tanh derivative function: sech²(x) = 1 - tanh²(x)
+        tanh_derivative_graph = graph(axes, ACTIVATIONS["tanh_derivative"], (-3, 3), color=YELLOW, stroke_width=6)
 
         # Tanh title and formula positioned in top left
         tanh_title = Text("Tanh Function", font_size=40, color=PURPLE)
@@ -470,26 +460,10 @@ class SigmoidScene(Scene):
         y_label = Tex("\\sigma(z)", font_size=48, color=WHITE).next_to(axes.y_axis.get_end(), UP, buff=0.2)
 
         # Sigmoid function - changed scaling to 3.5 so maximum (1) appears at y=3.5
-        x_vals = np.linspace(-5, 5, 1000)
-        sigmoid_points = []
-        for x in x_vals:
-            sigmoid_val = 1 / (1 + np.exp(-x))  # Sigmoid function
-            sigmoid_points.append(axes.c2p(x, sigmoid_val * 3.5))  # Scale by 3.5
-
-        sigmoid_graph = VMobject()
-        sigmoid_graph.set_points_as_corners(sigmoid_points)
-        sigmoid_graph.set_stroke(GREEN, width=6)
-
-        # Sigmoid derivative function
-        sigmoid_derivative_points = []
-        for x in x_vals:
-            sigmoid_val = 1 / (1 + np.exp(-x))
-            derivative_val = sigmoid_val * (1 - sigmoid_val)  # Sigmoid derivative
-            sigmoid_derivative_points.append(axes.c2p(x, derivative_val * 3.5))  # Scale by 3.5
-
-        sigmoid_derivative_graph = VMobject()
-        sigmoid_derivative_graph.set_points_as_corners(sigmoid_derivative_points)
-        sigmoid_derivative_graph.set_stroke(ORANGE, width=6)
+        sigmoid_graph = graph(axes, lambda x: 3.5 * ACTIVATIONS["sigmoid"](x), (-5, 5), color=GREEN, stroke_width=6)
+
+        # Sigmoid derivative function (scaled by 3.5 as well)
+        sigmoid_derivative_graph = graph(axes, lambda x: 3.5 * ACTIVATIONS["sigmoid_derivative"](x), (-5, 5), color=ORANGE, stroke_width=6)
 
         # Custom tick marks and labels
         # Tick at y = 3.5 (sigmoid maximum, labeled "1")
@@ -557,26 +531,11 @@ class ReLUScene(Scene):
         x_label = Tex("z", font_size=48, color=WHITE).next_to(axes.x_axis.get_end(), RIGHT, buff=0.2)
         y_label = Tex("ReLU(z)", font_size=48, color=WHITE).next_to(axes.y_axis.get_end(), UP, buff=0.2)
 
-        # ReLU function
-        x_vals = np.linspace(-3, 5, 1000)
-        relu_points = []
-        for x in x_vals:
-            relu_val = max(0, x)  # ReLU function
-            relu_points.append(axes.c2p(x, relu_val))
-
-        relu_graph = VMobject()
-        relu_graph.set_points_as_corners(relu_points)
-        relu_graph.set_stroke(GREEN, width=6)
+        # ReLU function (two straight pieces, so only a handful of samples)
+        relu_graph = graph(axes, ACTIVATIONS["relu"], (-3, 5), color=GREEN, stroke_width=6)
 
-        # ReLU derivative function (step function)
-        relu_derivative_points = []
-        for x in x_vals:
-            derivative_val = 1 if x > 0 else 0  # ReLU derivative
-            relu_derivative_points.append(axes.c2p(x, derivative_val * 0.8))  # Scale for visibility
-
-        relu_derivative_graph = VMobject()
-        relu_derivative_graph.set_points_as_corners(relu_derivative_points)
-        relu_derivative_graph.set_stroke(ORANGE, width=6)
+        # ReLU derivative function (step function, scaled for visibility)
+        relu_derivative_graph = graph(axes, lambda x: 0.8 * ACTIVATIONS["relu_derivative"](x), (-3, 5), color=ORANGE, stroke_width=6)
 
         # ReLU title and formula positioned in top left
         relu_title = Text("ReLU Function", font_size=40, color=GREEN)
@@ -595,24 +554,10 @@ class ReLUScene(Scene):
         alpha = 0.1  # Leaky ReLU parameter
         
         # Leaky ReLU function
-        leaky_relu_points = []
-        for x in x_vals:
-            leaky_relu_val = max(alpha * x, x)  # Leaky ReLU function
-            leaky_relu_points.append(axes.c2p(x, leaky_relu_val))
-
-        leaky_relu_graph = VMobject()
-        leaky_relu_graph.set_points_as_corners(leaky_relu_points)
-        leaky_relu_graph.set_stroke(BLUE, width=6)
+        leaky_relu_graph = graph(axes, lambda x: ACTIVATIONS["leaky_relu"](x, alpha), (-3, 5), color=BLUE, stroke_width=6)
 
-        # Leaky ReLU derivative function
-        leaky_relu_derivative_points = []
-        for x in x_vals:
-            derivative_val = 1 if x > 0 else alpha  # Leaky ReLU derivative
-            leaky_relu_derivative_points.append(axes.c2p(x, derivative_val * 0.8))  # Scale for visibility
-
-        leaky_relu_derivative_graph = VMobject()
-        leaky_relu_derivative_graph.set_points_as_corners(leaky_relu_derivative_points)
-        leaky_relu_derivative_graph.set_stroke(RED, width=6).shift(DOWN*0.066)
+        # Leaky ReLU derivative function (scaled for visibility)
+        leaky_relu_derivative_graph = graph(axes, lambda x: 0.8 * ACTIVATIONS["leaky_relu_derivative"](x, alpha), (-3, 5), color=RED, stroke_width=6).shift(DOWN*0.066)
 
         # Leaky ReLU title and formulas
         leaky_relu_title = Text("Leaky ReLU Function", font_size=40, color=BLUE)
@@ -680,28 +625,11 @@ class SwishScene(Scene):
         x_label = Tex("z", font_size=48, color=WHITE).next_to(axes.x_axis.get_end(), RIGHT, buff=0.2)
         y_label = Tex("Swish(z)", font_size=38, color=WHITE).next_to(axes.y_axis.get_end(), UP, buff=0.2)
 
-        # Swish function
-        x_vals = np.linspace(-3, 3, 1000)
-        swish_points = []
-        for x in x_vals:
-            sigmoid_val = 1 / (1 + np.exp(-x))
-            swish_val = x * sigmoid_val  # Swish function: x * sigmoid(x)
-            swish_points.append(axes.c2p(x, swish_val))
-
-        swish_graph = VMobject()
-        swish_graph.set_points_as_corners(swish_points)
-        swish_graph.set_stroke(MAROON_B, width=6)
+        # Swish function: x * sigmoid(x)
+        swish_graph = graph(axes, ACTIVATIONS["swish"], (-3, 3), color=MAROON_B, stroke_width=6)
 
         # Swish derivative function
-        swish_derivative_points = []
-        for x in x_vals:
-            sigmoid_val = 1 / (1 + np.exp(-x))
-            derivative_val = sigmoid_val * (1 + x * (1 - sigmoid_val))  # Swish derivative
-            swish_derivative_points.append(axes.c2p(x, derivative_val))
-
-        swish_derivative_graph = VMobject()
-        swish_derivative_graph.set_points_as_corners(swish_derivative_points)
-        swish_derivative_graph.set_stroke(YELLOW_B, width=6)
+        swish_derivative_graph = graph(axes, ACTIVATIONS["swish_derivative"], (-3, 3), color=YELLOW_B, stroke_width=6)
 
         # Swish title and formula positioned in top left
         swish_title = Text("Swish Function", font_size=40, color=MAROON_B)
@@ -1,6 +1,11 @@
 from manimlib import *
 import numpy as np
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common import particles
+
 from manimlib import *
 
 
@@ -116,31 +121,14 @@ class BackPropGeneral(Scene):
 
         # Function to create glow effect around a dot
         def create_glow(center_point, radius=0.15, color=YELLOW, intensity=0.3):
-            glow_group = VGroup()
-            for i in range(20):
-                glow_radius = radius * (1 + i * 0.1)
-                opacity = intensity * (1 - i/20)
-                glow_circle = Circle(
-                    radius=glow_radius, 
-                    stroke_opacity=0, 
-                    fill_color=color,
-                    fill_opacity=opacity
-                ).move_to(center_point)
-                glow_group.add(glow_circle)
-            return glow_group
+            # One GlowDot instead of 20 stacked translucent circles
+            return particles.glow(center_point, radius=radius, color=color, intensity=intensity)
 
         # Enhanced pulse creation function
         def create_pulse(start_point, color="#ff0000"):
-            # Create the main pulse dot
-            pulse = Dot(radius=0.12, color=color, fill_opacity=1)
-            pulse.move_to(start_point)
-
-            # Create the enhanced glow effect
-            glow = create_glow(start_point, radius=0.1, color=color, intensity=0.4)
-
-            # Combine pulse and glow into a group
-            pulse_group = VGroup(glow, pulse)
-            return pulse_group
+            # Pulse dot over a single shader glow, grouped so it moves and fades as one
+            return particles.glow_pulse(start_point, color=color, core_radius=0.12,
+                                        glow_radius=0.1, intensity=0.4)
 
         # SINGLE ITERATION WITH ONE PULSE PER WEIGHT CONNECTION
 
@@ -1671,18 +1659,8 @@ class BackPropSimple(Scene):
         
         # Function to create glow effect around a dot
         def create_glow(center_point, radius=0.15, color=YELLOW, intensity=0.3):
-            glow_group = VGroup()
-            for i in range(20):
-                glow_radius = radius * (1 + i * 0.1)
-                opacity = intensity * (1 - i/20)
-                glow_circle = Circle(
-                    radius=glow_radius, 
-                    stroke_opacity=0, 
-                    fill_color=color,
-                    fill_opacity=opacity
-                ).move_to(center_point)
-                glow_group.add(glow_circle)
-            return glow_group
+            # One GlowDot instead of 20 stacked translucent circles
+            return particles.glow(center_point, radius=radius, color=color, intensity=intensity)
         
         # STEP 1: Create all elements except output arrow, output label, and f(z) labels
         self.play(
@@ -1713,11 +1691,11 @@ class BackPropSimple(Scene):
         # Create pulse dots with glow
         pulse1_dot = Dot(radius=0.1, color=YELLOW).move_to(input_node.get_center())
         pulse1_glow = create_glow(input_node.get_center(), radius=0.12, color="#ff0000")
-        pulse1 = VGroup(pulse1_glow, pulse1_dot)
+        pulse1 = Group(pulse1_glow, pulse1_dot)
         
         pulse2_dot = Dot(radius=0.1, color=YELLOW).move_to(bias_arrow_hidden.get_start())
         pulse2_glow = create_glow(bias_arrow_hidden.get_start(), radius=0.12, color="#ff0000")
-        pulse2 = VGroup(pulse2_glow, pulse2_dot)
+        pulse2 = Group(pulse2_glow, pulse2_dot)
         
         # Animate pulses growing from center
         self.play(
@@ -1757,11 +1735,11 @@ class BackPropSimple(Scene):
         # Create new pulse dots with glow
         pulse3_dot = Dot(radius=0.1, color=YELLOW).move_to(hidden_neuron.get_center())
         pulse3_glow = create_glow(hidden_neuron.get_center(), radius=0.12, color="#ff0000")
-        pulse3 = VGroup(pulse3_glow, pulse3_dot)
+        pulse3 = Group(pulse3_glow, pulse3_dot)
         
         pulse4_dot = Dot(radius=0.1, color=YELLOW).move_to(bias_arrow_output.get_start())
         pulse4_glow = create_glow(bias_arrow_output.get_start(), radius=0.12, color="#ff0000")
-        pulse4 = VGroup(pulse4_glow, pulse4_dot)
+        pulse4 = Group(pulse4_glow, pulse4_dot)
         
         # Animate pulses growing from center
         self.play(
@@ -2061,7 +2039,7 @@ class BackPropSimple(Scene):
         # Create purple pulse starting from y_hat
         purple_pulse_dot = Dot(radius=0.1, color=PURPLE).move_to(y_hat_label.get_center())
         purple_pulse_glow = create_glow(y_hat_label.get_center(), radius=0.12, color=PURPLE)
-        purple_pulse = VGroup(purple_pulse_glow, purple_pulse_dot)
+        purple_pulse = Group(purple_pulse_glow, purple_pulse_dot)
         
         # Animate pulse growing from y_hat
         self.play(GrowFromCenter(purple_pulse), run_time=0.4)
@@ -2237,7 +2215,7 @@ class BackPropSimple(Scene):
         # Create purple pulse starting from y_hat
         purple_pulse_dot = Dot(radius=0.1, color=PURPLE).move_to(hidden_neuron.get_center())
         purple_pulse_glow = create_glow(hidden_neuron.get_center(), radius=0.12, color=PURPLE)
-        purple_pulse = VGroup(purple_pulse_glow, purple_pulse_dot)
+        purple_pulse = Group(purple_pulse_glow, purple_pulse_dot)
         
         # Animate pulse growing from y_hat
         self.play(GrowFromCenter(purple_pulse), run_time=0.4)
@@ -2284,11 +2262,11 @@ class BackPropSimple(Scene):
         # Create pulse dots with glow
         pulse1_dot = Dot(radius=0.1, color=YELLOW).move_to(input_node.get_center())
         pulse1_glow = create_glow(input_node.get_center(), radius=0.12, color="#ff0000")
-        pulse1 = VGroup(pulse1_glow, pulse1_dot)
+        pulse1 = Group(pulse1_glow, pulse1_dot)
         
         pulse2_dot = Dot(radius=0.1, color=YELLOW).move_to(bias_arrow_hidden.get_start())
         pulse2_glow = create_glow(bias_arrow_hidden.get_start(), radius=0.12, color="#ff0000")
-        pulse2 = VGroup(pulse2_glow, pulse2_dot)
+        pulse2 = Group(pulse2_glow, pulse2_dot)
         
         # Animate pulses growing from center
         self.play(
@@ -2317,11 +2295,11 @@ class BackPropSimple(Scene):
         # Create new pulse dots with glow
         pulse3_dot = Dot(radius=0.1, color=YELLOW).move_to(hidden_neuron.get_center())
         pulse3_glow = create_glow(hidden_neuron.get_center(), radius=0.12, color="#ff0000")
-        pulse3 = VGroup(pulse3_glow, pulse3_dot)
+        pulse3 = Group(pulse3_glow, pulse3_dot)
         
         pulse4_dot = Dot(radius=0.1, color=YELLOW).move_to(bias_arrow_output.get_start())
         pulse4_glow = create_glow(bias_arrow_output.get_start(), radius=0.12, color="#ff0000")
-        pulse4 = VGroup(pulse4_glow, pulse4_dot)
+        pulse4 = Group(pulse4_glow, pulse4_dot)
         
         # Animate pulses growing from center
         self.play(
@@ -2357,7 +2335,7 @@ class BackPropSimple(Scene):
         # Create purple pulse starting from y_hat
         purple_pulse_dot = Dot(radius=0.1, color=PURPLE).move_to(y_hat_label.get_center())
         purple_pulse_glow = create_glow(y_hat_label.get_center(), radius=0.12, color=PURPLE)
-        purple_pulse = VGroup(purple_pulse_glow, purple_pulse_dot)
+        purple_pulse = Group(purple_pulse_glow, purple_pulse_dot)
         
         # Animate pulse growing from y_hat
         self.play(GrowFromCenter(purple_pulse), run_time=0.4)
@@ -2402,7 +2380,7 @@ class BackPropSimple(Scene):
         # Create purple pulse starting from y_hat
         purple_pulse_dot = Dot(radius=0.1, color=PURPLE).move_to(hidden_neuron.get_center())
         purple_pulse_glow = create_glow(hidden_neuron.get_center(), radius=0.12, color=PURPLE)
-        purple_pulse = VGroup(purple_pulse_glow, purple_pulse_dot)
+        purple_pulse = Group(purple_pulse_glow, purple_pulse_dot)
         
         # Animate pulse growing from y_hat
         self.play(GrowFromCenter(purple_pulse), run_time=0.4)
@@ -2446,11 +2424,11 @@ class BackPropSimple(Scene):
         # Create pulse dots with glow
         pulse1_dot = Dot(radius=0.1, color=YELLOW).move_to(input_node.get_center())
         pulse1_glow = create_glow(input_node.get_center(), radius=0.12, color="#ff0000")
-        pulse1 = VGroup(pulse1_glow, pulse1_dot)
+        pulse1 = Group(pulse1_glow, pulse1_dot)
         
         pulse2_dot = Dot(radius=0.1, color=YELLOW).move_to(bias_arrow_hidden.get_start())
         pulse2_glow = create_glow(bias_arrow_hidden.get_start(), radius=0.12, color="#ff0000")
-        pulse2 = VGroup(pulse2_glow, pulse2_dot)
+        pulse2 = Group(pulse2_glow, pulse2_dot)
         
         # Animate pulses growing from center
         self.play(
@@ -2479,11 +2457,11 @@ class BackPropSimple(Scene):
         # Create new pulse dots with glow
         pulse3_dot = Dot(radius=0.1, color=YELLOW).move_to(hidden_neuron.get_center())
         pulse3_glow = create_glow(hidden_neuron.get_center(), radius=0.12, color="#ff0000")
-        pulse3 = VGroup(pulse3_glow, pulse3_dot)
+        pulse3 = Group(pulse3_glow, pulse3_dot)
         
         pulse4_dot = Dot(radius=0.1, color=YELLOW).move_to(bias_arrow_output.get_start())
         pulse4_glow = create_glow(bias_arrow_output.get_start(), radius=0.12, color="#ff0000")
-        pulse4 = VGroup(pulse4_glow, pulse4_dot)
+        pulse4 = Group(pulse4_glow, pulse4_dot)
         
         # Animate pulses growing from center
         self.play(
@@ -2518,7 +2496,7 @@ class BackPropSimple(Scene):
         # Create purple pulse starting from y_hat
         purple_pulse_dot = Dot(radius=0.1, color=PURPLE).move_to(y_hat_label.get_center())
         purple_pulse_glow = create_glow(y_hat_label.get_center(), radius=0.12, color=PURPLE)
-        purple_pulse = VGroup(purple_pulse_glow, purple_pulse_dot)
+        purple_pulse = Group(purple_pulse_glow, purple_pulse_dot)
         
         # Animate pulse growing from y_hat
         self.play(GrowFromCenter(purple_pulse), run_time=0.4)
@@ -2563,7 +2541,7 @@ class BackPropSimple(Scene):
         # Create purple pulse starting from y_hat
         purple_pulse_dot = Dot(radius=0.1, color=PURPLE).move_to(hidden_neuron.get_center())
         purple_pulse_glow = create_glow(hidden_neuron.get_center(), radius=0.12, color=PURPLE)
-        purple_pulse = VGroup(purple_pulse_glow, purple_pulse_dot)
+        purple_pulse = Group(purple_pulse_glow, purple_pulse_dot)
         
         # Animate pulse growing from y_hat
         self.play(GrowFromCenter(purple_pulse), run_time=0.4)
@@ -2611,11 +2589,11 @@ class BackPropSimple(Scene):
         # Create pulse dots with glow
         pulse1_dot = Dot(radius=0.1, color=YELLOW).move_to(input_node.get_center())
         pulse1_glow = create_glow(input_node.get_center(), radius=0.12, color="#ff0000")
-        pulse1 = VGroup(pulse1_glow, pulse1_dot)
+        pulse1 = Group(pulse1_glow, pulse1_dot)
         
         pulse2_dot = Dot(radius=0.1, color=YELLOW).move_to(bias_arrow_hidden.get_start())
         pulse2_glow = create_glow(bias_arrow_hidden.get_start(), radius=0.12, color="#ff0000")
-        pulse2 = VGroup(pulse2_glow, pulse2_dot)
+        pulse2 = Group(pulse2_glow, pulse2_dot)
         
         # Animate pulses growing from center
         self.play(
@@ -2644,11 +2622,11 @@ class BackPropSimple(Scene):
         # Create new pulse dots with glow
         pulse3_dot = Dot(radius=0.1, color=YELLOW).move_to(hidden_neuron.get_center())
         pulse3_glow = create_glow(hidden_neuron.get_center(), radius=0.12, color="#ff0000")
-        pulse3 = VGroup(pulse3_glow, pulse3_dot)
+        pulse3 = Group(pulse3_glow, pulse3_dot)
         
         pulse4_dot = Dot(radius=0.1, color=YELLOW).move_to(bias_arrow_output.get_start())
         pulse4_glow = create_glow(bias_arrow_output.get_start(), radius=0.12, color="#ff0000")
-        pulse4 = VGroup(pulse4_glow, pulse4_dot)
+        pulse4 = Group(pulse4_glow, pulse4_dot)
         
         # Animate pulses growing from center
         self.play(
@@ -2683,7 +2661,7 @@ class BackPropSimple(Scene):
         # Create purple pulse starting from y_hat
         purple_pulse_dot = Dot(radius=0.1, color=PURPLE).move_to(y_hat_label.get_center())
         purple_pulse_glow = create_glow(y_hat_label.get_center(), radius=0.12, color=PURPLE)
-        purple_pulse = VGroup(purple_pulse_glow, purple_pulse_dot)
+        purple_pulse = Group(purple_pulse_glow, purple_pulse_dot)
         
         # Animate pulse growing from y_hat
         self.play(GrowFromCenter(purple_pulse), run_time=0.4)
@@ -2728,7 +2706,7 @@ class BackPropSimple(Scene):
         # Create purple pulse starting from y_hat
         purple_pulse_dot = Dot(radius=0.1, color=PURPLE).move_to(hidden_neuron.get_center())
         purple_pulse_glow = create_glow(hidden_neuron.get_center(), radius=0.12, color=PURPLE)
-        purple_pulse = VGroup(purple_pulse_glow, purple_pulse_dot)
+        purple_pulse = Group(purple_pulse_glow, purple_pulse_dot)
         
         # Animate pulse growing from y_hat
         self.play(GrowFromCenter(purple_pulse), run_time=0.4)
@@ -2,6 +2,9 @@ from manimlib import *
 import numpy as np
 from PIL import Image, ImageFilter, ImageOps
 import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common import image_ops
 
 
 class pool_example(Scene):
@@ -14,33 +17,9 @@ class pool_example(Scene):
         # Generate pooled images from cat.jpeg
         # ==========================================
         
-        img = Image.open("cat.jpeg")
-        img_gray = img.convert("L")
-        img_array = np.array(img_gray)
-        
-        pool_size = 4
-        h, w = img_array.shape
-        new_h, new_w = h // pool_size, w // pool_size
-        
-        # MAX POOLING
-        max_pooled = np.zeros((new_h, new_w), dtype=np.uint8)
-        for i in range(new_h):
-            for j in range(new_w):
-                block = img_array[i*pool_size:(i+1)*pool_size, j*pool_size:(j+1)*pool_size]
-                max_pooled[i, j] = np.max(block)
-        max_pooled_img = Image.fromarray(max_pooled)
-        max_pooled_img = max_pooled_img.resize(img_gray.size, Image.NEAREST)
-        max_pooled_img.save("cat_maxpool.png")
-        
-        # AVERAGE POOLING
-        avg_pooled = np.zeros((new_h, new_w), dtype=np.uint8)
-        for i in range(new_h):
-            for j in range(new_w):
-                block = img_array[i*pool_size:(i+1)*pool_size, j*pool_size:(j+1)*pool_size]
-                avg_pooled[i, j] = np.mean(block).astype(np.uint8)
-        avg_pooled_img = Image.fromarray(avg_pooled)
-        avg_pooled_img = avg_pooled_img.resize(img_gray.size, Image.NEAREST)
-        avg_pooled_img.save("cat_avgpool.png")
+        # Pooled with numpy windows and cached on disk by image hash + params
+        maxpool_path = image_ops.pooled_image("cat.jpeg", mode="max", size=4)
+        avgpool_path = image_ops.pooled_image("cat.jpeg", mode="avg", size=4)
         
         # ==========================================
         # Show original cat image
@@ -64,7 +43,7 @@ class pool_example(Scene):
         
         MAXPOOL_COLOR = ORANGE
         
-        maxpool_img = ImageMobject("cat_maxpool.png")
+        maxpool_img = ImageMobject(maxpool_path)
         maxpool_img.set_height(2.0)
         maxpool_img.move_to(RIGHT * 3.76 + UP * 1.5)
         maxpool_border = SurroundingRectangle(maxpool_img, color=MAXPOOL_COLOR, stroke_width=3, buff=0.05)
@@ -93,7 +72,7 @@ class pool_example(Scene):
         
         AVGPOOL_COLOR = PURPLE
         
-        avgpool_img = ImageMobject("cat_avgpool.png")
+        avgpool_img = ImageMobject(avgpool_path)
         avgpool_img.set_height(2.0)
         avgpool_img.move_to(RIGHT * 3.76 + DOWN * 1.5)
         avgpool_border = SurroundingRectangle(avgpool_img, color=AVGPOOL_COLOR, stroke_width=3, buff=0.05)
@@ -205,10 +184,11 @@ class Dilation(Scene):
         
         d2_kernel_full = VGroup()
         # 5x5 grid with 3x3 kernel cells and gaps
+        d2_mask = image_ops.dilated_kernel_mask(3, dilation=2)
         for i in range(5):
             for j in range(5):
                 cell = Square(side_length=kernel_cell)
-                if i % 2 == 0 and j % 2 == 0:
+                if d2_mask[i, j]:
                     cell.set_fill(MINT, opacity=0.9)
                     cell.set_stroke(WHITE, width=3)
                 else:
@@ -247,10 +227,11 @@ class Dilation(Scene):
         d3_kernel_full = VGroup()
         # 7x7 grid with 3x3 kernel cells and gaps
         cell_size_3 = kernel_cell * 0.85
+        d3_mask = image_ops.dilated_kernel_mask(3, dilation=3)
         for i in range(7):
             for j in range(7):
                 cell = Square(side_length=cell_size_3)
-                if i % 3 == 0 and j % 3 == 0:
+                if d3_mask[i, j]:
                     cell.set_fill(LAVENDER, opacity=0.9)
                     cell.set_stroke(WHITE, width=3)
                 else:
@@ -383,8 +364,9 @@ class Dilation(Scene):
         
         # Perform convolution
         filled_cells_d1 = VGroup()
-        for out_i in range(5):
-            for out_j in range(5):
+        out_d1 = image_ops.conv_output_size(7, 3, dilation=1)
+        for out_i in range(out_d1):
+            for out_j in range(out_d1):
                 new_center = input_cells[(out_i + 1, out_j + 1)].get_center()
                 
                 out_highlight = Square(side_length=cell_size)
@@ -446,7 +428,7 @@ class Dilation(Scene):
             for i in range(5):
                 for j in range(5):
                     cell = Square(side_length=cell_size)
-                    if i % 2 == 0 and j % 2 == 0:
+                    if d2_mask[i, j]:
                         cell.set_fill(MINT, opacity=0.88)
                         cell.set_stroke(WHITE, width=2.5)
                         kernel.add(cell)
@@ -513,8 +495,9 @@ class Dilation(Scene):
         
         # Perform dilated convolution
         filled_cells_d2 = VGroup()
-        for out_i in range(3):
-            for out_j in range(3):
+        out_d2 = image_ops.conv_output_size(7, 3, dilation=2)
+        for out_i in range(out_d2):
+            for out_j in range(out_d2):
                 new_kernel = create_dilated_kernel_on_input(out_i, out_j)
                 
                 out_highlight = Square(side_length=cell_size * 1.2)
@@ -1033,6 +1016,8 @@ class ReceptiveField(Scene):
 
         # Three layers
         lcell = 0.34
+        stack = [(3, 1, 1), (3, 1, 1)]  # (kernel, stride, dilation) per conv
+        stack_rf = image_ops.receptive_fields(stack)
         
         # Layer 1: 9x9
         l1_size = 9
@@ -1088,7 +1073,7 @@ class ReceptiveField(Scene):
         l2_dim.set_color(GREY_B)
         l2_dim.next_to(l2_label, DOWN, buff=0.15)
         
-        l2_rf = Text("RF = 3", font_size=35, weight=BOLD)
+        l2_rf = Text(f"RF = {stack_rf[1]}", font_size=35, weight=BOLD)
         l2_rf.set_color(GREY_A)
         l2_rf.next_to(l2_grid, DOWN, buff=0.42)
         
@@ -1117,7 +1102,7 @@ class ReceptiveField(Scene):
         l3_dim.set_color(GREY_B)
         l3_dim.next_to(l3_label, DOWN, buff=0.15)
         
-        l3_rf = Text("RF = 5", font_size=35, weight=BOLD)
+        l3_rf = Text(f"RF = {stack_rf[2]}", font_size=35, weight=BOLD)
         l3_rf.next_to(l3_grid, DOWN, buff=0.42)
         
         # Arrows
@@ -1229,22 +1214,18 @@ class ReceptiveField(Scene):
             # Calculate new centers
             new_l3_center = l3_cells[(out_row, out_col)].get_center()
             
-            # L2 RF center: output position maps to center of 3x3 in L2
-            # The output (out_row, out_col) corresponds to L2 cells starting at (out_row, out_col)
-            l2_rf_start_row = out_row
-            l2_rf_start_col = out_col
-            new_l2_rf_center = l2_cells[(l2_rf_start_row + 1, l2_rf_start_col + 1)].get_center()
+            # L2 RF: the 3x3 region of L2 seen through the last conv
+            l2_rf_start_row, l2_rf_start_col, l2_span = image_ops.receptive_region(stack[1:], out_row, out_col)
+            new_l2_rf_center = l2_cells[(l2_rf_start_row + l2_span // 2, l2_rf_start_col + l2_span // 2)].get_center()
             
-            # L1 RF center: each L2 cell has 3x3 RF, so 3x3 L2 region covers 5x5 L1 region
-            # The 5x5 starts at (out_row, out_col) in L1
-            l1_rf_start_row = out_row
-            l1_rf_start_col = out_col
-            new_l1_rf_center = l1_cells[(l1_rf_start_row + 2, l1_rf_start_col + 2)].get_center()
+            # L1 RF: each L2 cell has 3x3 RF, so 3x3 L2 region covers 5x5 L1 region
+            l1_rf_start_row, l1_rf_start_col, l1_span = image_ops.receptive_region(stack, out_row, out_col)
+            new_l1_rf_center = l1_cells[(l1_rf_start_row + l1_span // 2, l1_rf_start_col + l1_span // 2)].get_center()
             
             # Create new RF cell groups for L2
             new_l2_rf_cells = VGroup()
-            for di in range(3):
-                for dj in range(3):
+            for di in range(l2_span):
+                for dj in range(l2_span):
                     cell = Square(side_length=lcell)
                     cell.set_fill(CORAL, opacity=0.7)
                     cell.set_stroke(WHITE, width=1.2)
@@ -1253,8 +1234,8 @@ class ReceptiveField(Scene):
             
             # Create new RF cell groups for L1
             new_l1_rf_cells = VGroup()
-            for di in range(5):
-                for dj in range(5):
+            for di in range(l1_span):
+                for dj in range(l1_span):
                     cell = Square(side_length=lcell)
                     cell.set_fill(CORAL, opacity=0.5)
                     cell.set_stroke(WHITE, width=0.8)
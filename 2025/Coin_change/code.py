@@ -1,4 +1,8 @@
 from manimlib import *
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.dp_table import DPTable, coin_change_table, format_value
 
 
 class Coins(Scene):
@@ -81,43 +85,11 @@ class CoinChangeTable(Scene):
         coin_table.to_edge(LEFT, buff=1)
         coin_table.shift(UP * 0.5)  # Adjust vertical position
         
-        # Create table structure - position on right side
-        table = VGroup()
-        cells = {}
-        cell_texts = {}
-        
-        # Calculate table width and height
-        table_width = (amount + 1) * cell_width
-        table_height = cell_height
-        
-        # Create cells - for coin changing, we need only one row per amount
-        for j in range(amount + 1):
-            cell = Rectangle(width=cell_width, height=cell_height)
-            cell.set_stroke(WHITE, 1)
-            
-            # Position cells to the right of the coin details
-            x_pos = j * cell_width
-            y_pos = 0
-            cell.move_to(np.array([x_pos, y_pos, 0]))
-            
-            # Add cell to table
-            table.add(cell)
-            cells[j] = cell
-            
-            # Add initial text (will be updated for DP calculation)
-            if j == 0:
-                text = Text("0", font_size=34)
-            else:
-                text = Text("∞", font_size=34)  # Start with infinity for DP
-            text.move_to(cell.get_center())
-            table.add(text)
-            cell_texts[j] = text
-        
-        # Add column labels (amounts)
-        for j in range(amount + 1):
-            label = Text(f"${j}", font_size=23)
-            label.next_to(cells[j], UP, buff=0.25)
-            table.add(label)
+        # One row of amounts $0..$amount, starting at 0 / ∞
+        table = DPTable(1, amount + 1, cell_width=cell_width, cell_height=cell_height,
+                        col_labels=[f"${j}" for j in range(amount + 1)],
+                        values={(0, j): 0 if j == 0 else float("inf") for j in range(amount + 1)},
+                        font_size=34, label_size=23)
         
         # Position table properly
         table.scale(1.1)  # Scale up for better visibility
@@ -142,9 +114,9 @@ class CoinChangeTable(Scene):
 
 
         
-        # Initialize DP array
-        dp = [float('inf')] * (amount + 1)
-        dp[0] = 0  # Base case
+        # Row k of the table is the dp array after the first k coins
+        steps = coin_change_table(coins, amount)
+        dp = steps[-1]
         
         # Text for explaining states
         explanation = Text("Step 1: Compute how to make $0 (base case = 0 coins)", font_size=24)
@@ -182,22 +154,17 @@ class CoinChangeTable(Scene):
             # Update dp values
             for j in range(coin, amount + 1):
                 # Highlight current cell
-                current_cell = cells[j]
+                current_cell = table.cell(0, j)
                 self.play(current_cell.animate.set_fill(BLUE, opacity=0.39), run_time=1.2)
                 
                 # Highlight the cell we're comparing against
-                prev_cell = cells[j - coin]
+                prev_cell = table.cell(0, j - coin)
                 self.play(prev_cell.animate.set_fill(GREEN, opacity=0.3), run_time=1.2)
                 
-                # Update current cell value
-                dp[j] = min(dp[j], dp[j - coin] + 1)
-                new_text = Text(str(dp[j]) if dp[j] != float('inf') else "∞", font_size=34)
-                new_text.move_to(current_cell.get_center())
-                
-                # Add the new text directly to the scene
-                self.play(FadeOut(cell_texts[j]), run_time=0.5)
+                # Update current cell value: min(dp[j], dp[j - coin] + 1)
+                self.play(FadeOut(table.entry(0, j)), run_time=0.5)
+                _, new_text = table.set_entry(0, j, steps[coin_index + 1][j])
                 self.play(FadeIn(new_text), run_time=0.5)
-                cell_texts[j] = new_text
                 
                 # Reset cell colors
                 self.play(
@@ -207,14 +174,14 @@ class CoinChangeTable(Scene):
                 self.play(current_cell.animate.set_fill(opacity=0), run_time=0.2)
         
         # Highlight final answer
-        final_cell = cells[amount]
+        final_cell = table.cell(0, amount)
         self.play(
             final_cell.animate.set_fill(RED, opacity=0.5),
             run_time=1
         )
         
         # Show final result explanation
-        final_explanation = Text(f"Minimum coins needed for ${amount}: {dp[amount]}", font_size=28)
+        final_explanation = Text(f"Minimum coins needed for ${amount}: {format_value(dp[amount])}", font_size=28)
         final_explanation.to_edge(DOWN, buff=1)
         self.play(Transform(explanation, final_explanation))
         
@@ -249,11 +216,11 @@ class CoinChangeTable(Scene):
                     
                     # Highlight cells in backtracking
                     self.play(
-                        cells[old_remaining].animate.set_fill(YELLOW, opacity=0.5),
+                        table.cell(0, old_remaining).animate.set_fill(YELLOW, opacity=0.5),
                         run_time=1.2
                     )
                     self.play(
-                        cells[remaining].animate.set_fill(GREEN, opacity=0.5),
+                        table.cell(0, remaining).animate.set_fill(GREEN, opacity=0.5),
                         run_time=1.2
                     )
                     
@@ -266,7 +233,7 @@ class CoinChangeTable(Scene):
                     
                     # Reset previous highlighted cell
                     self.play(
-                        cells[old_remaining].animate.set_fill(opacity=0),
+                        table.cell(0, old_remaining).animate.set_fill(opacity=0),
                         run_time=0.2
                     )
                     
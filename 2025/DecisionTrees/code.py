@@ -1,5 +1,10 @@
 from manimlib import *
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.instancing import InstancedMobject, ShowInstancesCreation
+
 class RandoomForest(Scene):
 
     def construct(self):
@@ -40,8 +45,6 @@ class RandoomForest(Scene):
 
 
         # Create grid of trees
-        trees_group = VGroup()
-        
         # Grid parameters - increased for better screen filling
         rows = 5
         cols = 8
@@ -55,27 +58,20 @@ class RandoomForest(Scene):
         start_x = -total_width / 2
         start_y = total_height / 2 + 1  # Keep some space at the bottom
         
-        # Create trees in a grid
-        for row in range(rows):
-            for col in range(cols):
-                # Create tree with random colors for variety
-                colors = [WHITE, BLUE, GREEN, RED, YELLOW, PURPLE, ORANGE, PINK]
-                tree_color = np.random.choice(colors)
-                
-                tree, _ = self.create_single_tree(tree_color, 0)
-                
-                # Position and scale the tree
-                x_pos = start_x + col * spacing_x
-                y_pos = start_y - row * spacing_y
-                
-                tree.scale(tree_scale).move_to([x_pos, y_pos, 0]).shift(RIGHT*15)
-                
-                trees_group.add(tree)
+        # One tree template, instanced at every grid position with random colors
+        colors = [WHITE, BLUE, GREEN, RED, YELLOW, PURPLE, ORANGE, PINK]
+        tree_colors = [np.random.choice(colors) for _ in range(rows * cols)]
+        positions = [
+            [start_x + col * spacing_x + 15, start_y - row * spacing_y, 0]
+            for row in range(rows) for col in range(cols)
+        ]
+        tree, _ = self.create_single_tree(WHITE, 0)
+        trees_group = InstancedMobject(tree, positions, scales=tree_scale,
+                                       stroke_colors=tree_colors)
         
         # Animate all trees appearing
         self.play(
-            *[ShowCreation(tree) for tree in trees_group],
-            lag_ratio=0.08,  # Slightly faster animation
+            ShowInstancesCreation(trees_group, lag_ratio=0.08),  # Slightly faster animation
             run_time=1.2
         )
     
@@ -1,6 +1,11 @@
 from manimlib import *
 import numpy as np
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.point_cloud import DataCloud, mix_colors
+
 class EWMA(Scene):
     def construct(self):
         self.camera.frame.scale(1.16).shift(UP*0.39)
@@ -78,13 +83,9 @@ class EWMA(Scene):
         # --- PLOTTING OBJECTS ---
         
         # Raw Data (Scatter plot)
-        raw_dots = VGroup()
-        for day, temp in zip(days, raw_temps):
-            dot = Dot(radius=0.08) # Slightly smaller base radius for contrast
-            dot.move_to(axes.c2p(day, temp))
-            dot.set_color(BLUE_C)
-            dot.set_opacity(0.8) 
-            raw_dots.add(dot)
+        # One DotCloud; days / temperatures stay as arrays in raw_dots.x / .y
+        raw_dots = DataCloud(axes, days, raw_temps, color=BLUE_C, opacity=0.8,
+                             radius=0.08) # Slightly smaller base radius for contrast
 
         # --- ANIMATION SEQUENCE ---
         
@@ -118,23 +119,14 @@ class EWMA(Scene):
             # Define the width of the highlight beam
             window_width = 30 
 
-            for dot in dots:
-                # Convert the dot's screen position back to graph coordinates (x, y)
-                # we only care about index [0] which is the x-value (time)
-                dot_x_value = axes.p2c(dot.get_center())[0]
-
-                # Check if the dot falls inside the current scan window
-                # Logic: Scan moves right. If dot is between (current - window) and (current)
-                if current_x - window_width < dot_x_value < current_x:
-                    # HIGHLIGHT STATE
-                    dot.set_color(YELLOW)
-                    dot.set_opacity(1)
-                    dot.set_height(0.2) # Make it pop (bigger)
-                else:
-                    # ORIGINAL STATE
-                    dot.set_color(BLUE_C)
-                    dot.set_opacity(0.8)
-                    dot.set_height(0.16) # Return to normal size (2 * radius)
+            # Dots between (current - window) and (current) are highlighted
+            # (yellow, opaque, bigger); the rest keep the original state
+            inside = dots.window(current_x - window_width, current_x)
+            dots.set_style_arrays(
+                color=mix_colors(BLUE_C, YELLOW, inside),
+                opacity=np.where(inside, 1.0, 0.8),
+                radius=np.where(inside, 0.1, 0.08),
+            )
 
         # 3. Attach the updater to the group of dots
         # This tells Manim: "Every single frame, run scan_updater on raw_dots"
@@ -366,8 +358,7 @@ class EWMA(Scene):
         self.play(ShowCreation(vert_line)) 
         
         # Highlight current dot
-        current_dot = raw_dots[now_index]
-        self.play(current_dot.animate.set_color(YELLOW).set_height(0.2))
+        self.play(raw_dots.animate.set_style_arrays(color=YELLOW, radius=0.1, indices=[now_index]))
 
         # 2. Setup Updater on the OLD Beta variable
         
@@ -389,19 +380,17 @@ class EWMA(Scene):
         # 3. The Fading Updater
         def decay_visualizer(mob_dots):
             b = beta_tracker.get_value()
-            for i, dot in enumerate(mob_dots):
-                lag = now_index - i
-                if lag < 0:
-                    dot.set_opacity(0.1).set_color(GREY)
-                elif lag == 0:
-                    dot.set_opacity(1).set_color(YELLOW).set_height(0.2)
-                else:
-                    weight = b ** lag
-                    visual_opacity = np.clip(weight, 0.05, 1.0)
-                    dot.set_opacity(visual_opacity)
-                    new_color = interpolate_color(BLUE_E, YELLOW, visual_opacity)
-                    dot.set_color(new_color)
-                    dot.set_height(0.16) 
+            lag = now_index - np.arange(len(mob_dots))
+            # Past dots fade with their EWMA weight b ** lag, the current dot
+            # (lag 0, weight 1) is full yellow, future dots are greyed out
+            visual_opacity = np.clip(b ** np.maximum(lag, 0), 0.05, 1.0)
+            color = mix_colors(BLUE_E, YELLOW, visual_opacity)
+            color[lag < 0] = color_to_rgb(GREY)
+            mob_dots.set_style_arrays(
+                color=color,
+                opacity=np.where(lag < 0, 0.1, visual_opacity),
+                radius=np.where(lag == 0, 0.1, 0.08),
+            )
 
         raw_dots.add_updater(decay_visualizer)
         self.wait(3)
@@ -1,6 +1,11 @@
 from manimlib import *
 import numpy as np
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.optimizers import bowl_1d, elliptic_bowl, scene_paths, trajectories
+
 class Momentum(Scene):
     def construct(self):
 
@@ -81,27 +86,11 @@ class Momentum(Scene):
         
         # Starting position relative to center
         start_offset = np.array([5.5, 1.4, 0])
-        current_pos_local = start_offset
 
-        path_points = [graph_center + current_pos_local]
-        
         # REQUEST: "use Zig Zag lines not only once and then flat"
-        # Increased steps to 40 to show sustained bouncing
-        for _ in range(40):
-            x_loc, y_loc, _ = current_pos_local
-            
-            # Calculate Gradients based on our hypothetical loss function
-            grad_x = 2 * x_loc
-            grad_y = 70 * y_loc # Extremely steep in Y
-
-            # Update step
-            new_x_loc = x_loc - alpha * grad_x
-            new_y_loc = y_loc - alpha * grad_y
-            
-            current_pos_local = np.array([new_x_loc, new_y_loc, 0])
-            
-            # Add global coordinate to path list
-            path_points.append(graph_center + current_pos_local)
+        # 40 plain GD steps on the hypothetical loss (dL/dx = 2x, dL/dy = 70y)
+        path = trajectories(elliptic_bowl(1, 35).grad, start_offset[:2], "sgd", lr=alpha, steps=40)
+        path_points = scene_paths(path, offset=graph_center)[0]
 
 
         # Create the path VMobject
@@ -136,27 +125,11 @@ class Momentum(Scene):
         
         # Starting position relative to center
         start_offset = np.array([5.5, 1.4, 0])
-        current_pos_local = start_offset
 
-        path_points = [graph_center + current_pos_local]
-        
         # REQUEST: "use Zig Zag lines not only once and then flat"
-        # Increased steps to 40 to show sustained bouncing
-        for _ in range(40):
-            x_loc, y_loc, _ = current_pos_local
-            
-            # Calculate Gradients based on our hypothetical loss function
-            grad_x = 2 * x_loc
-            grad_y = 70 * y_loc # Extremely steep in Y
-
-            # Update step
-            new_x_loc = x_loc - alpha * grad_x
-            new_y_loc = y_loc - alpha * grad_y
-            
-            current_pos_local = np.array([new_x_loc, new_y_loc, 0])
-            
-            # Add global coordinate to path list
-            path_points.append(graph_center + current_pos_local)
+        # 40 plain GD steps on the hypothetical loss (dL/dx = 2x, dL/dy = 70y)
+        path = trajectories(elliptic_bowl(1, 35).grad, start_offset[:2], "sgd", lr=alpha, steps=40)
+        path_points = scene_paths(path, offset=graph_center)[0]
 
 
         # Create the path VMobject
@@ -405,6 +378,8 @@ class Momentum(Scene):
             # The +1 lifts it up, the sine adds wiggles, x^2 is the main bowl
             return 0.18 * (x)**2 + 0.4 * np.sin(2 * x) + 1.0
 
+        bowl = bowl_1d(bowl_function, lambda x: 0.36 * x + 0.8 * np.cos(2 * x))
+
         # Create Axes
         axes_1d = Axes(
             x_range=[-6, 6, 1],
@@ -447,17 +422,16 @@ class Momentum(Scene):
         self.play(FadeIn(ball, scale=0.5))
         self.wait(0.5)
 
-        # Iteration Loop for GD
+        # Iteration Loop for GD (positions and slopes precomputed)
         iterations = 10
+        gd_xs = trajectories(bowl.grad, [start_x_val], "sgd", lr=learning_rate, steps=iterations)[:, 0, 0]
+        gd_slopes = bowl.grad(gd_xs[:, None])[:, 0]
         
         for i in range(iterations):
             # 1. Get Current Position
+            x_val = gd_xs[i]
             current_point = axes_1d.c2p(x_val, bowl_function(x_val))
-            
-            # Calculate Gradient
-            dx_small = 0.0001
-            dy = bowl_function(x_val + dx_small) - bowl_function(x_val)
-            slope = dy / dx_small
+            slope = gd_slopes[i]
             
             # 2. Visual Slope Arrow
             if slope > 0:
@@ -482,7 +456,7 @@ class Momentum(Scene):
                  self.wait(0.1)
             
             # 3. Update Position
-            x_val = x_val - learning_rate * slope
+            x_val = gd_xs[i + 1]
             new_point = axes_1d.c2p(x_val, bowl_function(x_val))
             
             # Animate Movement
@@ -531,22 +505,9 @@ class Momentum(Scene):
         
         self.play(FadeIn(ball_mom))
 
-        # Pre-calculate path
-        path_points_mom = [start_point_mom]
-        
-        sim_x = x_val_mom
-        sim_v = 0
-        
-        for _ in range(50): 
-            dx_small = 0.0001
-            dy = bowl_function(sim_x + dx_small) - bowl_function(sim_x)
-            slope = dy / dx_small
-            
-            sim_v = beta * sim_v + (1 - beta) * slope
-            sim_x = sim_x - lr_mom * sim_v
-            
-            pt = axes_1d.c2p(sim_x, bowl_function(sim_x))
-            path_points_mom.append(pt)
+        # Pre-calculate path (v = beta v + (1 - beta) slope,  x -= lr v)
+        mom_xs = trajectories(bowl.grad, [x_val_mom], "momentum", lr=lr_mom, beta=beta, steps=50)[:, 0, 0]
+        path_points_mom = [axes_1d.c2p(x, bowl_function(x)) for x in mom_xs]
 
         # Create path
         mom_path_visual = VMobject()
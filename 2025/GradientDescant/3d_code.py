@@ -1,6 +1,12 @@
 from manim import *
 import numpy as np
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.optimizers import elliptic_bowl, trajectories
+from common.playback import trajectory_playback
+
 class GradientDescentOnMSE(ThreeDScene):
     def construct(self):
         # Set background color to white
@@ -62,7 +68,7 @@ class GradientDescentOnMSE(ThreeDScene):
         dot = Dot3D(point=axes.c2p(w, b, 0.5 * (w**2 + b**2)), color=YELLOW).scale(2)
         
         # Modified tangent line - extends beyond the dot
-        def create_tangent_line():
+        def create_tangent_line(w, b):
             current_pos = axes.c2p(w, b, 0.5 * (w**2 + b**2))
             # Calculate gradient direction
             grad_w = w  # derivative of 0.5*(w^2 + b^2) w.r.t. w
@@ -90,13 +96,13 @@ class GradientDescentOnMSE(ThreeDScene):
         
         self.add(dot)
 
-        # Animate descent
-        for _ in range(20):
-            # Gradient updates
-            w *= (1 - alpha)
-            b *= (1 - alpha)
-            new_pos = axes.c2p(w, b, 0.5 * (w**2 + b**2))
-            self.play(dot.animate.move_to(new_pos), run_time=0.7)
+        # Gradient updates on J = 0.5 * (w^2 + b^2): w, b <- (1 - alpha) * (w, b)
+        path = trajectories(elliptic_bowl(0.5, 0.5).grad, [w, b], "sgd", lr=alpha, steps=20)[:, 0]
+
+        # Animate descent as one playback, with the tangent line of each step
+        points = [axes.c2p(w, b, 0.5 * (w**2 + b**2)) for w, b in path]
+        tangents = [create_tangent_line(w, b) for w, b in path[:-1]]
+        self.play(trajectory_playback(dot, points, step_time=0.7, glyphs=tangents))
 
         self.wait(2)
 
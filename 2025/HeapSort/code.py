@@ -1,5 +1,10 @@
 from manimlib import *
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.array_row import ArrayRow
+
 
 PURE_RED = "#FF0000"
 PURE_GREEN = "#00FF00"
@@ -8,14 +13,7 @@ DARK_BLUE = BLUE_E
 TEAL_B, GREEN = GREEN, TEAL_B
 
 
-class Array(VGroup):
-    def __init__(self, array_size=5, **kwargs):
-        super().__init__(**kwargs)
-        self.array_size = array_size
-        self.square_contents = [None] * array_size
-        self.array_group = self.create_array()
-        self.add(self.array_group)
-
+class Array(ArrayRow, VGroup):
     def create_element(self, text):
         square = Square(side_length=1.72, fill_opacity=1, fill_color=RED, color=BLACK)
         text = Text(text, font_size=44, color=BLACK).scale(0.8).set_color(BLACK)
@@ -36,76 +34,34 @@ class Array(VGroup):
                 scene.play(FadeIn(new_square))
             else:
                 scene.play(Transform(self.square_contents[index], new_square))
-            self.square_contents[index] = new_square
+            self.place(index, new_square)
         else:
             scene.play(Indicate(self.array_group, color=RED))
             print(f"Index {index} is out of bounds")
 
     def append_element(self, scene, value):
-        for i, square in enumerate(self.array_group[0]):
-            if self.square_contents[i] is None:
-                new_square = Square(side_length=1.72, fill_opacity=1, fill_color=YELLOW, color=PURE_RED,
-                                    stroke_width=6)
-                number = Text(str(value), color=BLACK).set_z_index(1).set_color(BLACK).scale(1.6)
-                new_square1 = VGroup(new_square, number)
-                new_square1.move_to(square.get_center())
-                self.square_contents[i] = new_square1
-                scene.play(ShowCreation(self.square_contents[i]))
-                break
-        else:
-            pass
+        i = self.next_free_index()
+        if i is None:
+            return
+        new_square = Square(side_length=1.72, fill_opacity=1, fill_color=YELLOW, color=PURE_RED,
+                            stroke_width=6)
+        number = Text(str(value), color=BLACK).set_z_index(1).set_color(BLACK).scale(1.6)
+        new_square1 = VGroup(new_square, number)
+        new_square1.move_to(self.slot_center(i))
+        self.place(i, new_square1)
+        scene.play(ShowCreation(self.square_contents[i]))
 
     def add_element(self, scene, value, color=TEAL_B):
-        for i, square in enumerate(self.array_group[0]):
-            if self.square_contents[i] is None:
-                new_square = Square(side_length=1.72, fill_opacity=1, fill_color=color, color=PURE_RED,
-                                    stroke_width=6)
-                number = Text(str(value), color=BLACK).set_z_index(1)
-                new_square1 = VGroup(new_square, number)
-                new_square1.move_to(square.get_center())
-                self.square_contents[i] = new_square1
-                break
-        else:
-            scene.play(Indicate(self.array_group, color=RED))
-
-    def pop_element(self, scene):
-        for i in range(self.array_size - 1, -1, -1):
-            if self.square_contents[i] is not None:
-                scene.play(FadeOut(self.square_contents[i]))
-                self.square_contents[i] = None
-                break
-        else:
-            scene.play(Indicate(self.array_group, color=RED))
-
-    def delete_from_front(self, scene):
-        if self.square_contents[0] is not None:
-            scene.play(FadeOut(self.square_contents[0]))
-            self.square_contents[0] = None
-            animations = []
-            for i in range(1, self.array_size):
-                if self.square_contents[i] is not None:
-                    animations.append(
-                        self.square_contents[i].animate.move_to(self.array_group[0][i - 1].get_center())
-                    )
-                    self.square_contents[i - 1] = self.square_contents[i]
-                    self.square_contents[i] = None
-            if animations:
-                scene.play(*animations)
-        else:
+        i = self.next_free_index()
+        if i is None:
             scene.play(Indicate(self.array_group, color=RED))
-
-    def create_new_array(self, scene, new_size):
-        new_array = Array(array_size=new_size)
-        new_array.next_to(self, DOWN, buff=0.7)
-        scene.play(ShowCreation(new_array))
-        return new_array
-
-    def transfer_elements_to_new_array(self, scene, new_array):
-        for i, content in enumerate(self.square_contents):
-            if content is not None:
-                scene.play(Transform(content, new_array.array_group[0][i]))
-                new_array.square_contents[i] = content
-                self.square_contents[i] = None
+            return
+        new_square = Square(side_length=1.72, fill_opacity=1, fill_color=color, color=PURE_RED,
+                            stroke_width=6)
+        number = Text(str(value), color=BLACK).set_z_index(1)
+        new_square1 = VGroup(new_square, number)
+        new_square1.move_to(self.slot_center(i))
+        self.place(i, new_square1)
 
 
 class HeapSort(Scene):
@@ -258,15 +214,13 @@ class HeapSort(Scene):
 
         self.play(Swap(root, left_child))
         root, left_child = left_child, root
-        self.play(Swap(array.square_contents[0], array.square_contents[1]))
-        array.square_contents[0], array.square_contents[1] = array.square_contents[1], array.square_contents[0]
+        array.swap(self, 0, 1)
         self.wait()
 
 
         self.play(Swap(left_child, left_right_grandchild))
         left_child, left_right_grandchild = left_right_grandchild, left_child
-        self.play(Swap(array.square_contents[1], array.square_contents[4]))
-        array.square_contents[1], array.square_contents[4] = array.square_contents[4], array.square_contents[1]
+        array.swap(self, 1, 4)
         self.play(
             left_right_grandchild[0].animate.set_color(RED),
                   left_right_grandchild[1].animate.set_color(WHITE),
@@ -308,15 +262,13 @@ class HeapSort(Scene):
 
         self.play(Swap(root, left_child))
         root, left_child = left_child, root
-        self.play(Swap(array.square_contents[0], array.square_contents[1]))
-        array.square_contents[0], array.square_contents[1] = array.square_contents[1], array.square_contents[0]
+        array.swap(self, 0, 1)
         self.wait()
 
 
         self.play(Swap(left_child, left_right_grandchild))
         left_child, left_right_grandchild = left_right_grandchild, left_child
-        self.play(Swap(array.square_contents[1], array.square_contents[4]))
-        array.square_contents[1], array.square_contents[4] = array.square_contents[4], array.square_contents[1]
+        array.swap(self, 1, 4)
 
         self.play(
             left_right_grandchild[0].animate.set_color(RED),
@@ -364,8 +316,7 @@ class HeapSort(Scene):
 
         self.play(Swap(root, right_child))
         root, right_child = right_child, root
-        self.play(Swap(array.square_contents[0], array.square_contents[2]))
-        array.square_contents[0], array.square_contents[2] = array.square_contents[2], array.square_contents[0]
+        array.swap(self, 0, 2)
         self.wait()
 
 
@@ -413,8 +364,7 @@ class HeapSort(Scene):
 
         self.play(Swap(root, left_child))
         root, left_child = left_child, root
-        self.play(Swap(array.square_contents[0], array.square_contents[1]))
-        array.square_contents[0], array.square_contents[1] = array.square_contents[1], array.square_contents[0]
+        array.swap(self, 0, 1)
         self.wait()
 
 
@@ -1,6 +1,11 @@
 from manimlib import *
 import numpy as np
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common import decision_surface
+
 class KNNVisualizationImproved(Scene):
     def construct(self):
         self.camera.frame.shift(UP*0.23)
@@ -139,6 +144,26 @@ class KNNVisualizationImproved(Scene):
         # Final pause to show result
         self.wait(2)
 
+        # Decision regions of the same k = 6 classifier over the whole frame
+        train = np.array([p[:2] for p in green_positions + yellow_positions + red_positions], dtype=float)
+        train_labels = np.repeat([0, 1, 2], 7)  # index into cluster_colors
+
+        def knn_predict(points):
+            d = np.linalg.norm(points[:, None, :] - train[None, :, :], axis=2)
+            nearest = train_labels[np.argsort(d, axis=1)[:, :6]]
+            votes = np.stack([(nearest == c).sum(axis=1) for c in range(3)], axis=1)
+            return votes.argmax(axis=1)
+
+        surface = decision_surface.adaptive_surface(
+            knn_predict, (-7.2, 7.2), (-3.9, 4.4), base=(18, 10), depth=3, labels=True
+        )
+        regions = decision_surface.region_mobject(
+            surface, lambda c: cluster_colors[int(c)], opacity=0.2
+        ).set_z_index(-2)
+
+        self.play(FadeIn(regions), run_time=1.5)
+        self.wait(2)
+
 from manimlib import *
 import numpy as np
 
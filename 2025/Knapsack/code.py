@@ -1,5 +1,10 @@
 from manimlib import *
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.dp_table import DPTable, knapsack_table
+
 PURE_RED = "#FF0000"
 PURE_GREEN = "#00FF00"
 PURE_BLUE = "#0000FF"
@@ -102,47 +107,14 @@ class KnapsackTable(Scene):
         item_table.shift(UP * 0.5)  # Adjust vertical position
         
         # Create table structure - position on right side
-        table = VGroup()
-        cells = {}
-        cell_texts = {}
-        
-        # Calculate table width and height
-        table_width = (capacity + 1) * cell_width
-        table_height = (num_items + 1) * cell_height
-        
-        # Create cells
-        for i in range(num_items + 1):
-            for j in range(capacity + 1):
-                cell = Rectangle(width=cell_width, height=cell_height)
-                cell.set_stroke(WHITE, 1)
-                
-                # Position cells to the right of the item details
-                x_pos = j * cell_width
-                y_pos = -i * cell_height
-                cell.move_to(np.array([x_pos, y_pos, 0]))
-                
-                # Add cell to table
-                table.add(cell)
-                cells[(i, j)] = cell
-                
-                # Add initial text (will be updated for DP calculation)
-                if i == 0 or j == 0:
-                    text = Text("0", font_size=22)
-                    text.move_to(cell.get_center())
-                    table.add(text)
-                    cell_texts[(i, j)] = text
-        
-        # Add row labels (item numbers)
-        for i in range(num_items + 1):
-            label = Text(f"{i}" if i > 0 else "0", font_size=18)
-            label.next_to(cells[(i, 0)], LEFT, buff=0.25)
-            table.add(label)
-        
-        # Add column labels (weights)
-        for j in range(capacity + 1):
-            label = Text(f"{j}", font_size=18)
-            label.next_to(cells[(0, j)], UP, buff=0.25)
-            table.add(label)
+        # Row 0 and column 0 start filled with the base-case zeros
+        base_cases = {(i, 0): 0 for i in range(num_items + 1)}
+        base_cases.update({(0, j): 0 for j in range(capacity + 1)})
+        table = DPTable(
+            num_items + 1, capacity + 1, cell_width=cell_width, cell_height=cell_height,
+            row_labels=range(num_items + 1), col_labels=range(capacity + 1),
+            values=base_cases,
+        )
         
         # Position table properly
         table.scale(1.1)  # Scale up for better visibility
@@ -177,10 +149,9 @@ class KnapsackTable(Scene):
 
 
         
-        # Fill the table with DP values (animate the calculation)
-        dp = [[0 for _ in range(capacity + 1)] for _ in range(num_items + 1)]
-        
-        # Base case already filled with 0s
+        # The whole DP table, from the real recurrence; the loop below
+        # animates how each cell is obtained
+        dp = knapsack_table(values[1:], weights[1:], capacity)
         
         # Fill the DP table
         for i in range(1, num_items + 1):
@@ -188,30 +159,21 @@ class KnapsackTable(Scene):
                 self.play(Transform(rect, SurroundingRectangle(item_table[i], color=YELLOW, stroke_width=7).scale(1.234)))
             for j in range(1, capacity + 1):
                 # Highlight current cell
-                current_cell = cells[(i, j)]
+                current_cell = table.cell(i, j)
                 self.play(current_cell.animate.set_fill(BLUE, opacity=0.39), run_time=1)
                 
                 if weights[i] <= j:
-                    # Two options: include or exclude current item
-                    value1 = dp[i-1][j]  # Exclude
-                    value2 = values[i] + dp[i-1][j-weights[i]]  # Include
-                    
+                    # Two options: exclude (above) or include (item value + diagonal)
                     # Highlight the cells we're comparing
-                    above_cell = cells[(i-1, j)]
-                    prev_cell = cells[(i-1, j-weights[i])] if j-weights[i] >= 0 else None
+                    above_cell = table.cell(i-1, j)
+                    prev_cell = table.cell(i-1, j-weights[i]) if j-weights[i] >= 0 else None
                     
                     self.play(above_cell.animate.set_fill(GREEN, opacity=0.3), run_time=1)
                     if prev_cell:
                         self.play(prev_cell.animate.set_fill(YELLOW, opacity=0.3), run_time=1)
                     
-                    # Update current cell value
-                    dp[i][j] = max(value1, value2)
-                    new_text = Text(str(dp[i][j]), font_size=22)
-                    new_text.move_to(current_cell.get_center())
-                    
-                    # Add the new text directly to the scene
-                    self.play(FadeIn(new_text), run_time=0.9)
-                    cell_texts[(i, j)] = new_text
+                    # Update current cell value: max of the two
+                    self.play(table.write(i, j, dp[i][j]), run_time=0.9)
                     
                     # Reset cell colors
                     self.play(
@@ -225,16 +187,10 @@ class KnapsackTable(Scene):
                         )
                 else:
                     # Just take the value from above
-                    above_cell = cells[(i-1, j)]
+                    above_cell = table.cell(i-1, j)
                     self.play(above_cell.animate.set_fill(GREEN, opacity=0.35), run_time=1)
                     
-                    dp[i][j] = dp[i-1][j]
-                    new_text = Text(str(dp[i][j]), font_size=22)
-                    new_text.move_to(current_cell.get_center())
-                    
-                    # Add the new text directly to the scene
-                    self.play(FadeIn(new_text), run_time=1)
-                    cell_texts[(i, j)] = new_text
+                    self.play(table.write(i, j, dp[i][j]), run_time=1)
                     
                     # Reset above cell color
                     self.play(
@@ -246,7 +202,7 @@ class KnapsackTable(Scene):
                 self.play(current_cell.animate.set_fill(opacity=0), run_time=0.2)
         
         # Highlight final answer
-        final_cell = cells[(num_items, capacity)]
+        final_cell = table.cell(num_items, capacity)
         self.play(
             final_cell.animate.set_fill(RED, opacity=0.5),
             run_time=1
@@ -254,61 +210,93 @@ class KnapsackTable(Scene):
         
         self.wait(2)
 
-        self.play(cells[(4,7)].animate.set_fill(YELLOW, opacity=0.5))
+        self.play(table.cell(4, 7).animate.set_fill(YELLOW, opacity=0.5))
 
         self.wait(2)
 
         self.play(Transform(rect, SurroundingRectangle(item_table[4], color=YELLOW, stroke_width=7).scale(1.234)),
-            cells[(4,7)].animate.set_fill(RED, opacity=0.5),
-            cells[(5,7)].animate.set_fill(YELLOW, opacity=0),
+            table.cell(4, 7).animate.set_fill(RED, opacity=0.5),
+            table.cell(5, 7).animate.set_fill(YELLOW, opacity=0),
             )
         
         self.wait()
 
-        self.play(cells[(3,7)].animate.set_fill(YELLOW, opacity=0.5))
+        self.play(table.cell(3, 7).animate.set_fill(YELLOW, opacity=0.5))
 
         self.wait(2)
 
         self.play(Transform(rect, SurroundingRectangle(item_table[3], color=YELLOW, stroke_width=7).scale(1.234)),
-            cells[(3,7)].animate.set_fill(RED, opacity=0.5),
-            cells[(4,7)].animate.set_fill(YELLOW, opacity=0),
+            table.cell(3, 7).animate.set_fill(RED, opacity=0.5),
+            table.cell(4, 7).animate.set_fill(YELLOW, opacity=0),
             )
         
         self.wait()
 
-        self.play(cells[(2,7)].animate.set_fill(YELLOW, opacity=0.5))
+        self.play(table.cell(2, 7).animate.set_fill(YELLOW, opacity=0.5))
         self.wait(2)
 
         self.play(
-            cells[(3,7)].animate.set_fill(GREEN, opacity=0.5),
-            cells[(2,7)].animate.set_fill(GREEN, opacity=0),
+            table.cell(3, 7).animate.set_fill(GREEN, opacity=0.5),
+            table.cell(2, 7).animate.set_fill(GREEN, opacity=0),
             )
         self.wait(2)
 
         self.play(Transform(rect, SurroundingRectangle(item_table[2], color=YELLOW, stroke_width=7).scale(1.234)),
-            cells[(2,3)].animate.set_fill(RED, opacity=0.5),
+            table.cell(2, 3).animate.set_fill(RED, opacity=0.5),
             )
         self.wait(1)
 
-        self.play(cells[(1,3)].animate.set_fill(YELLOW, opacity=0.5))
+        self.play(table.cell(1, 3).animate.set_fill(YELLOW, opacity=0.5))
 
         self.wait(2)
 
         self.play(Transform(rect, SurroundingRectangle(item_table[1], color=YELLOW, stroke_width=7).scale(1.234)),
-            cells[(1,3)].animate.set_fill(RED, opacity=0.5),
-            cells[(2,3)].animate.set_fill(RED, opacity=0),
+            table.cell(1, 3).animate.set_fill(RED, opacity=0.5),
+            table.cell(2, 3).animate.set_fill(RED, opacity=0),
             )
         self.wait()
 
-        self.play(cells[(0,3)].animate.set_fill(YELLOW, opacity=0.5))
+        self.play(table.cell(0, 3).animate.set_fill(YELLOW, opacity=0.5))
 
         self.wait(2)
 
         self.play(
-            cells[(0,3)].animate.set_fill(RED, opacity=0),
-            cells[(1,3)].animate.set_fill(GREEN, opacity=0.5),
+            table.cell(0, 3).animate.set_fill(RED, opacity=0),
+            table.cell(1, 3).animate.set_fill(GREEN, opacity=0.5),
             Uncreate(rect)
         )
 
         self.wait(2)
 
+
+class KnapsackTableFilled(Scene):
+    def construct(self):
+        # A larger instance, filled one item (row) per animation
+        values = [50, 40, 70, 80, 10, 30, 60, 20, 90, 45, 25, 65]
+        weights = [3, 2, 4, 5, 1, 2, 6, 1, 7, 3, 2, 4]
+        capacity = 20
+        num_items = len(values)
+
+        dp = knapsack_table(values, weights, capacity)
+
+        base_cases = {(i, 0): 0 for i in range(num_items + 1)}
+        base_cases.update({(0, j): 0 for j in range(capacity + 1)})
+        table = DPTable(
+            num_items + 1, capacity + 1, cell_width=0.6, font_size=16, label_size=14, label_buff=0.15,
+            row_labels=range(num_items + 1), col_labels=range(capacity + 1),
+            values=base_cases,
+        )
+        table.move_to(ORIGIN).scale(0.95)
+
+        title = Text(f"Knapsack (Capacity = {capacity}, {num_items} items)", font_size=34)
+        title.to_edge(UP, buff=0.3)
+
+        self.play(Write(title), ShowCreation(table))
+        self.wait()
+
+        for i in range(1, num_items + 1):
+            self.play(table.fill_row(i, dp[i, 1:], start=1, lag_ratio=0.05), run_time=1)
+
+        self.play(table.cell(num_items, capacity).animate.set_fill(RED, opacity=0.5))
+        self.wait(2)
+
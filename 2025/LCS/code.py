@@ -1,5 +1,10 @@
 from manimlib import *
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.dp_table import DPTable, lcs_table
+
 class LongestCommonSubsequence(Scene):
     def construct(self):
         # Problem statement
@@ -18,70 +23,33 @@ class LongestCommonSubsequence(Scene):
         # DP table setup
         n, m = len(s1), len(s2)
         cell_size = 0.65
-        table = VGroup()
-        
-        # Create cells for the table
-        cells = {}
-        for i in range(n + 1):
-            for j in range(m + 1):
-                cell = Square(side_length=cell_size)
-                cell.set_stroke(WHITE, 2)
-                cell.move_to(RIGHT * j * cell_size + DOWN * i * cell_size)
-                table.add(cell)
-                cells[(i, j)] = cell
-        
-        # Add row and column headers
-        row_headers = VGroup()
-        for i in range(n + 1):
-            if i == 0:
-                char = ""  # Empty set symbol for initial row
-            else:
-                char = s1[i-1]
-            label = Text(char, font_size=24)
-            label.next_to(cells[(i, 0)], LEFT, buff=0.2)
-            row_headers.add(label)
-        
-        col_headers = VGroup()
-        for j in range(m + 1):
-            if j == 0:
-                char = ""  # Empty set symbol for initial column
-            else:
-                char = s2[j-1]
-            label = Text(char, font_size=24)
-            label.next_to(cells[(0, j)], UP, buff=0.2)
-            col_headers.add(label)
+        # DP table: one cell per pair of prefixes, headed by their last characters
+        # (blank for the empty prefix)
+        table = DPTable(n + 1, m + 1, cell_width=cell_size, stroke_width=2,
+                        row_labels=[""] + list(s1), col_labels=[""] + list(s2),
+                        label_size=24, label_buff=0.2)
+        row_headers, col_headers = table.row_labels, table.col_labels
         
         # Center the table and add some space at the top
-        table_group = VGroup(table, row_headers, col_headers)
-        table_group.center()
-        table_group.shift(UP * 1.1).scale(1.3)
+        table.center()
+        table.shift(UP * 1.1).scale(1.3)
         
         # Show the table
         self.play(
-            FadeIn(table),
+            FadeIn(table.cells),
             Write(row_headers),
             Write(col_headers)
         )
         self.embed()
         self.wait(1.5)  # Pause to let viewers see the table structure
 
-        # Initialize the dp table values
-        dp_values = {}
-        dp_texts = {}
+        # The whole DP table from the recurrence; the loop below shows how
+        # each cell is derived
+        dp_values = lcs_table(s1, s2)
         
-        # Initialize with zeros
-        for i in range(n + 1):
-            for j in range(m + 1):
-                dp_values[(i, j)] = 0
-                text = Text("0", font_size=34)
-                text.move_to(cells[(i, j)].get_center())
-                dp_texts[(i, j)] = text
-        
-        # Show the initial zeros
-        self.play(
-            *[Write(dp_texts[(i, 0)]) for i in range(n + 1)],
-            *[Write(dp_texts[(0, j)]) for j in range(1, m + 1)]
-        )
+        # Show the initial zeros (empty-prefix row and column)
+        base_cells = [(i, 0) for i in range(n + 1)] + [(0, j) for j in range(1, m + 1)]
+        self.play(table.fill_cells(base_cells, [0] * len(base_cells), lag_ratio=0, font_size=34))
         self.wait(1)  # Pause to let viewers see the initial values
         
         # Create black background for explanation text
@@ -124,10 +92,10 @@ class LongestCommonSubsequence(Scene):
             for j in range(1, m + 1):
                 # Highlight current cells being compared
                 self.play(
-                    cells[(i, j)].animate.set_fill(BLUE, opacity=0.3),
-                    cells[(i-1, j)].animate.set_fill(YELLOW, opacity=0.3),
-                    cells[(i, j-1)].animate.set_fill(YELLOW, opacity=0.3),
-                    cells[(i-1, j-1)].animate.set_fill(YELLOW, opacity=0.3),
+                    table.cell(i, j).animate.set_fill(BLUE, opacity=0.3),
+                    table.cell(i-1, j).animate.set_fill(YELLOW, opacity=0.3),
+                    table.cell(i, j-1).animate.set_fill(YELLOW, opacity=0.3),
+                    table.cell(i-1, j-1).animate.set_fill(YELLOW, opacity=0.3),
                     run_time=0.5
                 )
                 self.wait(0.5)  # Pause to let viewers see highlighted cells
@@ -147,11 +115,9 @@ class LongestCommonSubsequence(Scene):
                         run_time=0.3
                     )
                     update_explanation(f"Characters match: {s1[i-1]} = {s2[j-1]}\nTake diagonal value + 1")
-                    dp_values[(i, j)] = 1 + dp_values[(i-1, j-1)]
-                    
                     # Highlight the diagonal cell with special color
                     self.play(
-                        cells[(i-1, j-1)].animate.set_fill(GREEN, opacity=0.5),
+                        table.cell(i-1, j-1).animate.set_fill(GREEN, opacity=0.5),
                         run_time=0.5
                     )
                     self.wait(0.5)  # Pause to let viewers see the diagonal cell
@@ -162,45 +128,39 @@ class LongestCommonSubsequence(Scene):
                         run_time=0.3
                     )
                     update_explanation(f"Characters don't match: {s1[i-1]} ≠ {s2[j-1]}\nTake max of left and top cells")
-                    dp_values[(i, j)] = max(dp_values[(i-1, j)], dp_values[(i, j-1)])
-                    
                     # Highlight both left and top cells, with brighter color for the max
                     self.play(
-                        cells[(i-1, j)].animate.set_fill(YELLOW, opacity=0.3),
-                        cells[(i, j-1)].animate.set_fill(YELLOW, opacity=0.3),
+                        table.cell(i-1, j).animate.set_fill(YELLOW, opacity=0.3),
+                        table.cell(i, j-1).animate.set_fill(YELLOW, opacity=0.3),
                         run_time=0.5
                     )
                     
                     # Highlight the max value with a brighter color
                     if dp_values[(i-1, j)] >= dp_values[(i, j-1)]:
                         self.play(
-                            cells[(i-1, j)].animate.set_fill(GREEN, opacity=0.5),
+                            table.cell(i-1, j).animate.set_fill(GREEN, opacity=0.5),
                             run_time=0.5
                         )
                     else:
                         self.play(
-                            cells[(i, j-1)].animate.set_fill(GREEN, opacity=0.5),
+                            table.cell(i, j-1).animate.set_fill(GREEN, opacity=0.5),
                             run_time=0.5
                         )
                     self.wait(0.5)  # Pause to let viewers see which cell is being used
                 
                 # Create and display new value
-                new_text = Text(str(dp_values[(i, j)]), font_size=34)
-                new_text.move_to(cells[(i, j)].get_center())
-                
                 self.play(
-                    Write(new_text),
+                    table.write(i, j, dp_values[(i, j)], font_size=34),
                     run_time=0.5
                 )
-                dp_texts[(i, j)] = new_text
                 self.wait(0.5)  # Pause to let viewers see the new value
                 
                 # Reset cell colors
                 self.play(
-                    cells[(i, j)].animate.set_fill(opacity=0),
-                    cells[(i-1, j)].animate.set_fill(opacity=0),
-                    cells[(i, j-1)].animate.set_fill(opacity=0),
-                    cells[(i-1, j-1)].animate.set_fill(opacity=0),
+                    table.cell(i, j).animate.set_fill(opacity=0),
+                    table.cell(i-1, j).animate.set_fill(opacity=0),
+                    table.cell(i, j-1).animate.set_fill(opacity=0),
+                    table.cell(i-1, j-1).animate.set_fill(opacity=0),
                     run_time=0.5
                 )
                 self.wait(0.3)  # Slight pause before next iteration
@@ -209,8 +169,8 @@ class LongestCommonSubsequence(Scene):
         self.play(FadeOut(row_rect), FadeOut(col_rect))
         
         # Highlight the final result
-        final_cell = cells[(n, m)]
-        final_value = dp_texts[(n, m)]
+        final_cell = table.cell(n, m)
+        final_value = table.entry(n, m)
         
         self.play(
             final_cell.animate.set_fill(PURPLE, opacity=0.5),
@@ -248,7 +208,7 @@ class LongestCommonSubsequence(Scene):
             
             for pos in path_cells:
                 self.play(
-                    cells[pos].animate.set_fill(RED, opacity=0.7),
+                    table.cell(*pos).animate.set_fill(RED, opacity=0.7),
                     run_time=0.7
                 )
                 self.wait(0.5)  # Pause between each step of the path
@@ -1,6 +1,11 @@
 from manimlib import *
 import numpy as np
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.curves import graph_family, sigmoid
+
 
 class LogisticRegressionIntro(Scene):
     def construct(self):
@@ -56,12 +61,10 @@ class LogisticRegressionIntro(Scene):
         self.wait(2)
         
         # Create sigmoid curve (decision boundary) with thick stroke
-        sigmoid_curve = axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-2*x)),
-            x_range=[-3, 3],
-            color="#00FF00",
-            stroke_width=8
-        )
+        # Every sigmoid(kx) of this sweep, sampled adaptively on one shared grid
+        sigmoid_sweep = graph_family(axes, lambda x, k: sigmoid(k * x), [2, 4, 1, 2], (-3, 3),
+                                     color="#00FF00", stroke_width=8)
+        sigmoid_curve = sigmoid_sweep[0]  # sigmoid(2x)
         
         # Show sigmoid curve
         self.play(ShowCreation(sigmoid_curve))
@@ -104,13 +107,13 @@ class LogisticRegressionIntro(Scene):
         self.play(self.camera.frame.animate.shift(RIGHT*3).scale(1.1))
 
 
-        sigmoid = Tex(r"\sigma(x) = \frac{1}{1 + e^{-x}}").next_to(axes, RIGHT, buff=1).scale(1.7).shift(RIGHT*0.4)
+        sigmoid_tex = Tex(r"\sigma(x) = \frac{1}{1 + e^{-x}}").next_to(axes, RIGHT, buff=1).scale(1.7).shift(RIGHT*0.4)
 
-        self.play(Write(sigmoid))
+        self.play(Write(sigmoid_tex))
 
         self.wait(2)
 
-        x = sigmoid[-1]
+        x = sigmoid_tex[-1]
 
         rect = always_redraw(lambda: SurroundingRectangle(x,color=PINK))
 
@@ -119,12 +122,7 @@ class LogisticRegressionIntro(Scene):
 
 
         # First, transform to steeper curve (scale x by 2)
-        sigmoid_steep = axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-4*x)),  # Scale x by 2
-            x_range=[-3, 3],
-            color="#00ff00",  # Orange color
-            stroke_width=8
-        )
+        sigmoid_steep = sigmoid_sweep[1]  # sigmoid(4x)
         
 
         self.play(
@@ -135,12 +133,7 @@ class LogisticRegressionIntro(Scene):
         self.wait(2)
         
         # Transform to gentler curve (scale x by 0.2)
-        sigmoid_gentle = axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-x)),  # Scale x by 0.2
-            x_range=[-3, 3],
-            color="#00FF00",  # Blue color
-            stroke_width=8
-        )
+        sigmoid_gentle = sigmoid_sweep[2]  # sigmoid(x)
         
 
         self.play(
@@ -150,12 +143,7 @@ class LogisticRegressionIntro(Scene):
         self.wait(2)
         
         # Transform back to original
-        sigmoid_original = axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-2*x)),
-            x_range=[-3, 3],
-            color="#00FF00",
-            stroke_width=8
-        )
+        sigmoid_original = sigmoid_sweep[3]  # sigmoid(2x)
         
         sigmoid_original_eq = Tex(r"\sigma(x) = \frac{1}{1 + e^{-x}}").next_to(axes, RIGHT, buff=1).scale(1.7).shift(RIGHT*0.4)
         
@@ -179,7 +167,7 @@ class LogisticRegressionIntro(Scene):
     r"x = 0 & \Longrightarrow \sigma(x) = 0.5 \\"
     r"x \to -\infty & \Longrightarrow \sigma(x) \approx 0"
     r"\end{cases}"
-).next_to(sigmoid, DOWN, buff=1)
+).next_to(sigmoid_tex, DOWN, buff=1)
 
         self.play(Write(conditions))
         self.wait(2)
@@ -327,12 +315,10 @@ class LogsiticRegression(Scene):
         self.wait(1)
 
         # Create sigmoid curve (decision boundary) with thick stroke
-        sigmoid_curve = axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-2*x)),
-            x_range=[-3, 3],
-            color="#00FF00",
-            stroke_width=8
-        )
+        # Every sigmoid(kx) shown below, sampled adaptively on one shared grid
+        sigmoid_sweep = graph_family(axes, lambda x, k: sigmoid(k * x), [2, 3, 1, 2.5, 6, 0.6, 1.5], (-3, 3),
+                                     color="#00FF00", stroke_width=8)
+        sigmoid_curve = sigmoid_sweep[0]  # sigmoid(2x)
         
         # Show sigmoid curve
         self.play(ShowCreation(sigmoid_curve))
@@ -340,58 +326,28 @@ class LogsiticRegression(Scene):
 
 
         # Create sigmoid curve (decision boundary) with thick stroke
-        sigmoid_curve1 = axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-3*x)),
-            x_range=[-3, 3],
-            color="#00FF00",
-            stroke_width=8
-        )
+        sigmoid_curve1 = sigmoid_sweep[1]  # sigmoid(3x)
 
         # Create sigmoid curve (decision boundary) with thick stroke
-        sigmoid_curve2 = axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-1*x)),
-            x_range=[-3, 3],
-            color="#00FF00",
-            stroke_width=8
-        )
+        sigmoid_curve2 = sigmoid_sweep[2]  # sigmoid(x)
 
 
         # Create sigmoid curve (decision boundary) with thick stroke
-        sigmoid_curve3 = axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-2.5*x)),
-            x_range=[-3, 3],
-            color="#00FF00",
-            stroke_width=8
-        )
+        sigmoid_curve3 = sigmoid_sweep[3]  # sigmoid(2.5x)
 
         self.play(Transform(sigmoid_curve, sigmoid_curve1))
         self.play(Transform(sigmoid_curve, sigmoid_curve2))
         self.play(Transform(sigmoid_curve, sigmoid_curve3))
 
         # Create sigmoid curve (decision boundary) with thick stroke
-        sigmoid_curve1 = axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-6*x)),
-            x_range=[-3, 3],
-            color="#00FF00",
-            stroke_width=8
-        )
+        sigmoid_curve1 = sigmoid_sweep[4]  # sigmoid(6x)
 
         # Create sigmoid curve (decision boundary) with thick stroke
-        sigmoid_curve2 = axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-0.6*x)),
-            x_range=[-3, 3],
-            color="#00FF00",
-            stroke_width=8
-        )
+        sigmoid_curve2 = sigmoid_sweep[5]  # sigmoid(0.6x)
 
 
         # Create sigmoid curve (decision boundary) with thick stroke
-        sigmoid_curve3 = axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-1.5*x)),
-            x_range=[-3, 3],
-            color="#00FF00",
-            stroke_width=8
-        )
+        sigmoid_curve3 = sigmoid_sweep[6]  # sigmoid(1.5x)
 
         self.play(Transform(sigmoid_curve, sigmoid_curve1))
         self.play(Transform(sigmoid_curve, sigmoid_curve2))
@@ -414,12 +370,13 @@ class LogsiticRegression(Scene):
         sigma_x_label = Tex(r"\sigma(wx+b)").next_to(final_axes.y_axis, UP).scale(1.4).shift(UP*0.1)
         
         # Create the final sigmoid curve as a function of x
-        final_sigmoid_curve = final_axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-2*(0.5*x + 1.5))),  # Using w=0.5, b=1.5 from earlier
-            x_range=[-3, 3],
-            color="#00FF00",
-            stroke_width=8
+        # sigmoid(2(wx + b)) for every (w, b) shown below, on one shared grid
+        final_sweep = graph_family(
+            final_axes, lambda x, w, b: sigmoid(2 * (w * x + b)),
+            [(0.5, 1.5), (1.5, 2.5), (2.5, -0.5), (0.99, -3.5), (0, 4.5), (-2, 0.5)], (-3, 3),
+            color="#00FF00", stroke_width=8,
         )
+        final_sigmoid_curve = final_sweep[0]  # w=0.5, b=1.5
         
         # Transform the labels and curve
         self.play(
@@ -429,40 +386,15 @@ class LogsiticRegression(Scene):
         )
         self.wait(3)
         
-        final_sigmoid_curve1 = final_axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-2*(1.5*x + 2.5))),  # Using w=0.5, b=1.5 from earlier
-            x_range=[-3, 3],
-            color="#00FF00",
-            stroke_width=8
-        )
+        final_sigmoid_curve1 = final_sweep[1]  # w=1.5, b=2.5
 
-        final_sigmoid_curve2 = final_axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-2*(2.5*x - 0.5))),  # Using w=0.5, b=1.5 from earlier
-            x_range=[-3, 3],
-            color="#00FF00",
-            stroke_width=8
-        )
+        final_sigmoid_curve2 = final_sweep[2]  # w=2.5, b=-0.5
 
-        final_sigmoid_curve3 = final_axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-2*(0.99*x - 3.5))),  # Using w=0.5, b=1.5 from earlier
-            x_range=[-3, 3],
-            color="#00FF00",
-            stroke_width=8
-        )
+        final_sigmoid_curve3 = final_sweep[3]  # w=0.99, b=-3.5
 
-        final_sigmoid_curve4 = final_axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-2*(0*x + 4.5))),  # Using w=0.5, b=1.5 from earlier
-            x_range=[-3, 3],
-            color="#00FF00",
-            stroke_width=8
-        )
+        final_sigmoid_curve4 = final_sweep[4]  # w=0, b=4.5
 
-        final_sigmoid_curve5 = final_axes.get_graph(
-            lambda x: 1 / (1 + np.exp(-2*(-2*x + 0.5))),  # Using w=0.5, b=1.5 from earlier
-            x_range=[-3, 3],
-            color="#00FF00",
-            stroke_width=8
-        )
+        final_sigmoid_curve5 = final_sweep[5]  # w=-2, b=0.5
 
 
         self.play(Transform(sigmoid_curve, final_sigmoid_curve1))
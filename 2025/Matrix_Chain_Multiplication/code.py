@@ -1,4 +1,9 @@
 from manimlib import *
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.dp_table import DPTable
+
 
 class MatrixChainMultiplication(Scene):
 
@@ -915,61 +920,11 @@ class MatrixChainMultiplication(Scene):
         self.embed()
     
     def create_table(self, labels, title_text, position_shift):
-        # Create a table with cells
-        rows = 4  # Just the 4x4 grid
-        cols = 4
-        cell_width = 0.8
-        cell_height = 0.8
-        
-        # Create the title
+        # A len(labels) x len(labels) grid centred on position_shift
         title = Text(title_text, font_size=30).shift(UP + position_shift)
-        
-        # Create cells group
-        cells_group = VGroup()
-        cell_contents = VGroup()
-        
-        # Create the grid cells for the main table (not including labels)
-        for i in range(rows):
-            for j in range(cols):
-                # Calculate position - center the grid
-                pos_x = (j - cols/2 + 0.5) * cell_width + position_shift[0]
-                pos_y = (rows/2 - i - 0.5) * cell_height + position_shift[1]
-                
-                # Create cell rectangle
-                cell = Rectangle(
-                    width=cell_width,
-                    height=cell_height,
-                    stroke_width=1,
-                    color=WHITE
-                ).move_to([pos_x, pos_y, 0])
-                
-                cells_group.add(cell)
-                
-                # Add cell content
-                content = Text("", font_size=20) if i != j else Text("", font_size=20)
-                content.move_to(cell.get_center())
-                cell_contents.add(content)
-        
-        # Add row labels (left of table)
-        row_labels = VGroup()
-        for i in range(rows):
-            pos_y = (rows/2 - i - 0.5) * cell_height + position_shift[1]
-            label = Text(labels[i], font_size=24).move_to([
-                position_shift[0] - cols/2 * cell_width - 0.4,
-                pos_y,
-                0
-            ])
-            row_labels.add(label)
-        
-        # Add column labels (above table)
-        col_labels = VGroup()
-        for j in range(cols):
-            pos_x = (j - cols/2 + 0.5) * cell_width + position_shift[0]
-            label = Text(labels[j], font_size=24).move_to([
-                pos_x,
-                position_shift[1] + rows/2 * cell_height + 0.4,
-                0
-            ])
-            col_labels.add(label)
-            
-        return VGroup(title, cells_group, cell_contents, row_labels, col_labels)
+        table = DPTable(len(labels), len(labels), row_labels=labels, col_labels=labels,
+                        font_size=20, label_size=24, label_buff=0.3)
+        table.shift(position_shift - table.cells.get_center())
+
+        # [1] cells (row-major), [2] entries, [3] row labels, [4] column labels
+        return VGroup(title, *table.submobjects)
@@ -1,6 +1,15 @@
 from manimlib import *
 import numpy as np
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common import tex_bank
+from common.particles import ParticleSystem, ParticleTransition
+
+# Compile every statically known Tex string up front, in parallel
+tex_bank.warm_up(__file__)
+
 class NeuronNetwork(Scene):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -157,75 +166,53 @@ class NeuronNetwork(Scene):
     def massive_pulse_activity(self):
         """Create massive continuous red pulse activity for 10 seconds filling entire screen"""
         
-        # Create initial burst of 60 pulses
-        all_active_pulses = VGroup()
+        # All pulses live in one particle cloud: one draw call, one animation per round
+        pulses = ParticleSystem(color=self.PULSE_COLOR, glow_factor=1.5)
+        sites = np.array(self.neuron_positions, dtype=float)
         
-        for _ in range(60):
-            start_pos = np.array(self.neuron_positions[np.random.randint(0, len(self.neuron_positions))], dtype=float)
-            pulse = self.create_red_pulse(start_pos)
-            all_active_pulses.add(pulse)
+        def random_sites(n):
+            return sites[np.random.randint(0, len(sites), n)]
         
-        # Show initial pulses
-        self.play(
-            LaggedStartMap(FadeIn, all_active_pulses, lag_ratio=0.005),
-            run_time=0.5
-        )
+        def pulse_radii(n):
+            # Glow radius of the old Dot + Circle(3x) pulses
+            return np.random.uniform(0.04, 0.09, n) * 3
+        
+        # Create initial burst of 60 pulses
+        pulses.emit(random_sites(60), pulse_radii(60), opacity=0)
+        self.add(pulses)
+        self.play(ParticleTransition(pulses, opacities=1), run_time=0.5)
         
         # Run continuous activity for 10 seconds (20 rounds of 0.5 seconds each)
         for round_num in range(20):
-            animations = []
+            n_moving = len(pulses)
             
-            # Move all existing pulses to new random positions
-            for pulse in all_active_pulses:
-                new_pos = np.array(self.neuron_positions[np.random.randint(0, len(self.neuron_positions))], dtype=float)
-                # Add screen-wide randomness to fill entire space
-                noise = np.random.uniform(-0.3, 0.3, 3)
-                final_pos = new_pos + noise
-                animations.append(pulse.animate.move_to(final_pos))
-            
-            # Add 10-15 new pulses each round to maintain intensity
-            if round_num % 2 == 0:  # Every other round
-                for _ in range(np.random.randint(10, 16)):
-                    new_start_pos = np.array(self.neuron_positions[np.random.randint(0, len(self.neuron_positions))], dtype=float)
-                    new_pulse = self.create_red_pulse(new_start_pos)
-                    all_active_pulses.add(new_pulse)
-                    animations.append(FadeIn(new_pulse))
-            
-            # Remove some old pulses randomly to prevent overcrowding - FIXED VERSION
-            if len(all_active_pulses) > 80:
-                # Convert to list and randomly select indices
-                pulse_list = list(all_active_pulses.submobjects)
-                indices_to_remove = np.random.choice(len(pulse_list), size=min(10, len(pulse_list)), replace=False)
-                
-                # Remove selected pulses
-                for idx in sorted(indices_to_remove, reverse=True):  # Remove from end to avoid index shifting
-                    pulse_to_remove = pulse_list[idx]
-                    all_active_pulses.remove(pulse_to_remove)
-                    animations.append(FadeOut(pulse_to_remove))
+            # Add 10-15 new pulses every other round to maintain intensity; they fade in where they spawn
+            if round_num % 2 == 0:
+                n_new = np.random.randint(10, 16)
+                pulses.emit(random_sites(n_new), pulse_radii(n_new), opacity=0)
             
-            # Execute all animations
-            if animations:
-                self.play(*animations, run_time=0.5)
+            # Move all existing pulses to new random positions with screen-wide noise
+            targets = pulses.positions.copy()
+            targets[:n_moving] = random_sites(n_moving)
+            targets[:n_moving, :2] += np.random.uniform(-0.3, 0.3, (n_moving, 2))
+            
+            # Fade out 10 random pulses to prevent overcrowding
+            opacities = np.ones(len(pulses))
+            if len(pulses) > 80:
+                opacities[np.random.choice(len(pulses), size=10, replace=False)] = 0
+            
+            self.play(
+                ParticleTransition(pulses, positions=targets, opacities=opacities, remove_faded=True),
+                run_time=0.5
+            )
         
         # Final explosive fade
         self.play(
-            *[pulse.animate.scale(2.5).set_opacity(0) for pulse in all_active_pulses],
+            ParticleTransition(pulses, radii=pulses.particle_radii * 2.5, opacities=0, remove_faded=True),
             run_time=2
         )
         
         self.wait(1)
-    
-    def create_red_pulse(self, position):
-        """Create a red pulse with glow effect at given position"""
-        pulse_size = np.random.uniform(0.04, 0.09)
-        pulse = Dot(radius=pulse_size, color=self.PULSE_COLOR, fill_opacity=1.0)
-        glow = Circle(radius=pulse_size * 3, color=self.PULSE_COLOR, 
-                     fill_opacity=0.3, stroke_opacity=0)
-        
-        pulse_group = VGroup(pulse, glow)
-        pulse_group.move_to(position)
-        
-        return pulse_group
 
 
 
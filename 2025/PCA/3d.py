@@ -2,6 +2,12 @@ from manim import *
 import numpy as np
 from scipy.spatial import ConvexHull
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.contours import to_scene_points
+from common.pca_data import pca_dataset
+
 config.background_color = LOGO_WHITE
 
 class PCA3DAnimation(ThreeDScene):
@@ -21,29 +27,18 @@ class PCA3DAnimation(ThreeDScene):
         self.add(axes)
         self.wait(0.5)
 
-        # Generate 150 points — mostly in XZ plane, tiny Y noise
-        np.random.seed(42)
-        n_points = 150
-
-        x_vals = np.linspace(-2.5, 2.5, n_points)
-        z_vals = np.linspace(-2.5, 2.5, n_points)
-        y_vals = np.zeros(n_points)
-
-        noise_x = np.random.normal(scale=0.15, size=n_points)
-        noise_y = np.random.normal(scale=0.05, size=n_points)
-        noise_z = np.random.normal(scale=0.15, size=n_points)
-
-        x_vals += noise_x
-        y_vals += noise_y
-        z_vals += noise_z
-
-        data_points = list(zip(x_vals, y_vals, z_vals))
+        # Generate 150 points — mostly in XZ plane, tiny Y noise. The seeded
+        # dataset and its PCA come from the data layer shared with code.py.
+        data = pca_dataset(150, starts=(-2.5, 0, -2.5), ends=(2.5, 0, 2.5),
+                           noise=(0.15, 0.05, 0.15), seed=42)
+        raw_points = data["points"]
+        points_3d_np = to_scene_points(axes, raw_points)
 
         # Create 3D dots — BLUE_A
-        dots = VGroup()
-        for x, y, z in data_points:
-            dot = Dot3D(point=axes.c2p(x, y, z), radius=0.04, color=BLUE_C)  # 🔵 BLUE_A
-            dots.add(dot)
+        dots = VGroup(*[
+            Dot3D(point=p, radius=0.04, color=BLUE_C)  # 🔵 BLUE_A
+            for p in points_3d_np
+        ])
 
         self.play(
             LaggedStart(*[GrowFromCenter(dot) for dot in dots], lag_ratio=0.02),
@@ -52,8 +47,6 @@ class PCA3DAnimation(ThreeDScene):
         self.wait(1)
 
         # === 3D CRYSTAL-LIKE CONVEX HULL ===
-        raw_points = np.array([[x, y, z] for x, y, z in data_points])
-        points_3d_np = np.array([axes.c2p(x, y, z) for x, y, z in data_points])
 
         try:
             hull = ConvexHull(raw_points)
@@ -89,7 +82,7 @@ class PCA3DAnimation(ThreeDScene):
 
         except Exception as e:
             print("ConvexHull failed, using XZ fallback:", e)
-            points_xz = np.array([[x, z] for x, y, z in data_points])
+            points_xz = raw_points[:, [0, 2]]
             hull_2d = ConvexHull(points_xz)
             hull_vertices_2d = [points_xz[i] for i in hull_2d.vertices]
             hull_vertices_3d = [axes.c2p(x, 0, z) for x, z in hull_vertices_2d]
@@ -103,15 +96,8 @@ class PCA3DAnimation(ThreeDScene):
 
         self.wait(1)
 
-        # === PCA CALCULATION ===
-        centered_coords = np.array([[x, y, z] for x, y, z in data_points])
-        data_matrix = centered_coords.T
-        cov_matrix = np.cov(data_matrix)
-        eigenvalues, eigenvectors = np.linalg.eigh(cov_matrix)
-
-        sorted_indices = np.argsort(eigenvalues)[::-1]
-        eigenvalues = eigenvalues[sorted_indices]
-        eigenvectors = eigenvectors[:, sorted_indices]
+        # === PCA (precomputed with the dataset) ===
+        eigenvectors = data["eigenvectors"]
 
         PC_COLORS = [PURE_GREEN, PURE_RED, PURE_BLUE]
         vector_length = 2.5
@@ -146,16 +132,9 @@ class PCA3DAnimation(ThreeDScene):
             )
             pc_lines.add(dotted_line)
 
-            for x, y, z in data_points:
-                point = np.array([x, y, z])
-                proj_length = np.dot(point, pc_vector)
-                proj_point = proj_length * pc_vector
-                proj_dot = Dot3D(
-                    point=axes.c2p(*proj_point),
-                    radius=0.03,
-                    color=color
-                )
-                pc_projections[i].add(proj_dot)
+            # Projections of every sample onto this PC, mapped in one go
+            for proj_point in to_scene_points(axes, data["projections"][i]):
+                pc_projections[i].add(Dot3D(point=proj_point, radius=0.03, color=color))
 
         # Animate PCs
         for i in range(3):
@@ -188,7 +167,7 @@ class PCA3DAnimation(ThreeDScene):
         self.move_camera(phi=60 * DEGREES, theta=45 * DEGREES, zoom=0.9, run_time=2)
 
         # 💬 FIXED SCREEN TEXT — NOT 3D, NOT ROTATING
-        var_percent = 100 * eigenvalues / np.sum(eigenvalues)
+        var_percent = 100 * data["explained"]
         pc1_text = Text(
             f"PC1 captures {var_percent[0]:.1f}% of variance",
             font_size=36,
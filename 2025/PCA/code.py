@@ -3,6 +3,14 @@ from manimlib import *
 import numpy as np
 from scipy.spatial import ConvexHull
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.contours import to_scene_points
+from common.pca_data import pca_dataset
+from common.point_cloud import DataCloud
+from common.projection import ProjectionEngine, direction, projection_segments
+
 
 class PCA(Scene):
     def construct(self):
@@ -780,55 +788,17 @@ class PCA(Scene):
             color=PURE_RED
         ))
         
-        # Create projection lines (purple) - these update dynamically
-        projection_lines = always_redraw(lambda: VGroup(*[
-            Line(
-                axes1.c2p(x, y),
-                # Project point onto line
-                mean_point + np.dot(
-                    np.array(axes1.c2p(x, y)) - mean_point,
-                    np.array([np.cos(angle_tracker.get_value()), np.sin(angle_tracker.get_value()), 0])
-                ) * np.array([np.cos(angle_tracker.get_value()), np.sin(angle_tracker.get_value()), 0]),
-                stroke_width=4,
-                color=PURPLE
-            ) for x, y in data_points
-        ]))
-        
-        # Variance calculation function
-        def calculate_projected_variance():
-            angle = angle_tracker.get_value()
-            direction = np.array([np.cos(angle), np.sin(angle), 0])
-            projections = []
-            
-            for x, y in data_points:
-                point = np.array(axes1.c2p(x, y))
-                projection_scalar = np.dot(point - mean_point, direction)
-                projections.append(projection_scalar)
-            
-            variance = np.var(projections)
-            return variance
-        
-        
-        # Get projection points for brace
-        def get_projection_points():
-            angle = angle_tracker.get_value()
-            direction = np.array([np.cos(angle), np.sin(angle), 0])
-            projections = []
-            
-            for x, y in data_points:
-                point = np.array(axes1.c2p(x, y))
-                projection_scalar = np.dot(point - mean_point, direction)
-                projection_point = mean_point + projection_scalar * direction
-                projections.append(projection_point)
-            
-            return projections
+        # Samples cached in scene space, centred on the mean; every projection
+        # below is one matrix-vector product for all of them
+        engine = ProjectionEngine(axes1, data_points, center=mean_point)
+
+        # Create projection lines (purple) - one mobject, updated in place
+        projection_lines = projection_segments(engine, angle_tracker.get_value,
+                                               color=PURPLE, stroke_width=4)
         
-        # Brace for measuring variance - updates dynamically
+        # Brace for measuring variance - spans the outermost projections
         variance_brace = always_redraw(lambda: Brace(
-            Line(
-                min(get_projection_points(), key=lambda p: np.dot(p - mean_point, np.array([np.cos(angle_tracker.get_value()), np.sin(angle_tracker.get_value()), 0]))),
-                max(get_projection_points(), key=lambda p: np.dot(p - mean_point, np.array([np.cos(angle_tracker.get_value()), np.sin(angle_tracker.get_value()), 0])))
-            ),
+            Line(*engine.extremes(angle_tracker.get_value())),
             direction=np.array([-np.sin(angle_tracker.get_value()), np.cos(angle_tracker.get_value()), 0]),
             buff=0.6  # Much larger buff to keep brace well away from dots and line
         ).set_color(GREEN_E))
@@ -847,15 +817,10 @@ class PCA(Scene):
         
         # Move line clockwise and counterclockwise with smooth animations to find maximum variance
         angles_to_try = [0, PI/8,  PI/4, 0, -PI/8, -PI/6, PI/8, PI/6, PI/4]
-        max_variance = 0
-        best_angle = 0
+        best_angle = engine.best_angle(angles_to_try)
         
         for angle in angles_to_try:
             self.play(angle_tracker.animate.set_value(angle), run_time=1.5)
-            current_variance = calculate_projected_variance()
-            if current_variance > max_variance:
-                max_variance = current_variance
-                best_angle = angle
         
         # Set to optimal angle with smooth animation
         self.play(angle_tracker.animate.set_value(best_angle), run_time=1.7)
@@ -1610,23 +1575,12 @@ class PCA_MultiplePoints(Scene):
         # Camera frame adjustment
         self.camera.frame.scale(0.88)
 
-        # Generate 5x more data points (150) spread diagonally
-        np.random.seed(42)
-        n_points = 150  # 5x more than 30
-        
-        # Create diagonal spread from corner to corner, already centered at origin
-        # Diagonal from (-2.5, -2) to (2.5, 2) 
-        x_vals = np.linspace(-2.5, 2.5, n_points)
-        y_vals = np.linspace(-2, 2, n_points)
-        
-        # Add slight noise for realistic spread
-        noise_x = np.random.normal(scale=0.1, size=n_points)
-        noise_y = np.random.normal(scale=0.1, size=n_points)
-        
-        x_vals += noise_x
-        y_vals += noise_y
-        
-        data_points = list(zip(x_vals, y_vals))
+        # Generate 5x more data points (150) spread diagonally, already centered
+        # at origin: diagonal from (-2.5, -2) to (2.5, 2) with slight noise.
+        # The seeded dataset and its PCA come from the shared data layer.
+        data = pca_dataset(150, starts=(-2.5, -2), ends=(2.5, 2), noise=(0.1, 0.1), seed=42)
+        points_np = data["points"]
+        x_vals, y_vals = points_np.T
 
         # Create axes with same style as before
         axes = Axes(
@@ -1640,11 +1594,8 @@ class PCA_MultiplePoints(Scene):
             }
         ).set_color(GREY_D)
 
-        # Create visible dots - bigger than before
-        dots = VGroup()
-        for x, y in data_points:
-            dot = Dot(axes.c2p(x, y), radius=0.035).set_color(BLUE_D)  # More visible size
-            dots.add(dot)
+        # Create visible dots - one DotCloud, so thousands of samples stay cheap
+        dots = DataCloud(axes, x_vals, y_vals, color=BLUE_D, radius=0.035)
 
         # Show axes first
         self.play(
@@ -1653,16 +1604,12 @@ class PCA_MultiplePoints(Scene):
             run_time=1.5
         )
 
-        # Show all data points (already at mean/centered)
-        self.play(
-            LaggedStart(*[GrowFromCenter(dot) for dot in dots], lag_ratio=0.05),
-            run_time=3
-        )
+        # Show all data points (already at mean/centered), left to right
+        self.play(ShowCreation(dots), run_time=3)
 
         self.wait(1)
 
         # Create convex hull cloud - PURE RED AURA with higher opacity
-        points_np = np.array([[x, y] for x, y in data_points])
         hull = ConvexHull(points_np)
         hull_points = [axes.c2p(points_np[i][0], points_np[i][1]) for i in hull.vertices]
 
@@ -1685,22 +1632,9 @@ class PCA_MultiplePoints(Scene):
         self.play(FadeOut(cloud_polygon), run_time=1.5)
         self.wait(1)
 
-        # Since data is already centered, calculate PCA directly
-        centered_coords = [[x, y] for x, y in data_points]
-
-        # Calculate PCA using covariance matrix
-        data_matrix = np.array(centered_coords).T
-        cov_matrix = np.cov(data_matrix)
-        eigenvalues, eigenvectors = np.linalg.eigh(cov_matrix)
-
-        # Sort by eigenvalues (descending order)
-        sorted_indices = np.argsort(eigenvalues)[::-1]
-        eigenvalues = eigenvalues[sorted_indices]
-        eigenvectors = eigenvectors[:, sorted_indices]
-
-        # Get principal components
-        pc1_vector = eigenvectors[:, 0]  # Higher variance
-        pc2_vector = eigenvectors[:, 1]  # Lower variance
+        # Principal components, largest variance first
+        pc1_vector = data["eigenvectors"][:, 0]  # Higher variance
+        pc2_vector = data["eigenvectors"][:, 1]  # Lower variance
 
         # Create PC vectors
         PURE_BLUE = "#0000FF"
@@ -1733,6 +1667,24 @@ class PCA_MultiplePoints(Scene):
             stroke_width=3
         ).set_color(PURE_BLUE)
 
+        # Sweep a line through the origin: the projections spread out the
+        # most when it lines up with PC1
+        engine = ProjectionEngine(axes, points_np, center=axes.c2p(0, 0))
+        pc1_angle = np.arctan2(pc1_vector[1], pc1_vector[0])
+        sweep_angle = ValueTracker(pc1_angle - PI / 2)
+        sweep_line = always_redraw(lambda: Line(
+            engine.center - 3.5 * direction(sweep_angle.get_value()),
+            engine.center + 3.5 * direction(sweep_angle.get_value()),
+            stroke_width=3
+        ).set_color(GREY_B))
+        sweep_feet = DotCloud(engine.feet(sweep_angle.get_value()), radius=0.025, color=PURE_RED)
+        sweep_feet.add_updater(lambda m: m.set_points(engine.feet(sweep_angle.get_value())))
+
+        self.play(ShowCreation(sweep_line), FadeIn(sweep_feet), run_time=1.5)
+        self.play(sweep_angle.animate.set_value(pc1_angle + PI / 2), run_time=4)
+        self.play(sweep_angle.animate.set_value(pc1_angle), run_time=2)
+        self.play(FadeOut(sweep_line), FadeOut(sweep_feet), run_time=1)
+
         # Show dotted lines first
         self.play(
             ShowCreation(pc1_dotted_line),
@@ -1749,24 +1701,11 @@ class PCA_MultiplePoints(Scene):
 
         self.wait(1)
 
-        # Create projections for both PCs with respective colors
-        pc1_projections = VGroup()
-        pc2_projections = VGroup()
-
-        for x, y in data_points:
-            # Project onto PC1 - RED dots
-            proj_length_1 = np.dot([x, y], pc1_vector)
-            proj_x1 = proj_length_1 * pc1_vector[0]
-            proj_y1 = proj_length_1 * pc1_vector[1]
-            proj_dot1 = Dot(axes.c2p(proj_x1, proj_y1), radius=0.025).set_color(PURE_RED)  # RED for PC1
-            pc1_projections.add(proj_dot1)
-
-            # Project onto PC2 - BLUE dots
-            proj_length_2 = np.dot([x, y], pc2_vector)
-            proj_x2 = proj_length_2 * pc2_vector[0]
-            proj_y2 = proj_length_2 * pc2_vector[1]
-            proj_dot2 = Dot(axes.c2p(proj_x2, proj_y2), radius=0.025).set_color(PURE_BLUE)  # BLUE for PC2
-            pc2_projections.add(proj_dot2)
+        # Create projections for both PCs with respective colors, RED for PC1
+        # and BLUE for PC2
+        pc1_feet, pc2_feet = data["projections"][:2]
+        pc1_projections = DotCloud(to_scene_points(axes, pc1_feet), radius=0.025, color=PURE_RED)
+        pc2_projections = DotCloud(to_scene_points(axes, pc2_feet), radius=0.025, color=PURE_BLUE)
 
         # First projection: Transform original data to PC1
         self.play(
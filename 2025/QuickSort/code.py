@@ -1,6 +1,11 @@
 from manimlib import *
 import numpy as np
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.sort_trace import SortDriver, quicksort_trace
+
 
 class QuickSortAnimation(Scene):
     def construct(self):
@@ -31,7 +36,7 @@ class QuickSortAnimation(Scene):
         self.wait(1)
         
         # Start QuickSort
-        self.quicksort(0, self.n - 1)
+        self.quicksort()
         
         # Final celebration - all green
         self.play(*[rect.animate.set_fill(GREEN, opacity=0.8) for rect in self.rectangles], run_time=1)
@@ -76,99 +81,52 @@ class QuickSortAnimation(Scene):
                 run_time=0.3
             )
     
-    def quicksort(self, low, high):
+    def quicksort(self):
         """QuickSort showing the true divide-and-conquer nature"""
-        if low < high:
-            # Show current subarray being worked on
-            if low > 0 or high < self.n - 1:
-                for k in range(low, high + 1):
-                    if self.rectangles[k].fill_color != GREEN:
-                        self.play(self.rectangles[k].animate.set_stroke(YELLOW, width=5), run_time=0.1)
-                self.wait(0.3)
-            
-            # Partition and get pivot position
-            pivot_index = self.partition(low, high)
-            
-            # Reset stroke for processed elements
-            for k in range(low, high + 1):
-                self.play(self.rectangles[k].animate.set_stroke(WHITE, width=3), run_time=0.1)
-            
-            self.wait(0.4)
-            
-            # Recursively sort left half (elements < pivot)
-            if low < pivot_index - 1:
-                self.quicksort(low, pivot_index - 1)
-            
-            # Recursively sort right half (elements > pivot)  
-            if pivot_index + 1 < high:
-                self.quicksort(pivot_index + 1, high)
-            
-            # After both halves are sorted, make this entire subarray GREEN
-            for k in range(low, high + 1):
-                if self.rectangles[k].fill_color != GREEN:
-                    self.play(self.rectangles[k].animate.set_fill(GREEN, opacity=0.8), run_time=0.2)
-    
-    def partition(self, low, high):
-        """Partition with true QuickSort visualization - divide around pivot"""
-        # Choose last element as pivot and highlight it
-        pivot_value = self.array[high]
-        
-        # Highlight pivot in PURPLE
-        self.play(self.rectangles[high].animate.set_fill(PURPLE, opacity=0.9), run_time=0.5)
-        self.wait(0.5)
-        
-        # First pass: Color elements based on comparison with pivot
-        for j in range(low, high):
-            if self.array[j] < pivot_value:
-                # Color smaller elements BLUE
-                self.play(self.rectangles[j].animate.set_fill(BLUE, opacity=0.8), run_time=0.2)
-            else:
-                # Color larger elements RED
-                self.play(self.rectangles[j].animate.set_fill(RED, opacity=0.8), run_time=0.2)
-        
-        self.wait(0.8)
-        
-        # Now physically rearrange: smaller elements to left, larger to right
-        i = low - 1
-        
-        for j in range(low, high):
-            if self.array[j] < pivot_value:
-                i += 1
-                if i != j:
-                    self.swap_elements(i, j)
-        
-        # Place pivot in its final position (between smaller and larger)
-        pivot_final_pos = i + 1
-        if pivot_final_pos != high:
-            self.swap_elements(pivot_final_pos, high)
-        
-        # Make pivot GREEN immediately when it reaches correct position
-        self.play(self.rectangles[pivot_final_pos].animate.set_fill(GREEN, opacity=0.8), run_time=0.6)
-        
-        # Show the beautiful division: LEFT < PIVOT < RIGHT
-        self.wait(0.5)
-        
-        return pivot_final_pos
-    
-    def swap_elements(self, i, j):
-        """Swap two elements with animation"""
-        if i == j:
-            return
-        
-        # Get positions
-        pos_i = self.rectangles[i].get_center()
-        pos_j = self.rectangles[j].get_center()
-        
-        # Animate swap
-        self.play(
-            self.rectangles[i].animate.move_to(pos_j),
-            self.texts[i].animate.move_to(pos_j),
-            self.rectangles[j].animate.move_to(pos_i),
-            self.texts[j].animate.move_to(pos_i),
-            run_time=0.5
+        # Run the real algorithm once, then play its trace: every partition
+        # highlights its subarray, turns the pivot PURPLE, colors smaller
+        # elements BLUE and larger ones RED in one pass, swaps and marks the
+        # pivot GREEN once it is in place.
+        events, self.array = quicksort_trace(self.array)
+        driver = SortDriver(
+            self,
+            [VGroup(rect, text) for rect, text in zip(self.rectangles, self.texts)],
+            fills=self.rectangles,
+            less_color=BLUE, greater_color=RED, pivot_color=PURPLE,
+            sorted_color=GREEN, focus_color=YELLOW,
+            run_times={"focus": 0.4, "compare": 0.6, "swap": 0.5, "sorted": 0.6},
         )
-        
-        # Update arrays
-        self.rectangles[i], self.rectangles[j] = self.rectangles[j], self.rectangles[i]
-        self.texts[i], self.texts[j] = self.texts[j], self.texts[i]
-        self.array[i], self.array[j] = self.array[j], self.array[i]
+        driver.play(events, wait=0.4)
+        self.rectangles = [self.rectangles[k] for k in driver.order]
+        self.texts = [self.texts[k] for k in driver.order]
+
+
+class QuickSortBars(Scene):
+    def construct(self):
+        # 120 bars: the same trace driver, with tighter timings
+        title = Text("QuickSort on 120 Elements", font_size=54, weight=BOLD)
+        title.set_color("#00ff00")
+        title.to_edge(UP, buff=0.5)
+        self.play(ShowCreation(title), run_time=1)
+
+        values = np.random.RandomState(7).permutation(np.arange(1, 121))
+        bar_width = 12 / len(values)
+        bars = VGroup(*[
+            Rectangle(width=bar_width * 0.8, height=0.045 * v,
+                      fill_color=BLUE, fill_opacity=0.8, stroke_color=WHITE, stroke_width=0.5)
+            for v in values
+        ])
+        bars.arrange(RIGHT, buff=bar_width * 0.2, aligned_edge=DOWN)
+        bars.move_to(DOWN * 0.6)
+        self.play(ShowCreation(bars, lag_ratio=0.02), run_time=1.5)
+
+        events, _ = quicksort_trace(list(values))
+        driver = SortDriver(
+            self, bars,
+            less_color=BLUE, greater_color=RED, pivot_color=PURPLE,
+            sorted_color=GREEN, stroke_width=0.5, focus_width=1.5,
+            run_times={"focus": 0.1, "pivot": 0.1, "compare": 0.15, "swap": 0.15,
+                       "sorted": 0.1, "reset": 0.1},
+        )
+        driver.play(events, wait=0)
+        self.wait(2)
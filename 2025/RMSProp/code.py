@@ -1,6 +1,11 @@
 from manimlib import *
 import numpy as np
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.optimizers import elliptic_bowl, scene_paths, trajectories
+
 
 class RMSProp(Scene):
     def construct(self):
@@ -75,27 +80,11 @@ class RMSProp(Scene):
         
         # Starting position relative to center
         start_offset = np.array([5.5, 1.4, 0])
-        current_pos_local = start_offset
 
-        path_points = [graph_center + current_pos_local]
-        
         # REQUEST: "use Zig Zag lines not only once and then flat"
-        # Increased steps to 40 to show sustained bouncing
-        for _ in range(40):
-            x_loc, y_loc, _ = current_pos_local
-            
-            # Calculate Gradients based on our hypothetical loss function
-            grad_x = 2 * x_loc
-            grad_y = 70 * y_loc # Extremely steep in Y
-
-            # Update step
-            new_x_loc = x_loc - alpha * grad_x
-            new_y_loc = y_loc - alpha * grad_y
-            
-            current_pos_local = np.array([new_x_loc, new_y_loc, 0])
-            
-            # Add global coordinate to path list
-            path_points.append(graph_center + current_pos_local)
+        # 40 plain GD steps on the hypothetical loss (dL/dx = 2x, dL/dy = 70y)
+        path = trajectories(elliptic_bowl(1, 35).grad, start_offset[:2], "sgd", lr=alpha, steps=40)
+        path_points = scene_paths(path, offset=graph_center)[0]
 
 
         # Create the path VMobject
@@ -2,6 +2,13 @@ from manimlib import *
 import numpy as np
 from sklearn.svm import SVC
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common import assets
+from common import contours
+from common import decision_surface
+
 class SVM_Hard_Margin(Scene):
     def construct(self):
         # Create axes for first quadrant only
@@ -1304,7 +1311,6 @@ import numpy as np
 from sklearn.svm import SVC
 from sklearn.datasets import make_circles
 from sklearn.preprocessing import StandardScaler
-import matplotlib.pyplot as plt
 
 class PolyAndRBFKernelDemo(Scene):
     def construct(self):
@@ -1323,62 +1329,45 @@ class PolyAndRBFKernelDemo(Scene):
             }
         ).shift(LEFT * 2.5)
 
-        def train_real_svm(X, y, kernel='poly', **params):
-            """Train actual SVM and return model + decision boundary"""
+        def fit_decision_grid(X, y, kernel, h, **params):
             svm = SVC(kernel=kernel, **params)
             svm.fit(X, y)
             
-            h = 0.05
             x_min, x_max = X[:, 0].min() - 0.5, X[:, 0].max() + 0.5
             y_min, y_max = X[:, 1].min() - 0.5, X[:, 1].max() + 0.5
-            xx, yy = np.meshgrid(np.arange(x_min, x_max, h),
-                               np.arange(y_min, y_max, h))
             
-            Z = svm.decision_function(np.c_[xx.ravel(), yy.ravel()])
-            Z = Z.reshape(xx.shape)
-            return svm, xx, yy, Z
+            # Coarse cells of 8h, refined down to h only where the sign flips
+            depth = 3
+            base = (int(np.ceil((x_max - x_min) / (h * 2 ** depth))),
+                    int(np.ceil((y_max - y_min) / (h * 2 ** depth))))
+            surface = decision_surface.adaptive_surface(
+                svm.decision_function, (x_min, x_max), (y_min, y_max), base=base, depth=depth
+            )
+            xx, yy = np.meshgrid(surface.xs, surface.ys)
+            return dict(n_support=len(svm.support_), xx=xx, yy=yy, Z=surface.Z)
+
+        def train_real_svm(X, y, kernel='poly', **params):
+            """Train actual SVM and return support count + decision grid (cached on disk)"""
+            grid = assets.cached_arrays(
+                "svm_grid",
+                lambda data, **kw: fit_decision_grid(X, y, **kw),
+                data=assets.array_hash(X, y), kernel=kernel, h=0.025, **params
+            )
+            return int(grid["n_support"]), grid["xx"], grid["yy"], grid["Z"]
 
         def create_boundary_from_real_svm(xx, yy, Z, plane, color, level=0):
-            """Extract real SVM decision boundary"""
-            try:
-                fig, ax = plt.subplots(figsize=(6, 6))
-                cs = ax.contour(xx, yy, Z, levels=[level])
-                
-                boundary_curves = []
-                # Handle both old and new matplotlib versions
-                if hasattr(cs, 'collections'):
-                    for collection in cs.collections:
-                        for path in collection.get_paths():
-                            vertices = path.vertices
-                            if len(vertices) > 10:
-                                manim_points = []
-                                for vertex in vertices:
-                                    x, y = vertex[0], vertex[1]
-                                    if -3 <= x <= 3 and -3 <= y <= 3:
-                                        manim_points.append(plane.coords_to_point(x, y))
-                                if len(manim_points) > 5:
-                                    curve = VMobject().set_points_smoothly(manim_points)
-                                    curve.set_stroke(color, width=8)
-                                    boundary_curves.append(curve)
-                else:
-                    # Newer matplotlib versions
-                    for line_collection in cs.allsegs:
-                        for line in line_collection:
-                            if len(line) > 10:
-                                manim_points = []
-                                for point in line:
-                                    x, y = point[0], point[1]
-                                    if -3 <= x <= 3 and -3 <= y <= 3:
-                                        manim_points.append(plane.coords_to_point(x, y))
-                                if len(manim_points) > 5:
-                                    curve = VMobject().set_points_smoothly(manim_points)
-                                    curve.set_stroke(color, width=8)
-                                    boundary_curves.append(curve)
-                
-                plt.close(fig)
-                return boundary_curves
-            except:
-                return []
+            """Extract real SVM decision boundary (marching squares on the decision grid)"""
+            boundary_curves = []
+            for line in contours.marching_squares(xx[0], yy[:, 0], Z, level):
+                if len(line) <= 10:
+                    continue
+                inside = np.all((line >= -3) & (line <= 3), axis=1)
+                if inside.sum() > 5:
+                    manim_points = contours.to_scene_points(plane, line[inside])
+                    curve = VMobject().set_points_smoothly(manim_points)
+                    curve.set_stroke(color, width=8)
+                    boundary_curves.append(curve)
+            return boundary_curves
 
         def create_dots_from_data(X, y, plane):
             """Convert data points to manim dots"""
@@ -1411,7 +1400,7 @@ class PolyAndRBFKernelDemo(Scene):
         y_poly = 2 * y_poly - 1  # Convert to -1,1
 
         # Initial polynomial SVM training
-        svm_poly, xx_poly, yy_poly, Z_poly = train_real_svm(
+        n_support_poly, xx_poly, yy_poly, Z_poly = train_real_svm(
             X_poly, y_poly, kernel='poly', degree=2, C=1.0, coef0=1
         )
 
@@ -1425,7 +1414,7 @@ class PolyAndRBFKernelDemo(Scene):
         poly_params = Tex(r"c = 1, \quad d = 2", font_size=48).set_color(YELLOW)
         poly_params.next_to(poly_label, DOWN, buff=0.5)
 
-        poly_info = Tex(f"\\text{{Support Vectors: }}{len(svm_poly.support_)}", font_size=24).set_color(WHITE)
+        poly_info = Tex(f"\\text{{Support Vectors: }}{n_support_poly}", font_size=24).set_color(WHITE)
         poly_info.next_to(poly_params, DOWN, buff=0.3)
 
         self.play(Write(poly_formula), Write(poly_label), Write(poly_params), )
@@ -1452,7 +1441,7 @@ class PolyAndRBFKernelDemo(Scene):
         for degree in [3, 4, 5]:
             print(f"Updating Polynomial SVM to degree {degree}...")
             
-            new_svm, xx_new, yy_new, Z_new = train_real_svm(
+            _, xx_new, yy_new, Z_new = train_real_svm(
                 X_poly, y_poly, kernel='poly', degree=degree, C=1.0, coef0=1
             )
             
@@ -1489,7 +1478,7 @@ class PolyAndRBFKernelDemo(Scene):
         y_rbf = 2 * y_rbf - 1  # Convert to -1,1
 
         # Initial RBF SVM training
-        svm_rbf, xx_rbf, yy_rbf, Z_rbf = train_real_svm(
+        n_support_rbf, xx_rbf, yy_rbf, Z_rbf = train_real_svm(
             X_rbf, y_rbf, kernel='rbf', gamma=1.0, C=1.0
         )
 
@@ -1534,7 +1523,7 @@ class PolyAndRBFKernelDemo(Scene):
             # Convert sigma to gamma (gamma = 1/(2*sigma^2))
             gamma_val = 1.0 / (2 * sigma ** 2)
             
-            new_svm, xx_new, yy_new, Z_new = train_real_svm(
+            _, xx_new, yy_new, Z_new = train_real_svm(
                 X_rbf, y_rbf, kernel='rbf', gamma=gamma_val, C=1.0
             )
             
@@ -1,6 +1,11 @@
 from manimlib import *
 import numpy as np
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.curves import ACTIVATIONS, graph
+
 PURE_RED = "#FF0000"
 
 class ReLUScene(Scene):
@@ -23,26 +28,11 @@ class ReLUScene(Scene):
         x_label = Tex("z", font_size=48, color=WHITE).next_to(axes.x_axis.get_end(), RIGHT, buff=0.2)
         y_label = Tex("ReLU(z)", font_size=48, color=WHITE).next_to(axes.y_axis.get_end(), UP, buff=0.2)
 
-        # ReLU function
-        x_vals = np.linspace(-3, 5, 1000)
-        relu_points = []
-        for x in x_vals:
-            relu_val = max(0, x)  # ReLU function
-            relu_points.append(axes.c2p(x, relu_val))
-
-        relu_graph = VMobject()
-        relu_graph.set_points_as_corners(relu_points)
-        relu_graph.set_stroke(GREEN, width=6)
-
-        # ReLU derivative function (step function)
-        relu_derivative_points = []
-        for x in x_vals:
-            derivative_val = 1 if x > 0 else 0  # ReLU derivative
-            relu_derivative_points.append(axes.c2p(x, derivative_val * 0.8))  # Scale for visibility
+        # ReLU function (two straight pieces, so only a handful of samples)
+        relu_graph = graph(axes, ACTIVATIONS["relu"], (-3, 5), color=GREEN, stroke_width=6)
 
-        relu_derivative_graph = VMobject()
-        relu_derivative_graph.set_points_as_corners(relu_derivative_points)
-        relu_derivative_graph.set_stroke(ORANGE, width=6)
+        # ReLU derivative function (step function, scaled for visibility)
+        relu_derivative_graph = graph(axes, lambda x: 0.8 * ACTIVATIONS["relu_derivative"](x), (-3, 5), color=ORANGE, stroke_width=6)
 
         # ReLU title and formula positioned in top left
         relu_title = Text("ReLU Function", font_size=40, color=GREEN)
@@ -61,24 +51,10 @@ class ReLUScene(Scene):
         alpha = 0.1  # Leaky ReLU parameter
         
         # Leaky ReLU function
-        leaky_relu_points = []
-        for x in x_vals:
-            leaky_relu_val = max(alpha * x, x)  # Leaky ReLU function
-            leaky_relu_points.append(axes.c2p(x, leaky_relu_val))
-
-        leaky_relu_graph = VMobject()
-        leaky_relu_graph.set_points_as_corners(leaky_relu_points)
-        leaky_relu_graph.set_stroke(BLUE, width=6)
-
-        # Leaky ReLU derivative function
-        leaky_relu_derivative_points = []
-        for x in x_vals:
-            derivative_val = 1 if x > 0 else alpha  # Leaky ReLU derivative
-            leaky_relu_derivative_points.append(axes.c2p(x, derivative_val * 0.8))  # Scale for visibility
+        leaky_relu_graph = graph(axes, lambda x: ACTIVATIONS["leaky_relu"](x, alpha), (-3, 5), color=BLUE, stroke_width=6)
 
-        leaky_relu_derivative_graph = VMobject()
-        leaky_relu_derivative_graph.set_points_as_corners(leaky_relu_derivative_points)
-        leaky_relu_derivative_graph.set_stroke(RED, width=6).shift(DOWN*0.066)
+        # Leaky ReLU derivative function (scaled for visibility)
+        leaky_relu_derivative_graph = graph(axes, lambda x: 0.8 * ACTIVATIONS["leaky_relu_derivative"](x, alpha), (-3, 5), color=RED, stroke_width=6).shift(DOWN*0.066)
 
         # Leaky ReLU title and formulas
         leaky_relu_title = Text("Leaky ReLU Function", font_size=40, color=BLUE)
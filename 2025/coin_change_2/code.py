@@ -1,4 +1,8 @@
 from manimlib import *
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.dp_table import DPTable, coin_change_table, format_value
 
 
 class CoinChangeWays(Scene):
@@ -28,38 +32,15 @@ class CoinChangeWays(Scene):
         coin_table.to_edge(LEFT, buff=1)
         coin_table.shift(UP * 0.5)
         
-        # Create table structure - position on right side
-        table = VGroup()
-        cells = {}
-        cell_texts = {}
+        # Row k of the table is the ways array after the first k coins
+        steps = coin_change_table(coins, amount, ways=True)
+        dp = steps[-1]
         
-        # Initialize DP array
-        dp = [0] * (amount + 1)
-        dp[0] = 1  # Base case
-        
-        # Create cells
-        for j in range(amount + 1):
-            cell = Rectangle(width=cell_width, height=cell_height)
-            cell.set_stroke(WHITE, 1)
-            
-            x_pos = j * cell_width
-            y_pos = 0
-            cell.move_to(np.array([x_pos, y_pos, 0]))
-            
-            table.add(cell)
-            cells[j] = cell
-            
-            # Initial DP values
-            text = Text(str(dp[j]), font_size=34)
-            text.move_to(cell.get_center())
-            table.add(text)
-            cell_texts[j] = text
-        
-        # Add column labels
-        for j in range(amount + 1):
-            label = Text(f"${j}", font_size=23)
-            label.next_to(cells[j], UP, buff=0.25)
-            table.add(label)
+        # One row of amounts $0..$amount, starting at DP[0] = 1
+        table = DPTable(1, amount + 1, cell_width=cell_width, cell_height=cell_height,
+                        col_labels=[f"${j}" for j in range(amount + 1)],
+                        values={(0, j): steps[0][j] for j in range(amount + 1)},
+                        font_size=34, label_size=23)
         
         # Position table properly
         table.scale(1.1)
@@ -97,19 +78,15 @@ class CoinChangeWays(Scene):
             
             for j in range(coin, amount + 1):
                 # Highlight cells
-                current_cell = cells[j]
-                prev_cell = cells[j - coin]
+                current_cell = table.cell(0, j)
+                prev_cell = table.cell(0, j - coin)
                 self.play(current_cell.animate.set_fill(BLUE, opacity=0.4), run_time=1.2)
                 self.play(prev_cell.animate.set_fill(GREEN, opacity=0.3), run_time=1.2)
                 
-                # Update DP value
-                dp[j] += dp[j - coin]
-                new_text = Text(str(dp[j]), font_size=34).scale(1.55)
-                new_text.move_to(current_cell.get_center())
-                
-                self.play(FadeOut(cell_texts[j]), run_time=0.5)
+                # Update DP value: dp[j] += dp[j - coin]
+                self.play(FadeOut(table.entry(0, j)), run_time=0.5)
+                _, new_text = table.set_entry(0, j, steps[i + 1][j], font_size=34 * 1.55)
                 self.play(FadeIn(new_text), run_time=0.5)
-                cell_texts[j] = new_text
                 
                 # Reset cell colors
                 self.play(
@@ -119,14 +96,14 @@ class CoinChangeWays(Scene):
                 self.play(current_cell.animate.set_fill(opacity=0), run_time=0.2)
         
         # Highlight final answer
-        final_cell = cells[amount]
+        final_cell = table.cell(0, amount)
         self.play(
             final_cell.animate.set_fill(RED, opacity=0.5),
             run_time=1
         )
         
         # Show final result explanation
-        final_explanation = Text(f"Ways to make ${amount}: {dp[amount]}", font_size=38)
+        final_explanation = Text(f"Ways to make ${amount}: {format_value(dp[amount])}", font_size=38)
         final_explanation.to_edge(DOWN, buff=1)
         self.play(Transform(explanation, final_explanation), Uncreate(rect))
         self.wait(2)
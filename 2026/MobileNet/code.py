@@ -1,6 +1,11 @@
 from manimlib import *
 import numpy as np
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common.instancing import InstancedMobject
+
 
 # ── palette ──────────────────────────────────────────────────────────
 CH_COLORS = ["#E74C3C", "#27AE60", "#2980B9"]   # R, G, B channels
@@ -12,16 +17,17 @@ CARD_BG = "#222244"
 
 def make_grid(rows, cols, cell_size=0.45, fill_color=BLUE, fill_opacity=0.6,
               stroke_color=WHITE, stroke_width=1.5):
-    """Create a rows×cols grid of squares."""
-    cells = VGroup()
-    for r in range(rows):
-        for c in range(cols):
-            sq = Square(side_length=cell_size)
-            sq.set_fill(fill_color, opacity=fill_opacity)
-            sq.set_stroke(stroke_color, width=stroke_width)
-            cells.add(sq)
-    cells.arrange_in_grid(n_rows=rows, n_cols=cols, buff=0)
-    return cells
+    """Create a rows×cols grid of squares, instanced from one cell."""
+    cell = Square(side_length=cell_size)
+    cell.set_fill(fill_color, opacity=fill_opacity)
+    cell.set_stroke(stroke_color, width=stroke_width)
+    r, c = np.divmod(np.arange(rows * cols), cols)
+    positions = np.column_stack([
+        (c - (cols - 1) / 2) * cell_size,
+        ((rows - 1) / 2 - r) * cell_size,
+        np.zeros(rows * cols),
+    ])
+    return InstancedMobject(cell, positions)
 
 
 def make_channel_stack(n_channels, rows, cols, cell_size=0.45, colors=None,
@@ -6,6 +6,9 @@ Run the complete video:
     manimgl a.py SequentialDataFullVideo -w --hd
     manimgl a.py SequentialDataFullVideo -w -l
 
+Render the segments in parallel and join them (from the repo root):
+    python -m common.segments 2026/RNN/code.py SequentialDataFullVideo --hd
+
 Individual scenes:
     manimgl a.py HookScene
     manimgl a.py AudioScene
@@ -17,6 +20,16 @@ Individual scenes:
 from manimlib import *
 import numpy as np
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common import tex_bank
+from common.layout import validate_layout
+from common.segments import play_segments
+
+# Compile every statically known Tex string up front, in parallel
+tex_bank.warm_up(__file__)
+
 
 # ── Color palette ────────────────────────────────────────────────────
 WAVE_BLUE     = "#2980B9"
@@ -120,219 +133,6 @@ def make_status_badge(text, color, font_size=28, min_width=3.2):
     return VGroup(bg, label)
 
 
-# ── Layout validation ────────────────────────────────────────────────
-MIN_PADDING = 0.05
-MIN_FONT_SIZE = 24
-
-
-def validate_layout(scene, label="", camera_scale=1.0):
-    """Runtime validation: checks bounds, overlap, padding, font size, shape occlusion."""
-    half_w = 7.1 * camera_scale
-    half_h = 4.0 * camera_scale
-
-    cam_center = scene.camera.frame.get_center()
-    cx, cy = cam_center[0], cam_center[1]
-    left   = cx - half_w
-    right  = cx + half_w
-    bottom = cy - half_h
-    top    = cy + half_h
-
-    prefix = f"[VALIDATE {label}] " if label else "[VALIDATE] "
-    issues = []
-
-    text_mobjects = []
-    filled_shapes = []
-    seen_ids = set()
-
-    for mob in scene.mobjects:
-        _check_recursive(mob, left, right, bottom, top, prefix, issues,
-                         text_mobjects, filled_shapes, seen_ids)
-
-    for i in range(len(text_mobjects)):
-        for j in range(i + 1, len(text_mobjects)):
-            m1, m2 = text_mobjects[i], text_mobjects[j]
-            prox = _text_proximity(m1, m2, MIN_PADDING)
-            if prox == "overlap":
-                issues.append(
-                    f"{prefix}OVERLAP: \"{_mob_label(m1)}\" and \"{_mob_label(m2)}\""
-                )
-            elif prox == "too_close":
-                issues.append(
-                    f"{prefix}TOO CLOSE (gap < {MIN_PADDING}): "
-                    f"\"{_mob_label(m1)}\" and \"{_mob_label(m2)}\""
-                )
-
-    for shape in filled_shapes:
-        for txt in text_mobjects:
-            if _raw_boxes_overlap(shape, txt):
-                issues.append(
-                    f"{prefix}SHAPE COVERS TEXT: {type(shape).__name__} "
-                    f"may obscure \"{_mob_label(txt)}\""
-                )
-
-    for iss in issues:
-        _safe_print(iss)
-
-    if not issues:
-        _safe_print(f"{prefix}OK -- all mobjects in bounds, no overlap, padding OK")
-
-    return len(issues) == 0
-
-
-def _safe_print(msg):
-    try:
-        print(msg)
-    except UnicodeEncodeError:
-        print(msg.encode('ascii', errors='replace').decode('ascii'))
-
-
-def _mob_label(mob):
-    raw = None
-    if hasattr(mob, 'text') and isinstance(getattr(mob, 'text', None), str):
-        raw = mob.text[:40]
-    elif hasattr(mob, 'tex_string') and isinstance(getattr(mob, 'tex_string', None), str):
-        raw = mob.tex_string[:40]
-    if raw is None:
-        return type(mob).__name__
-    return raw.encode('ascii', errors='replace').decode('ascii')
-
-
-def _is_text_or_tex(mob):
-    if hasattr(mob, 'text') and isinstance(getattr(mob, 'text', None), str):
-        return True
-    if hasattr(mob, 'tex_string') and isinstance(getattr(mob, 'tex_string', None), str):
-        return True
-    return False
-
-
-def _get_fill_opacity(mob):
-    if hasattr(mob, 'get_fill_opacity'):
-        try:
-            fo = mob.get_fill_opacity()
-            if hasattr(fo, '__len__'):
-                return float(max(fo)) if len(fo) > 0 else 0.0
-            return float(fo)
-        except Exception:
-            pass
-    return 0.0
-
-
-def _check_recursive(mob, left, right, bottom, top, prefix, issues,
-                     text_list, filled_shapes, seen_ids):
-    mid = id(mob)
-    if mid in seen_ids:
-        return
-    seen_ids.add(mid)
-
-    class_name = type(mob).__name__
-
-    SKIP_TYPES = {"CameraFrame", "Axes", "NumberLine", "NumberPlane",
-                  "CoordinateSystem", "ParametricCurve"}
-    if class_name in SKIP_TYPES:
-        return
-
-    try:
-        ul = mob.get_corner(UL)
-        dr = mob.get_corner(DR)
-    except Exception:
-        return
-
-    w = abs(dr[0] - ul[0])
-    h = abs(ul[1] - dr[1])
-    if w < 0.001 and h < 0.001:
-        return
-
-    frame_w = abs(right - left)
-    frame_h = abs(top - bottom)
-    if w > frame_w * 2 or h > frame_h * 2:
-        return
-
-    is_text = _is_text_or_tex(mob)
-
-    if is_text:
-        text_list.append(mob)
-        font_size = getattr(mob, 'font_size', None)
-        if font_size is not None and font_size < MIN_FONT_SIZE:
-            issues.append(
-                f"{prefix}FONT TOO SMALL: \"{_mob_label(mob)}\" "
-                f"font_size={font_size} (min {MIN_FONT_SIZE})"
-            )
-
-    if not is_text and _get_fill_opacity(mob) > 0.3 and w > 0.5 and h > 0.5:
-        filled_shapes.append(mob)
-
-    EPS = 0.1
-    out = (ul[0] < left - EPS or dr[0] > right + EPS or
-           dr[1] < bottom - EPS or ul[1] > top + EPS)
-
-    if out:
-        vis_l = max(ul[0], left)
-        vis_r = min(dr[0], right)
-        vis_b = max(dr[1], bottom)
-        vis_t = min(ul[1], top)
-        vis_w = max(0.0, vis_r - vis_l)
-        vis_h = max(0.0, vis_t - vis_b)
-        area = w * h if w * h > 0 else 1
-        visible_frac = (vis_w * vis_h) / area
-
-        if visible_frac < 0.01:
-            severity = "COMPLETELY OFF SCREEN"
-        elif visible_frac < 0.5:
-            severity = "MOSTLY OFF SCREEN"
-        else:
-            severity = "OUT OF BOUNDS"
-
-        issues.append(
-            f"{prefix}{severity}: {_mob_label(mob) if is_text else class_name} "
-            f"ul=({ul[0]:.1f},{ul[1]:.1f}) dr=({dr[0]:.1f},{dr[1]:.1f}) "
-            f"visible={visible_frac:.0%} "
-            f"frame=({left:.1f},{bottom:.1f})-({right:.1f},{top:.1f})"
-        )
-
-    if hasattr(mob, 'submobjects'):
-        for sub in mob.submobjects:
-            _check_recursive(sub, left, right, bottom, top, prefix, issues,
-                             text_list, filled_shapes, seen_ids)
-
-
-def _text_proximity(m1, m2, min_padding):
-    try:
-        ul1, dr1 = m1.get_corner(UL), m1.get_corner(DR)
-        ul2, dr2 = m2.get_corner(UL), m2.get_corner(DR)
-    except Exception:
-        return None
-
-    x_sep = max(ul2[0] - dr1[0], ul1[0] - dr2[0])
-    y_sep = max(dr2[1] - ul1[1], dr1[1] - ul2[1])
-
-    if x_sep <= 0 and y_sep <= 0:
-        return "overlap"
-
-    if x_sep >= 0 and y_sep >= 0:
-        gap = (x_sep ** 2 + y_sep ** 2) ** 0.5
-    elif x_sep >= 0:
-        gap = x_sep
-    else:
-        gap = y_sep
-
-    if gap < min_padding:
-        return "too_close"
-    return None
-
-
-def _raw_boxes_overlap(m1, m2):
-    try:
-        ul1, dr1 = m1.get_corner(UL), m1.get_corner(DR)
-        ul2, dr2 = m2.get_corner(UL), m2.get_corner(DR)
-    except Exception:
-        return False
-    if dr1[0] < ul2[0] or dr2[0] < ul1[0]:
-        return False
-    if dr1[1] > ul2[1] or dr2[1] > ul1[1]:
-        return False
-    return True
-
-
 # =====================================================================
 # SCENE 1: The Hook
 # =====================================================================
@@ -1303,38 +1103,16 @@ class NotationScene(InteractiveScene):
 
 class SequentialDataFullVideo(InteractiveScene):
 
-    def construct(self):
+    segments = [
+        HookScene._build_hook,                 # ~25s
+        AudioScene._build_audio_scene,         # ~40s
+        StockScene._build_stock_scene,         # ~40s
+        SentenceScene._build_sentence,         # ~50s, hero scene
+        TakeawayScene._build_takeaway,         # ~20s
+    ]
 
-        # ==============================================================
-        # SCENE 1: The Hook  (~25s)
-        # ==============================================================
-        HookScene._build_hook(self)
-        self.play(*[FadeOut(m) for m in self.mobjects], run_time=0.8)
-
-        # ==============================================================
-        # SCENE 2: Audio Waveform  (~40s)
-        # ==============================================================
-        AudioScene._build_audio_scene(self)
-        self.play(*[FadeOut(m) for m in self.mobjects], run_time=0.8)
-
-        # ==============================================================
-        # SCENE 3: Stock Price  (~40s)
-        # ==============================================================
-        StockScene._build_stock_scene(self)
-        self.play(*[FadeOut(m) for m in self.mobjects], run_time=0.8)
-
-        # ==============================================================
-        # SCENE 4: The Sentence — HERO SCENE  (~50s)
-        # ==============================================================
-        SentenceScene._build_sentence(self)
-        self.play(*[FadeOut(m) for m in self.mobjects], run_time=0.8)
-
-        # ==============================================================
-        # SCENE 5: The Takeaway  (~20s)
-        # ==============================================================
-        TakeawayScene._build_takeaway(self)
-        self.play(*[FadeOut(m) for m in self.mobjects], run_time=0.8)
-        self.wait(1)
+    def construct(self):
+        play_segments(self, self.segments, final_wait=1)
 
 
 # =====================================================================
@@ -1478,15 +1256,22 @@ def make_vector_bar(n_slots, slot_labels=None, fill_color=ANN_BLUE,
 #       manimgl a.py ANNFailFullVideo -w --hd
 #       manimgl a.py ANNFailFullVideo -w -l
 #
+#   Render the seven scenes in parallel and join them:
+#       python -m common.segments 2026/RNN/code.py ANNFailFullVideo --hd
+#
 # =====================================================================
 
-class ANNFailFullVideo(InteractiveScene):
+# =====================================================================
+# VIDEO 2 — SCENE 1: Quick Recap Hook
+# =====================================================================
+
+class RecapHookScene(InteractiveScene):
 
     def construct(self):
+        self._build_recap_hook(self)
 
-        # ==============================================================
-        # SCENE 1: Quick Recap Hook (~20s)
-        # ==============================================================
+    @staticmethod
+    def _build_recap_hook(scene):
 
         # Start directly — no icon recap, jump straight into the question
         question = Text(
@@ -1500,17 +1285,25 @@ class ANNFailFullVideo(InteractiveScene):
         sub_q.set_color(PROBLEM_RED)
         sub_q.next_to(question, DOWN, buff=0.85)
 
-        self.play(Write(question), run_time=1.5)
-        self.wait(0.5)
-        self.play(FadeIn(sub_q, shift=UP * 0.3), run_time=0.8)
-        self.wait(2)
+        scene.play(Write(question), run_time=1.5)
+        scene.wait(0.5)
+        scene.play(FadeIn(sub_q, shift=UP * 0.3), run_time=0.8)
+        scene.wait(2)
 
-        validate_layout(self, label="V2 Scene 1")
-        self.play(*[FadeOut(m) for m in self.mobjects], run_time=0.8)
+        validate_layout(scene, label="V2 Scene 1")
 
-        # ==============================================================
-        # SCENE 2: The Feedforward ANN (~50s)
-        # ==============================================================
+
+# =====================================================================
+# VIDEO 2 — SCENE 2: The Feedforward ANN
+# =====================================================================
+
+class FeedforwardScene(InteractiveScene):
+
+    def construct(self):
+        self._build_feedforward(self)
+
+    @staticmethod
+    def _build_feedforward(scene):
 
         title = make_scene_title("The Feedforward Network", color=ANN_BLUE,
                                  font_size=56)
@@ -1539,7 +1332,7 @@ class ANNFailFullVideo(InteractiveScene):
         conn_2 = make_nn_connections(h1_nodes, h2_nodes)
         conn_3 = make_nn_connections(h2_nodes, out_nodes)
 
-        self.play(FadeIn(title), run_time=0.6)
+        scene.play(FadeIn(title), run_time=0.6)
 
         # Build layer by layer with connections
         for layer, conns, nodes in [
@@ -1554,18 +1347,18 @@ class ANNFailFullVideo(InteractiveScene):
             )]
             if len(layer) > 1:
                 anims.append(FadeIn(layer[1], shift=UP * 0.1))
-            self.play(*anims, run_time=0.5)
+            scene.play(*anims, run_time=0.5)
             if conns is not None:
-                self.play(LaggedStart(
+                scene.play(LaggedStart(
                     *[ShowCreation(l) for l in conns],
                     lag_ratio=0.005, run_time=0.6,
                 ))
                 # Push this batch of edges behind the already-drawn nodes
-                self.bring_to_back(*list(conns))
+                scene.bring_to_back(*list(conns))
 
         # Final pass: guarantee ALL edges sit behind ALL nodes
-        self.bring_to_back(*list(conn_3), *list(conn_2), *list(conn_1))
-        self.wait(0.5)
+        scene.bring_to_back(*list(conn_3), *list(conn_2), *list(conn_1))
+        scene.wait(0.5)
 
         # Data propagation — bright dots travel along weight edges, layer by layer
         layer_pairs = [
@@ -1588,7 +1381,7 @@ class ANNFailFullVideo(InteractiveScene):
                 dot_targets.append(line.get_end())
 
             # Light up all edges and spawn dots at source ends
-            self.play(
+            scene.play(
                 *[GrowFromCenter(d) for d in dots],
                 *[l.animate.set_stroke("#FF4444", opacity=0.7, width=2.2)
                   for l in conns],
@@ -1596,25 +1389,25 @@ class ANNFailFullVideo(InteractiveScene):
             )
 
             # Every dot travels along its own edge to the target node
-            self.play(
+            scene.play(
                 *[d.animate.move_to(t) for d, t in zip(dots, dot_targets)],
                 run_time=0.45,
             )
 
             # Flash target nodes, fade all dots, restore edges
-            self.play(
+            scene.play(
                 *[n.animate.set_stroke("#FF0000", width=4) for n in tgt_nodes],
                 FadeOut(dots),
                 *[l.animate.set_stroke(SOFT_GRAY, opacity=0.4, width=1.5)
                   for l in conns],
                 run_time=0.25,
             )
-            self.play(
+            scene.play(
                 *[n.animate.set_stroke(WHITE, width=2) for n in tgt_nodes],
                 run_time=0.15,
             )
 
-        self.wait(0.5)
+        scene.wait(0.5)
 
         # Forward-only arrow — anchored well below the network's bottom edge
         net_bottom_y = nn_group.get_bottom()[1]
@@ -1631,43 +1424,51 @@ class ANNFailFullVideo(InteractiveScene):
         flow_label.set_color("#FF8C00")
         flow_label.next_to(flow_arrow, DOWN, buff=0.35)
 
-        self.play(GrowArrow(flow_arrow), FadeIn(flow_label, shift=UP * 0.2),
+        scene.play(GrowArrow(flow_arrow), FadeIn(flow_label, shift=UP * 0.2),
                   run_time=0.8)
-        self.wait(1.2)
+        scene.wait(1.2)
 
         # Fade out arrow + label, then fade in the fixed-size badge at the same spot
         fixed_badge = make_status_badge("Fixed: 4 inputs -> 2 outputs",
                                          ANN_BLUE, font_size=28, min_width=5.5)
         fixed_badge.move_to(flow_arrow.get_center() + DOWN * 0.3)
 
-        self.play(
+        scene.play(
             FadeOut(flow_arrow), FadeOut(flow_label),
             run_time=0.4,
         )
-        self.play(FadeIn(fixed_badge, shift=UP * 0.2), run_time=0.5)
+        scene.play(FadeIn(fixed_badge, shift=UP * 0.2), run_time=0.5)
 
         # Glow input nodes to emphasize fixed size
-        self.play(
+        scene.play(
             *[n.animate.set_stroke("#FF9900", width=4) for n in input_nodes],
             run_time=0.4,
         )
-        self.play(
+        scene.play(
             *[n.animate.set_stroke(WHITE, width=2) for n in input_nodes],
             run_time=0.3,
         )
-        self.wait(2)
+        scene.wait(2)
 
-        validate_layout(self, label="V2 Scene 2")
-        self.play(*[FadeOut(m) for m in self.mobjects], run_time=0.8)
+        validate_layout(scene, label="V2 Scene 2")
 
-        # ==============================================================
-        # SCENE 3: Fixed-Size Problem (~55s)
-        # ==============================================================
+
+# =====================================================================
+# VIDEO 2 — SCENE 3: Fixed-Size Problem
+# =====================================================================
+
+class FixedSizeScene(InteractiveScene):
+
+    def construct(self):
+        self._build_fixed_size(self)
+
+    @staticmethod
+    def _build_fixed_size(scene):
 
         title = make_scene_title("Problem 1: Fixed-Size Inputs",
                                   color=PROBLEM_RED, font_size=52)
         title.shift(DOWN * 0.55)
-        self.play(FadeIn(title), run_time=0.6)
+        scene.play(FadeIn(title), run_time=0.6)
 
         # -- SECTION A: 6-word sentence fits perfectly --
         words_6 = ["the", "cat", "sat", "on", "the", "mat"]
@@ -1678,11 +1479,11 @@ class ANNFailFullVideo(InteractiveScene):
         word_cards.arrange(RIGHT, buff=0.25)
         word_cards.move_to(UP * 1.0)
 
-        self.play(LaggedStart(
+        scene.play(LaggedStart(
             *[FadeIn(c, shift=UP * 0.4) for c in word_cards],
             lag_ratio=0.12, run_time=1.5,
         ))
-        self.wait(0.5)
+        scene.wait(0.5)
 
         # Vector bar (6 slots) with labels — shifted further down for breathing room
         vec_bar = make_vector_bar(6, slot_labels=words_6, fill_color=ANN_BLUE,
@@ -1696,19 +1497,19 @@ class ANNFailFullVideo(InteractiveScene):
         )
         flatten_arrow.set_color(SOFT_GRAY)
 
-        self.play(GrowArrow(flatten_arrow), run_time=0.4)
-        self.play(FadeIn(vec_bar, shift=DOWN * 0.2), run_time=0.6)
+        scene.play(GrowArrow(flatten_arrow), run_time=0.4)
+        scene.play(FadeIn(vec_bar, shift=DOWN * 0.2), run_time=0.6)
 
         # Green "Fits!" label
         fits_label = Text("Fits!", font_size=44, weight=BOLD)
         fits_label.set_color(MEANING_GREEN)
         fits_label.next_to(vec_bar, DOWN, buff=0.5)
 
-        self.play(FadeIn(fits_label, scale=1.3), run_time=0.4)
-        self.wait(1)
+        scene.play(FadeIn(fits_label, scale=1.3), run_time=0.4)
+        scene.wait(1)
 
         # -- SECTION B: Short sentence — doesn't fit --
-        self.play(
+        scene.play(
             FadeOut(word_cards), FadeOut(flatten_arrow),
             FadeOut(vec_bar), FadeOut(fits_label),
             run_time=0.4,
@@ -1740,25 +1541,25 @@ class ANNFailFullVideo(InteractiveScene):
         padding_label.set_color(PROBLEM_RED)
         padding_label.next_to(short_vec, DOWN, buff=0.5)
 
-        self.play(FadeIn(short_cards, shift=UP * 0.3), run_time=0.5)
-        self.play(FadeIn(short_vec), run_time=0.5)
-        self.play(FadeIn(padding_label, shift=UP * 0.2), run_time=0.5)
+        scene.play(FadeIn(short_cards, shift=UP * 0.3), run_time=0.5)
+        scene.play(FadeIn(short_vec), run_time=0.5)
+        scene.play(FadeIn(padding_label, shift=UP * 0.2), run_time=0.5)
 
         # Pulse red slots
-        self.play(
+        scene.play(
             *[short_vec[0][i].animate.set_fill(PROBLEM_RED, opacity=0.4)
               for i in range(2, 6)],
             run_time=0.3,
         )
-        self.play(
+        scene.play(
             *[short_vec[0][i].animate.set_fill(PROBLEM_RED, opacity=0.15)
               for i in range(2, 6)],
             run_time=0.3,
         )
-        self.wait(1)
+        scene.wait(1)
 
         # -- SECTION C: Long sentence — truncated --
-        self.play(
+        scene.play(
             FadeOut(short_cards), FadeOut(short_vec), FadeOut(padding_label),
             run_time=0.4,
         )
@@ -1798,18 +1599,18 @@ class ANNFailFullVideo(InteractiveScene):
         trunc_label.next_to(long_vec, DOWN, buff=0.6)
         trunc_label.shift(DOWN * 0.55)
 
-        self.play(FadeIn(long_text), run_time=0.5)
-        self.play(FadeIn(long_vec), run_time=0.5)
-        self.play(
+        scene.play(FadeIn(long_text), run_time=0.5)
+        scene.play(FadeIn(long_vec), run_time=0.5)
+        scene.play(
             FadeIn(lost_text, shift=RIGHT * 0.3),
             ShowCreation(lost_strike),
             run_time=0.5,
         )
-        self.play(FadeIn(trunc_label, shift=UP * 0.2), run_time=0.5)
-        self.wait(1.5)
+        scene.play(FadeIn(trunc_label, shift=UP * 0.2), run_time=0.5)
+        scene.wait(1.5)
 
         # -- SECTION D: Mismatch summary --
-        self.play(
+        scene.play(
             FadeOut(long_text), FadeOut(long_vec),
             FadeOut(lost_text), FadeOut(lost_strike),
             FadeOut(trunc_label),
@@ -1855,31 +1656,39 @@ class ANNFailFullVideo(InteractiveScene):
         mismatch.set_color(PROBLEM_RED)
         mismatch.move_to(DOWN * 2.8)
 
-        self.play(
+        scene.play(
             FadeIn(left_box), FadeIn(left_title),
             FadeIn(right_box), FadeIn(right_title),
             run_time=0.6,
         )
-        self.play(
+        scene.play(
             LaggedStart(*[GrowArrow(a) for a in var_arrows],
                          lag_ratio=0.15, run_time=0.6),
             FadeIn(fixed_slots),
             run_time=0.6,
         )
-        self.play(FadeIn(mismatch, scale=1.5), run_time=0.6)
-        self.wait(2)
+        scene.play(FadeIn(mismatch, scale=1.5), run_time=0.6)
+        scene.wait(2)
+
+        validate_layout(scene, label="V2 Scene 3")
 
-        validate_layout(self, label="V2 Scene 3")
-        self.play(*[FadeOut(m) for m in self.mobjects], run_time=0.8)
 
-        # ==============================================================
-        # SCENE 4: No Memory (~50s)
-        # ==============================================================
+# =====================================================================
+# VIDEO 2 — SCENE 4: No Memory
+# =====================================================================
+
+class NoMemoryScene(InteractiveScene):
+
+    def construct(self):
+        self._build_no_memory(self)
+
+    @staticmethod
+    def _build_no_memory(scene):
 
         title = make_scene_title("Problem 2: No Memory", color=PROBLEM_RED,
                                  font_size=52)
         title.shift(DOWN * 0.4)
-        self.play(FadeIn(title), run_time=0.6)
+        scene.play(FadeIn(title), run_time=0.6)
 
         # ANN centered for symmetry — slightly bigger
         ann_in = make_nn_layer(3, ANN_BLUE, radius=0.27, spacing=0.75)
@@ -1917,26 +1726,26 @@ class ANNFailFullVideo(InteractiveScene):
                                        font_size=26, min_width=4.0)
         mem_badge.next_to(ann_group, DOWN, buff=0.5)
 
-        self.play(
+        scene.play(
             FadeIn(ann_group), FadeIn(ann_c1), FadeIn(ann_c2),
             FadeIn(ann_label), run_time=0.6,
         )
-        self.bring_to_back(*list(ann_c1), *list(ann_c2))
-        self.play(LaggedStart(
+        scene.bring_to_back(*list(ann_c1), *list(ann_c2))
+        scene.play(LaggedStart(
             *[FadeIn(c, shift=RIGHT * 0.3) for c in day_cards],
             lag_ratio=0.2, run_time=0.8,
         ))
-        self.wait(0.5)
+        scene.wait(0.5)
 
         # -- Day 1 processing --
         day1_copy = day_cards[0].copy()
-        self.play(
+        scene.play(
             day1_copy.animate.move_to(ann_in.get_center()).scale(0.35),
             run_time=0.55,
         )
 
         # Connections flash bright as data flows
-        self.play(
+        scene.play(
             *[l.animate.set_stroke(color=WHITE, opacity=0.8, width=2.5)
               for l in ann_c1],
             *[l.animate.set_stroke(color=WHITE, opacity=0.8, width=2.5)
@@ -1949,7 +1758,7 @@ class ANNFailFullVideo(InteractiveScene):
         pred_label.next_to(ann_out, RIGHT, buff=0.75)
 
         # MEMORY WIPE — connections snap back to dim
-        self.play(
+        scene.play(
             *[l.animate.set_stroke(color=SOFT_GRAY, opacity=0.15, width=1.5)
               for l in ann_c1],
             *[l.animate.set_stroke(color=SOFT_GRAY, opacity=0.15, width=1.5)
@@ -1960,27 +1769,27 @@ class ANNFailFullVideo(InteractiveScene):
         )
 
         # Memory badge appears
-        self.play(FadeIn(mem_badge, shift=UP * 0.2), run_time=0.4)
+        scene.play(FadeIn(mem_badge, shift=UP * 0.2), run_time=0.4)
 
         # Restore connection opacity for Day 2
-        self.play(
+        scene.play(
             *[l.animate.set_stroke(opacity=0.4, width=1.5, color=SOFT_GRAY)
               for l in ann_c1],
             *[l.animate.set_stroke(opacity=0.4, width=1.5, color=SOFT_GRAY)
               for l in ann_c2],
             run_time=0.2,
         )
-        self.wait(0.5)
+        scene.wait(0.5)
 
         # -- Day 2 processing --
         day2_copy = day_cards[1].copy()
-        self.play(
+        scene.play(
             day2_copy.animate.move_to(ann_in.get_center()).scale(0.35),
             run_time=0.5,
         )
 
         # Connections light up again
-        self.play(
+        scene.play(
             *[l.animate.set_stroke(color=WHITE, opacity=0.8, width=2.5)
               for l in ann_c1],
             *[l.animate.set_stroke(color=WHITE, opacity=0.8, width=2.5)
@@ -1989,7 +1798,7 @@ class ANNFailFullVideo(InteractiveScene):
         )
 
         # Memory wipe again
-        self.play(
+        scene.play(
             *[l.animate.set_stroke(color=SOFT_GRAY, opacity=0.15, width=1.5)
               for l in ann_c1],
             *[l.animate.set_stroke(color=SOFT_GRAY, opacity=0.15, width=1.5)
@@ -2012,11 +1821,11 @@ class ANNFailFullVideo(InteractiveScene):
         thought = VGroup(thought_bg, thought_text)
         thought.next_to(mem_badge, DOWN, buff=0.55)
 
-        self.play(FadeIn(thought, shift=UP * 0.2), run_time=0.5)
-        self.wait(1.5)
+        scene.play(FadeIn(thought, shift=UP * 0.2), run_time=0.5)
+        scene.wait(1.5)
 
         # -- Split comparison --
-        self.play(*[FadeOut(m) for m in self.mobjects if m is not title],
+        scene.play(*[FadeOut(m) for m in scene.mobjects if m is not title],
                   run_time=0.5)
 
         # Left: what ANN sees
@@ -2084,18 +1893,18 @@ class ANNFailFullVideo(InteractiveScene):
         connected_label.next_to(right_panel, DOWN, buff=0.45)
         connected_label.shift(DOWN * 0.4)
 
-        self.play(
+        scene.play(
             FadeIn(left_panel), FadeIn(left_t),
             FadeIn(right_panel), FadeIn(right_t),
             run_time=0.6,
         )
-        self.play(
+        scene.play(
             LaggedStart(*[GrowFromCenter(d) for d in scat_dots],
                          lag_ratio=0.2, run_time=0.6),
             LaggedStart(*[GrowFromCenter(d) for d in trend_dots],
                          lag_ratio=0.2, run_time=0.6),
         )
-        self.play(
+        scene.play(
             FadeIn(isolated_label),
             LaggedStart(*[ShowCreation(l) for l in trend_lines],
                          lag_ratio=0.3, run_time=0.6),
@@ -2103,19 +1912,27 @@ class ANNFailFullVideo(InteractiveScene):
             FadeIn(connected_label),
             run_time=0.6,
         )
-        self.wait(2.5)
+        scene.wait(2.5)
 
-        validate_layout(self, label="V2 Scene 4")
-        self.play(*[FadeOut(m) for m in self.mobjects], run_time=0.8)
+        validate_layout(scene, label="V2 Scene 4")
 
-        # ==============================================================
-        # SCENE 5: Parameter Explosion (~45s)
-        # ==============================================================
+
+# =====================================================================
+# VIDEO 2 — SCENE 5: Parameter Explosion
+# =====================================================================
+
+class ParamExplosionScene(InteractiveScene):
+
+    def construct(self):
+        self._build_param_explosion(self)
+
+    @staticmethod
+    def _build_param_explosion(scene):
 
         title = make_scene_title("Problem 3: Parameter Explosion",
                                   color=PROBLEM_RED, font_size=48)
         title.shift(DOWN * 0.4)
-        self.play(FadeIn(title), run_time=0.6)
+        scene.play(FadeIn(title), run_time=0.6)
 
         # Table with growing bars
         table_data = [
@@ -2132,7 +1949,7 @@ class ANNFailFullVideo(InteractiveScene):
         h_seq.move_to(LEFT * 4.5 + UP * 1.8)
         h_par.move_to(LEFT * 1.5 + UP * 1.8)
 
-        self.play(FadeIn(h_seq), FadeIn(h_par), run_time=0.3)
+        scene.play(FadeIn(h_seq), FadeIn(h_par), run_time=0.3)
 
         # All bars start from the same x — aligned column
         BAR_START_X = 0.8   # left edge of all bars
@@ -2168,17 +1985,17 @@ class ANNFailFullVideo(InteractiveScene):
             rows.add(row)
 
             rt = 0.3 if idx < 3 else 0.8
-            self.play(
+            scene.play(
                 FadeIn(seq_text), GrowArrow(arrow), FadeIn(par_text),
                 GrowFromCenter(bar),
                 run_time=rt,
             )
 
-        self.wait(1)
+        scene.wait(1)
 
         # Audio example
         table_group = VGroup(h_seq, h_par, rows)
-        self.play(FadeOut(table_group), run_time=0.4)
+        scene.play(FadeOut(table_group), run_time=0.4)
 
         audio_line1 = Text("10 seconds of audio @ 16kHz", font_size=38,
                             weight=BOLD)
@@ -2202,10 +2019,10 @@ class ANNFailFullVideo(InteractiveScene):
         huge_label.move_to(huge_bar.get_center())
         huge_combo = VGroup(huge_bar, huge_label)
 
-        self.play(Write(audio_line1), run_time=0.7)
-        self.play(Write(audio_line2), run_time=0.7)
-        self.play(GrowFromCenter(huge_combo), run_time=1.0)
-        self.wait(1)
+        scene.play(Write(audio_line1), run_time=0.7)
+        scene.play(Write(audio_line2), run_time=0.7)
+        scene.play(GrowFromCenter(huge_combo), run_time=1.0)
+        scene.wait(1)
 
         # Consequences
         cons = ["Slow training", "Massive memory", "Overfitting"]
@@ -2216,23 +2033,31 @@ class ANNFailFullVideo(InteractiveScene):
         cons_cards.arrange(RIGHT, buff=0.5)
         cons_cards.move_to(DOWN * 1.8)
 
-        self.play(LaggedStart(
+        scene.play(LaggedStart(
             *[FadeIn(c, shift=UP * 0.3) for c in cons_cards],
             lag_ratio=0.2, run_time=1.0,
         ))
-        self.wait(2)
+        scene.wait(2)
+
+        validate_layout(scene, label="V2 Scene 5")
 
-        validate_layout(self, label="V2 Scene 5")
-        self.play(*[FadeOut(m) for m in self.mobjects], run_time=0.8)
 
-        # ==============================================================
-        # SCENE 6: The Sliding Window Hack (~45s)
-        # ==============================================================
+# =====================================================================
+# VIDEO 2 — SCENE 6: The Sliding Window Hack
+# =====================================================================
+
+class SlidingWindowScene(InteractiveScene):
+
+    def construct(self):
+        self._build_sliding_window(self)
+
+    @staticmethod
+    def _build_sliding_window(scene):
 
         title = make_scene_title("The Sliding Window Hack",
                                   color=WINDOW_AMBER, font_size=52)
         title.shift(DOWN * 0.4)
-        self.play(FadeIn(title), run_time=0.6)
+        scene.play(FadeIn(title), run_time=0.6)
 
         # Sequence of 12 stock prices
         prices = [100, 105, 98, 110, 107, 115, 112, 120, 118, 125, 122, 130]
@@ -2257,7 +2082,7 @@ class ANNFailFullVideo(InteractiveScene):
         for i, lbl in enumerate(cell_labels):
             lbl.move_to(cells[i].get_center())
 
-        self.play(LaggedStart(
+        scene.play(LaggedStart(
             *[FadeIn(VGroup(cells[i], cell_labels[i]))
               for i in range(len(prices))],
             lag_ratio=0.04, run_time=1.0,
@@ -2276,7 +2101,7 @@ class ANNFailFullVideo(InteractiveScene):
         win_label.set_color(WINDOW_AMBER)
         win_label.next_to(window, UP, buff=0.3)
 
-        self.play(FadeIn(window), FadeIn(win_label), run_time=0.5)
+        scene.play(FadeIn(window), FadeIn(win_label), run_time=0.5)
 
         # Mini ANN below
         mini_in = make_nn_layer(3, ANN_BLUE, radius=0.25, spacing=0.65)
@@ -2295,25 +2120,25 @@ class ANNFailFullVideo(InteractiveScene):
         pred_txt.set_color(OUTPUT_GOLD)
         pred_txt.next_to(mini_out, RIGHT, buff=0.4)
 
-        self.play(
+        scene.play(
             FadeIn(mini_nn), FadeIn(mini_c1), FadeIn(mini_c2),
             FadeIn(pred_txt), run_time=0.5,
         )
-        self.bring_to_back(*list(mini_c1), *list(mini_c2))
-        self.wait(0.5)
+        scene.bring_to_back(*list(mini_c1), *list(mini_c2))
+        scene.wait(0.5)
 
         # Slide the window across
         for _ in range(5):
-            self.play(
+            scene.play(
                 window.animate.shift(RIGHT * cell_w),
                 win_label.animate.shift(RIGHT * cell_w),
                 run_time=0.35,
             )
 
-        self.wait(0.5)
+        scene.wait(0.5)
 
         # Show limitation: long-range dependency
-        self.play(
+        scene.play(
             FadeOut(window), FadeOut(win_label), FadeOut(mini_nn),
             FadeOut(mini_c1), FadeOut(mini_c2), FadeOut(pred_txt),
             run_time=0.3,
@@ -2347,14 +2172,14 @@ class ANNFailFullVideo(InteractiveScene):
         cant_see.set_color(PROBLEM_RED)
         cant_see.next_to(broken_line, DOWN, buff=0.85)
 
-        self.play(ShowCreation(early_rect), ShowCreation(late_rect), run_time=0.4)
-        self.play(ShowCreation(broken_line), FadeIn(x_mark, scale=1.5),
+        scene.play(ShowCreation(early_rect), ShowCreation(late_rect), run_time=0.4)
+        scene.play(ShowCreation(broken_line), FadeIn(x_mark, scale=1.5),
                   run_time=0.6)
-        self.play(FadeIn(cant_see, shift=UP * 0.2), run_time=0.5)
-        self.wait(1.5)
+        scene.play(FadeIn(cant_see, shift=UP * 0.2), run_time=0.5)
+        scene.wait(1.5)
 
         # Dilemma
-        self.play(*[FadeOut(m) for m in self.mobjects if m is not title],
+        scene.play(*[FadeOut(m) for m in scene.mobjects if m is not title],
                   run_time=0.4)
 
         # Dilemma — two enclosed boxes stacked vertically with VS between
@@ -2384,23 +2209,31 @@ class ANNFailFullVideo(InteractiveScene):
         no_win.set_color(PROBLEM_RED)
         no_win.next_to(stack, DOWN, buff=0.55)
 
-        self.play(FadeIn(dilemma_l, shift=LEFT * 0.3), run_time=0.5)
-        self.play(FadeIn(vs, scale=1.2), run_time=0.3)
-        self.play(FadeIn(dilemma_r, shift=RIGHT * 0.3), run_time=0.5)
-        self.play(FadeIn(no_win, scale=1.5), run_time=0.6)
-        self.wait(2)
+        scene.play(FadeIn(dilemma_l, shift=LEFT * 0.3), run_time=0.5)
+        scene.play(FadeIn(vs, scale=1.2), run_time=0.3)
+        scene.play(FadeIn(dilemma_r, shift=RIGHT * 0.3), run_time=0.5)
+        scene.play(FadeIn(no_win, scale=1.5), run_time=0.6)
+        scene.wait(2)
 
-        validate_layout(self, label="V2 Scene 6")
-        self.play(*[FadeOut(m) for m in self.mobjects], run_time=0.8)
+        validate_layout(scene, label="V2 Scene 6")
 
-        # ==============================================================
-        # SCENE 7: Conclusion — ANNs Cannot Handle Sequences (~30s)
-        #   (NO RNN — this is ONLY about ANN limitations)
-        # ==============================================================
 
+# =====================================================================
+# VIDEO 2 — SCENE 7: Conclusion — ANNs Cannot Handle Sequences
+# =====================================================================
+
+class SolutionTeaserScene(InteractiveScene):
+
+    def construct(self):
+        self._build_solution_teaser(self)
+
+    @staticmethod
+    def _build_solution_teaser(scene):
+
+        # (NO RNN — this is ONLY about ANN limitations)
         title = make_scene_title("The Bottom Line", color=WHITE, font_size=56)
         title.shift(DOWN * 0.5)
-        self.play(FadeIn(title), run_time=0.6)
+        scene.play(FadeIn(title), run_time=0.6)
 
         # Three problems displayed as definitive failure cards
         problems = [
@@ -2428,10 +2261,10 @@ class ANNFailFullVideo(InteractiveScene):
 
         # Appear one by one with impact
         for card in prob_cards:
-            self.play(FadeIn(card, shift=LEFT * 0.4), run_time=0.5)
-            self.wait(0.3)
+            scene.play(FadeIn(card, shift=LEFT * 0.4), run_time=0.5)
+            scene.wait(0.3)
 
-        self.wait(1)
+        scene.wait(1)
 
         # Red X overlays
         x_marks = VGroup()
@@ -2442,14 +2275,14 @@ class ANNFailFullVideo(InteractiveScene):
             x.move_to(card[0].get_right() + LEFT * 0.6)
             x_marks.add(x)
 
-        self.play(LaggedStart(
+        scene.play(LaggedStart(
             *[FadeIn(x, scale=2.0) for x in x_marks],
             lag_ratio=0.15, run_time=0.8,
         ))
-        self.wait(1.5)
+        scene.wait(1.5)
 
         # Final statement — NO RNN teaser
-        self.play(
+        scene.play(
             FadeOut(prob_cards), FadeOut(x_marks), FadeOut(title),
             run_time=0.6,
         )
@@ -2461,12 +2294,30 @@ class ANNFailFullVideo(InteractiveScene):
         final.set_color(WHITE)
         final.move_to(ORIGIN)
 
-        self.play(Write(final), run_time=2.0)
-        self.wait(4)
+        scene.play(Write(final), run_time=2.0)
+        scene.wait(4)
+
+        validate_layout(scene, label="V2 Scene 7")
+
+
+# =====================================================================
+# VIDEO 2 — full video
+# =====================================================================
+
+class ANNFailFullVideo(InteractiveScene):
+
+    segments = [
+        RecapHookScene._build_recap_hook,
+        FeedforwardScene._build_feedforward,
+        FixedSizeScene._build_fixed_size,
+        NoMemoryScene._build_no_memory,
+        ParamExplosionScene._build_param_explosion,
+        SlidingWindowScene._build_sliding_window,
+        SolutionTeaserScene._build_solution_teaser,
+    ]
 
-        validate_layout(self, label="V2 Scene 7")
-        self.play(*[FadeOut(m) for m in self.mobjects], run_time=0.8)
-        self.wait(1)
+    def construct(self):
+        play_segments(self, self.segments, final_wait=1)
 
 
 # =====================================================================
@@ -4,11 +4,25 @@ Transformers — Attention Is All You Need
 Scene classes (one per topic, run individually):
     manimgl a.py RNNLimitations -w --hd
     manimgl a.py WordEmbeddings -w --hd
+
+The long attention scenes have named checkpoints; render one section range:
+    MANIM_SECTIONS=parallelism manimgl a.py SelfAttentionIntro -w --hd
+    MANIM_SECTIONS=mask_matrix:formula manimgl a.py MaskedMultiHeadAttention
 """
 
 from manimlib import *
 import numpy as np
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from common import assets, tex_bank
+from common.checkpoints import Checkpoints
+from common.labels import cached_text
+
+# Compile every statically known Tex string up front, in parallel
+tex_bank.warm_up(__file__)
+
 
 # ── Color palette ────────────────────────────────────────────────────
 C_RNN       = "#1ABC9C"     # RNN cell teal
@@ -86,6 +100,22 @@ def flash_arrow(mob, tw=0.45, rt=0.50):
                            time_width=tw, run_time=rt)
 
 
+def positional_encoding(n_pos, n_dim):
+    """Sinusoidal PE table: sin on even dims, cos on odd dims."""
+    pos = np.arange(n_pos)[:, None]
+    i_d = np.arange(n_dim // 2)[None, :]
+    angle = pos / 10000 ** (2 * i_d / n_dim)
+    pe = np.empty((n_pos, n_dim))
+    pe[:, 0::2] = np.sin(angle)
+    pe[:, 1::2] = np.cos(angle)
+    return pe
+
+
+def pe_heatmap_rgb(n_pos, n_dim, scale):
+    """PE table as a blue-white-red image, each value a ``scale``-pixel square."""
+    return assets.upscale(assets.diverging_rgb(positional_encoding(n_pos, n_dim)), scale)
+
+
 
 # ═══════════════════════════════════════════════════════════════════
 #  SCENE 2 — Word Embeddings  (~3 min, all 2D, multiple analogies)
@@ -220,7 +250,7 @@ class WordEmbeddings(InteractiveScene):
 
         tok_idxs = []
         for i in range(len(tok_words)):
-            idx = Text(str(i), font_size=26, weight=BOLD)
+            idx = cached_text(str(i), font_size=26, weight=BOLD)
             idx.set_color(WHITE)
             idx.next_to(cards[i], DOWN, buff=0.22)
             tok_idxs.append(idx)
@@ -284,7 +314,7 @@ class WordEmbeddings(InteractiveScene):
 
         vocab_idxs = []
         for i in range(N):
-            idx = Text(f"#{i}", font_size=20, weight=BOLD)
+            idx = cached_text(f"#{i}", font_size=20, weight=BOLD)
             idx.set_color(WHITE)
             idx.next_to(vocab_row[i], DOWN, buff=0.18)
             vocab_idxs.append(idx)
@@ -447,7 +477,7 @@ class WordEmbeddings(InteractiveScene):
                 )
                 cell.set_stroke(WHITE, width=0.8, opacity=0.25)
                 cell.move_to(np.array([x, y, 0]))
-                vt = Text(f"{val:.1f}", font_size=18, weight=BOLD)
+                vt = cached_text(f"{val:.1f}", font_size=18, weight=BOLD)
                 vt.set_color(WHITE)
                 vt.move_to(cell.get_center())
                 grp = VGroup(cell, vt)
@@ -871,13 +901,14 @@ class WordEmbeddings(InteractiveScene):
 #  SCENE 3 — Self-Attention Intro (context-aware embeddings)
 # ═══════════════════════════════════════════════════════════════════
 
-class SelfAttentionIntro(InteractiveScene):
+class SelfAttentionIntro(Checkpoints, InteractiveScene):
     def construct(self):
         self.camera.frame.scale(1.30)
 
         # ══════════════════════════════════════════════════════════════
         # PHASE 1 — Hook: same word, two meanings
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("hook")
         title = make_title("Same Word, Different Meaning",
                            np.array([0, 3.7, 0]), C_FADE, fs=60)
         self.play(Write(title), run_time=0.60)
@@ -932,6 +963,7 @@ class SelfAttentionIntro(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE 2 — Word cards one-by-one, attention arcs, embeddings
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("word_cards")
         words = ["I", "loved", "her"]
         word_colors = ["#2ECC71", "#E74C3C", "#3498DB"]
 
@@ -1010,6 +1042,7 @@ class SelfAttentionIntro(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE 3 — Colored weighted-sum equation with Ē (bar)
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("weighted_sum")
         eq_data = [
             (r"\boldsymbol{\bar{E}_{\mathbf{her}}}", "#3498DB"),
             (r"=",                                    WHITE),
@@ -1369,6 +1402,7 @@ class SelfAttentionIntro(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE — Parallelism demonstration
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("parallelism")
 
         # Fade out the 3 equations
         all_eqs = VGroup(eq, eq_i, eq_l)
@@ -1531,7 +1565,7 @@ class SelfAttentionIntro(InteractiveScene):
                 sq = Square(side_length=EMB_SZ)
                 sq.set_fill(YELLOW, opacity=0.25 + w_nums[i][j] * 0.75)
                 sq.set_stroke(WHITE, width=1.0)
-                nm = Text(f"{w_nums[i][j]:.1f}", font_size=18, weight=BOLD)
+                nm = cached_text(f"{w_nums[i][j]:.1f}", font_size=18, weight=BOLD)
                 nm.set_color(WHITE)
                 nm.move_to(sq.get_center())
                 w_row.add(VGroup(sq, nm))
@@ -1837,7 +1871,7 @@ class SelfAttentionFinal(InteractiveScene):
                 sq = Square(side_length=PSZ)
                 sq.set_fill(YELLOW, opacity=0.25 + w_nums1[i][j] * 0.75)
                 sq.set_stroke(WHITE, width=1.0)
-                nm = Text(f"{w_nums1[i][j]:.1f}", font_size=9, weight=BOLD)
+                nm = cached_text(f"{w_nums1[i][j]:.1f}", font_size=9, weight=BOLD)
                 nm.set_color(WHITE)
                 nm.move_to(sq.get_center())
                 w_row.add(VGroup(sq, nm))
@@ -2204,7 +2238,7 @@ class SelfAttentionFinal(InteractiveScene):
                 sq = Square(side_length=PSZ)
                 sq.set_fill(YELLOW, opacity=0.25 + w_nums2[i][j] * 0.75)
                 sq.set_stroke(WHITE, width=1.0)
-                nm = Text(f"{w_nums2[i][j]:.1f}", font_size=9, weight=BOLD)
+                nm = cached_text(f"{w_nums2[i][j]:.1f}", font_size=9, weight=BOLD)
                 nm.set_color(WHITE)
                 nm.move_to(sq.get_center())
                 w_row.add(VGroup(sq, nm))
@@ -2801,7 +2835,7 @@ class SoftmaxScaling(InteractiveScene):
 
         in_nums = VGroup()
         for i, (v, c) in enumerate(zip(in_vals, in_colors)):
-            t = Text(f"{v:.1f}", font_size=36, weight=BOLD)
+            t = cached_text(f"{v:.1f}", font_size=36, weight=BOLD)
             t.set_color(c)
             t.move_to(LEFT * 4.5 + DOWN * (0.0 + i * 1.19) + DOWN*0.49)
             in_nums.add(t)
@@ -2826,7 +2860,7 @@ class SoftmaxScaling(InteractiveScene):
             bar.align_to(RIGHT * -0.2, LEFT)
             out_bars.add(bar)
 
-            prob = Text(f"{v:.2f}", font_size=26, weight=BOLD)
+            prob = cached_text(f"{v:.2f}", font_size=26, weight=BOLD)
             prob.set_color(c)
             prob.next_to(bar, RIGHT, buff=0.18)
             out_probs.add(prob)
@@ -2873,13 +2907,13 @@ class SoftmaxScaling(InteractiveScene):
         small_bars = VGroup()
         small_lbls = VGroup()
         for i, (v, ov, c) in enumerate(zip(small_in, small_out, bar_cols)):
-            num = Text(f"{v:.1f}", font_size=34, weight=BOLD).set_color(c)
+            num = cached_text(f"{v:.1f}", font_size=34, weight=BOLD).set_color(c)
             num.move_to(LEFT * 6.0 + BARY + DOWN * i * 1.22)
             bar = Rectangle(width=ov * MW, height=BH)
             bar.set_fill(c, opacity=0.85).set_stroke(WHITE, width=1.0)
             bar.move_to(LEFT * 3.5 + BARY + DOWN * i * 1.22)
             bar.align_to(LEFT * 5.2, LEFT)
-            prob = Text(f"{ov:.2f}", font_size=32, weight=BOLD).set_color(c)
+            prob = cached_text(f"{ov:.2f}", font_size=32, weight=BOLD).set_color(c)
             prob.next_to(bar, RIGHT, buff=0.22)
             small_bars.add(bar)
             small_lbls.add(VGroup(num, prob))
@@ -2895,13 +2929,13 @@ class SoftmaxScaling(InteractiveScene):
         large_bars = VGroup()
         large_lbls = VGroup()
         for i, (v, ov, c) in enumerate(zip(large_in, large_out, bar_cols)):
-            num = Text(f"{v:.1f}", font_size=34, weight=BOLD).set_color(c)
+            num = cached_text(f"{v:.1f}", font_size=34, weight=BOLD).set_color(c)
             num.move_to(RIGHT * 2.0 + BARY + DOWN * i * 1.22)
             bar = Rectangle(width=ov * MW, height=BH)
             bar.set_fill(c, opacity=0.85).set_stroke(WHITE, width=1.0)
             bar.move_to(RIGHT * 4.5 + BARY + DOWN * i * 1.22)
             bar.align_to(RIGHT * 2.8, LEFT)
-            prob = Text(f"{ov:.2f}", font_size=32, weight=BOLD).set_color(c)
+            prob = cached_text(f"{ov:.2f}", font_size=32, weight=BOLD).set_color(c)
             prob.next_to(bar, RIGHT, buff=0.22)
             large_bars.add(bar)
             large_lbls.add(VGroup(num, prob))
@@ -3143,7 +3177,7 @@ class SoftmaxScaling(InteractiveScene):
             bb.set_fill(c, opacity=0.85).set_stroke(WHITE, width=1.0)
             bb.move_to(LEFT * 4.0 + UP * (1.8 - i * 1.2))
             bb.align_to(LEFT * 5.5, LEFT)
-            bp = Text(f"{bv:.2f}", font_size=32, weight=BOLD).set_color(c)
+            bp = cached_text(f"{bv:.2f}", font_size=32, weight=BOLD).set_color(c)
             bp.next_to(bb, RIGHT, buff=0.22)
             bf_bars.add(VGroup(bb, bp))
 
@@ -3151,7 +3185,7 @@ class SoftmaxScaling(InteractiveScene):
             ab.set_fill(c, opacity=0.85).set_stroke(WHITE, width=1.0)
             ab.move_to(RIGHT * 4.0 + UP * (1.8 - i * 1.2))
             ab.align_to(RIGHT * 2.2, LEFT)
-            ap = Text(f"{av:.2f}", font_size=32, weight=BOLD).set_color(c)
+            ap = cached_text(f"{av:.2f}", font_size=32, weight=BOLD).set_color(c)
             ap.next_to(ab, RIGHT, buff=0.22)
             af_bars.add(VGroup(ab, ap))
 
@@ -3293,7 +3327,7 @@ class PositionalEncoding(InteractiveScene):
             sq.set_fill(C_POS, opacity=1.0)
             sq.set_stroke(WHITE, width=1.0)
             sq.next_to(emb_vecs[i], RIGHT, buff=0)
-            num = Text(str(i), font_size=FS_SMALL, weight=BOLD)
+            num = cached_text(str(i), font_size=FS_SMALL, weight=BOLD)
             num.set_color(BLACK)
             num.move_to(sq)
             extra_cells.add(VGroup(sq, num))
@@ -3719,7 +3753,7 @@ class PositionalEncoding(InteractiveScene):
             sq.set_stroke(WHITE, width=1.5)
             pe_cells.add(sq)
 
-            vl = Text(str(val), font_size=30, weight=BOLD)
+            vl = cached_text(str(val), font_size=30, weight=BOLD)
             vl.set_color(WHITE)
             pe_val_labels.add(vl)
 
@@ -3801,7 +3835,7 @@ class PositionalEncoding(InteractiveScene):
             sq.set_fill(C_PE, opacity=0.80)
             sq.set_stroke(WHITE, width=1.5)
             pe_row.add(sq)
-            vl = Text(str(val), font_size=30, weight=BOLD)
+            vl = cached_text(str(val), font_size=30, weight=BOLD)
             vl.set_color(WHITE)
             pe_row_vals.add(vl)
         pe_row.arrange(RIGHT, buff=0)
@@ -3982,36 +4016,11 @@ class PositionalEncoding(InteractiveScene):
         heat_title.move_to(UP * 3)
         self.play(FadeIn(heat_title), run_time=0.40)
 
-        # Compute PE values
-        n_pos, n_dim = 50, 128
-        pe_arr = np.zeros((n_pos, n_dim))
-        for p in range(n_pos):
-            for i_d in range(n_dim // 2):
-                denom = 10000 ** (2 * i_d / n_dim)
-                pe_arr[p, 2 * i_d] = np.sin(p / denom)
-                pe_arr[p, 2 * i_d + 1] = np.cos(p / denom)
-
-        # Blue-White-Red colormap
-        t = (pe_arr + 1) / 2
-        rgb = np.zeros((n_pos, n_dim, 3), dtype=np.uint8)
-        mask_lo = t <= 0.5
-        s_lo = np.clip(t / 0.5, 0, 1)
-        s_hi = np.clip((t - 0.5) / 0.5, 0, 1)
-        rgb[:, :, 0] = np.where(mask_lo, (s_lo * 255).astype(int), 255)
-        rgb[:, :, 1] = np.where(mask_lo, (s_lo * 255).astype(int),
-                                ((1 - s_hi) * 255).astype(int))
-        rgb[:, :, 2] = np.where(mask_lo, 255,
-                                ((1 - s_hi) * 255).astype(int))
-
-        sc = 5
-        big_rgb = np.repeat(np.repeat(rgb, sc, axis=0), sc, axis=1)
-
-        from PIL import Image as PILImage
-        import tempfile, os
-        tmp_path = os.path.join(tempfile.gettempdir(), "pe_heatmap.png")
-        PILImage.fromarray(big_rgb).save(tmp_path)
-
-        heatmap = ImageMobject(tmp_path)
+        # Closed-form PE -> blue-white-red PNG, generated once and cached
+        heatmap_path = assets.cached_image("pe_heatmap", pe_heatmap_rgb,
+                                           n_pos=50, n_dim=128, scale=5)
+
+        heatmap = ImageMobject(heatmap_path)
         heatmap.set_height(3.8)
         heatmap.move_to(LEFT * 1.0 + DOWN * 0.3).shift(DOWN*0.4+RIGHT*0.4)
 
@@ -4103,7 +4112,7 @@ class PositionalEncoding(InteractiveScene):
         self.play(*[FadeOut(m) for m in p_heat], run_time=0.60)
         self.wait(1.0)
 
-class MultiHeadAttention(InteractiveScene):
+class MultiHeadAttention(Checkpoints, InteractiveScene):
     def construct(self):
         self.camera.frame.scale(1.30)
 
@@ -4115,6 +4124,7 @@ class MultiHeadAttention(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE 1 — Self-Attention Recap (brief)
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("recap")
         title = Text("Self-Attention Recap", font_size=62, weight=BOLD)
         title.set_color(WHITE)
         title.move_to(UP * 4).shift(DOWN*0.25)
@@ -4163,6 +4173,7 @@ class MultiHeadAttention(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE 2 — Sentence + images (no meaning text lines)
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("sentence")
         words = ["He", "fed", "her", "cat", "food"]
         w_colors = ["#1ABC9C", "#E67E22", "#FF6B9D", "#2ECC71", "#9B59B6"]
 
@@ -4233,6 +4244,7 @@ class MultiHeadAttention(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE 3 — Single head limitation + "we need both"
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("single_head")
         single_lbl = Text("Single head captures only ONE pattern",
                           font_size=FS_SMALL*1.6, weight=BOLD)
         single_lbl.set_color(ORANGE)
@@ -4280,6 +4292,7 @@ class MultiHeadAttention(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE 4 — 2 heads with W_Q^{(1)}, W_Q^{(2)} on dummy example
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("two_heads")
         m_title = Text("Multi-Head Attention",
                        font_size=FS_TITLE*1.4, weight=BOLD)
         m_title.set_color(WHITE)
@@ -4359,6 +4372,7 @@ class MultiHeadAttention(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE 4.5 — Detailed pipeline: data flow with dimensions
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("pipeline")
 
         head_colors = [C_HEAD1, C_HEAD2]
         BAR_W = 6   # full d_model width
@@ -4577,6 +4591,7 @@ class MultiHeadAttention(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE 5 — General case: formulas + dimensionality
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("general_case")
         gen_title = Text("General Multi-Head Attention",
                          font_size=FS_TITLE*1.35, weight=BOLD)
         gen_title.set_color(ORANGE)
@@ -4638,6 +4653,7 @@ class MultiHeadAttention(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE 6 — Visual dimension splitting (bar -> 8 chunks)
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("dimension_split")
         dim_title = Text("How Dimensions Are Split",
                          font_size=FS_TITLE*1.55, weight=BOLD)
         dim_title.set_color(ORANGE)
@@ -4736,6 +4752,7 @@ class MultiHeadAttention(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE FINAL — Summary pipeline (HORIZONTAL: left -> right)
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("summary")
         sum_title = Text("Multi-Head Attention - Summary",
                          font_size=FS_TITLE*1.5, weight=BOLD)
         sum_title.set_color(ORANGE)
@@ -4859,7 +4876,7 @@ class MultiHeadAttention(InteractiveScene):
 #  manimgl a.py MaskedMultiHeadAttention -w --hd
 # ═══════════════════════════════════════════════════════════════════
 
-class MaskedMultiHeadAttention(InteractiveScene):
+class MaskedMultiHeadAttention(Checkpoints, InteractiveScene):
     def construct(self):
         self.camera.frame.scale(1.30)
 
@@ -4882,6 +4899,7 @@ class MaskedMultiHeadAttention(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE 1 — Why Masking? Autoregressive generation
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("why_masking")
 
         # Decoder generates one token at a time
         gen_note = Text("The decoder generates tokens one at a time",
@@ -4963,6 +4981,7 @@ class MaskedMultiHeadAttention(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE 2 — Visual: which tokens can attend to which
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("attend_grid")
         title2 = Text("Masked Attention - Who Can See Whom?",
                       font_size=FS_TITLE * 1.23, weight=BOLD)
         title2.set_color(WHITE)
@@ -5151,6 +5170,7 @@ class MaskedMultiHeadAttention(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE 3 — The Mask Matrix
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("mask_matrix")
         title3 = Text("The Mask Matrix", font_size=FS_TITLE * 1.65, weight=BOLD)
         title3.set_color(PINK)
         title3.move_to(UP * 3.3)
@@ -5298,6 +5318,7 @@ class MaskedMultiHeadAttention(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE 4 — After Softmax: -inf becomes 0
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("after_softmax")
         title4 = Text("After Softmax", font_size=FS_TITLE * 1.4, weight=BOLD)
         title4.set_color(WHITE)
         title4.move_to(UP * 3.44)
@@ -5435,6 +5456,7 @@ class MaskedMultiHeadAttention(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE 5 — Full formula + comparison with regular attention
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("formula")
 
         # Regular attention formula
         reg_lbl = Text("Regular Self-Attention", font_size=FS_BODY, weight=BOLD)
@@ -5492,6 +5514,7 @@ class MaskedMultiHeadAttention(InteractiveScene):
         # ══════════════════════════════════════════════════════════════
         # PHASE 6 — Multi-Head: same masking in every head
         # ══════════════════════════════════════════════════════════════
+        self.checkpoint("multi_head")
         title6 = Text("Masked Multi-Head Attention",
                       font_size=FS_TITLE * 1.55, weight=BOLD)
         title6.set_color(WHITE)
@@ -7938,7 +7961,7 @@ class SelfAttentionIntuition(InteractiveScene):
                     0
                 ]))
 
-                val = Text(f"{s:.2f}", font_size=20, weight="BOLD")
+                val = cached_text(f"{s:.2f}", font_size=20, weight="BOLD")
                 val.set_color(WHITE if s < 0.4 else BLACK)
                 val.move_to(r)
 
@@ -1,6 +1,11 @@
 from manim import *
 from collections import deque
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import graph
+
 PURPLE = ORANGE
 
 config.background_color = LOGO_WHITE
@@ -225,30 +230,11 @@ class GraphAnimation(MovingCameraScene):
 
     def create_nodes(self, node_positions):
         """Create nodes at specified positions with labels."""
-        nodes = {}
-        for label, position in node_positions.items():
-            # Create a circle for the node
-            node_circle = Circle(
-                radius=0.5,
-                fill_color=GREEN,
-                fill_opacity=1,
-                color=DARK_BLUE,
-                stroke_width=5.6
-            )
-            node_circle.move_to(position)
-
-            # Create the label (text) for the node with black color
-            node_label = Text(label, color=BLACK).move_to(position)
-
-            # Group the circle and the text together
-            node_group = VGroup(node_circle, node_label)
-            nodes[label] = node_group  # Store with direct label access (e.g., "A")
-
-        return nodes
+        template = Circle(radius=0.5, fill_color=GREEN, fill_opacity=1, color=DARK_BLUE, stroke_width=5.6)
+        return graph.build_nodes(node_positions, template, label_color=BLACK)
 
     def create_edges(self, node_positions):
         """Create undirected edges between nodes."""
-        edge_list = []
         edge_pairs = [
             ("A", "B"),
             ("A", "C"),
@@ -259,19 +245,11 @@ class GraphAnimation(MovingCameraScene):
             ("C", "G"),
             ("C", "F")
         ]
-
-        for node1, node2 in edge_pairs:
-            start_pos = node_positions[node1]
-            end_pos = node_positions[node2]
-            edge_line = Line(start_pos, end_pos, color=DARK_BLUE, stroke_width=5)
-            edge_line.z_index = -1  # Set z-index lower than nodes
-            edge_list.append(edge_line)
-
-        return {}, edge_list
+        edges = graph.build_edges(node_positions, edge_pairs, z_index=-1, color=DARK_BLUE, stroke_width=5)
+        return {}, edges
 
     def create_directed_edges(self, node_positions):
         """Transform undirected edges into directed edges."""
-        directed_edge_list = []
         edge_pairs = [
             ("A", "B"),
             ("C", "A"),
@@ -282,24 +260,12 @@ class GraphAnimation(MovingCameraScene):
             ("G", "C"),
             ("C", "F")
         ]
-
-        for node1, node2 in edge_pairs:
-            start_pos = node_positions[node1]
-            end_pos = node_positions[node2]
-            directed_edge = Arrow(
-                start_pos, end_pos,
-                buff=0.5,  # Adjusted buff to ensure arrow touches the circle but does not penetrate
-                color=MAROON_B,
-                stroke_width=5
-            )
-            directed_edge.z_index = -1  # Set z-index lower than nodes
-            directed_edge_list.append(directed_edge)
-
-        return {}, directed_edge_list
+        edges = graph.build_edges(node_positions, edge_pairs, directed=True,
+                                  z_index=-1, buff=0.5, color=MAROON_B, stroke_width=5)
+        return {}, edges
 
     def create_edge_weights(self, node_positions):
         """Create weights for each edge and place them at the center of the edge, adjusting for orientation."""
-        weights = {}
         edge_pairs = [
             ("A", "B", "3"),
             ("A", "C", "4"),
@@ -310,32 +276,5 @@ class GraphAnimation(MovingCameraScene):
             ("C", "G", "8"),
             ("C", "F", "9")
         ]
+        return graph.build_edge_weights(node_positions, edge_pairs, offset=0.2, scale=0.6)
 
-        for node1, node2, weight in edge_pairs:
-            start_pos = np.array(node_positions[node1])
-            end_pos = np.array(node_positions[node2])
-            edge_center = (start_pos + end_pos) / 2
-
-            # Calculate the direction of the edge
-            direction = end_pos - start_pos
-            direction_norm = np.linalg.norm(direction)
-
-            # Normalize the direction vector to get the unit vector for the edge
-            direction_unit = direction / direction_norm
-
-            # Adjust the weight's position based on the edge's orientation
-            if abs(direction_unit[0]) > abs(direction_unit[1]):  # More horizontal
-                weight_offset = UP * 0.2  # Shift up for horizontal edges
-            else:  # More vertical
-                weight_offset = RIGHT * 0.2  # Shift right for vertical edges
-
-            # For sloped edges, slightly shift the weight in the direction perpendicular to the edge
-            perpendicular_unit = np.array([-direction_unit[1], direction_unit[0], 0]) * 0.2
-
-            # Create the weight label and apply the calculated offset
-            weight_label = Text(weight, color=BLACK).move_to(edge_center + perpendicular_unit).scale(0.6)
-
-            # Store the weight
-            weights[f"weight_{node1}_{node2}"] = weight_label
-
-        return weights
@@ -1,16 +1,14 @@
 from manim import *
 
-config.background_color = "#173340"
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.array_row import ArrayRow
 
+config.background_color = "#173340"
 
-class Array(VGroup):
-    def __init__(self, array_size=5, **kwargs):
-        super().__init__(**kwargs)
-        self.array_size = array_size
-        self.square_contents = [None] * array_size
-        self.array_group = self.create_array()
-        self.add(self.array_group)
 
+class Array(ArrayRow, VGroup):
     def create_element(self, text):
         square = Square(side_length=1.22, fill_opacity=1, fill_color=RED, color=BLACK)
         text = Text(text, font_size=44, color=BLACK).scale(0.8)
@@ -34,75 +32,34 @@ class Array(VGroup):
                 scene.play(FadeIn(new_square))
             else:
                 scene.play(Transform(self.square_contents[index], new_square))
-            self.square_contents[index] = new_square
+            self.place(index, new_square)
         else:
             scene.play(Indicate(self.array_group, color=RED))
             print(f"Index {index} is out of bounds")
 
     def append_element(self, scene, value):
-        for i, square in enumerate(self.array_group[0]):
-            if self.square_contents[i] is None:
-                new_square = Square(side_length=1.22, fill_opacity=1, fill_color=ORANGE, color=PURE_RED,
-                                    stroke_width=6)
-                number = Text(str(value), color=BLACK).set_z_index(1)
-                new_square1 = VGroup(new_square, number)
-                new_square1.move_to(square.get_center())
-                self.square_contents[i] = new_square1
-                break
-        else:
+        i = self.next_free_index()
+        if i is None:
             scene.play(Indicate(self.array_group, color=RED))
+            return
+        new_square = Square(side_length=1.22, fill_opacity=1, fill_color=ORANGE, color=PURE_RED,
+                            stroke_width=6)
+        number = Text(str(value), color=BLACK).set_z_index(1)
+        new_square1 = VGroup(new_square, number)
+        new_square1.move_to(self.slot_center(i))
+        self.place(i, new_square1)
 
     def add_element(self, scene, value, color=TEAL_B):
-        for i, square in enumerate(self.array_group[0]):
-            if self.square_contents[i] is None:
-                new_square = Square(side_length=1.22, fill_opacity=1, fill_color=color, color=PURE_RED,
-                                    stroke_width=6)
-                number = Text(str(value), color=BLACK).set_z_index(1)
-                new_square1 = VGroup(new_square, number)
-                new_square1.move_to(square.get_center())
-                self.square_contents[i] = new_square1
-                break
-        else:
+        i = self.next_free_index()
+        if i is None:
             scene.play(Indicate(self.array_group, color=RED))
-
-    def pop_element(self, scene):
-        for i in range(self.array_size - 1, -1, -1):
-            if self.square_contents[i] is not None:
-                scene.play(FadeOut(self.square_contents[i]))
-                self.square_contents[i] = None
-                break
-        else:
-            scene.play(Indicate(self.array_group, color=RED))
-
-    def delete_from_front(self, scene):
-        if self.square_contents[0] is not None:
-            scene.play(FadeOut(self.square_contents[0]))
-            self.square_contents[0] = None
-            animations = []
-            for i in range(1, self.array_size):
-                if self.square_contents[i] is not None:
-                    animations.append(
-                        self.square_contents[i].animate.move_to(self.array_group[0][i - 1].get_center())
-                    )
-                    self.square_contents[i - 1] = self.square_contents[i]
-                    self.square_contents[i] = None
-            if animations:
-                scene.play(*animations)
-        else:
-            scene.play(Indicate(self.array_group, color=RED))
-
-    def create_new_array(self, scene, new_size):
-        new_array = Array(array_size=new_size)
-        new_array.next_to(self, DOWN, buff=0.7)
-        scene.play(Create(new_array))
-        return new_array
-
-    def transfer_elements_to_new_array(self, scene, new_array):
-        for i, content in enumerate(self.square_contents):
-            if content is not None:
-                scene.play(Transform(content, new_array.array_group[0][i]))
-                new_array.square_contents[i] = content
-                self.square_contents[i] = None
+            return
+        new_square = Square(side_length=1.22, fill_opacity=1, fill_color=color, color=PURE_RED,
+                            stroke_width=6)
+        number = Text(str(value), color=BLACK).set_z_index(1)
+        new_square1 = VGroup(new_square, number)
+        new_square1.move_to(self.slot_center(i))
+        self.place(i, new_square1)
 
 
 class Heap(MovingCameraScene):
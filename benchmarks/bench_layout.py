@@ -0,0 +1,322 @@
+"""
+Benchmark: layout validation
+============================
+Compares the old all-pairs ``validate_layout`` loops with the box-array /
+sweep-and-prune version in ``common.layout`` on synthetic scenes, and checks
+that both report exactly the same issues.  A second table times the
+incremental ``LayoutValidator`` at checkpoints where only a few mobjects
+moved, against a full re-validation.
+
+    python benchmarks/bench_layout.py
+    python benchmarks/bench_layout.py --sizes 1000 10000 --skip-legacy-above 10000
+
+The all-pairs version grows quadratically: ~10 s at 1k mobjects and about a
+hundred times that at 10k, so by default it only runs up to 1k.
+
+Only numpy is needed; the scene is made of small stand-ins exposing the parts
+of the mobject API the validator reads (bounding box, corners, text,
+font size, fill opacity, submobjects, and ManimGL's ``note_changed_data``
+calls up the parent chain).  Labels carry one glyph per character, as
+``Text`` does, and the mobject counts below include only the top of each
+label.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import layout  # noqa: E402
+
+
+class FakeMob:
+    def __init__(self, center, w, h, text=None, font_size=None, opacity=0.0):
+        cx, cy = center
+        self._bb = np.array([[cx - w / 2, cy - h / 2, 0.0],
+                             [cx, cy, 0.0],
+                             [cx + w / 2, cy + h / 2, 0.0]])
+        if text is not None:
+            self.text = text
+            self.font_size = font_size
+        self._opacity = opacity
+        self.submobjects = []
+        self.parents = []
+
+    @property
+    def points(self):
+        return self._bb
+
+    def get_family(self):
+        family = [self]
+        for sub in self.submobjects:
+            family.extend(sub.get_family())
+        return family
+
+    def get_bounding_box(self):
+        return self._bb
+
+    def get_corner(self, direction):
+        idx = (np.sign(direction) + 1).astype(int)
+        return self._bb[idx, np.arange(3)]
+
+    def get_fill_opacity(self):
+        return self._opacity
+
+    def note_changed_data(self):
+        for parent in self.parents:
+            parent.note_changed_data()
+
+    def shift(self, dx, dy):
+        self._bb = self._bb + np.array([dx, dy, 0.0])
+        for sub in self.submobjects:
+            sub.shift(dx, dy)
+        self.note_changed_data()
+
+
+class FakeShape(FakeMob):
+    pass
+
+
+class FakeText(FakeMob):
+    """A label with one glyph submobject per character, like ``Text``."""
+
+    def __init__(self, center, w, h, text, font_size):
+        super().__init__(center, w, h, text=text, font_size=font_size)
+        left = center[0] - w / 2
+        step = w / len(text)
+        for k in range(len(text)):
+            glyph = FakeMob((left + (k + 0.5) * step, center[1]), step * 0.8, h * 0.8, opacity=1.0)
+            glyph.parents.append(self)
+            self.submobjects.append(glyph)
+
+
+class FakeGroup(FakeMob):
+    def __init__(self, *subs):
+        bbs = np.array([s.get_bounding_box() for s in subs])
+        lo, hi = bbs[:, 0].min(axis=0), bbs[:, 2].max(axis=0)
+        super().__init__(((lo + hi) / 2)[:2], *(hi - lo)[:2])
+        self.submobjects = list(subs)
+        for sub in subs:
+            sub.parents.append(self)
+
+
+class FakeFrame:
+    def get_center(self):
+        return np.zeros(3)
+
+
+class FakeScene:
+    def __init__(self, mobjects, frame_scale):
+        self.mobjects = mobjects
+        self.camera = type("Camera", (), {"frame": FakeFrame()})()
+        self.frame_scale = frame_scale
+
+
+def make_mobjects(n, scale, rng, tag=""):
+    half_w, half_h = 7.1 * scale, 4.0 * scale
+    mobs = []
+    count = 0
+    while count < n:
+        c = rng.uniform((-half_w, -half_h), (half_w, half_h))
+        if rng.random() < 0.3:
+            w, h = rng.uniform(0.6, 2.0), rng.uniform(0.6, 1.2)
+            card = FakeShape(c, w, h, opacity=0.9)
+            label = FakeText(c, w * 0.6, 0.3, text=f"card {tag}{count}", font_size=28)
+            mobs.append(FakeGroup(card, label))
+            count += 3
+        else:
+            fs = int(rng.choice([20, 28, 36]))
+            mobs.append(FakeText(c, rng.uniform(0.2, 1.5), 0.35,
+                                 text=f"t{tag}{count}", font_size=fs))
+            count += 1
+    return mobs
+
+
+def make_scene(n, seed=0, per_frame=60):
+    """Cards (filled box + label) and loose labels scattered over a frame
+    scaled so there are about ``per_frame`` mobjects per 14.2 x 8 area --
+    60 is as crowded as the densest hand-made scenes."""
+    rng = np.random.default_rng(seed)
+    scale = max(1.0, np.sqrt(n / per_frame))
+    return FakeScene(make_mobjects(n, scale, rng), scale)
+
+
+# ── The validator as it was before common.layout ─────────────────────
+
+def legacy_validate(scene, camera_scale):
+    half_w = 7.1 * camera_scale
+    half_h = 4.0 * camera_scale
+    left, right, bottom, top = -half_w, half_w, -half_h, half_h
+    prefix = "[VALIDATE] "
+    issues, text_mobjects, filled_shapes, seen_ids = [], [], [], set()
+
+    for mob in scene.mobjects:
+        _legacy_check(mob, left, right, bottom, top, prefix, issues,
+                      text_mobjects, filled_shapes, seen_ids)
+
+    for i in range(len(text_mobjects)):
+        for j in range(i + 1, len(text_mobjects)):
+            m1, m2 = text_mobjects[i], text_mobjects[j]
+            prox = _legacy_text_proximity(m1, m2, layout.MIN_PADDING)
+            if prox == "overlap":
+                issues.append(
+                    f"{prefix}OVERLAP: \"{layout._mob_label(m1)}\" and \"{layout._mob_label(m2)}\""
+                )
+            elif prox == "too_close":
+                issues.append(
+                    f"{prefix}TOO CLOSE (gap < {layout.MIN_PADDING}): "
+                    f"\"{layout._mob_label(m1)}\" and \"{layout._mob_label(m2)}\""
+                )
+
+    for shape in filled_shapes:
+        for txt in text_mobjects:
+            if _legacy_boxes_overlap(shape, txt):
+                issues.append(
+                    f"{prefix}SHAPE COVERS TEXT: {type(shape).__name__} "
+                    f"may obscure \"{layout._mob_label(txt)}\""
+                )
+    return issues
+
+
+def _legacy_check(mob, left, right, bottom, top, prefix, issues,
+                  text_list, filled_shapes, seen_ids):
+    if id(mob) in seen_ids:
+        return
+    seen_ids.add(id(mob))
+    ul = mob.get_corner(layout._UL)
+    dr = mob.get_corner(layout._DR)
+    # Bounds / font-size messages are shared code; only the pair loops and
+    # the per-pair corner lookups are what this benchmark measures.
+    role = layout.check_mobject(mob, (ul[0], dr[1], dr[0], ul[1]),
+                                (left, bottom, right, top), prefix, issues)
+    if role == "skip":
+        return
+    if role == "text":
+        text_list.append(mob)
+    elif role == "shape":
+        filled_shapes.append(mob)
+    for sub in mob.submobjects:
+        _legacy_check(sub, left, right, bottom, top, prefix, issues,
+                      text_list, filled_shapes, seen_ids)
+
+
+def _legacy_text_proximity(m1, m2, min_padding):
+    ul1, dr1 = m1.get_corner(layout._UL), m1.get_corner(layout._DR)
+    ul2, dr2 = m2.get_corner(layout._UL), m2.get_corner(layout._DR)
+    x_sep = max(ul2[0] - dr1[0], ul1[0] - dr2[0])
+    y_sep = max(dr2[1] - ul1[1], dr1[1] - ul2[1])
+    if x_sep <= 0 and y_sep <= 0:
+        return "overlap"
+    if x_sep >= 0 and y_sep >= 0:
+        gap = (x_sep ** 2 + y_sep ** 2) ** 0.5
+    elif x_sep >= 0:
+        gap = x_sep
+    else:
+        gap = y_sep
+    if gap < min_padding:
+        return "too_close"
+    return None
+
+
+def _legacy_boxes_overlap(m1, m2):
+    ul1, dr1 = m1.get_corner(layout._UL), m1.get_corner(layout._DR)
+    ul2, dr2 = m2.get_corner(layout._UL), m2.get_corner(layout._DR)
+    if dr1[0] < ul2[0] or dr2[0] < ul1[0]:
+        return False
+    if dr1[1] > ul2[1] or dr2[1] > ul1[1]:
+        return False
+    return True
+
+
+def current_validate(scene, camera_scale):
+    frame = layout.frame_bounds(scene, camera_scale)
+    issues = []
+    texts, tb, shapes, sb = layout.collect_layout(scene.mobjects, frame, "[VALIDATE] ", issues)
+    issues.extend(layout.pair_issues("[VALIDATE] ", texts, tb, shapes, sb))
+    return issues
+
+
+def timed(fn, *args):
+    with contextlib.redirect_stdout(io.StringIO()):
+        t0 = time.perf_counter()
+        out = fn(*args)
+        return out, time.perf_counter() - t0
+
+
+def printed(fn, *args):
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        t0 = time.perf_counter()
+        fn(*args)
+        elapsed = time.perf_counter() - t0
+    return buf.getvalue(), elapsed
+
+
+def bench_incremental(n, per_frame=8, checkpoints=5, changed=0.01, seed=1):
+    """Move / add / remove ``changed * n`` mobjects between checkpoints, in a
+    scene laid out well enough that only a handful of issues remain."""
+    rng = np.random.default_rng(seed)
+    scene = make_scene(n, seed, per_frame=per_frame)
+    validator = layout.LayoutValidator()
+    printed(validator.validate, scene, "", scene.frame_scale)
+
+    k = max(1, int(len(scene.mobjects) * changed))
+    t_inc = t_full = 0.0
+    for step in range(checkpoints):
+        for idx in rng.choice(len(scene.mobjects), k, replace=False):
+            scene.mobjects[idx].shift(*rng.normal(0, 0.5, 2))
+        del scene.mobjects[:k // 4]
+        scene.mobjects.extend(make_mobjects(k // 4, scene.frame_scale, rng, tag=f"{step}."))
+
+        inc, t = printed(validator.validate, scene, "", scene.frame_scale)
+        t_inc += t
+        full, t = printed(layout.validate_layout_full, scene, "", scene.frame_scale)
+        t_full += t
+        assert inc == full, "incremental result differs from a full validation"
+
+    # Zooming changes which mobjects are too big to check, so roles flip:
+    # the banner is skipped at this zoom and covers texts at 1.2x.
+    scene.mobjects.append(FakeShape((0, 0), 2.2 * 14.2 * scene.frame_scale, 1.0, opacity=0.9))
+    for camera_scale in (scene.frame_scale * 1.2, scene.frame_scale, scene.frame_scale / 1.5):
+        inc, _ = printed(validator.validate, scene, "", camera_scale)
+        full, _ = printed(layout.validate_layout_full, scene, "", camera_scale)
+        assert inc == full, "incremental result differs after a camera change"
+    validator.close()
+    assert "counting" not in FakeMob.note_changed_data.__qualname__, "hook left installed"
+    return t_full / checkpoints, t_inc / checkpoints
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--skip-legacy-above", type=int, default=1000,
+                        help="don't run the O(n^2) version on larger scenes")
+    args = parser.parse_args()
+
+    print(f"{'mobjects':>9} {'texts':>7} {'issues':>8} {'legacy s':>10} {'sweep s':>9} {'speedup':>8}")
+    for n in args.sizes:
+        scene = make_scene(n)
+        new, t_new = timed(current_validate, scene, scene.frame_scale)
+        frame = layout.frame_bounds(scene, scene.frame_scale)
+        n_text = len(layout.collect_layout(scene.mobjects, frame, "", [])[0])
+        if n <= args.skip_legacy_above:
+            old, t_old = timed(legacy_validate, scene, scene.frame_scale)
+            assert old == new, "sweep-and-prune result differs from the all-pairs loops"
+            print(f"{n:>9} {n_text:>7} {len(new):>8} {t_old:>10.3f} {t_new:>9.3f} {t_old / t_new:>7.1f}x")
+        else:
+            print(f"{n:>9} {n_text:>7} {len(new):>8} {'-':>10} {t_new:>9.3f} {'-':>8}")
+
+    print()
+    print(f"{'mobjects':>9} {'changed':>8} {'full s':>9} {'incr s':>9} {'speedup':>8}")
+    for n in args.sizes:
+        t_full, t_inc = bench_incremental(n)
+        print(f"{n:>9} {'1%':>8} {t_full:>9.4f} {t_inc:>9.4f} {t_full / t_inc:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""
+Helpers shared between the scene files of this repo.
+
+Scene files are run directly by ``manimgl`` / ``manim``, so each one puts the
+repo root on ``sys.path`` before importing from here.
+"""
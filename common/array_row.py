@@ -0,0 +1,176 @@
+"""
+Array rows
+==========
+The ``Array(VGroup)`` class was copied into the rotate-array, maximum
+subarray and heap scenes, each copy finding free slots by scanning
+``square_contents`` and moving elements with one ``.animate`` per element
+(``delete_from_front``) or one ``MoveAlongPath`` per element (rotations
+and reversals written out in the scenes).
+
+``ArrayRow`` is the shared part, as a mixin next to ``VGroup``; the scene
+files keep their own ``create_element`` / ``create_array`` /
+``append_element`` styling.  Slot centres come from one ``(n, 3)`` array of
+offsets, kept valid when the row is moved or scaled.  A filled-slot mask
+gives the next free and last filled slots without a Python scan.
+Rearrangements (``rotate_contents``, ``reverse_contents``, ``shift_left``,
+``permute_contents``) are an index permutation of ``square_contents`` plus
+a single ``slide`` animation for every moved element, so rotating a
+thousand elements is still one animation object.
+
+    class Array(ArrayRow, VGroup):
+        def create_array(self): ...
+
+    array.rotate_contents(self, 3, arc_height=1.5, run_time=2)
+"""
+
+import numpy as np
+
+from common.backend import is_manimgl, mn
+
+
+def slide(mobjects, targets, arc_heights=0.0, **kwargs):
+    """
+    One animation moving every mobject's centre to its target, optionally
+    along an arc ``arc_heights`` above (negative: below) the straight line.
+    """
+    m = mn()
+    mobjects = list(mobjects)
+    starts = np.array([mob.get_center() for mob in mobjects]).reshape(-1, 3)
+    targets = np.asarray(targets, dtype=float).reshape(-1, 3)
+    lifts = np.broadcast_to(np.asarray(arc_heights, dtype=float), len(mobjects))[:, None] * m.UP
+
+    def update(_, alpha):
+        path = starts + (targets - starts) * alpha + lifts * (4 * alpha * (1 - alpha))
+        for mob, point in zip(mobjects, path):
+            mob.move_to(point)
+
+    return m.UpdateFromAlphaFunc(m.Group(*mobjects), update, **kwargs)
+
+
+class ArrayRow:
+    """
+    Mixin for a fixed-size row of slots: ``class Array(ArrayRow, VGroup)``.
+
+    Subclasses build the slots in ``create_array`` (a group whose first
+    member holds one square per slot).  ``square_contents[i]`` is the
+    element shown in slot ``i`` or ``None``; scenes may read and swap it
+    directly.
+    """
+
+    def __init__(self, array_size=5, **kwargs):
+        super().__init__(**kwargs)
+        self.array_size = array_size
+        self.square_contents = [None] * array_size
+        self.filled = np.zeros(array_size, dtype=bool)
+        self.array_group = self.create_array()
+        self.add(self.array_group)
+        squares = self.array_group[0]
+        self._slot_offsets = np.array([sq.get_center() for sq in squares]) - squares.get_center()
+        self._row_width = squares.get_width()
+
+    # ── Slots ─────────────────────────────────────────────────────────────
+
+    def slot_centers(self):
+        """``(n, 3)`` centres of the slots where the row is now."""
+        squares = self.array_group[0]
+        return squares.get_center() + self._slot_offsets * (squares.get_width() / self._row_width)
+
+    def slot_center(self, index):
+        return self.slot_centers()[index]
+
+    def next_free_index(self):
+        """First empty slot, or ``None`` when the row is full."""
+        free = np.flatnonzero(~self.filled)
+        return int(free[0]) if len(free) else None
+
+    def last_filled_index(self):
+        """Last occupied slot, or ``None`` when the row is empty."""
+        used = np.flatnonzero(self.filled)
+        return int(used[-1]) if len(used) else None
+
+    def place(self, index, element):
+        """Put ``element`` in slot ``index`` (``None`` empties it)."""
+        self.square_contents[index] = element
+        self.filled[index] = element is not None
+
+    # ── Shared element operations ─────────────────────────────────────────
+
+    def pop_element(self, scene):
+        index = self.last_filled_index()
+        if index is None:
+            scene.play(mn().Indicate(self.array_group, color=mn().RED))
+            return
+        scene.play(mn().FadeOut(self.square_contents[index]))
+        self.place(index, None)
+
+    def delete_from_front(self, scene):
+        if self.square_contents[0] is None:
+            scene.play(mn().Indicate(self.array_group, color=mn().RED))
+            return
+        scene.play(mn().FadeOut(self.square_contents[0]))
+        self.place(0, None)
+        self.shift_left(scene)
+
+    def create_new_array(self, scene, new_size):
+        m = mn()
+        new_array = type(self)(array_size=new_size)
+        new_array.next_to(self, m.DOWN, buff=0.7)
+        scene.play((m.ShowCreation if is_manimgl() else m.Create)(new_array))
+        return new_array
+
+    def transfer_elements_to_new_array(self, scene, new_array):
+        for i, content in enumerate(self.square_contents):
+            if content is not None:
+                scene.play(mn().Transform(content, new_array.array_group[0][i]))
+                new_array.place(i, content)
+                self.place(i, None)
+
+    def swap(self, scene, i, j, **kwargs):
+        """``Swap`` the elements in slots ``i`` and ``j``."""
+        a, b = self.square_contents[i], self.square_contents[j]
+        scene.play(mn().Swap(a, b), **kwargs)
+        self.place(i, b)
+        self.place(j, a)
+
+    # ── Batched rearrangements ────────────────────────────────────────────
+
+    def permute_contents(self, scene, order, arc_heights=0.0, **kwargs):
+        """
+        Rearrange so slot ``k`` shows what slot ``order[k]`` showed, in one
+        animation.  ``arc_heights`` is one value or one per slot of the
+        destination.
+        """
+        order = np.asarray(order, dtype=int)
+        contents = self.square_contents
+        moved = np.flatnonzero((order != np.arange(self.array_size)) & self.filled[order])
+        self.square_contents = [contents[k] for k in order]
+        self.filled = self.filled[order]
+        if len(moved):
+            heights = np.broadcast_to(np.asarray(arc_heights, dtype=float), self.array_size)[moved]
+            scene.play(slide([self.square_contents[k] for k in moved], self.slot_centers()[moved],
+                             heights), **kwargs)
+
+    def rotate_contents(self, scene, k, arc_height=0.0, **kwargs):
+        """
+        Rotate right by ``k`` slots: elements that stay in order arc up,
+        the ``k`` that wrap around to the front arc down.
+        """
+        n = self.array_size
+        k %= n
+        order = np.roll(np.arange(n), k)
+        heights = np.where(np.arange(n) >= k, arc_height, -arc_height)
+        self.permute_contents(scene, order, heights, **kwargs)
+
+    def reverse_contents(self, scene, lo=0, hi=None, arc_height=0.0, **kwargs):
+        """Reverse slots ``lo..hi``; the left half arcs up, the right half down."""
+        hi = self.array_size - 1 if hi is None else hi
+        order = np.arange(self.array_size)
+        order[lo:hi + 1] = order[lo:hi + 1][::-1]
+        slots = np.arange(self.array_size)
+        heights = np.where(slots > (lo + hi) / 2, arc_height, -arc_height)
+        self.permute_contents(scene, order, heights, **kwargs)
+
+    def shift_left(self, scene, **kwargs):
+        """Move every element one slot left (slot 0 must be empty)."""
+        order = np.roll(np.arange(self.array_size), -1)
+        self.permute_contents(scene, order, **kwargs)
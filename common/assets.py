@@ -0,0 +1,165 @@
+"""
+Generated-asset cache
+=====================
+Heatmaps, pooled images and precomputed grids that scenes build from
+numpy are stored once under ``CACHE_DIR`` and reused on every later
+render, including ``-s`` previews.
+
+Each asset is content-addressed: its file name is a hash of the asset name,
+every parameter that went into it (plus, for derived images, a hash of the
+source file) and the code that computes it (``code_hash``: the builder and
+every function of this repository it calls by name).  Changing a parameter
+or editing the builder produces a new file instead of silently reusing a
+stale one; deleting ``.cache/`` forces a rebuild.  Files are written under a
+temporary name and moved into place, so renders running side by side never
+read a half-written asset.
+
+    path = assets.cached_image("pe_heatmap", make_rgb, n_pos=50, n_dim=128)
+    heatmap = ImageMobject(path)
+"""
+
+import functools
+import hashlib
+import os
+import tempfile
+import types
+
+import numpy as np
+
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_DIR = os.path.join(REPO_DIR, ".cache", "assets")
+
+
+def file_hash(path):
+    """SHA-1 of a file's bytes, for keying assets derived from it."""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def array_hash(*arrays):
+    """SHA-1 over the bytes of ``arrays``, for keying assets computed from data."""
+    h = hashlib.sha1()
+    for a in arrays:
+        a = np.ascontiguousarray(a)
+        h.update(f"{a.dtype}{a.shape}".encode())
+        h.update(a.tobytes())
+    return h.hexdigest()
+
+
+def _in_repo(obj):
+    path = getattr(getattr(obj, "__code__", None), "co_filename", None) \
+        or getattr(obj, "__file__", None)
+    return path is not None and os.path.abspath(path).startswith(REPO_DIR + os.sep)
+
+
+def code_hash(fn):
+    """
+    SHA-1 of ``fn``'s code and, recursively, of the repository functions it
+    reaches through globals, module attributes, closures and
+    ``functools.partial``.  Library code and data in closures are left out.
+    """
+    h = hashlib.sha1()
+    seen = set()
+
+    def visit_code(code, fn):
+        h.update(code.co_code)
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                visit_code(const, fn)
+            else:
+                h.update(repr(const).encode())
+        for name in code.co_names:
+            target = fn.__globals__.get(name)
+            if isinstance(target, types.ModuleType):
+                if _in_repo(target):
+                    for attr in code.co_names:
+                        visit(getattr(target, attr, None))
+            else:
+                visit(target)
+
+    def visit(obj):
+        if isinstance(obj, functools.partial):
+            visit(obj.func)
+            return
+        if not isinstance(obj, types.FunctionType) or id(obj) in seen or not _in_repo(obj):
+            return
+        seen.add(id(obj))
+        visit_code(obj.__code__, obj)
+        for cell in obj.__closure__ or ():
+            try:
+                visit(cell.cell_contents)
+            except ValueError:      # not bound yet
+                pass
+
+    if isinstance(fn, functools.partial) or isinstance(fn, types.FunctionType):
+        visit(fn)
+    else:
+        h.update(repr(fn).encode())
+    return h.hexdigest()
+
+
+def atomic_write(path, write):
+    """Call ``write(file)`` on a temporary file next to ``path``, then move it there."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def asset_key(name, **params):
+    """Stable hash of ``name`` and ``params`` (order-independent)."""
+    blob = repr((name, sorted(params.items())))
+    return hashlib.sha1(blob.encode()).hexdigest()[:16]
+
+
+def asset_path(name, ext, **params):
+    return os.path.join(CACHE_DIR, f"{name}_{asset_key(name, **params)}.{ext}")
+
+
+def cached_image(name, make_rgb, **params):
+    """
+    Path of a PNG made from ``make_rgb(**params)`` (a ``uint8`` array,
+    grayscale or RGB).  ``make_rgb`` only runs when the file is missing.
+    """
+    path = asset_path(name, "png", code=code_hash(make_rgb), **params)
+    if not os.path.exists(path):
+        from PIL import Image
+
+        image = Image.fromarray(np.asarray(make_rgb(**params), dtype=np.uint8))
+        atomic_write(path, lambda f: image.save(f, format="PNG"))
+    return path
+
+
+def cached_arrays(name, compute, **params):
+    """
+    Dict of arrays returned by ``compute(**params)``, stored as one ``.npz``
+    and loaded from it on later calls.
+    """
+    path = asset_path(name, "npz", code=code_hash(compute), **params)
+    if os.path.exists(path):
+        with np.load(path) as data:
+            return {k: data[k] for k in data.files}
+    arrays = {k: np.asarray(v) for k, v in compute(**params).items()}
+    atomic_write(path, lambda f: np.savez(f, **arrays))
+    return arrays
+
+
+def upscale(image, factor):
+    """Nearest-neighbour upscale of an ``(h, w[, c])`` array by an integer factor."""
+    return image.repeat(factor, axis=0).repeat(factor, axis=1)
+
+
+def diverging_rgb(values, lo=-1.0, hi=1.0):
+    """Blue - white - red ``uint8`` image of ``values`` mapped from ``[lo, hi]``."""
+    t = np.clip((np.asarray(values, dtype=float) - lo) / (hi - lo), 0, 1)
+    up = np.clip(t / 0.5, 0, 1)
+    down = np.clip((1 - t) / 0.5, 0, 1)
+    rgb = np.stack([up, np.minimum(up, down), down], axis=-1)
+    return (rgb * 255).astype(np.uint8)
@@ -0,0 +1,27 @@
+"""
+Which manim the calling scene runs on.
+
+The ``manimGl/`` and ``2025``/``2026`` scenes use ManimGL (``manimlib``), the
+``ManimCE Codes/`` scenes use ManimCE (``manim``).  Helpers in ``common`` look
+up mobject classes through ``mn()`` so one module serves both.
+"""
+
+import sys
+
+
+def mn():
+    """The manim module already imported by the scene file."""
+    for name in ("manimlib", "manim"):
+        module = sys.modules.get(name)
+        if module is not None:
+            return module
+    try:
+        import manimlib
+        return manimlib
+    except ImportError:
+        import manim
+        return manim
+
+
+def is_manimgl():
+    return mn().__name__ == "manimlib"
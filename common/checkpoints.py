@@ -0,0 +1,122 @@
+"""
+Named checkpoints for long scenes (ManimGL)
+===========================================
+``SelfAttentionIntro``, ``MultiHeadAttention`` and
+``MaskedMultiHeadAttention`` are single ``construct`` methods of several
+hundred lines; fixing an animation near the end meant rendering everything
+before it again.  With the ``Checkpoints`` mixin a scene marks its sections
+with ``self.checkpoint("name")`` and ``MANIM_SECTIONS`` picks what to
+render:
+
+    MANIM_SECTIONS=parallelism manimgl code.py SelfAttentionIntro -w
+    MANIM_SECTIONS=word_cards:weighted_sum manimgl code.py SelfAttentionIntro
+
+``from:to`` renders from checkpoint ``from`` up to (not including) ``to``;
+either side may be empty.  Sections before ``from`` still run, since later
+code uses their mobjects, but in ManimGL's skip mode: no interpolation, no
+frames, no encoding, which is where the minutes went.
+
+Every rendered checkpoint also writes the scene state to
+``CHECKPOINT_DIR/<Scene>/<name>.pkl``: scene time, frame, a fingerprint of
+the mobject family and, when it pickles (no lambda updaters), the mobjects
+themselves.  A later run that fast-forwards past the checkpoint compares
+fingerprints and warns when an earlier section has changed since, and
+``load_checkpoint`` gives the saved mobjects back for an ``embed`` session.
+"""
+
+import hashlib
+import inspect
+import os
+import pickle
+import re
+import warnings
+
+import numpy as np
+
+from manimlib.scene.scene import EndScene
+
+
+SECTION_ENV = "MANIM_SECTIONS"
+CHECKPOINT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              ".cache", "checkpoints")
+
+_CHECKPOINT_CALL = re.compile(r"""\.checkpoint\(\s*["']([^"']+)["']""")
+
+
+def checkpoint_names(scene_class):
+    """Checkpoint names in ``scene_class.construct``, in source order."""
+    return _CHECKPOINT_CALL.findall(inspect.getsource(scene_class.construct))
+
+
+def parse_sections(value):
+    """``"a:b"`` -> ``("a", "b")``, ``"a"`` -> ``("a", None)``, empty -> ``None``s."""
+    if not value:
+        return None, None
+    start, _, end = value.partition(":")
+    return start or None, end or None
+
+
+def _checkpoint_path(scene_name, name):
+    return os.path.join(CHECKPOINT_DIR, scene_name, f"{name}.pkl")
+
+
+def load_checkpoint(scene_name, name):
+    """The state dict saved at checkpoint ``name`` of ``scene_name``."""
+    with open(_checkpoint_path(scene_name, name), "rb") as f:
+        return pickle.load(f)
+
+
+class Checkpoints:
+    """Mixin for ManimGL scenes: ``class S(Checkpoints, InteractiveScene)``."""
+
+    def setup(self):
+        super().setup()
+        names = checkpoint_names(type(self))
+        self.section_start, self.section_end = parse_sections(os.environ.get(SECTION_ENV))
+        for name in (self.section_start, self.section_end):
+            if name is not None and name not in names:
+                raise ValueError(f"{type(self).__name__} has no checkpoint {name!r}; "
+                                 f"checkpoints are {names}")
+        self.skip_outside_sections = self.skip_animations
+        if self.section_start is not None:
+            self.skip_animations = True
+
+    def checkpoint(self, name):
+        """Mark the start of section ``name``."""
+        if name == self.section_end:
+            raise EndScene()
+        if name == self.section_start:
+            self.skip_animations = self.skip_outside_sections
+        path = _checkpoint_path(type(self).__name__, name)
+        fingerprint = self.state_fingerprint()
+        if self.skip_animations:
+            saved = load_checkpoint(type(self).__name__, name) if os.path.exists(path) else None
+            if saved is not None and saved["fingerprint"] != fingerprint:
+                warnings.warn(f"sections before checkpoint {name!r} changed since it was last rendered")
+            return
+        state = {
+            "name": name,
+            "time": self.time,
+            "frame": self.frame.copy(),
+            "fingerprint": fingerprint,
+            "mobjects": list(self.mobjects),
+        }
+        try:
+            blob = pickle.dumps(state)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # Updaters closing over locals do not pickle; keep time and fingerprint
+            state["mobjects"] = state["frame"] = None
+            blob = pickle.dumps(state)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(blob)
+
+    def state_fingerprint(self):
+        """Hash of every on-screen mobject's points, rounded."""
+        h = hashlib.sha1()
+        for mob in self.mobjects:
+            for sub in mob.get_family():
+                points = np.round(np.asarray(sub.get_points(), dtype=float), 4)
+                h.update(str(points.shape).encode())
+                h.update(points.tobytes())
+        return h.hexdigest()
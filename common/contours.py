@@ -0,0 +1,148 @@
+"""
+Marching-squares contours
+=========================
+Level-set lines of a sampled 2-D field (an SVM ``decision_function`` grid,
+a loss surface, ...) without going through a matplotlib figure.
+
+Cell cases, edge crossings and segments are computed for the whole grid
+with numpy; only the final stitching of segments into polylines walks the
+points that actually lie on a contour.  ``to_scene_points`` maps the
+resulting ``(n, 2)`` data arrays onto a linear ``Axes`` / ``NumberPlane``
+in one operation, ready for ``VMobject.set_points_smoothly``.
+"""
+
+import numpy as np
+
+
+# Edges of a cell: 0 bottom, 1 right, 2 top, 3 left.  Corner bits:
+# 1 bottom-left, 2 bottom-right, 4 top-right, 8 top-left.  Saddles (5, 10)
+# are listed separately and resolved with the cell-centre value.
+_SEGMENTS = {
+    1: [(3, 0)], 2: [(0, 1)], 3: [(3, 1)], 4: [(1, 2)],
+    6: [(0, 2)], 7: [(3, 2)], 8: [(2, 3)], 9: [(0, 2)],
+    11: [(1, 2)], 12: [(1, 3)], 13: [(0, 1)], 14: [(3, 0)],
+}
+# (centre above level, centre below level)
+_SADDLES = {
+    5: ([(0, 1), (2, 3)], [(3, 0), (1, 2)]),
+    10: ([(3, 0), (1, 2)], [(0, 1), (2, 3)]),
+}
+
+
+def _crossing(a, b, level):
+    """Fraction along an edge from value ``a`` to ``b`` where ``level`` is hit."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = (level - a) / (b - a)
+    return np.clip(np.nan_to_num(t, nan=0.5), 0, 1)
+
+
+def _edge_points(xs, ys, Z, level):
+    """Crossing coordinates of every horizontal edge, then every vertical one."""
+    t_h = _crossing(Z[:, :-1], Z[:, 1:], level)
+    hx = xs[:-1] + t_h * np.diff(xs)
+    hy = np.broadcast_to(ys[:, None], hx.shape)
+    t_v = _crossing(Z[:-1, :], Z[1:, :], level)
+    vy = ys[:-1, None] + t_v * np.diff(ys)[:, None]
+    vx = np.broadcast_to(xs[None, :], vy.shape)
+    return np.concatenate([
+        np.stack([hx.ravel(), hy.ravel()], axis=1),
+        np.stack([vx.ravel(), vy.ravel()], axis=1),
+    ])
+
+
+def contour_segments(xs, ys, Z, level=0.0):
+    """
+    ``(points, segments)``: crossing coordinates for every grid edge and an
+    ``(m, 2)`` array of point ids joined by a contour segment.
+    """
+    Z = np.asarray(Z, dtype=float)
+    ny, nx = Z.shape
+    above = Z > level
+    case = (above[:-1, :-1] * 1 + above[:-1, 1:] * 2
+            + above[1:, 1:] * 4 + above[1:, :-1] * 8)
+    centre_above = (Z[:-1, :-1] + Z[:-1, 1:] + Z[1:, 1:] + Z[1:, :-1]) / 4 > level
+
+    # Point id of each cell's four edges
+    i, j = np.mgrid[0:ny - 1, 0:nx - 1]
+    n_h = ny * (nx - 1)
+    edge_id = np.stack([
+        i * (nx - 1) + j,            # bottom
+        n_h + i * nx + j + 1,        # right
+        (i + 1) * (nx - 1) + j,      # top
+        n_h + i * nx + j,            # left
+    ], axis=-1)
+
+    segments = []
+    for c, pairs in _SEGMENTS.items():
+        cells = edge_id[case == c]
+        for a, b in pairs:
+            segments.append(np.stack([cells[:, a], cells[:, b]], axis=1))
+    for c, (hi_pairs, lo_pairs) in _SADDLES.items():
+        for centre, pairs in ((True, hi_pairs), (False, lo_pairs)):
+            cells = edge_id[(case == c) & (centre_above == centre)]
+            for a, b in pairs:
+                segments.append(np.stack([cells[:, a], cells[:, b]], axis=1))
+
+    points = _edge_points(np.asarray(xs, float), np.asarray(ys, float), Z, level)
+    return points, np.concatenate(segments) if segments else np.zeros((0, 2), int)
+
+
+def marching_squares(xs, ys, Z, level=0.0):
+    """
+    Contour lines of ``Z`` (shape ``(len(ys), len(xs))``) at ``level`` as a
+    list of ``(n, 2)`` arrays in data coordinates.  Closed loops repeat their
+    first point at the end.
+    """
+    points, segments = contour_segments(xs, ys, Z, level)
+    if not len(segments):
+        return []
+
+    # Each crossing point is shared by at most two cells, so it has at
+    # most two neighbours.
+    ids, local = np.unique(segments, return_inverse=True)
+    local = local.reshape(segments.shape)
+    nbr = np.full((len(ids), 2), -1)
+    ends = np.concatenate([local, local[:, ::-1]])
+    order = np.argsort(ends[:, 0], kind="stable")
+    ends = ends[order]
+    first = np.r_[True, ends[1:, 0] != ends[:-1, 0]]
+    slot = np.where(first, 0, 1)
+    nbr[ends[:, 0], slot] = ends[:, 1]
+
+    degree = (nbr >= 0).sum(axis=1)
+    visited = np.zeros(len(ids), dtype=bool)
+    lines = []
+    # Open lines start at degree-1 points, loops anywhere
+    for start in np.r_[np.flatnonzero(degree == 1), np.arange(len(ids))]:
+        if visited[start]:
+            continue
+        path, prev, cur = [start], -1, start
+        visited[start] = True
+        while True:
+            a, b = nbr[cur]
+            nxt = b if a == prev else a
+            if nxt < 0 or nxt == start and len(path) > 2:
+                if nxt == start:
+                    path.append(start)
+                break
+            if visited[nxt]:
+                break
+            visited[nxt] = True
+            path.append(nxt)
+            prev, cur = cur, nxt
+        lines.append(points[ids[path]])
+    return lines
+
+
+def to_scene_points(axes, xy):
+    """
+    ``(n, 3)`` scene points for ``(n, 2)`` (or ``(n, 3)`` on ``ThreeDAxes``)
+    data coordinates on a linear ``axes`` (``NumberPlane`` / ``Axes``),
+    using one ``coords_to_point`` call per dimension instead of one per point.
+    """
+    xy = np.asarray(xy, dtype=float)
+    dims = xy.shape[1]
+    origin = np.asarray(axes.coords_to_point(*np.zeros(dims)), dtype=float)
+    basis = np.array([np.asarray(axes.coords_to_point(*unit), dtype=float) - origin
+                      for unit in np.eye(dims)])
+    return origin + xy @ basis
@@ -0,0 +1,181 @@
+"""
+Adaptive function graphs
+========================
+Activation and loss curves were drawn from 1000 evenly spaced samples (or
+``axes.get_graph``), rebuilt in every scene.  ``sample_curve`` instead
+starts from a few segments and bisects, all segments of a level at once,
+only where the curve bends away from its chord by more than ``tol`` scene
+units: a straight ReLU piece keeps its two end points while the sigmoid
+knee and the derivative's jump get many.
+
+Samples are memoized by (function, range, axes transform, tolerance).
+``graph_family`` evaluates a whole parameter sweep (``sigmoid(w x + b)``
+for several ``w, b``) on one shared sample set, so the curves have the same
+number of points and ``Transform`` between them needs no re-alignment.
+
+    relu = graph(axes, ACTIVATIONS["relu"], (-3, 5), color=GREEN)
+    steep, gentle = graph_family(axes, lambda x, w: sigmoid(w * x), [4, 1], (-3, 3))
+"""
+
+import numpy as np
+
+from common.backend import mn
+
+
+# ── Activation functions (vectorized) ─────────────────────────────────────
+
+def sigmoid(x):
+    return 1 / (1 + np.exp(-x))
+
+
+ACTIVATIONS = {
+    "sigmoid": sigmoid,
+    "sigmoid_derivative": lambda x: sigmoid(x) * (1 - sigmoid(x)),
+    "tanh": np.tanh,
+    "tanh_derivative": lambda x: 1 - np.tanh(x) ** 2,
+    "relu": lambda x: np.maximum(0, x),
+    "relu_derivative": lambda x: np.where(x > 0, 1.0, 0.0),
+    "leaky_relu": lambda x, alpha=0.1: np.maximum(alpha * x, x),
+    "leaky_relu_derivative": lambda x, alpha=0.1: np.where(x > 0, 1.0, alpha),
+    "swish": lambda x: x * sigmoid(x),
+    "swish_derivative": lambda x: sigmoid(x) * (1 + x * (1 - sigmoid(x))),
+}
+
+
+# ── Sampling ──────────────────────────────────────────────────────────────
+
+_SAMPLE_CACHE = {}
+
+
+def _function_key(f):
+    """Equal for re-created identical lambdas, ``f`` itself otherwise."""
+    code = getattr(f, "__code__", None)
+    if code is None:
+        return f
+    try:
+        cells = tuple(c.cell_contents for c in (f.__closure__ or ()))
+    except ValueError:      # a closed-over name not bound yet: nothing stable to key on
+        return f
+    key = (code, f.__defaults__, cells)
+    try:
+        hash(key)
+    except TypeError:
+        return id(f)
+    return key
+
+
+def _transform(axes):
+    """``(origin, ex, ey)`` of a linear ``axes``; identity without one."""
+    if axes is None:
+        return np.zeros(3), np.array([1.0, 0, 0]), np.array([0, 1.0, 0])
+    origin = np.asarray(axes.c2p(0, 0), dtype=float)
+    return (origin, np.asarray(axes.c2p(1, 0), dtype=float) - origin,
+            np.asarray(axes.c2p(0, 1), dtype=float) - origin)
+
+
+def _bend(x0, x1, f, transform):
+    """
+    Largest distance (over the curves of ``f``) of the quarter and mid
+    points from the chord; the quarter points catch bends that are
+    point-symmetric about the midpoint (``tanh`` across zero).
+    """
+    origin, ex, ey = transform
+    xs = np.stack([x0 + (x1 - x0) * t for t in (0, 0.25, 0.5, 0.75, 1)])
+    ys = np.asarray(f(xs[..., None]), dtype=float)
+    pts = xs[..., None, None] * ex + ys[..., None] * ey
+    a, b = pts[0], pts[-1]
+    chord = b - a
+    length = np.linalg.norm(chord, axis=-1)
+    cross = np.linalg.norm(np.cross(chord, pts[1:-1] - a), axis=-1).max(axis=0)
+    dist = np.where(length > 0, cross / np.maximum(length, 1e-12), 0)
+    return np.nan_to_num(dist, nan=np.inf).max(axis=-1)
+
+
+def sample_curve(f, x_range, axes=None, tol=0.002, base=8, max_depth=12):
+    """
+    Sorted sample positions for ``f`` on ``x_range``.
+
+    ``f`` maps an array of x (shape ``(..., 1)``) to y of shape ``(..., k)``
+    for ``k`` curves sampled together.  Segments are bisected while their
+    mid or quarter points are more than ``tol`` (scene units when ``axes``
+    is given) off the chord, up to ``max_depth`` times.
+    """
+    transform = _transform(axes)
+    key = (_function_key(f), tuple(x_range), tuple(np.round(np.concatenate(transform), 6)),
+           tol, base, max_depth)
+    xs = _SAMPLE_CACHE.get(key)
+    if xs is None:
+        edges = np.linspace(x_range[0], x_range[1], base + 1)
+        done = [edges]
+        lo, hi = edges[:-1], edges[1:]
+        for _ in range(max_depth):
+            split = _bend(lo, hi, f, transform) > tol
+            if not split.any():
+                break
+            mid = (lo[split] + hi[split]) / 2
+            done.append(mid)
+            lo, hi = np.concatenate([lo[split], mid]), np.concatenate([mid, hi[split]])
+        xs = _SAMPLE_CACHE[key] = np.unique(np.concatenate(done))
+    return xs
+
+
+def clear_sample_cache():
+    _SAMPLE_CACHE.clear()
+
+
+def curve_points(axes, f, x_range, **kwargs):
+    """``(n, 3)`` scene points of ``y = f(x)`` on ``axes``."""
+    xs = sample_curve(f, x_range, axes, **kwargs)
+    origin, ex, ey = _transform(axes)
+    ys = np.broadcast_to(np.asarray(f(xs), dtype=float), xs.shape)
+    return origin + xs[:, None] * ex + ys[:, None] * ey
+
+
+def _corner_path(points, color, stroke_width):
+    m = mn()
+    path = m.VMobject()
+    path.set_points_as_corners(points)
+    path.set_stroke(color, width=stroke_width)
+    return path
+
+
+def graph(axes, f, x_range, color=None, stroke_width=6, **kwargs):
+    """Corner-path ``VMobject`` of ``y = f(x)`` on adaptive samples."""
+    return _corner_path(curve_points(axes, f, x_range, **kwargs), color, stroke_width)
+
+
+def graph_family(axes, f, params, x_range, color=None, stroke_width=6, **kwargs):
+    """
+    One graph per parameter of ``f(x, p)``, all on a shared sample set.
+
+    ``params`` is a sequence of scalars or of tuples (``f(x, *p)``); every
+    curve is evaluated in one broadcast call.
+    """
+    params = [p if isinstance(p, tuple) else (p,) for p in params]
+    columns = [np.asarray(c, dtype=float) for c in zip(*params)]
+    family = _FamilyEval(f, columns)
+    xs = sample_curve(family, x_range, axes, **kwargs)
+    origin, ex, ey = _transform(axes)
+    ys = family(xs[:, None])
+    return [
+        _corner_path(origin + xs[:, None] * ex + ys[:, i, None] * ey, color, stroke_width)
+        for i in range(len(params))
+    ]
+
+
+class _FamilyEval:
+    """``x (..., 1) -> (..., k)`` for ``k`` parameter sets; hashable for the cache."""
+
+    def __init__(self, f, columns):
+        self.f = f
+        self.columns = columns
+        self.key = (_function_key(f),) + tuple(tuple(c) for c in columns)
+
+    def __call__(self, x):
+        return np.asarray(self.f(x, *self.columns), dtype=float)
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __eq__(self, other):
+        return isinstance(other, _FamilyEval) and self.key == other.key
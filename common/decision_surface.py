@@ -0,0 +1,145 @@
+"""
+Adaptive decision-surface sampling
+==================================
+Classifier scenes shade decision regions and trace boundaries from a model
+evaluated over the plane.  A uniform ``meshgrid`` spends almost all of its
+evaluations far from the boundary; ``adaptive_surface`` starts from a coarse
+lattice and only subdivides (quadtree style) the cells whose corners fall
+on different sides of the boundary, evaluating every new lattice point of a
+level in one batched model call.
+
+The result is a fine lattice (``xs``, ``ys``, ``Z``): exact model values in
+refined cells, bilinear fill inside uniform cells (which never changes the
+sign / label there), so ``common.contours.marching_squares`` traces a
+boundary at the finest resolution.  ``leaves`` keeps the quadtree cells for
+shading with a handful of rectangles instead of one per pixel.
+
+Features smaller than a coarse cell whose corners all agree are not seen,
+so ``base`` should be fine enough to catch every region once.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from common.backend import mn
+from common.contours import to_scene_points
+
+
+Surface = namedtuple("Surface", "xs ys Z leaves evaluations")
+
+
+def _classes(values, level, labels):
+    return values if labels else values > level
+
+
+def adaptive_surface(f, x_range, y_range, base=16, depth=4, level=0.0, labels=False):
+    """
+    Sample ``f`` -- ``(n, 2)`` points -> ``(n,)`` values -- over the box.
+
+    ``base`` cells per axis at the coarsest level (an int or ``(nx, ny)``),
+    each split up to ``depth`` times.  With ``labels=True`` values are class
+    labels and a cell is refined when its corners disagree; otherwise when
+    they straddle ``level``.
+    """
+    nx, ny = (base, base) if np.isscalar(base) else base
+    step = 2 ** depth
+    xs = np.linspace(x_range[0], x_range[1], nx * step + 1)
+    ys = np.linspace(y_range[0], y_range[1], ny * step + 1)
+    Z = np.full((len(ys), len(xs)), np.nan)
+    known = np.zeros(Z.shape, dtype=bool)
+    evaluations = 0
+
+    def evaluate(ii, jj):
+        nonlocal evaluations
+        flat = np.unique(ii * len(xs) + jj)
+        flat = flat[~known.ravel()[flat]]
+        if len(flat):
+            i, j = np.divmod(flat, len(xs))
+            Z[i, j] = np.asarray(f(np.stack([xs[j], ys[i]], axis=1)), dtype=float)
+            known[i, j] = True
+            evaluations += len(flat)
+
+    ci, cj = np.mgrid[0:ny, 0:nx]
+    cells = np.stack([ci.ravel() * step, cj.ravel() * step], axis=1)
+    evaluate(*np.mgrid[0:len(ys):step, 0:len(xs):step].reshape(2, -1))
+
+    leaves = []
+    size = step
+    while len(cells):
+        i, j = cells[:, 0], cells[:, 1]
+        corners = _classes(np.stack([Z[i, j], Z[i, j + size],
+                                     Z[i + size, j], Z[i + size, j + size]]), level, labels)
+        mixed = np.any(corners != corners[0], axis=0)
+        leaves.append(np.column_stack([cells[~mixed], np.full((~mixed).sum(), size)]))
+        if size == 1:
+            leaves.append(np.column_stack([cells[mixed], np.ones(mixed.sum(), int)]))
+            break
+        half = size // 2
+        parents = cells[mixed]
+        cells = np.concatenate([parents + [di, dj] for di in (0, half) for dj in (0, half)])
+        # Edge midpoints and centres of the split cells
+        offsets = np.array([[0, half], [half, 0], [half, half], [half, size], [size, half]])
+        points = (parents[:, None, :] + offsets[None]).reshape(-1, 2)
+        evaluate(points[:, 0], points[:, 1])
+        size = half
+
+    leaves = np.concatenate(leaves)
+    _fill_uniform(Z, known, leaves, labels)
+    return Surface(xs, ys, Z, leaves, evaluations)
+
+
+def _fill_uniform(Z, known, leaves, labels):
+    """Fill unevaluated lattice points inside each leaf from its corners."""
+    for size in np.unique(leaves[:, 2]):
+        if size == 1:
+            continue
+        block = leaves[leaves[:, 2] == size]
+        t = np.linspace(0, 1, size + 1)
+        di = np.arange(size + 1)
+        ii, jj = np.broadcast_arrays(block[:, 0, None, None] + di[None, :, None],
+                                     block[:, 1, None, None] + di[None, None, :])
+        i0, j0 = block[:, 0], block[:, 1]
+        z00, z01 = Z[i0, j0], Z[i0, j0 + size]
+        z10, z11 = Z[i0 + size, j0], Z[i0 + size, j0 + size]
+        if labels:
+            fill = np.broadcast_to(z00[:, None, None], ii.shape)
+        else:
+            u, v = t[None, None, :], t[None, :, None]
+            fill = ((1 - v) * ((1 - u) * z00[:, None, None] + u * z01[:, None, None])
+                    + v * ((1 - u) * z10[:, None, None] + u * z11[:, None, None]))
+        todo = ~known[ii, jj]
+        Z[ii[todo], jj[todo]] = fill[todo]
+
+
+def leaf_values(surface):
+    """Value at the centre of every leaf (a corner for single-step leaves)."""
+    i, j, s = surface.leaves.T
+    h = s // 2
+    return surface.Z[i + h, j + h]
+
+
+def region_mobject(surface, color_for, axes=None, opacity=0.25):
+    """
+    ``VGroup`` of unstroked rectangles, one per quadtree leaf, coloured by
+    ``color_for(value)``.  ``axes`` maps data to scene coordinates (scene
+    coordinates are used as-is without it).
+    """
+    m = mn()
+    i, j, s = surface.leaves.T
+    x0, x1 = surface.xs[j], surface.xs[j + s]
+    y0, y1 = surface.ys[i], surface.ys[i + s]
+    lo = np.stack([x0, y0], axis=1)
+    hi = np.stack([x1, y1], axis=1)
+    if axes is not None:
+        lo, hi = to_scene_points(axes, lo), to_scene_points(axes, hi)
+    else:
+        lo = np.column_stack([lo, np.zeros(len(lo))])
+        hi = np.column_stack([hi, np.zeros(len(hi))])
+
+    regions = m.VGroup()
+    for a, b, value in zip(lo, hi, leaf_values(surface)):
+        rect = m.Rectangle(width=abs(b[0] - a[0]), height=abs(b[1] - a[1]))
+        rect.set_fill(color_for(value), opacity=opacity).set_stroke(width=0)
+        regions.add(rect.move_to((a + b) / 2))
+    return regions
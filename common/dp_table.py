@@ -0,0 +1,229 @@
+"""
+Dynamic-programming tables (ManimGL)
+====================================
+The DP scenes (knapsack, LCS, coin change, LIS, matrix chain) each built
+their grid as one ``Rectangle`` + ``Text`` per cell in nested loops and kept
+them in ``(i, j)`` dicts.  ``DPTable`` is that grid as one mobject: cell
+centres come from a single ``(rows, cols, 3)`` array, cells are copies of
+one prototype rectangle, and entries and labels are shared glyphs from
+``cached_text``, so a 50x50 table costs a few hundred layouts, not 2500.
+
+Entries are animated one at a time (``write``) for the narrated scenes or
+in bulk (``fill_row``, ``fill_diagonal``) from the tables the recurrences
+below compute.
+
+    dp = knapsack_table(values, weights, capacity)
+    table = DPTable(len(values) + 1, capacity + 1, col_labels=range(capacity + 1))
+    for i in range(1, len(dp)):
+        self.play(table.fill_row(i, dp[i, 1:], start=1))
+"""
+
+import numpy as np
+
+from manimlib import (
+    AnimationGroup, FadeIn, FadeOut, LaggedStart, LEFT, Rectangle, UP, VGroup, WHITE,
+)
+
+from common.labels import cached_text
+
+
+def format_value(value):
+    """Cell text: ``∞`` for infinity, blank for ``None``, integers without ``.0``."""
+    if value is None:
+        return ""
+    if isinstance(value, (float, np.floating)):
+        if np.isinf(value):
+            return "∞"
+        if float(value).is_integer():
+            return str(int(value))
+    return str(value)
+
+
+class DPTable(VGroup):
+    """
+    ``n_rows x n_cols`` grid of cells with optional row / column labels.
+
+    Submobjects are ``cells``, ``entries``, ``row_labels`` and
+    ``col_labels`` (all ``VGroup``s); ``cell(i, j)`` and ``entry(i, j)``
+    look single ones up, ``values`` holds what each cell shows.
+    """
+
+    def __init__(self, n_rows, n_cols, cell_width=0.8, cell_height=None,
+                 row_labels=None, col_labels=None, values=None, font_size=22,
+                 label_size=18, label_buff=0.25, stroke_color=WHITE, stroke_width=1,
+                 **kwargs):
+        cell_height = cell_width if cell_height is None else cell_height
+        self.n_rows, self.n_cols = n_rows, n_cols
+        self.font_size = font_size
+
+        i, j = np.indices((n_rows, n_cols))
+        self.grid_centers = np.stack([j * cell_width, -i * cell_height, np.zeros(i.shape)], axis=-1)
+        prototype = Rectangle(width=cell_width, height=cell_height)
+        prototype.set_stroke(stroke_color, stroke_width)
+        self.cells = VGroup(*(prototype.copy().move_to(c) for c in self.grid_centers.reshape(-1, 3)))
+
+        self.entries = VGroup()
+        self._entries = {}
+        self.values = np.full((n_rows, n_cols), None, dtype=object)
+
+        self.row_labels = VGroup(*(
+            cached_text(str(label), font_size=label_size).next_to(self.cell(r, 0), LEFT, buff=label_buff)
+            for r, label in enumerate(row_labels or [])
+        ))
+        self.col_labels = VGroup(*(
+            cached_text(str(label), font_size=label_size).next_to(self.cell(0, c), UP, buff=label_buff)
+            for c, label in enumerate(col_labels or [])
+        ))
+        super().__init__(self.cells, self.entries, self.row_labels, self.col_labels, **kwargs)
+
+        for (r, c), value in (values or {}).items():
+            self.set_entry(r, c, value)
+
+    # ── Lookup ────────────────────────────────────────────────────────────
+
+    def cell(self, i, j):
+        return self.cells[i * self.n_cols + j]
+
+    def entry(self, i, j):
+        return self._entries.get((i, j))
+
+    def cell_group(self, indices):
+        return VGroup(*(self.cell(i, j) for i, j in indices))
+
+    # ── Entries ───────────────────────────────────────────────────────────
+
+    def make_entry(self, i, j, value, font_size=None, **style):
+        """A glyph for ``value`` centred on cell ``(i, j)`` (not added)."""
+        text = cached_text(format_value(value), persist=True,
+                           font_size=font_size or self.font_size, **style)
+        return text.move_to(self.cell(i, j).get_center())
+
+    def set_entry(self, i, j, value, **style):
+        """Show ``value`` in cell ``(i, j)``; returns ``(old, new)`` glyphs."""
+        old = self._entries.pop((i, j), None)
+        if old is not None:
+            self.entries.remove(old)
+        new = self.make_entry(i, j, value, **style)
+        self.entries.add(new)
+        self._entries[(i, j)] = new
+        self.values[i, j] = value
+        return old, new
+
+    def write(self, i, j, value, **style):
+        """Animation replacing the entry of one cell."""
+        old, new = self.set_entry(i, j, value, **style)
+        if old is None:
+            return FadeIn(new)
+        return AnimationGroup(FadeOut(old), FadeIn(new))
+
+    def fill_cells(self, indices, values, lag_ratio=0.1, **style):
+        """One lagged animation writing ``values`` into the cells ``indices``."""
+        olds, news = [], []
+        for (i, j), value in zip(indices, values):
+            old, new = self.set_entry(i, j, value, **style)
+            news.append(new)
+            if old is not None:
+                olds.append(old)
+        fill = LaggedStart(*(FadeIn(n) for n in news), lag_ratio=lag_ratio)
+        if not olds:
+            return fill
+        return AnimationGroup(*(FadeOut(o) for o in olds), fill)
+
+    def fill_row(self, i, values, start=0, **kwargs):
+        values = list(values)
+        return self.fill_cells([(i, start + k) for k in range(len(values))], values, **kwargs)
+
+    def fill_diagonal(self, offset, values, **kwargs):
+        """Fill cells ``(k, k + offset)``, e.g. one chain length of matrix-chain DP."""
+        values = list(values)
+        return self.fill_cells([(k, k + offset) for k in range(len(values))], values, **kwargs)
+
+    def highlight(self, indices, color, opacity=0.3):
+        """``.animate`` fills for several cells, to unpack into ``self.play``."""
+        return [self.cell(i, j).animate.set_fill(color, opacity=opacity) for i, j in indices]
+
+
+# ── Recurrences ───────────────────────────────────────────────────────────
+# Whole tables computed row by row (or diagonal by diagonal) with numpy.
+
+def knapsack_table(values, weights, capacity):
+    """0/1 knapsack ``(n + 1, capacity + 1)``: best value of the first i items."""
+    dp = np.zeros((len(values) + 1, capacity + 1), dtype=int)
+    for i, (v, w) in enumerate(zip(values, weights), 1):
+        prev = dp[i - 1]
+        dp[i] = prev
+        if w <= capacity:
+            dp[i, w:] = np.maximum(prev[w:], prev[:capacity + 1 - w] + v)
+    return dp
+
+
+def lcs_table(a, b):
+    """``(len(a) + 1, len(b) + 1)`` longest-common-subsequence lengths."""
+    dp = np.zeros((len(a) + 1, len(b) + 1), dtype=int)
+    chars = np.array(list(b))
+    for i, ch in enumerate(a, 1):
+        # A match takes the diagonal + 1, otherwise the cell above; taking
+        # the running max along the row then covers "or the cell to the left".
+        candidate = np.where(chars == ch, dp[i - 1, :-1] + 1, dp[i - 1, 1:])
+        dp[i, 1:] = np.maximum.accumulate(candidate)
+    return dp
+
+
+def coin_change_table(coins, amount, ways=False):
+    """
+    Row ``k`` is the 1-D coin-change array after the first ``k`` coins:
+    fewest coins per amount (``inf`` when unreachable), or the number of
+    ways with ``ways=True``.
+    """
+    dp = np.zeros((len(coins) + 1, amount + 1))
+    if ways:
+        dp[0, 0] = 1
+    else:
+        dp[0, 1:] = np.inf
+    for k, coin in enumerate(coins, 1):
+        # Amounts r, r + c, r + 2c, ... only see each other: run each residue
+        # class of the coin as one column.
+        n = -(-(amount + 1) // coin) * coin
+        prev = np.full(n, 0.0 if ways else np.inf)
+        prev[:amount + 1] = dp[k - 1]
+        cols = prev.reshape(-1, coin)
+        if ways:
+            row = np.cumsum(cols, axis=0)
+        else:
+            steps = np.arange(len(cols))[:, None]
+            row = np.minimum.accumulate(cols - steps, axis=0) + steps
+        dp[k] = row.reshape(-1)[:amount + 1]
+    return dp
+
+
+def lis_table(nums):
+    """Length of the longest increasing subsequence ending at each index."""
+    nums = np.asarray(nums)
+    dp = np.ones(len(nums), dtype=int)
+    for i in range(1, len(nums)):
+        smaller = nums[:i] < nums[i]
+        if smaller.any():
+            dp[i] = dp[:i][smaller].max() + 1
+    return dp
+
+
+def matrix_chain_table(dims):
+    """
+    ``(cost, split)`` for matrices ``dims[i] x dims[i + 1]``; filled one
+    diagonal (chain length) at a time, all chains of a length together.
+    Cells below the diagonal stay ``nan`` / ``-1``.
+    """
+    dims = np.asarray(dims)
+    n = len(dims) - 1
+    cost = np.full((n, n), np.nan)
+    split = np.full((n, n), -1, dtype=int)
+    cost[np.arange(n), np.arange(n)] = 0
+    for length in range(1, n):
+        i = np.arange(n - length)
+        j = i + length
+        k = i[:, None] + np.arange(length)[None, :]
+        options = cost[i[:, None], k] + cost[k + 1, j[:, None]] + dims[i, None] * dims[k + 1] * dims[j + 1, None]
+        best = np.argmin(options, axis=1)
+        cost[i, j] = options[np.arange(len(i)), best]
+        split[i, j] = k[np.arange(len(i)), best]
+    return cost, split
@@ -0,0 +1,174 @@
+"""
+Graph building for the graph-algorithm scenes
+=============================================
+Dijkstra, Prim, Kruskal, Bellman-Ford, Floyd (ManimGL) and BFS / DFS
+(ManimCE) all draw the same kind of picture: labelled circles at fixed
+positions, straight or arrowed edges, and a weight next to each edge.
+
+Edge geometry (centres, directions, normals) is computed for every edge in
+one numpy pass, node circles are copied from a single template, and labels
+come from ``common.labels.cached_text`` so each distinct string is laid out
+once no matter how many nodes, weights or scenes use it.
+"""
+
+import numpy as np
+
+from common.backend import mn
+from common.labels import cached_text
+
+
+def parse_edges(spec):
+    """
+    Normalise an adjacency spec to a list of ``(u, v, weight)``.
+
+    Accepts ``[(u, v), ...]``, ``[(u, v, w), ...]``, ``{u: [v, ...]}`` or
+    ``{u: {v: w}}``; missing weights are ``None``.
+    """
+    if isinstance(spec, dict):
+        edges = []
+        for u, nbrs in spec.items():
+            if isinstance(nbrs, dict):
+                edges.extend((u, v, w) for v, w in nbrs.items())
+            else:
+                edges.extend((u, v, None) for v in nbrs)
+        return edges
+    return [(e[0], e[1], e[2] if len(e) > 2 else None) for e in spec]
+
+
+def _as_points(positions, names):
+    pts = np.zeros((len(names), 3))
+    for k, name in enumerate(names):
+        p = np.asarray(positions[name], dtype=float)
+        pts[k, :len(p)] = p
+    return pts
+
+
+def edge_geometry(positions, pairs):
+    """
+    ``(starts, ends, centers, units, normals)`` as ``(m, 3)`` arrays for the
+    ``(u, v)`` pairs.  ``normals`` is ``units`` rotated a quarter turn
+    counter-clockwise.
+    """
+    starts = _as_points(positions, [p[0] for p in pairs])
+    ends = _as_points(positions, [p[1] for p in pairs])
+    direction = ends - starts
+    length = np.linalg.norm(direction, axis=1, keepdims=True)
+    units = direction / np.where(length == 0, 1, length)
+    normals = np.stack([-units[:, 1], units[:, 0], np.zeros(len(units))], axis=1)
+    return starts, ends, (starts + ends) / 2, units, normals
+
+
+def build_nodes(positions, template, label_color=None, label_z_index=None,
+                label_kwargs=None):
+    """
+    ``{label: VGroup(circle, text)}``; every circle is a copy of
+    ``template`` moved onto its position.
+    """
+    m = mn()
+    label_color = m.BLACK if label_color is None else label_color
+    label_kwargs = label_kwargs or {}
+    nodes = {}
+    for label, position in positions.items():
+        circle = template.copy().move_to(position)
+        text = cached_text(label, **label_kwargs).move_to(position).set_color(label_color)
+        if label_z_index is not None:
+            text.set_z_index(label_z_index)
+        nodes[label] = m.VGroup(circle, text)
+    return nodes
+
+
+def build_edges(positions, pairs, directed=False, z_index=-1, buff=0.5, **style):
+    """``Line`` (or ``Arrow`` when ``directed``) per ``(u, v)`` pair."""
+    m = mn()
+    starts, ends, *_ = edge_geometry(positions, pairs)
+    edges = []
+    for start, end in zip(starts, ends):
+        if directed:
+            edge = m.Arrow(start, end, buff=buff, **style)
+        else:
+            edge = m.Line(start, end, **style)
+        edges.append(edge.set_z_index(z_index))
+    return edges
+
+
+def build_edge_weights(positions, weighted_pairs, offset=0.3, scale=0.7, color=None):
+    """
+    ``{"weight_u_v": text}`` with each weight centred on its edge and pushed
+    ``offset`` along the edge normal.
+    """
+    color = mn().BLACK if color is None else color
+    _, _, centers, _, normals = edge_geometry(positions, weighted_pairs)
+    spots = centers + normals * offset
+    weights = {}
+    for (u, v, w), spot in zip(weighted_pairs, spots):
+        weights[f"weight_{u}_{v}"] = cached_text(str(w), persist=True).move_to(spot).scale(scale).set_color(color)
+    return weights
+
+
+def align_text_parallel_to_line(text_str, line, offset=0.37, scale=0.6, color=None):
+    """Label rotated to run along ``line``, offset to its left-hand side."""
+    m = mn()
+    text = cached_text(text_str).set_color(m.BLACK if color is None else color)
+    text.rotate(line.get_angle())
+    normal_direction = m.rotate_vector(line.get_unit_vector(), m.PI / 2)
+    text.move_to(line.get_center() + normal_direction * offset)
+    return text.scale(scale)
+
+
+def highlight_circle(node, radius=0.5, stroke_color="#FF0000", stroke_width=7, z_index=2):
+    """Hollow ring drawn around a node to mark it as current."""
+    m = mn()
+    ring = m.Circle(radius=radius, fill_opacity=0,
+                    stroke_color=stroke_color, stroke_width=stroke_width)
+    return ring.move_to(node).set_z_index(z_index)
+
+
+def path_line(a, b, color="#FF0000", stroke_width=6.6, z_index=-0.5):
+    """Highlighted edge between two node mobjects."""
+    return mn().Line(start=a.get_center(), end=b.get_center(), color=color,
+                     stroke_width=stroke_width).set_z_index(z_index)
+
+
+class GraphParts:
+    """Mobjects of a built graph, addressable by node label and edge."""
+
+    def __init__(self, nodes, edges, weights):
+        self.nodes = nodes          # label -> VGroup(circle, text)
+        self.edges = edges          # (u, v) -> Line / Arrow
+        self.weights = weights      # (u, v) -> Text
+
+    @property
+    def edge_list(self):
+        return list(self.edges.values())
+
+    def edge(self, u, v):
+        """The edge between ``u`` and ``v`` in either direction."""
+        return self.edges.get((u, v)) or self.edges.get((v, u))
+
+    def weight(self, u, v):
+        return self.weights.get((u, v)) or self.weights.get((v, u))
+
+    def group(self):
+        return mn().VGroup(*self.nodes.values(), *self.edges.values(), *self.weights.values())
+
+
+def build_graph(positions, adjacency, node_template, directed=False,
+                label_color=None, label_z_index=1, edge_style=None,
+                edge_z_index=-5, arrow_buff=0.5,
+                weight_offset=0.3, weight_scale=0.7, weight_color=None):
+    """
+    Nodes, edges and weights for a whole graph in one pass.
+
+    ``adjacency`` is anything ``parse_edges`` accepts; weights are drawn for
+    the edges that have one.
+    """
+    triples = parse_edges(adjacency)
+    pairs = [(u, v) for u, v, _ in triples]
+    nodes = build_nodes(positions, node_template, label_color, label_z_index)
+    edges = dict(zip(pairs, build_edges(positions, pairs, directed=directed,
+                                        z_index=edge_z_index, buff=arrow_buff,
+                                        **(edge_style or {}))))
+    weighted = [t for t in triples if t[2] is not None]
+    labels = build_edge_weights(positions, weighted, weight_offset, weight_scale, weight_color)
+    weights = {(u, v): labels[f"weight_{u}_{v}"] for u, v, _ in weighted}
+    return GraphParts(nodes, edges, weights)
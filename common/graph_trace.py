@@ -0,0 +1,305 @@
+"""
+Shortest-path event traces
+==========================
+Runs Dijkstra, Bellman-Ford or Floyd-Warshall on an edge list and records
+what the algorithm did as a flat list of ``Event``s.  ``TraceDriver`` turns
+that list into animations, batching every event that belongs to one step
+(all relaxations out of a popped node, all updates of one Bellman-Ford pass,
+all cells of one Floyd pivot) into a single ``play``.
+
+The scenes used to hand-script each relaxation; with a trace the same
+bookkeeping comes from one real run of the algorithm, so larger graphs need
+no extra code.
+
+Event kinds
+-----------
+``push``      node entered the queue            (node, new)
+``decrease``  queued node got a smaller key     (node, old, new)
+``pop``       node left the queue / settled     (node, new)
+``relax``     edge u -> v tried                 (u, v, old, new)
+``update``    tentative distance improved       (node, old, new, prev)
+``pass``      Bellman-Ford iteration started    (step)
+``pivot``     Floyd-Warshall pivot k started    (node)
+``negative_cycle``  Bellman-Ford found one      (u, v)
+"""
+
+import heapq
+import math
+from collections import namedtuple
+
+from common.backend import mn
+from common.graph import parse_edges
+from common.labels import cached_text
+
+
+INF = math.inf
+
+Event = namedtuple("Event", "kind node u v old new prev step")
+Event.__new__.__defaults__ = (None,) * len(Event._fields)
+
+
+def _adjacency(edges, directed):
+    adj = {}
+    for u, v, w in parse_edges(edges):
+        adj.setdefault(u, []).append((v, float(w)))
+        adj.setdefault(v, [])
+        if not directed:
+            adj[v].append((u, float(w)))
+    return adj
+
+
+def dijkstra_trace(edges, source, directed=False):
+    """
+    ``(events, dist, prev)`` for Dijkstra from ``source``.
+
+    The heap uses lazy deletion internally, but events describe a
+    decrease-key queue: a node is pushed once and then only ``decrease``d.
+    """
+    adj = _adjacency(edges, directed)
+    adj.setdefault(source, [])      # an isolated source has a trivial trace
+    dist = {n: INF for n in adj}
+    prev = {n: None for n in adj}
+    dist[source] = 0.0
+    events = [Event("push", node=source, new=0.0)]
+    heap = [(0.0, source)]
+    queued, done = {source}, set()
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if u in done or d > dist[u]:
+            continue
+        done.add(u)
+        queued.discard(u)
+        events.append(Event("pop", node=u, new=d))
+        for v, w in adj[u]:
+            if v in done:
+                continue
+            cand = d + w
+            events.append(Event("relax", u=u, v=v, old=dist[v], new=cand))
+            if cand < dist[v]:
+                old = dist[v]
+                dist[v], prev[v] = cand, u
+                events.append(Event("update", node=v, old=old, new=cand, prev=u))
+                if v in queued:
+                    events.append(Event("decrease", node=v, old=old, new=cand))
+                else:
+                    queued.add(v)
+                    events.append(Event("push", node=v, new=cand))
+                heapq.heappush(heap, (cand, v))
+    return events, dist, prev
+
+
+def bellman_ford_trace(edges, source, directed=True):
+    """
+    ``(events, dist, prev)`` for Bellman-Ford from ``source``.  Stops early
+    when a pass changes nothing; a relaxation that still succeeds after
+    ``n - 1`` passes is reported as ``negative_cycle``.
+    """
+    adj = _adjacency(edges, directed)
+    adj.setdefault(source, [])      # an isolated source has a trivial trace
+    edge_list = [(u, v, w) for u, out in adj.items() for v, w in out]
+    dist = {n: INF for n in adj}
+    prev = {n: None for n in adj}
+    dist[source] = 0.0
+    events = []
+
+    for step in range(1, len(adj)):
+        events.append(Event("pass", step=step))
+        changed = False
+        for u, v, w in edge_list:
+            if dist[u] == INF:
+                continue
+            cand = dist[u] + w
+            events.append(Event("relax", u=u, v=v, old=dist[v], new=cand, step=step))
+            if cand < dist[v]:
+                events.append(Event("update", node=v, old=dist[v], new=cand, prev=u, step=step))
+                dist[v], prev[v] = cand, u
+                changed = True
+        if not changed:
+            break
+    else:
+        for u, v, w in edge_list:
+            if dist[u] + w < dist[v]:
+                events.append(Event("negative_cycle", u=u, v=v))
+                break
+    return events, dist, prev
+
+
+def floyd_trace(edges, nodes=None, directed=True):
+    """
+    ``(events, dist, nxt)`` for Floyd-Warshall.  ``update`` events use the
+    cell ``(i, j)`` as their node; ``prev`` is the pivot that improved it.
+    """
+    adj = _adjacency(edges, directed)
+    nodes = list(nodes) if nodes is not None else list(adj)
+    dist = {(i, j): (0.0 if i == j else INF) for i in nodes for j in nodes}
+    nxt = {(i, j): None for i in nodes for j in nodes}
+    for u, out in adj.items():
+        for v, w in out:
+            if w < dist[(u, v)]:
+                dist[(u, v)], nxt[(u, v)] = w, v
+
+    events = []
+    for k in nodes:
+        events.append(Event("pivot", node=k))
+        for i in nodes:
+            if i == k or dist[(i, k)] == INF:
+                continue
+            for j in nodes:
+                if j == k or j == i:
+                    continue
+                cand = dist[(i, k)] + dist[(k, j)]
+                if cand < dist[(i, j)]:
+                    events.append(Event("update", node=(i, j), old=dist[(i, j)],
+                                        new=cand, prev=k, u=i, v=j))
+                    dist[(i, j)], nxt[(i, j)] = cand, nxt[(i, k)]
+    return events, dist, nxt
+
+
+def format_distance(d):
+    if d == INF:
+        return "∞"
+    return str(int(d)) if float(d).is_integer() else f"{d:g}"
+
+
+def distance_table(nodes, source=None, label_scale=0.62, color=None, buff=0.45):
+    """
+    Two-column node / distance table.  Returns ``(table, labels)`` where
+    ``labels[node]`` is the distance mobject for ``TraceDriver``.
+    """
+    m = mn()
+    color = m.WHITE if color is None else color
+    table, labels = m.VGroup(), {}
+    for node in nodes:
+        name = cached_text(node).scale(label_scale).set_color(color)
+        value = cached_text("0" if node == source else "∞").scale(label_scale).set_color(color)
+        table.add(m.VGroup(name, value).arrange(m.RIGHT, buff=0.8))
+        labels[node] = value
+    table.arrange(m.DOWN, buff=buff)
+    return table, labels
+
+
+def distance_matrix(nodes, dist, label_scale=0.55, color=None, cell=0.9):
+    """
+    Floyd-Warshall matrix with row / column headers.  Returns
+    ``(matrix, labels)`` keyed by cell ``(i, j)``.
+    """
+    m = mn()
+    color = m.WHITE if color is None else color
+    matrix, labels = m.VGroup(), {}
+    for r, name in enumerate(nodes):
+        matrix.add(cached_text(name).scale(label_scale).set_color(color)
+                   .move_to(m.RIGHT * (r + 1) * cell))
+        matrix.add(cached_text(name).scale(label_scale).set_color(color)
+                   .move_to(m.DOWN * (r + 1) * cell))
+    for r, i in enumerate(nodes):
+        for c, j in enumerate(nodes):
+            value = cached_text(format_distance(dist[(i, j)])).scale(label_scale)
+            value.set_color(color).move_to(m.RIGHT * (c + 1) * cell + m.DOWN * (r + 1) * cell)
+            matrix.add(value)
+            labels[(i, j)] = value
+    return matrix.center(), labels
+
+
+def initial_distances(dist, events):
+    """Distances as they were before ``events`` ran, given the final ones."""
+    start = dict(dist)
+    for ev in reversed(events):
+        if ev.kind == "update":
+            start[ev.node] = ev.old
+    return start
+
+
+def group_steps(events):
+    """
+    Split a trace into steps: each ``pop``, ``pass`` or ``pivot`` starts a
+    new step that owns every event up to the next one.
+    """
+    steps, current = [], []
+    for ev in events:
+        if ev.kind in ("pop", "pass", "pivot") and current:
+            steps.append(current)
+            current = []
+        current.append(ev)
+    if current:
+        steps.append(current)
+    return steps
+
+
+class TraceDriver:
+    """
+    Plays a trace on a built graph (``common.graph.GraphParts``).
+
+    ``dist_labels`` maps a node (or a Floyd cell) to the mobject showing its
+    distance; updated values replace it in place.  ``queue`` is optional and
+    needs ``push(node, key, scene)``, ``pop(scene, node)`` (the trace's
+    node, so ties break as the algorithm broke them) and
+    ``decrease_key(node, key, scene)``.
+    """
+
+    def __init__(self, scene, parts, dist_labels=None, queue=None,
+                 visit_color=None, relax_color=None, settled_color=None,
+                 label_scale=0.62, run_time=0.6):
+        m = mn()
+        self.scene = scene
+        self.parts = parts
+        self.dist_labels = dist_labels or {}
+        self.queue = queue
+        self.visit_color = m.YELLOW if visit_color is None else visit_color
+        self.relax_color = m.RED if relax_color is None else relax_color
+        self.settled_color = m.GREY if settled_color is None else settled_color
+        self.label_scale = label_scale
+        self.run_time = run_time
+
+    def play(self, events, wait=0.3):
+        for step in group_steps(events):
+            self.play_step(step)
+            if wait:
+                self.scene.wait(wait)
+
+    def play_step(self, step):
+        m = mn()
+        head = step[0]
+        focus = head.kind in ("pop", "pivot") and head.node in self.parts.nodes
+        if head.kind == "pop" and self.queue is not None:
+            self.queue.pop(self.scene, node=head.node)
+        if focus:
+            self.scene.play(self.parts.nodes[head.node][0].animate.set_fill(self.visit_color),
+                            run_time=self.run_time)
+
+        relaxed = {}
+        for ev in step:
+            edge = self.parts.edge(ev.u, ev.v) if ev.kind == "relax" else None
+            if edge is not None:
+                relaxed[id(edge)] = edge
+        relaxed = list(relaxed.values())
+        if relaxed:
+            originals = [e.copy() for e in relaxed]
+            self.scene.play(*[e.animate.set_color(self.relax_color) for e in relaxed],
+                            run_time=self.run_time)
+
+        # Only the last update of a node within a step is shown.
+        updates = {ev.node: ev for ev in step
+                   if ev.kind == "update" and ev.node in self.dist_labels}
+        if updates:
+            self.scene.play(*[m.Transform(self.dist_labels[node], self._label_for(ev))
+                              for node, ev in updates.items()], run_time=self.run_time)
+
+        if self.queue is not None:
+            for ev in step:
+                if ev.kind == "push":
+                    self.queue.push(ev.node, ev.new, self.scene)
+                elif ev.kind == "decrease":
+                    self.queue.decrease_key(ev.node, ev.new, self.scene)
+
+        if relaxed:
+            self.scene.play(*[m.Transform(e, o) for e, o in zip(relaxed, originals)],
+                            run_time=self.run_time)
+        if focus:
+            self.scene.play(self.parts.nodes[head.node][0].animate.set_fill(self.settled_color),
+                            run_time=self.run_time)
+
+    def _label_for(self, ev):
+        old = self.dist_labels[ev.node]
+        return (cached_text(format_distance(ev.new)).scale(self.label_scale)
+                .set_color(old.get_color()).move_to(old))
@@ -0,0 +1,124 @@
+"""
+Image ops for the CNN scenes
+============================
+Pooling, dilated convolution and receptive-field arithmetic, written with
+numpy windows instead of per-pixel Python loops.
+
+``pool_example`` pools the full-size ``cat.jpeg``; ``pooled_image`` does
+that once and keeps the result (as the PNG the scene loads) in the
+``common.assets`` cache, keyed by a hash of the source image bytes and the
+op parameters, so re-rendering only reads a file.  ``Dilation`` and
+``ReceptiveField`` take their kernel masks, output sizes and receptive
+fields from the helpers at the bottom.
+"""
+
+import functools
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from common import assets
+
+
+# ── Array ops ────────────────────────────────────────────────────────
+
+def pool_windows(array, size, stride=None):
+    """
+    ``(out_h, out_w, size, size)`` view of the pooling windows of a 2-D
+    array.  Rows / columns that don't fill a whole window are dropped.
+    """
+    stride = size if stride is None else stride
+    h, w = array.shape[:2]
+    if stride == size:
+        out_h, out_w = h // size, w // size
+        cropped = array[:out_h * size, :out_w * size]
+        return cropped.reshape(out_h, size, out_w, size).swapaxes(1, 2)
+    return sliding_window_view(array, (size, size))[::stride, ::stride]
+
+
+def max_pool(array, size, stride=None):
+    return pool_windows(array, size, stride).max(axis=(2, 3))
+
+
+def avg_pool(array, size, stride=None):
+    """Mean of each window, truncated back to the input dtype."""
+    windows = pool_windows(array, size, stride)
+    return windows.mean(axis=(2, 3)).astype(array.dtype)
+
+
+def conv2d(array, kernel, stride=1, dilation=1):
+    """
+    'Valid' cross-correlation of a 2-D array with a square ``kernel``
+    spread out by ``dilation``.
+    """
+    kernel = np.asarray(kernel, dtype=float)
+    span = effective_kernel_size(kernel.shape[0], dilation)
+    windows = sliding_window_view(np.asarray(array, dtype=float), (span, span))
+    windows = windows[::stride, ::stride, ::dilation, ::dilation]
+    return np.einsum("ijkl,kl->ij", windows, kernel)
+
+
+# ── Cached image results ─────────────────────────────────────────────
+
+def _pooled_rgb(image_path, source, mode, size, stride):
+    # ``source`` (the file hash) is only part of the cache key
+    from PIL import Image
+
+    gray = Image.open(image_path).convert("L")
+    pool = {"max": max_pool, "avg": avg_pool}[mode]
+    pooled = Image.fromarray(pool(np.array(gray), size, stride))
+    return np.array(pooled.resize(gray.size, Image.NEAREST))
+
+
+def pooled_image(image_path, mode="max", size=4, stride=None):
+    """
+    Path of a PNG of the grayscale image pooled with ``mode`` ("max" or
+    "avg") and scaled back up to the original size, as ``pool_example``
+    shows it.  Computed on the first call, read from the cache after.
+    """
+    return assets.cached_image(
+        f"{mode}pool", functools.partial(_pooled_rgb, image_path),
+        source=assets.file_hash(image_path), mode=mode, size=size, stride=stride or size,
+    )
+
+
+# ── Kernel / receptive-field arithmetic ──────────────────────────────
+
+def effective_kernel_size(k, dilation=1):
+    """Side of the input patch a ``k x k`` kernel covers at ``dilation``."""
+    return dilation * (k - 1) + 1
+
+
+def conv_output_size(n, k, stride=1, dilation=1, padding=0):
+    return (n + 2 * padding - effective_kernel_size(k, dilation)) // stride + 1
+
+
+def dilated_kernel_mask(k, dilation=1):
+    """Boolean ``(span, span)`` grid, True where a kernel weight sits."""
+    span = effective_kernel_size(k, dilation)
+    taps = np.zeros(span, dtype=bool)
+    taps[::dilation] = True
+    return np.outer(taps, taps)
+
+
+def receptive_fields(layers):
+    """
+    Receptive field after each of ``layers`` -- ``(k, stride, dilation)``
+    tuples, input first.  Starts with the input's own field of 1.
+    """
+    rf, jump = 1, 1
+    fields = [rf]
+    for k, stride, dilation in layers:
+        rf += (effective_kernel_size(k, dilation) - 1) * jump
+        jump *= stride
+        fields.append(rf)
+    return fields
+
+
+def receptive_region(layers, i, j):
+    """
+    ``(row, col, size)`` of the input square seen by output cell ``(i, j)``
+    after ``layers`` (no padding).
+    """
+    jump = int(np.prod([stride for _, stride, _ in layers]))
+    return i * jump, j * jump, receptive_fields(layers)[-1]
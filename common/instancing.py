@@ -0,0 +1,194 @@
+"""
+Instanced mobjects (ManimGL)
+============================
+The random-forest grid calls ``create_single_tree`` forty times, and the
+MobileNet channel grids build one ``Square`` per cell: the same circles,
+lines and squares rebuilt per copy, every copy its own mobject family to
+copy, interpolate and draw each frame.
+
+``InstancedMobject`` takes the template once and keeps, per instance, a
+3x3 transform, a position, stroke / fill colours and an opacity as arrays.
+All instances are written into the points and per-point colours of a
+single ``VMobject``, so the whole set is one stroke and one fill draw, and
+moving or recolouring instances is a few numpy operations.  ``extract(i)``
+hands an instance back as an ordinary mobject (and hides it in the batch)
+when it has to animate on its own; ``restore(i, mob)`` puts it back.
+
+Styling the whole ``InstancedMobject`` (``set_stroke``, ``animate.set_fill``)
+works as for any ``VMobject`` until the next ``refresh``, which rewrites
+the per-instance colours.
+
+    tree, _ = self.create_single_tree(WHITE, 0)
+    forest = InstancedMobject(tree, positions, scales=0.44, stroke_colors=colors)
+    self.play(ShowInstancesCreation(forest, lag_ratio=0.08), run_time=1.2)
+    lone_tree = forest.extract(7)
+"""
+
+import numpy as np
+
+from manimlib import Animation, VMobject, color_to_rgb, rgb_to_color
+from manimlib.utils.iterables import resize_with_interpolation
+
+
+def _rgb_array(colors, n):
+    """``(n, 3)`` rgb from one colour or a list / array of one per instance."""
+    if isinstance(colors, np.ndarray) and colors.ndim == 2:
+        return colors
+    if isinstance(colors, (list, tuple)) and len(colors) == n \
+            and (isinstance(colors[0], str) or not np.isscalar(colors[0])):
+        return np.array([color_to_rgb(c) for c in colors], dtype=float)
+    return np.tile(color_to_rgb(colors), (n, 1))
+
+
+def _color_array(colors, n):
+    """``(n, 3)`` rgb, ``nan`` rows where the template's colour is kept."""
+    if colors is None:
+        return np.full((n, 3), np.nan)
+    return np.array(_rgb_array(colors, n), dtype=float)
+
+
+def _per_instance(value, n, shape=()):
+    return np.array(np.broadcast_to(np.asarray(value, dtype=float), (n, *shape)))
+
+
+def _merged_layout(counts, copies):
+    """
+    For every point of ``copies`` x ``counts`` parts appended into one
+    ``VMobject``, the index of the point it copies in the flat
+    ``(copies, sum(counts))`` array.  The parts are appended with their
+    indices as coordinates, so the path breaks ManimGL inserts between
+    subpaths are resolved by ManimGL itself.
+    """
+    merged = VMobject()
+    for copy in range(copies):
+        for part, n in enumerate(counts):
+            encoded = VMobject()
+            encoded.set_points(np.column_stack([
+                np.arange(n), np.full(n, part), np.full(n, copy),
+            ]).astype(float))
+            merged.append_vectorized_mobject(encoded)
+    source = np.round(merged.get_points()).astype(int)
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(int)
+    return source[:, 2] * sum(counts) + offsets[source[:, 1]] + source[:, 0]
+
+
+class InstancedMobject(VMobject):
+    """
+    ``len(positions)`` copies of ``template``, each scaled by ``scales``
+    about the template's centre and moved to its position.  Colours are
+    one colour or one per instance (``None`` keeps the template's).
+    """
+
+    def __init__(self, template, positions, scales=1.0, stroke_colors=None,
+                 fill_colors=None, opacities=1.0, **kwargs):
+        super().__init__(**kwargs)
+        self.template = template.copy().shift(-template.get_center())
+        self.template_parts = self.template.family_members_with_points()
+        counts = [part.get_num_points() for part in self.template_parts]
+        self.template_points = np.vstack([part.get_points() for part in self.template_parts])
+        self.template_stroke = np.vstack([
+            resize_with_interpolation(np.array(part.data["stroke_rgba"]), n)
+            for part, n in zip(self.template_parts, counts)
+        ])
+        self.template_fill = np.vstack([
+            resize_with_interpolation(np.array(part.data["fill_rgba"]), n)
+            for part, n in zip(self.template_parts, counts)
+        ])
+
+        self.positions = np.array(positions, dtype=float).reshape(-1, 3)
+        n = len(self.positions)
+        self.matrices = _per_instance(scales, n)[:, None, None] * np.identity(3)
+        self.stroke_colors = _color_array(stroke_colors, n)
+        self.fill_colors = _color_array(fill_colors, n)
+        self.opacities = _per_instance(opacities, n)
+        self.hidden = np.zeros(n, dtype=bool)
+        self.layout = _merged_layout(counts, n)
+
+        self.refresh()
+        self.set_stroke(width=self.template_parts[0].get_stroke_width())
+
+    def __len__(self):
+        return len(self.positions)
+
+    def _styled(self, template_rgba, colors):
+        rgba = np.tile(template_rgba, (len(self), 1, 1))
+        keep = np.isnan(colors)
+        rgba[:, :, :3] = np.where(keep[:, None, :], rgba[:, :, :3], colors[:, None, :])
+        rgba[:, :, 3] *= np.where(self.hidden, 0, self.opacities)[:, None]
+        return rgba.reshape(-1, 4)[self.layout]
+
+    def refresh(self, template_points=None):
+        """Rewrite points and colours of every instance from the arrays."""
+        if template_points is None:
+            template_points = self.template_points
+        points = np.einsum("nij,mj->nmi", self.matrices, template_points)
+        points += self.positions[:, None, :]
+        self.set_points(points.reshape(-1, 3)[self.layout])
+        self.set_rgba_array(self._styled(self.template_stroke, self.stroke_colors), "stroke_rgba")
+        self.set_rgba_array(self._styled(self.template_fill, self.fill_colors), "fill_rgba")
+        return self
+
+    def set_instances(self, indices=None, positions=None, scales=None, matrices=None,
+                      stroke_colors=None, fill_colors=None, opacities=None):
+        """Update some (``indices``) or all instances, then ``refresh``."""
+        sel = slice(None) if indices is None else indices
+        n = len(self.positions[sel])
+        if positions is not None:
+            self.positions[sel] = positions
+        if matrices is not None:
+            self.matrices[sel] = matrices
+        elif scales is not None:
+            self.matrices[sel] = _per_instance(scales, n)[:, None, None] * np.identity(3)
+        if stroke_colors is not None:
+            self.stroke_colors[sel] = _rgb_array(stroke_colors, n)
+        if fill_colors is not None:
+            self.fill_colors[sel] = _rgb_array(fill_colors, n)
+        if opacities is not None:
+            self.opacities[sel] = opacities
+        return self.refresh()
+
+    def extract(self, index):
+        """Instance ``index`` as an independent mobject; hidden in the batch."""
+        mob = self.template.copy()
+        mob.apply_matrix(self.matrices[index], about_point=np.zeros(3))
+        mob.shift(self.positions[index])
+        if not np.isnan(self.stroke_colors[index]).any():
+            mob.set_stroke(rgb_to_color(self.stroke_colors[index]))
+        if not np.isnan(self.fill_colors[index]).any():
+            mob.set_fill(rgb_to_color(self.fill_colors[index]))
+        opacity = self.opacities[index]
+        if opacity != 1:
+            for part in mob.family_members_with_points():
+                part.set_stroke(opacity=part.get_stroke_opacity() * opacity)
+                part.set_fill(opacity=part.get_fill_opacity() * opacity)
+        self.hidden[index] = True
+        self.refresh()
+        return mob
+
+    def restore(self, index, mob=None):
+        """Show instance ``index`` in the batch again, at ``mob``'s centre if given."""
+        if mob is not None:
+            self.positions[index] = mob.get_center()
+        self.hidden[index] = False
+        return self.refresh()
+
+
+class ShowInstancesCreation(Animation):
+    """
+    ``ShowCreation`` of every instance at once: the template parts are drawn
+    partially (``lag_ratio`` between them, as for a ``VGroup``) and the
+    partial template is instanced each frame.
+    """
+
+    def __init__(self, mobject, lag_ratio=1.0, **kwargs):
+        super().__init__(mobject, lag_ratio=lag_ratio, **kwargs)
+
+    def begin(self):
+        self.parts = [part.copy() for part in self.mobject.template_parts]
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        full_parts = self.mobject.template_parts
+        for index, (part, full) in enumerate(zip(self.parts, full_parts)):
+            part.pointwise_become_partial(full, 0, self.get_sub_alpha(alpha, index, len(full_parts)))
+        self.mobject.refresh(np.vstack([part.get_points() for part in self.parts]))
@@ -0,0 +1,130 @@
+"""
+Cached text labels
+==================
+Building a ``Text`` runs font layout, building a ``Tex`` runs LaTeX and
+parses its SVG, every time.  Graphs, tables, arrays and weight matrices
+create the same few strings ("3", "0.7", "x_{2}", "∞") over and over, so
+the first mobject for a given string and style is kept and later requests
+get a copy.
+
+The in-memory cache is a bounded LRU (``MAX_CACHED`` entries).  With
+``persist=True`` single-colour labels are also written to ``GLYPH_DIR`` as
+their glyph outlines (one point array per glyph), so a fresh render process
+rebuilds them from an ``.npz`` instead of laying out or compiling anything.
+Labels restored from disk are plain ``VGroup``s of glyph ``VMobject``s
+carrying the source string (``text`` / ``tex_string``) and ``font_size``:
+they index, colour, scale and animate like the original, but are not
+``Text`` / ``Tex`` and have no part lookup.  Persistence is opt-in so that a
+warm render never hands a caller a different kind of object than a cold one;
+the DP-table values and graph edge weights, which are only placed, coloured
+and faded, use it.
+
+    weight = cached_text(f"{w:.1f}", font_size=18, weight=BOLD)
+    sub = cached_tex(f"x_{{{i + 1}}}").scale(0.6)
+    digit = cached_text(str(d), persist=True)      # plain outlines are enough
+"""
+
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from common import assets
+from common.backend import mn
+
+
+MAX_CACHED = 4096
+GLYPH_DIR = os.path.join(os.path.dirname(assets.CACHE_DIR), "glyphs")
+
+_TEXT_CACHE = OrderedDict()
+
+
+def _key(string, kwargs):
+    return (string, repr(sorted(kwargs.items())))
+
+
+# ── On-disk glyph outlines ────────────────────────────────────────────────
+
+def _glyph_path(kind, key):
+    # ManimGL and ManimCE store different curves (quadratic / cubic)
+    name = assets.asset_key(kind, key=key, backend=mn().__name__)
+    return os.path.join(GLYPH_DIR, f"{kind}_{name}.npz")
+
+
+def _points(mobject):
+    get = getattr(mobject, "get_points", None)
+    return get() if get is not None else mobject.points
+
+
+def _save_glyphs(path, mobject):
+    """Store the outlines of a single-colour label; skip multi-colour ones."""
+    leaves = mobject.family_members_with_points()
+    if not leaves or len({str(leaf.get_fill_color()) for leaf in leaves}) > 1:
+        return
+    points = [np.asarray(_points(leaf), dtype=float) for leaf in leaves]
+    arrays = dict(
+        points=np.concatenate(points),
+        counts=np.array([len(p) for p in points]),
+        fill=np.array([str(mobject.get_fill_color()), str(mobject.get_stroke_color())]),
+        style=np.array([mobject.get_fill_opacity(), mobject.get_stroke_width(),
+                        mobject.get_stroke_opacity()], dtype=float),
+    )
+    # Renders running side by side must never load a half-written file
+    assets.atomic_write(path, lambda f: np.savez(f, **arrays))
+
+
+def _load_glyphs(path, kind, string, kwargs):
+    m = mn()
+    with np.load(path) as data:
+        points, counts = data["points"], data["counts"]
+        fill_color, stroke_color = (str(c) for c in data["fill"])
+        fill_opacity, stroke_width, stroke_opacity = data["style"]
+    group = m.VGroup()
+    for chunk in np.split(points, np.cumsum(counts)[:-1]):
+        glyph = m.VMobject()
+        glyph.set_points(chunk)
+        group.add(glyph)
+    group.set_fill(fill_color, opacity=float(fill_opacity))
+    group.set_stroke(stroke_color, width=float(stroke_width), opacity=float(stroke_opacity))
+    setattr(group, "text" if kind == "text" else "tex_string", string)
+    group.font_size = kwargs.get("font_size")
+    return group
+
+
+# ── Cache ─────────────────────────────────────────────────────────────────
+
+def _cached(kind, build, string, kwargs, persist):
+    key = _key(string, kwargs)
+    base = _TEXT_CACHE.get((kind, key))
+    if base is None:
+        path = _glyph_path(kind, key) if persist else None
+        if path is not None and os.path.exists(path):
+            base = _load_glyphs(path, kind, string, kwargs)
+        else:
+            base = build(string, **kwargs)
+            if path is not None:
+                _save_glyphs(path, base)
+        _TEXT_CACHE[(kind, key)] = base
+        if len(_TEXT_CACHE) > MAX_CACHED:
+            _TEXT_CACHE.popitem(last=False)
+    else:
+        _TEXT_CACHE.move_to_end((kind, key))
+    return base.copy()
+
+
+def cached_text(string, persist=False, **kwargs):
+    """A fresh copy of ``Text(string, **kwargs)``, laid out only once."""
+    return _cached("text", mn().Text, string, kwargs, persist)
+
+
+def cached_tex(string, persist=False, **kwargs):
+    """A fresh copy of ``Tex(string, **kwargs)``, compiled only once."""
+    return _cached("tex", mn().Tex, string, kwargs, persist)
+
+
+def clear_text_cache(disk=False):
+    """Empty the in-memory cache (and with ``disk=True`` the stored outlines)."""
+    _TEXT_CACHE.clear()
+    if disk and os.path.isdir(GLYPH_DIR):
+        for name in os.listdir(GLYPH_DIR):
+            os.remove(os.path.join(GLYPH_DIR, name))
@@ -0,0 +1,677 @@
+"""
+Layout validation
+=================
+Runtime checks for bounds, overlap, padding, font size and shape occlusion.
+
+Every mobject's bounding box is read exactly once into an ``(n, 4)`` array of
+``[xmin, ymin, xmax, ymax]`` rows.  Pair checks then run a sweep-and-prune
+broad phase over that array, so only boxes that actually come near each other
+are compared, and the narrow phase is a handful of vectorised comparisons.
+
+``validate_layout`` keeps a ``LayoutValidator`` on the scene, so repeated
+checkpoints inside one ``construct`` only re-check mobjects that were added,
+removed or moved since the previous call.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+
+MIN_PADDING = 0.05
+MIN_FONT_SIZE = 24
+
+SKIP_TYPES = {"CameraFrame", "Axes", "NumberLine", "NumberPlane",
+              "CoordinateSystem", "ParametricCurve"}
+
+_UL = np.array([-1.0, 1.0, 0.0])
+_DR = np.array([1.0, -1.0, 0.0])
+_NO_PAIRS = (np.zeros(0, dtype=int), np.zeros(0, dtype=int))
+
+
+def validate_layout(scene, label="", camera_scale=1.0):
+    """Runtime validation: checks bounds, overlap, padding, font size, shape occlusion."""
+    validator = getattr(scene, "layout_validator", None)
+    if validator is None:
+        validator = scene.layout_validator = LayoutValidator()
+        _close_on_tear_down(scene, validator)
+    return validator.validate(scene, label, camera_scale)
+
+
+def _close_on_tear_down(scene, validator):
+    tear_down = getattr(scene, "tear_down", None)
+    if tear_down is None:
+        return
+
+    def close_and_tear_down(*args, **kwargs):
+        validator.close()
+        return tear_down(*args, **kwargs)
+
+    scene.tear_down = close_and_tear_down
+
+
+def validate_layout_full(scene, label="", camera_scale=1.0):
+    """Same checks as ``validate_layout`` without reusing earlier results."""
+    frame = frame_bounds(scene, camera_scale)
+    prefix = f"[VALIDATE {label}] " if label else "[VALIDATE] "
+    issues = []
+
+    texts, text_boxes, shapes, shape_boxes = collect_layout(
+        scene.mobjects, frame, prefix, issues)
+    issues.extend(pair_issues(prefix, texts, text_boxes, shapes, shape_boxes))
+
+    report_issues(prefix, issues)
+    return len(issues) == 0
+
+
+def frame_bounds(scene, camera_scale=1.0):
+    """(left, bottom, right, top) of the visible frame."""
+    half_w = 7.1 * camera_scale
+    half_h = 4.0 * camera_scale
+    cam_center = scene.camera.frame.get_center()
+    cx, cy = cam_center[0], cam_center[1]
+    return (cx - half_w, cy - half_h, cx + half_w, cy + half_h)
+
+
+def report_issues(prefix, issues):
+    for iss in issues:
+        _safe_print(iss)
+    if not issues:
+        _safe_print(f"{prefix}OK -- all mobjects in bounds, no overlap, padding OK")
+
+
+def collect_layout(mobjects, frame, prefix, issues):
+    """
+    Walk the mobject families once, appending per-mobject issues (bounds,
+    font size) to ``issues``.  Returns ``(texts, text_boxes, shapes,
+    shape_boxes)`` where the box arrays line up with the mobject lists.
+    """
+    texts, text_rows = [], []
+    shapes, shape_rows = [], []
+    seen_ids = set()
+    for mob in mobjects:
+        _collect_recursive(mob, frame, prefix, issues, texts, text_rows,
+                           shapes, shape_rows, seen_ids)
+    return texts, _as_boxes(text_rows), shapes, _as_boxes(shape_rows)
+
+
+def pair_issues(prefix, texts, text_boxes, shapes, shape_boxes):
+    """OVERLAP / TOO CLOSE / SHAPE COVERS TEXT messages, in the same order
+    the old all-pairs loops produced them."""
+    issues = []
+    i, j, kind = text_pair_kinds(text_boxes, MIN_PADDING)
+    for a, b, k in zip(i, j, kind):
+        issues.append(prefix + _text_pair_message(k, texts[a], texts[b]))
+    for s, t in zip(*shape_text_overlaps(shape_boxes, text_boxes)):
+        issues.append(prefix + _shape_text_message(shapes[s], texts[t]))
+    return issues
+
+
+def _text_pair_message(kind, m1, m2):
+    if kind == 1:
+        return f"OVERLAP: \"{_mob_label(m1)}\" and \"{_mob_label(m2)}\""
+    return (f"TOO CLOSE (gap < {MIN_PADDING}): "
+            f"\"{_mob_label(m1)}\" and \"{_mob_label(m2)}\"")
+
+
+def _shape_text_message(shape, txt):
+    return (f"SHAPE COVERS TEXT: {type(shape).__name__} "
+            f"may obscure \"{_mob_label(txt)}\"")
+
+
+# ── Box arrays ───────────────────────────────────────────────────────
+
+def mobject_box(mob):
+    """[xmin, ymin, xmax, ymax] of a mobject, or None if it has no bounds."""
+    try:
+        bb = mob.get_bounding_box()
+        return (bb[0][0], bb[0][1], bb[2][0], bb[2][1])
+    except Exception:
+        pass
+    try:
+        ul = mob.get_corner(_UL)
+        dr = mob.get_corner(_DR)
+    except Exception:
+        return None
+    return (ul[0], dr[1], dr[0], ul[1])
+
+
+def _as_boxes(rows):
+    if not rows:
+        return np.zeros((0, 4))
+    return np.array(rows, dtype=float)
+
+
+def sweep_pairs(boxes, pad=0.0, inclusive=False):
+    """
+    Sweep-and-prune broad phase.
+
+    Returns index arrays ``(i, j)`` with ``i < j`` for every pair of boxes
+    whose separation is below ``pad`` on both axes (``<= pad`` when
+    ``inclusive``).  Boxes are sorted along the axis where they are most
+    spread out, and each box is only compared with the run of boxes that
+    start before it ends.
+    """
+    n = len(boxes)
+    if n < 2:
+        return _NO_PAIRS
+
+    extent = boxes[:, 2:].max(axis=0) - boxes[:, :2].min(axis=0)
+    size = (boxes[:, 2:] - boxes[:, :2]).mean(axis=0)
+    ax = int(np.argmin(size / np.maximum(extent, 1e-9)))
+    other = 1 - ax
+
+    order = np.argsort(boxes[:, ax], kind="stable")
+    lo = boxes[order, ax]
+    hi = boxes[order, ax + 2]
+    end = np.searchsorted(lo, hi + pad, side="right" if inclusive else "left")
+    counts = np.maximum(end - np.arange(1, n + 1), 0)
+    total = int(counts.sum())
+    if total == 0:
+        return _NO_PAIRS
+
+    first = np.repeat(np.arange(n), counts)
+    run_start = np.repeat(np.cumsum(counts) - counts, counts)
+    second = first + 1 + (np.arange(total) - run_start)
+    a, b = order[first], order[second]
+
+    sep = np.maximum(boxes[b, other] - boxes[a, other + 2],
+                     boxes[a, other] - boxes[b, other + 2])
+    keep = sep <= pad if inclusive else sep < pad
+    a, b = a[keep], b[keep]
+    i, j = np.minimum(a, b), np.maximum(a, b)
+    idx = np.lexsort((j, i))
+    return i[idx], j[idx]
+
+
+def text_pair_kinds(boxes, min_padding):
+    """
+    Classify text-box pairs.  Returns ``(i, j, kind)`` sorted by ``(i, j)``,
+    where ``kind`` is 1 for overlapping boxes and 2 for boxes closer than
+    ``min_padding``.
+    """
+    i, j = sweep_pairs(boxes, pad=min_padding)
+    return _classify_text_pairs(boxes[i], boxes[j], i, j, min_padding)
+
+
+def _classify_text_pairs(b1, b2, i, j, min_padding):
+    if len(i) == 0:
+        return i, j, np.zeros(0, dtype=int)
+    x_sep = np.maximum(b2[:, 0] - b1[:, 2], b1[:, 0] - b2[:, 2])
+    y_sep = np.maximum(b2[:, 1] - b1[:, 3], b1[:, 1] - b2[:, 3])
+
+    overlap = (x_sep <= 0) & (y_sep <= 0)
+    gap = np.where((x_sep >= 0) & (y_sep >= 0), np.hypot(x_sep, y_sep),
+                   np.where(x_sep >= 0, x_sep, y_sep))
+    too_close = ~overlap & (gap < min_padding)
+
+    kind = np.where(overlap, 1, np.where(too_close, 2, 0))
+    keep = kind > 0
+    return i[keep], j[keep], kind[keep]
+
+
+def shape_text_overlaps(shape_boxes, text_boxes):
+    """(shape_idx, text_idx) for every shape box touching a text box,
+    sorted by shape then text."""
+    ns, nt = len(shape_boxes), len(text_boxes)
+    if ns == 0 or nt == 0:
+        return _NO_PAIRS
+    i, j = sweep_pairs(np.vstack([shape_boxes, text_boxes]), inclusive=True)
+    keep = (i < ns) & (j >= ns)
+    s, t = i[keep], j[keep] - ns
+    idx = np.lexsort((t, s))
+    return s[idx], t[idx]
+
+
+def _near_rows(boxes, rows, pad=0.0, inclusive=False):
+    """
+    ``(r, k)`` for every ``r`` in ``rows`` and every other box ``k`` within
+    ``pad`` of it on both axes.  Used when only a few boxes changed: each
+    changed box is only compared with the boxes whose x-range can reach it.
+    """
+    if len(rows) == 0 or len(boxes) < 2:
+        return _NO_PAIRS
+    order = np.argsort(boxes[:, 0], kind="stable")
+    lo = boxes[order, 0]
+    reach = float((boxes[:, 2] - boxes[:, 0]).max())
+    r = np.asarray(rows, dtype=int)
+    start = np.searchsorted(lo, boxes[r, 0] - reach - pad, side="left")
+    end = np.searchsorted(lo, boxes[r, 2] + pad, side="right")
+    counts = end - start
+    total = int(counts.sum())
+    if total == 0:
+        return _NO_PAIRS
+
+    rr = np.repeat(r, counts)
+    run_start = np.repeat(np.cumsum(counts) - counts, counts)
+    k = order[np.repeat(start, counts) + (np.arange(total) - run_start)]
+
+    q, b = boxes[rr], boxes[k]
+    x_sep = np.maximum(b[:, 0] - q[:, 2], q[:, 0] - b[:, 2])
+    y_sep = np.maximum(b[:, 1] - q[:, 3], q[:, 1] - b[:, 3])
+    if inclusive:
+        near = (x_sep <= pad) & (y_sep <= pad)
+    else:
+        near = (x_sep < pad) & (y_sep < pad)
+    near &= k != rr
+    return rr[near], k[near]
+
+
+def family_signature(mob):
+    """
+    Fingerprint of a mobject family: member ids plus a hash of every
+    member's point / colour data.  Equal signatures mean nothing in the
+    family moved, restyled or was added or removed.  Reads every point, so
+    it is only the fallback for mobjects without ``note_changed_data``.
+    """
+    try:
+        family = mob.get_family()
+    except Exception:
+        return None
+    return (tuple(map(id, family)),
+            hash(b"".join([_data_bytes(m) for m in family])))
+
+
+def _data_bytes(mob):
+    data = getattr(mob, 'data', None)
+    if data is None:
+        data = getattr(mob, 'points', None)
+        return b"" if data is None else data.tobytes()
+    if isinstance(data, dict):
+        return b"".join([np.asarray(v).tobytes() for v in data.values()])
+    return data.tobytes()
+
+
+_HOOK_CLASSES = {}   # mobject type -> class defining its note_changed_data, or None
+_COUNTING = {}       # hooked class -> [original note_changed_data, users]
+
+
+def _hook_class(mob):
+    kind = type(mob)
+    if kind not in _HOOK_CLASSES:
+        _HOOK_CLASSES[kind] = next(
+            (cls for cls in kind.__mro__ if "note_changed_data" in cls.__dict__), None)
+    return _HOOK_CLASSES[kind]
+
+
+def count_changes(cls):
+    """
+    Make ``cls.note_changed_data`` count calls per mobject until as many
+    ``stop_counting(cls)`` calls.  ManimGL calls it for every point, style
+    or family edit (it is what makes the renderer refresh) on the edited
+    mobject and all its ancestors, so a top-level mobject's count moves
+    whenever anything in its family changed.
+    """
+    hook = _COUNTING.get(cls)
+    if hook is not None:
+        hook[1] += 1
+        return
+    note = cls.__dict__["note_changed_data"]
+
+    def counting(self, *args, **kwargs):
+        self.layout_changes = getattr(self, "layout_changes", 0) + 1
+        return note(self, *args, **kwargs)
+
+    _COUNTING[cls] = [note, 1]
+    setattr(cls, "note_changed_data", counting)
+
+
+def stop_counting(cls):
+    """Undo one ``count_changes(cls)``; the last one restores the original method."""
+    hook = _COUNTING[cls]
+    hook[1] -= 1
+    if hook[1] == 0:
+        setattr(cls, "note_changed_data", hook[0])
+        del _COUNTING[cls]
+
+
+def _positions(ids, wanted):
+    """``{id: position in ids}`` for the ids in ``wanted``."""
+    if not wanted:
+        return {}
+    rows = np.flatnonzero(np.isin(ids, np.fromiter(wanted, dtype=np.int64, count=len(wanted))))
+    return {int(ids[k]): int(k) for k in rows}
+
+
+# ── Incremental validation ───────────────────────────────────────────
+
+_Family = namedtuple(
+    "_Family",
+    "mob token ids messages texts text_ids text_boxes shapes shape_ids shape_boxes")
+
+
+class LayoutValidator:
+    """
+    Layout validation that lives across a whole ``construct``.
+
+    Each top-level mobject is remembered with its change token and the
+    results of its family: per-member messages, and the text and shape
+    members with their boxes.  Families whose token is unchanged are reused
+    as a whole, so an unchanged family costs one counter read.  Changed or
+    new families are walked, and every member whose box, style or role
+    differs is marked dirty.  Pair results (OVERLAP, TOO CLOSE, SHAPE
+    COVERS TEXT) are cached by mobject ids, and only pairs involving dirty
+    or removed mobjects are recomputed; a new frame recomputes them all.
+    Output is identical to ``validate_layout_full``.
+
+    The change token is the count kept by ``count_changes``, which the
+    validator turns on for the mobject classes it sees and turns off again
+    in ``close`` (``validate_layout`` closes it when the scene tears down);
+    mobjects without ``note_changed_data`` use ``family_signature``.
+    """
+
+    # Above this fraction of changed boxes a full sweep is cheaper than
+    # checking the changed rows against everything.
+    FULL_SWEEP_FRACTION = 0.125
+
+    def __init__(self):
+        self._frame = None
+        self._families = {}       # top-level id -> _Family
+        self._entries = {}        # id -> (mob, signature, role, messages)
+        self._text_pairs = {}     # (id_a, id_b) -> (kind, message)
+        self._shape_pairs = {}    # (shape_id, text_id) -> message
+        self._counted = set()     # classes whose note_changed_data we count
+
+    def close(self):
+        """Stop counting changes; the next ``validate`` walks everything again."""
+        for cls in self._counted:
+            stop_counting(cls)
+        self._counted.clear()
+        self._families = {}
+
+    def change_token(self, mob):
+        """A value that differs whenever ``mob``'s family changed."""
+        cls = _hook_class(mob)
+        if cls is None:
+            return family_signature(mob)
+        if cls not in self._counted:
+            count_changes(cls)
+            self._counted.add(cls)
+            return None     # changes before now were not counted
+        return getattr(mob, "layout_changes", 0)
+
+    def validate(self, scene, label="", camera_scale=1.0):
+        frame = frame_bounds(scene, camera_scale)
+        prefix = f"[VALIDATE {label}] " if label else "[VALIDATE] "
+        frame_changed = frame != self._frame
+
+        families, parts, seen, dirty = {}, [], set(), set()
+        for mob in scene.mobjects:
+            if id(mob) in families:
+                continue
+            token = self.change_token(mob)
+            fam = self._families.get(id(mob))
+            if (fam is None or fam.mob is not mob or fam.token is None
+                    or fam.token != token or frame_changed
+                    or not seen.isdisjoint(fam.ids)):
+                fam = self._walk_family(mob, token, frame, seen, dirty)
+            seen.update(fam.ids)
+            families[id(mob)] = fam
+            parts.append(fam)
+        removed = self._entries.keys() - seen
+        for mid in removed:
+            del self._entries[mid]
+        stale = dirty | removed
+
+        issues = [prefix + msg for fam in parts for msg in fam.messages]
+        texts = [m for fam in parts for m in fam.texts]
+        text_ids = np.array([mid for fam in parts for mid in fam.text_ids], dtype=np.int64)
+        text_boxes = np.concatenate([_as_boxes([])] + [fam.text_boxes for fam in parts])
+        shapes = [m for fam in parts for m in fam.shapes]
+        shape_ids = np.array([mid for fam in parts for mid in fam.shape_ids], dtype=np.int64)
+        shape_boxes = np.concatenate([_as_boxes([])] + [fam.shape_boxes for fam in parts])
+
+        full = frame_changed
+        self._update_text_pairs(texts, text_ids, text_boxes, stale, full)
+        self._update_shape_pairs(shapes, shape_ids, shape_boxes,
+                                 texts, text_ids, text_boxes, stale, full)
+
+        text_index = _positions(text_ids, {mid for pair in self._text_pairs for mid in pair}
+                                | {t for _, t in self._shape_pairs})
+        shape_index = _positions(shape_ids, {s for s, _ in self._shape_pairs})
+        for (a, b), (kind, msg) in sorted(
+                self._text_pairs.items(),
+                key=lambda item: sorted((text_index[item[0][0]], text_index[item[0][1]]))):
+            if text_index[a] > text_index[b]:
+                msg = _text_pair_message(kind, texts[text_index[b]], texts[text_index[a]])
+            issues.append(prefix + msg)
+        for (s, t), msg in sorted(self._shape_pairs.items(),
+                                  key=lambda item: (shape_index[item[0][0]],
+                                                    text_index[item[0][1]])):
+            issues.append(prefix + msg)
+
+        self._frame = frame
+        self._families = families
+
+        report_issues(prefix, issues)
+        return len(issues) == 0
+
+    def _walk_family(self, mob, token, frame, seen, dirty):
+        walked, shared = {}, []
+        self._walk(mob, frame, seen, walked, dirty, shared)
+        messages, texts, text_ids, text_rows = [], [], [], []
+        shapes, shape_ids, shape_rows = [], [], []
+        for mid, (member, sig, role, msgs) in walked.items():
+            messages.extend(msgs)
+            if role == "text":
+                texts.append(member)
+                text_ids.append(mid)
+                text_rows.append(sig[0])
+            elif role == "shape":
+                shapes.append(member)
+                shape_ids.append(mid)
+                shape_rows.append(sig[0])
+        # A family that shares members with an earlier one is walked again
+        # next time: its own results depend on what came before it.
+        return _Family(mob, None if shared else token, tuple(walked), messages,
+                       texts, text_ids, _as_boxes(text_rows),
+                       shapes, shape_ids, _as_boxes(shape_rows))
+
+    def _walk(self, mob, frame, seen, walked, dirty, shared):
+        mid = id(mob)
+        if mid in walked:
+            return
+        if mid in seen:
+            shared.append(mid)
+            return
+        if type(mob).__name__ in SKIP_TYPES:
+            return
+        box = mobject_box(mob)
+        if box is None:
+            return
+
+        subs = getattr(mob, 'submobjects', ())
+        sig = (tuple(map(float, box)), _get_fill_opacity(mob),
+               getattr(mob, 'font_size', None), _mob_label(mob))
+        old = self._entries.get(mid)
+        if old is not None and old[1] == sig and frame == self._frame:
+            role, messages = old[2], old[3]
+        else:
+            messages = []
+            role = check_mobject(mob, sig[0], frame, "", messages)
+        if old is None or old[1] != sig or old[2] != role:
+            dirty.add(mid)
+
+        walked[mid] = self._entries[mid] = (mob, sig, role, messages)
+        if role == "skip":
+            return
+        for sub in subs:
+            self._walk(sub, frame, seen, walked, dirty, shared)
+
+    def _changed_rows(self, ids, stale, full):
+        rows = _positions(ids, stale)
+        full = full or len(rows) > self.FULL_SWEEP_FRACTION * len(ids)
+        return sorted(rows.values()), full
+
+    def _update_text_pairs(self, texts, text_ids, text_boxes, stale, full):
+        rows, full = self._changed_rows(text_ids, stale, full)
+        if full:
+            self._text_pairs = {}
+            i, j, kind = text_pair_kinds(text_boxes, MIN_PADDING)
+        else:
+            self._text_pairs = {
+                key: val for key, val in self._text_pairs.items()
+                if key[0] not in stale and key[1] not in stale
+            }
+            r, k = _near_rows(text_boxes, rows, pad=MIN_PADDING)
+            i, j = np.minimum(r, k), np.maximum(r, k)
+            i, j, kind = _classify_text_pairs(text_boxes[i], text_boxes[j], i, j, MIN_PADDING)
+        for a, b, kd in zip(i, j, kind):
+            self._text_pairs[(int(text_ids[a]), int(text_ids[b]))] = (
+                int(kd), _text_pair_message(kd, texts[a], texts[b]))
+
+    def _update_shape_pairs(self, shapes, shape_ids, shape_boxes,
+                            texts, text_ids, text_boxes, stale, full):
+        ns = len(shape_boxes)
+        rows, full = self._changed_rows(np.concatenate([shape_ids, text_ids]), stale, full)
+        if full:
+            self._shape_pairs = {}
+            pairs = zip(*shape_text_overlaps(shape_boxes, text_boxes))
+        else:
+            self._shape_pairs = {
+                key: msg for key, msg in self._shape_pairs.items()
+                if key[0] not in stale and key[1] not in stale
+            }
+            if ns == 0 or len(text_boxes) == 0:
+                return
+            r, k = _near_rows(np.vstack([shape_boxes, text_boxes]), rows, inclusive=True)
+            cross = (r < ns) != (k < ns)
+            s, t = np.minimum(r, k)[cross], np.maximum(r, k)[cross] - ns
+            pairs = zip(s, t)
+        for a, b in pairs:
+            self._shape_pairs[(int(shape_ids[a]), int(text_ids[b]))] = \
+                _shape_text_message(shapes[a], texts[b])
+
+
+# ── Per-mobject checks ───────────────────────────────────────────────
+
+def _safe_print(msg):
+    try:
+        print(msg)
+    except UnicodeEncodeError:
+        print(msg.encode('ascii', errors='replace').decode('ascii'))
+
+
+def _mob_label(mob):
+    raw = None
+    if hasattr(mob, 'text') and isinstance(getattr(mob, 'text', None), str):
+        raw = mob.text[:40]
+    elif hasattr(mob, 'tex_string') and isinstance(getattr(mob, 'tex_string', None), str):
+        raw = mob.tex_string[:40]
+    if raw is None:
+        return type(mob).__name__
+    return raw.encode('ascii', errors='replace').decode('ascii')
+
+
+def _is_text_or_tex(mob):
+    if hasattr(mob, 'text') and isinstance(getattr(mob, 'text', None), str):
+        return True
+    if hasattr(mob, 'tex_string') and isinstance(getattr(mob, 'tex_string', None), str):
+        return True
+    return False
+
+
+def _get_fill_opacity(mob):
+    if hasattr(mob, 'get_fill_opacity'):
+        try:
+            fo = mob.get_fill_opacity()
+            if hasattr(fo, '__len__'):
+                return float(max(fo)) if len(fo) > 0 else 0.0
+            return float(fo)
+        except Exception:
+            pass
+    return 0.0
+
+
+def check_mobject(mob, box, frame, prefix, issues):
+    """
+    Bounds and font-size checks for a single mobject.  Returns
+    ``"text"``, ``"shape"`` or ``None`` depending on whether the mobject
+    takes part in the pair checks; ``"skip"`` means its family is not
+    worth descending into.
+    """
+    left, bottom, right, top = frame
+    xmin, ymin, xmax, ymax = box
+
+    w = abs(xmax - xmin)
+    h = abs(ymax - ymin)
+    if w < 0.001 and h < 0.001:
+        return "skip"
+
+    frame_w = abs(right - left)
+    frame_h = abs(top - bottom)
+    if w > frame_w * 2 or h > frame_h * 2:
+        return "skip"
+
+    is_text = _is_text_or_tex(mob)
+    role = None
+
+    if is_text:
+        role = "text"
+        font_size = getattr(mob, 'font_size', None)
+        if font_size is not None and font_size < MIN_FONT_SIZE:
+            issues.append(
+                f"{prefix}FONT TOO SMALL: \"{_mob_label(mob)}\" "
+                f"font_size={font_size} (min {MIN_FONT_SIZE})"
+            )
+
+    if not is_text and _get_fill_opacity(mob) > 0.3 and w > 0.5 and h > 0.5:
+        role = "shape"
+
+    EPS = 0.1
+    out = (xmin < left - EPS or xmax > right + EPS or
+           ymin < bottom - EPS or ymax > top + EPS)
+
+    if out:
+        vis_l = max(xmin, left)
+        vis_r = min(xmax, right)
+        vis_b = max(ymin, bottom)
+        vis_t = min(ymax, top)
+        vis_w = max(0.0, vis_r - vis_l)
+        vis_h = max(0.0, vis_t - vis_b)
+        area = w * h if w * h > 0 else 1
+        visible_frac = (vis_w * vis_h) / area
+
+        if visible_frac < 0.01:
+            severity = "COMPLETELY OFF SCREEN"
+        elif visible_frac < 0.5:
+            severity = "MOSTLY OFF SCREEN"
+        else:
+            severity = "OUT OF BOUNDS"
+
+        issues.append(
+            f"{prefix}{severity}: {_mob_label(mob) if is_text else type(mob).__name__} "
+            f"ul=({xmin:.1f},{ymax:.1f}) dr=({xmax:.1f},{ymin:.1f}) "
+            f"visible={visible_frac:.0%} "
+            f"frame=({left:.1f},{bottom:.1f})-({right:.1f},{top:.1f})"
+        )
+    return role
+
+
+def _collect_recursive(mob, frame, prefix, issues, texts, text_rows,
+                       shapes, shape_rows, seen_ids):
+    mid = id(mob)
+    if mid in seen_ids:
+        return
+    seen_ids.add(mid)
+
+    if type(mob).__name__ in SKIP_TYPES:
+        return
+
+    box = mobject_box(mob)
+    if box is None:
+        return
+
+    role = check_mobject(mob, box, frame, prefix, issues)
+    if role == "skip":
+        return
+    if role == "text":
+        texts.append(mob)
+        text_rows.append(box)
+    elif role == "shape":
+        shapes.append(mob)
+        shape_rows.append(box)
+
+    for sub in getattr(mob, 'submobjects', ()):
+        _collect_recursive(sub, frame, prefix, issues, texts, text_rows,
+                           shapes, shape_rows, seen_ids)
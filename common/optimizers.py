@@ -0,0 +1,133 @@
+"""
+Batched optimizer trajectories
+==============================
+The gradient-descent scenes each stepped their own optimizer in a Python
+loop with a hand-written gradient.  Here a loss is given once as a
+vectorized gradient -- ``(n, d)`` points -> ``(n, d)`` gradients -- and
+SGD, Momentum, RMSProp or Adam are run on a whole batch of start points
+together, one numpy update per step for all of them.
+
+Paths come back as ``(steps + 1, n, d)`` arrays; ``scene_paths`` turns
+them into ``(steps + 1, 3)`` scene points for ``set_points_as_corners``.
+
+    paths = trajectories(elliptic_bowl(1, 35).grad, starts, "momentum", lr=0.03)
+    for pts in scene_paths(paths, offset=graph_center):
+        path = VMobject().set_points_as_corners(pts)
+
+The update rules are the ones written on screen in the Momentum, RMSProp
+and Adam videos (exponential averages with ``1 - beta`` weights).
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from common.backend import mn
+
+
+Loss = namedtuple("Loss", "f grad")
+
+
+def elliptic_bowl(a=1.0, b=1.0):
+    """``L = a x^2 + b y^2``, the stretched bowl the zig-zag scenes use."""
+    scale = np.array([a, b], dtype=float)
+    return Loss(lambda p: (np.asarray(p)[..., :2] ** 2 * scale).sum(axis=-1),
+                lambda p: 2 * np.asarray(p)[..., :2] * scale)
+
+
+def bowl_1d(f, df):
+    """A 1-D loss from scalar functions applied elementwise."""
+    return Loss(lambda p: f(np.asarray(p)[..., 0]),
+                lambda p: df(np.asarray(p)[..., :1]))
+
+
+# ── Update rules ──────────────────────────────────────────────────────────
+# Each takes (x, g, state, t, hyper) and returns the step to subtract.
+
+def _sgd(x, g, state, t, lr, **_):
+    return lr * g
+
+
+def _momentum(x, g, state, t, lr, beta=0.9, **_):
+    state["v"] = beta * state.get("v", 0) + (1 - beta) * g
+    return lr * state["v"]
+
+
+def _rmsprop(x, g, state, t, lr, beta=0.9, eps=1e-8, **_):
+    state["s"] = beta * state.get("s", 0) + (1 - beta) * g ** 2
+    return lr * g / (np.sqrt(state["s"]) + eps)
+
+
+def _adam(x, g, state, t, lr, beta1=0.9, beta2=0.999, eps=1e-8, **_):
+    state["m"] = beta1 * state.get("m", 0) + (1 - beta1) * g
+    state["v"] = beta2 * state.get("v", 0) + (1 - beta2) * g ** 2
+    m_hat = state["m"] / (1 - beta1 ** t)
+    v_hat = state["v"] / (1 - beta2 ** t)
+    return lr * m_hat / (np.sqrt(v_hat) + eps)
+
+
+OPTIMIZERS = {
+    "sgd": _sgd,
+    "momentum": _momentum,
+    "rmsprop": _rmsprop,
+    "adam": _adam,
+}
+
+
+def trajectories(grad, starts, optimizer="sgd", lr=0.1, steps=40, **hyper):
+    """
+    ``(steps + 1, n, d)`` positions of ``optimizer`` run from every row of
+    ``starts`` (one start point may be given as a flat vector).  ``hyper``
+    goes to the update rule (``beta``, ``beta1``, ``beta2``, ``eps``).
+    """
+    update = OPTIMIZERS[optimizer]
+    x = np.atleast_2d(np.asarray(starts, dtype=float)).copy()
+    path = np.empty((steps + 1,) + x.shape)
+    path[0] = x
+    state = {}
+    for t in range(1, steps + 1):
+        x = x - update(x, grad(x), state, t, lr=lr, **hyper)
+        path[t] = x
+    return path
+
+
+def compare(grad, starts, configs, steps=40):
+    """
+    ``{name: paths}`` for several optimizers from the same start points;
+    ``configs`` maps a name to ``trajectories`` keyword arguments, e.g.
+    ``{"sgd": dict(lr=0.027), "adam": dict(optimizer="adam", lr=0.3)}``.
+    """
+    return {
+        name: trajectories(grad, starts, **dict(dict(optimizer=name, steps=steps), **cfg))
+        for name, cfg in configs.items()
+    }
+
+
+def scene_paths(paths, to_scene=None, offset=0):
+    """
+    ``(n, steps + 1, 3)`` scene points for ``(steps + 1, n, d)`` paths.
+    ``to_scene`` maps ``(m, d)`` data points to ``(m, 3)`` (e.g.
+    ``lambda p: to_scene_points(axes, p)``); without it data coordinates
+    are padded to 3-D and shifted by ``offset``.
+    """
+    steps, n, d = paths.shape
+    flat = paths.transpose(1, 0, 2).reshape(-1, d)
+    if to_scene is not None:
+        points = np.asarray(to_scene(flat), dtype=float)
+    else:
+        points = np.zeros((len(flat), 3))
+        points[:, :min(d, 3)] = flat[:, :3]
+        points = points + offset
+    return points.reshape(n, steps, 3)
+
+
+def path_mobjects(paths, to_scene=None, offset=0, color=None, stroke_width=3):
+    """``VGroup`` with one corner path per trajectory."""
+    m = mn()
+    group = m.VGroup()
+    for points in scene_paths(paths, to_scene, offset):
+        line = m.VMobject()
+        line.set_points_as_corners(points)
+        line.set_stroke(color=color, width=stroke_width)
+        group.add(line)
+    return group
@@ -0,0 +1,145 @@
+"""
+Glowing particles (ManimGL)
+===========================
+The neural-activity scenes draw pulses as ``VGroup(Dot, Circle)`` or as a
+dot over a stack of twenty translucent circles, and move them with one
+``.animate`` per pulse.  Here every particle is one point of a single
+``GlowDots`` cloud: positions, radii, colours and opacities are numpy
+arrays, the whole cloud is drawn by one shader call, and
+``ParticleTransition`` moves / fades / resizes all of it with array
+interpolation.
+
+    pulses = ParticleSystem(color=RED)
+    pulses.emit(starts, radii)
+    self.play(ParticleTransition(pulses, positions=targets, opacities=alive,
+                                 remove_faded=True))
+
+``glow`` and ``glow_pulse`` are the single-pulse versions for scenes that
+animate pulses one by one.
+"""
+
+import numpy as np
+
+from manimlib import Animation, Dot, GlowDot, GlowDots, Group, RED, color_to_rgb
+
+
+def _as_points(points):
+    points = np.atleast_2d(np.asarray(points, dtype=float))
+    if points.shape[1] == 2:
+        points = np.column_stack([points, np.zeros(len(points))])
+    return points
+
+
+class ParticleSystem(GlowDots):
+    """
+    A cloud of glowing particles backed by numpy arrays.
+
+    ``positions`` ``(n, 3)``, ``particle_radii`` ``(n,)``,
+    ``particle_colors`` ``(n, 3)`` rgb and ``particle_opacities`` ``(n,)``
+    are the source of truth; they are only ever replaced, never edited in
+    place, so copies made by animations stay independent.
+    """
+
+    def __init__(self, color=RED, glow_factor=2.0, **kwargs):
+        super().__init__(points=[], color=color, glow_factor=glow_factor, **kwargs)
+        self.default_rgb = np.array(color_to_rgb(color))
+        self.positions = np.zeros((0, 3))
+        self.particle_radii = np.zeros(0)
+        self.particle_colors = np.zeros((0, 3))
+        self.particle_opacities = np.zeros(0)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def _sync(self):
+        self.set_points(self.positions)
+        if len(self.positions):
+            self.set_radii(self.particle_radii)
+            self.set_rgba_array(np.column_stack([self.particle_colors, self.particle_opacities]))
+        return self
+
+    def emit(self, points, radii, color=None, opacity=1.0):
+        """Add particles at ``points`` (``(n, 2)`` or ``(n, 3)``)."""
+        points = _as_points(points)
+        n = len(points)
+        rgb = self.default_rgb if color is None else np.array(color_to_rgb(color))
+        self.positions = np.concatenate([self.positions, points])
+        self.particle_radii = np.concatenate([self.particle_radii, np.broadcast_to(radii, n)])
+        self.particle_colors = np.concatenate([self.particle_colors, np.tile(rgb, (n, 1))])
+        self.particle_opacities = np.concatenate([self.particle_opacities,
+                                                  np.broadcast_to(opacity, n)])
+        return self._sync()
+
+    def kill(self, mask):
+        """Drop the particles where ``mask`` is true."""
+        keep = ~np.asarray(mask, dtype=bool)
+        self.positions = self.positions[keep]
+        self.particle_radii = self.particle_radii[keep]
+        self.particle_colors = self.particle_colors[keep]
+        self.particle_opacities = self.particle_opacities[keep]
+        return self._sync()
+
+    def set_state(self, positions=None, radii=None, opacities=None):
+        if positions is not None:
+            self.positions = _as_points(positions)
+        if radii is not None:
+            self.particle_radii = np.broadcast_to(radii, len(self.positions)).astype(float)
+        if opacities is not None:
+            self.particle_opacities = np.broadcast_to(opacities, len(self.positions)).astype(float)
+        return self._sync()
+
+    def map_positions(self, func):
+        """Replace positions with ``func(positions)``, e.g. inside an updater."""
+        return self.set_state(positions=func(self.positions))
+
+
+class ParticleTransition(Animation):
+    """
+    Interpolate every particle of a ``ParticleSystem`` to new positions,
+    radii and / or opacities in one animation.  With ``remove_faded`` the
+    particles whose target opacity is 0 are dropped at the end.
+    """
+
+    def __init__(self, system, positions=None, radii=None, opacities=None,
+                 remove_faded=False, **kwargs):
+        self.targets = dict(positions=positions, radii=radii, opacities=opacities)
+        self.remove_faded = remove_faded
+        super().__init__(system, **kwargs)
+
+    def begin(self):
+        s = self.mobject
+        self.start = dict(positions=s.positions, radii=s.particle_radii,
+                          opacities=s.particle_opacities)
+        self.end = {}
+        for key, start in self.start.items():
+            target = self.targets[key]
+            if target is None:
+                self.end[key] = start
+            elif key == "positions":
+                self.end[key] = _as_points(target)
+            else:
+                self.end[key] = np.broadcast_to(np.asarray(target, dtype=float), start.shape)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha)
+        self.mobject.set_state(**{
+            key: start + (self.end[key] - start) * t for key, start in self.start.items()
+        })
+
+    def finish(self):
+        super().finish()
+        if self.remove_faded:
+            self.mobject.kill(self.end["opacities"] <= 0)
+
+
+def glow(center, radius=0.15, color=RED, intensity=0.3):
+    """One shader-drawn halo in place of a stack of translucent circles."""
+    return GlowDot(center, radius=radius * 3, color=color, opacity=min(1.0, 2 * intensity),
+                   glow_factor=2.0)
+
+
+def glow_pulse(center, color=RED, core_radius=0.12, glow_radius=0.1, intensity=0.4):
+    """``Group(halo, core dot)``: a pulse that can be moved and faded as one."""
+    core = Dot(radius=core_radius, color=color, fill_opacity=1).move_to(center)
+    return Group(glow(center, glow_radius, color, intensity), core)
@@ -0,0 +1,68 @@
+"""
+PCA datasets
+============
+The 2-D PCA video (ManimGL) and the 3-D one (ManimCE) each generated their
+noisy diagonal cloud and worked out its principal directions and per-PC
+projections on their own, the 3-D scene point by point.  ``pca_dataset``
+does both once: it draws the seeded dataset, then computes mean,
+covariance, the eigen-decomposition (largest variance first), every
+sample's scores and its projection onto every PC as whole-array
+operations.  The result is stored with ``assets.cached_arrays``, so both
+renderers, and every re-render, read the same arrays.
+
+Projections are taken about the origin, as the scenes draw the PCs through
+it (the clouds are generated centred).
+
+    data = pca_dataset(150, starts=(-2.5, -2), ends=(2.5, 2), noise=(0.1, 0.1))
+    pc1 = data["eigenvectors"][:, 0]
+    pc1_feet = data["projections"][0]        # (n, d) data coordinates
+"""
+
+import numpy as np
+
+from common import assets
+
+
+def line_cloud(n_points, starts, ends, noise, seed=42):
+    """
+    ``(n, d)`` samples spread evenly from ``starts`` to ``ends`` with
+    Gaussian noise per dimension; the noise is drawn dimension by dimension
+    from ``seed``, as ``np.random.seed(seed)`` followed by one
+    ``np.random.normal`` per axis would.
+    """
+    rng = np.random.RandomState(seed)
+    columns = [np.linspace(a, b, n_points) for a, b in zip(starts, ends)]
+    for column, scale in zip(columns, noise):
+        column += rng.normal(scale=scale, size=n_points)
+    return np.column_stack(columns)
+
+
+def analyze(points):
+    """Mean, covariance, sorted eigenpairs, scores and per-PC projections."""
+    points = np.asarray(points, dtype=float)
+    cov = np.cov(points.T)
+    eigenvalues, eigenvectors = np.linalg.eigh(cov)
+    order = np.argsort(eigenvalues)[::-1]
+    eigenvalues, eigenvectors = eigenvalues[order], eigenvectors[:, order]
+    scores = points @ eigenvectors                                  # (n, k)
+    projections = scores.T[:, :, None] * eigenvectors.T[:, None, :]  # (k, n, d)
+    return {
+        "points": points,
+        "mean": points.mean(axis=0),
+        "cov": cov,
+        "eigenvalues": eigenvalues,
+        "eigenvectors": eigenvectors,
+        "explained": eigenvalues / eigenvalues.sum(),
+        "scores": scores,
+        "projections": projections,
+    }
+
+
+def pca_dataset(n_points, starts, ends, noise, seed=42):
+    """``analyze(line_cloud(...))``, computed once and then read from disk."""
+    return assets.cached_arrays(
+        "pca_dataset",
+        lambda **p: analyze(line_cloud(**p)),
+        n_points=n_points, starts=tuple(starts), ends=tuple(ends),
+        noise=tuple(noise), seed=seed,
+    )
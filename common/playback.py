@@ -0,0 +1,72 @@
+"""
+Trajectory playback
+===================
+Descent scenes used to move a dot along a precomputed path with one
+``self.play(dot.animate.move_to(p))`` per step, paying an animation's setup
+and teardown every time.  ``trajectory_playback`` plays the whole
+``(N, 3)`` path as one animation: each step eases from point ``i`` to
+``i + 1`` over ``step_time`` and then rests for ``dwell`` (both scalars or
+one value per step), optionally showing a per-step glyph (a tangent line,
+a gradient arrow, ...) while that step runs.
+
+    self.play(trajectory_playback(dot, path, step_time=0.7, glyphs=tangents))
+"""
+
+import numpy as np
+
+from common.backend import mn
+
+
+def step_schedule(n_steps, step_time=0.7, dwell=0.0):
+    """
+    ``(starts, moves, total)``: start time and move time of every step;
+    ``total`` is 0 when there are no steps.
+    """
+    n_steps = max(n_steps, 0)
+    moves = np.broadcast_to(np.asarray(step_time, dtype=float), n_steps)
+    rests = np.broadcast_to(np.asarray(dwell, dtype=float), n_steps)
+    ends = np.cumsum(moves + rests)
+    return ends - moves - rests, moves, float(ends[-1]) if n_steps else 0.0
+
+
+def trajectory_playback(mobject, path, step_time=0.7, dwell=0.0, glyphs=None,
+                        step_rate=None, **kwargs):
+    """
+    One animation moving ``mobject`` through every point of ``path``.
+
+    ``glyphs`` is a list with one mobject per step (``len(path) - 1``);
+    glyph ``i`` is on screen while the step from point ``i`` runs.
+    ``step_rate`` eases each step (``smooth`` by default, as ``.animate``).
+    A path of one point just puts ``mobject`` there.
+    """
+    m = mn()
+    path = np.asarray(path, dtype=float)
+    n_steps = len(path) - 1
+    starts, moves, total = step_schedule(n_steps, step_time, dwell)
+    step_rate = step_rate or m.smooth
+
+    holder = m.Group() if glyphs is not None else None
+    target = mobject if holder is None else m.Group(mobject, holder)
+    shown = [-1]
+
+    def update(_, alpha):
+        if n_steps < 1:
+            if len(path):
+                mobject.move_to(path[0])
+            return
+        t = alpha * total
+        i = min(int(np.searchsorted(starts, t, side="right")) - 1, n_steps - 1)
+        i = max(i, 0)
+        frac = 1.0 if moves[i] <= 0 else min(max((t - starts[i]) / moves[i], 0.0), 1.0)
+        mobject.move_to(path[i] + (path[i + 1] - path[i]) * step_rate(frac))
+        if holder is not None:
+            current = -1 if alpha >= 1 else i
+            if current != shown[0]:
+                holder.remove(*holder.submobjects)
+                if current >= 0:
+                    holder.add(glyphs[current])
+                shown[0] = current
+
+    # Without steps there is nothing to time, but run_time must be positive
+    kwargs.setdefault("run_time", total or 1 / 30)
+    return m.UpdateFromAlphaFunc(target, update, rate_func=m.linear, **kwargs)
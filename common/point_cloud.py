@@ -0,0 +1,86 @@
+"""
+Data-space point clouds (ManimGL)
+=================================
+A scatter plot of a few hundred samples as a ``VGroup`` of ``Dot``s means
+one mobject per sample, and an updater that restyles them pays several
+Python calls per dot per frame.  ``DataCloud`` is one ``DotCloud``: the
+samples' data coordinates are kept as arrays, and colour, opacity and
+radius are written for all points at once, so an updater is a handful of
+numpy operations whatever the sample count.
+
+    cloud = DataCloud(axes, days, temps, color=BLUE_C, opacity=0.8)
+    inside = cloud.window(x - 30, x)
+    cloud.set_style_arrays(color=mix_colors(BLUE_C, YELLOW, inside),
+                           opacity=np.where(inside, 1, 0.8))
+"""
+
+import numpy as np
+
+from manimlib import BLUE_C, DotCloud, color_to_rgb
+
+from common.contours import to_scene_points
+
+
+def rgb_array(color, n):
+    """``(n, 3)`` rgb for one colour or a list / array of colours."""
+    if isinstance(color, np.ndarray) and color.ndim == 2:
+        return color
+    if isinstance(color, (list, tuple)) and len(color) == n and not np.isscalar(color[0]):
+        return np.array([color_to_rgb(c) for c in color])
+    return np.tile(color_to_rgb(color), (n, 1))
+
+
+def mix_colors(a, b, t):
+    """Per-point blend from colour ``a`` (t = 0) to ``b`` (t = 1)."""
+    t = np.asarray(t, dtype=float)[:, None]
+    rgb_a, rgb_b = np.array(color_to_rgb(a)), np.array(color_to_rgb(b))
+    return rgb_a + (rgb_b - rgb_a) * t
+
+
+class DataCloud(DotCloud):
+    """
+    Samples ``(x, y)`` plotted on ``axes`` as a single ``DotCloud``.
+
+    ``x`` / ``y`` stay in data space, so masks like "inside the scan
+    window" or "lag behind day t" are plain comparisons on ``self.x``.
+    """
+
+    def __init__(self, axes, x, y, color=BLUE_C, opacity=1.0, radius=0.08, **kwargs):
+        self.axes = axes
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        points = to_scene_points(axes, np.column_stack([self.x, self.y]))
+        super().__init__(points=points, color=color, opacity=opacity, radius=radius, **kwargs)
+
+    def __len__(self):
+        return len(self.x)
+
+    def get_rgbas(self):
+        # ManimGL renamed the "rgbas" data key to "rgba" in 1.7
+        data = self.data
+        keys = data.dtype.names if hasattr(data, "dtype") else data.keys()
+        return np.array(data["rgba" if "rgba" in keys else "rgbas"])
+
+    def window(self, lo, hi):
+        """Mask of samples with ``lo < x < hi``."""
+        return (self.x > lo) & (self.x < hi)
+
+    def set_style_arrays(self, color=None, opacity=None, radius=None, indices=None):
+        """
+        Set colour, opacity and / or radius for every point (or only
+        ``indices``).  Each accepts a scalar / single colour or one value per
+        point.
+        """
+        rgba = self.get_rgbas()
+        radii = np.array(self.get_radii()).reshape(-1)
+        sel = slice(None) if indices is None else indices
+        n = len(rgba[sel])
+        if color is not None:
+            rgba[sel, :3] = rgb_array(color, n)
+        if opacity is not None:
+            rgba[sel, 3] = opacity
+        self.set_rgba_array(rgba)
+        if radius is not None:
+            radii[sel] = radius
+            self.set_radii(radii)
+        return self
@@ -0,0 +1,251 @@
+"""
+Render-cost profiler (ManimGL)
+==============================
+Where a render of ``2026/RNN/code.py`` or ``manimGl/Bellman_ford.py``
+spends its time was guesswork.  ``python -m common.profiler run`` renders a
+scene with ``Scene.play`` and ``Scene.wait`` wrapped and records, per call
+site (``file:line`` in the scene file):
+
+* calls, animations and the mobject family size they drive,
+* distinct mobjects touched,
+* wall time, split into rendering (``update_frame``: updaters and camera
+  capture, plus ``emit_frame``: frame read-back and encoding) and
+  everything else (animation setup and interpolation),
+* ``Text`` / ``Tex`` mobjects created since the previous play / wait.
+
+The report goes to ``PROFILE_DIR/<Scene>.json``, sorted by any column, and
+``<Scene>.folded`` (one ``stack;frames wall_us`` line per call site) for
+``flamegraph.pl`` or speedscope.  ``plan`` is the static counterpart: it
+counts ``play`` / ``wait`` calls and ``Text`` / ``Tex`` constructions per
+method of every scene class without rendering anything.
+
+    python -m common.profiler run 2026/RNN/code.py HookScene -w -l --sort render
+    python -m common.profiler plan manimGl/Bellman_ford.py
+"""
+
+import argparse
+import ast
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+
+
+PROFILE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           ".cache", "profiles")
+COLUMNS = ("wall", "render", "interpolate", "calls", "animations", "family",
+           "mobjects", "text_created", "tex_created")
+TEXT_CLASSES = ("Text", "MarkupText")
+TEX_CLASSES = ("Tex", "TexText", "MathTex")
+
+_LIBRARY_DIRS = (os.sep + "manimlib" + os.sep, os.path.dirname(os.path.abspath(__file__)) + os.sep)
+
+
+# ── Runtime profile ───────────────────────────────────────────────────────
+
+def _call_stack():
+    """Scene-file frames of the caller, outermost first, as ``func@file:line``."""
+    frames = []
+    frame = sys._getframe(2)
+    while frame is not None:
+        path = frame.f_code.co_filename
+        if not any(d in path for d in _LIBRARY_DIRS) and not path.startswith("<"):
+            name = os.path.basename(path).replace(" ", "_")
+            frames.append(f"{frame.f_code.co_name}@{name}:{frame.f_lineno}")
+        frame = frame.f_back
+    return frames[::-1]
+
+
+class RenderProfile:
+    """Per-call-site totals, filled by the wrappers ``install`` puts on ``Scene``."""
+
+    def __init__(self):
+        self.sites = defaultdict(lambda: dict.fromkeys(COLUMNS, 0))
+        self.stacks = defaultdict(float)
+        self.created = {"text_created": 0, "tex_created": 0}
+        self.current = None
+
+    def record_animations(self, animations):
+        if self.current is None:
+            return
+        mobjects = {id(a.mobject): a.mobject for a in animations if getattr(a, "mobject", None) is not None}
+        self.current["animations"] += len(animations)
+        self.current["mobjects"] += len(mobjects)
+        self.current["family"] += sum(len(m.get_family()) for m in mobjects.values())
+
+    def wrap_call(self, kind, method):
+        profile = self
+
+        def wrapper(scene, *args, **kwargs):
+            if profile.current is not None:      # nested play inside wait, etc.
+                return method(scene, *args, **kwargs)
+            stack = _call_stack()
+            site = f"{kind} {stack[-1].split('@', 1)[1]}" if stack else kind
+            row = profile.sites[site]
+            row["calls"] += 1
+            for key, count in profile.created.items():
+                row[key] += count
+                profile.created[key] = 0
+            profile.current = row
+            render_before = row["render"]
+            start = time.perf_counter()
+            try:
+                return method(scene, *args, **kwargs)
+            finally:
+                wall = time.perf_counter() - start
+                row["wall"] += wall
+                row["interpolate"] += wall - (row["render"] - render_before)
+                profile.stacks[";".join([type(scene).__name__] + stack + [kind])] += wall
+                profile.current = None
+
+        return wrapper
+
+    def wrap_timed(self, method, column):
+        profile = self
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                if profile.current is not None:
+                    profile.current[column] += time.perf_counter() - start
+
+        return wrapper
+
+    def wrap_init(self, cls, column):
+        profile = self
+        init = cls.__init__
+
+        def __init__(obj, *args, **kwargs):
+            if type(obj) is cls:
+                profile.created[column] += 1
+            init(obj, *args, **kwargs)
+
+        cls.__init__ = __init__
+
+    def rows(self, sort="wall"):
+        rows = [dict(site=site, **{k: round(v, 4) if isinstance(v, float) else v
+                                   for k, v in row.items()})
+                for site, row in self.sites.items()]
+        return sorted(rows, key=lambda r: r[sort], reverse=True)
+
+    def write(self, name, sort="wall"):
+        os.makedirs(PROFILE_DIR, exist_ok=True)
+        base = os.path.join(PROFILE_DIR, name)
+        with open(base + ".json", "w") as f:
+            json.dump({"scene": name, "sort": sort, "sites": self.rows(sort)}, f, indent=1)
+        with open(base + ".folded", "w") as f:
+            for stack, wall in sorted(self.stacks.items()):
+                f.write(f"{stack} {int(wall * 1e6)}\n")
+        return base + ".json"
+
+
+def install(profile):
+    """
+    Wrap ``Scene.play`` / ``wait`` / ``update_frame`` / ``emit_frame`` and
+    the text constructors.
+    """
+    import manimlib
+    from manimlib.scene.scene import Scene
+
+    Scene.play = profile.wrap_call("play", Scene.play)
+    Scene.wait = profile.wrap_call("wait", Scene.wait)
+    Scene.update_frame = profile.wrap_timed(Scene.update_frame, "render")
+    if hasattr(Scene, "emit_frame"):     # writes the frame after update_frame
+        Scene.emit_frame = profile.wrap_timed(Scene.emit_frame, "render")
+    original_begin = Scene.begin_animations
+
+    def begin_animations(scene, animations, *args, **kwargs):
+        profile.record_animations(animations)
+        return original_begin(scene, animations, *args, **kwargs)
+
+    Scene.begin_animations = begin_animations
+    for names, column in ((TEXT_CLASSES, "text_created"), (TEX_CLASSES, "tex_created")):
+        for name in names:
+            cls = getattr(manimlib, name, None)
+            if cls is not None:
+                profile.wrap_init(cls, column)
+
+
+def print_table(rows, limit=20):
+    print(f"{'site':<36}" + "".join(f"{c:>13}" for c in COLUMNS))
+    for row in rows[:limit]:
+        print(f"{row['site']:<36}" + "".join(f"{row[c]:>13}" for c in COLUMNS))
+
+
+def run(scene_file, scene_name, manim_flags, sort="wall"):
+    """Render ``scene_name`` in this process with profiling on."""
+    from manimlib.__main__ import main
+
+    profile = RenderProfile()
+    install(profile)
+    sys.argv = ["manimgl", scene_file, scene_name, *manim_flags]
+    try:
+        main()
+    finally:
+        path = profile.write(scene_name, sort)
+        print_table(profile.rows(sort))
+        print(f"report: {path}")
+    return profile
+
+
+# ── Static plan ───────────────────────────────────────────────────────────
+
+def _callee(node):
+    func = node.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return None
+
+
+def plan(path):
+    """``{class: {method: counts}}`` of play / wait / Text / Tex calls in ``path``."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    report = {}
+    for cls in (n for n in tree.body if isinstance(n, ast.ClassDef)):
+        methods = {}
+        for fn in (n for n in cls.body if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))):
+            counts = dict.fromkeys(("play", "wait", "text", "tex"), 0)
+            for node in ast.walk(fn):
+                if isinstance(node, ast.Call):
+                    name = _callee(node)
+                    if name in ("play", "wait"):
+                        counts[name] += 1
+                    elif name in TEXT_CLASSES or name == "cached_text":
+                        counts["text"] += 1
+                    elif name in TEX_CLASSES or name == "cached_tex":
+                        counts["tex"] += 1
+            if any(counts.values()):
+                methods[fn.name] = dict(counts, lines=fn.end_lineno - fn.lineno + 1)
+        if methods:
+            report[cls.name] = methods
+    return report
+
+
+def print_plan(report):
+    print(f"{'scene.method':<48}{'lines':>7}{'play':>7}{'wait':>7}{'text':>7}{'tex':>7}")
+    for cls, methods in report.items():
+        for name, c in methods.items():
+            print(f"{cls + '.' + name:<48}{c['lines']:>7}{c['play']:>7}{c['wait']:>7}"
+                  f"{c['text']:>7}{c['tex']:>7}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Profile where render time goes.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="render a scene with profiling")
+    run_parser.add_argument("scene_file")
+    run_parser.add_argument("scene_name")
+    run_parser.add_argument("--sort", choices=COLUMNS, default="wall")
+    plan_parser = commands.add_parser("plan", help="static counts per scene method")
+    plan_parser.add_argument("scene_file")
+    args, manim_flags = parser.parse_known_args()
+    if args.command == "run":
+        run(args.scene_file, args.scene_name, manim_flags, args.sort)
+    else:
+        print_plan(plan(args.scene_file))
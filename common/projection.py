@@ -0,0 +1,107 @@
+"""
+Projection onto a rotating axis
+===============================
+The PCA scenes sweep a line through the mean and show every sample's
+projection onto it.  Done per frame with ``axes.c2p`` and ``np.dot`` per
+point, plus a fresh ``Line`` per point in an ``always_redraw``, the sweep
+slowed down with every sample added.
+
+``ProjectionEngine`` maps the samples to scene space once and keeps them
+centred on the mean.  For a line angle, the projection scalars of all
+samples are one matrix-vector product; the feet, the variance along the
+line and the two extreme feet follow from them with numpy.  Several angles
+can be scored at once (``variances``).  ``projection_segments`` draws all
+the sample-to-foot segments as one ``VMobject`` whose point array is built
+with numpy and set once per frame.
+
+    engine = ProjectionEngine(axes, data_points)
+    lines = projection_segments(engine, angle_tracker.get_value, color=PURPLE)
+    best = engine.best_angle([0, PI / 8, PI / 4])
+"""
+
+import numpy as np
+
+from common.backend import is_manimgl, mn
+from common.contours import to_scene_points
+
+
+def direction(angle):
+    """Unit vector of a line at ``angle`` in the scene plane."""
+    return np.array([np.cos(angle), np.sin(angle), 0.0])
+
+
+class ProjectionEngine:
+    """
+    Samples ``xy`` (``(n, 2)`` data coordinates) cached in scene space on
+    ``axes``; lines pass through ``center`` (the samples' mean by default).
+    """
+
+    def __init__(self, axes, xy, center=None):
+        self.points = to_scene_points(axes, np.asarray(xy, dtype=float))
+        self.center = self.points.mean(axis=0) if center is None else np.asarray(center, dtype=float)
+        self.centered = self.points - self.center
+
+    def __len__(self):
+        return len(self.points)
+
+    def scalars(self, angle):
+        """Signed distance of every foot from the centre along the line."""
+        return self.centered @ direction(angle)
+
+    def feet(self, angle):
+        """``(n, 3)`` orthogonal projections onto the line."""
+        return self.center + np.outer(self.scalars(angle), direction(angle))
+
+    def variance(self, angle):
+        return self.scalars(angle).var()
+
+    def variances(self, angles):
+        """Projected variance for every angle in ``angles`` at once."""
+        angles = np.asarray(angles, dtype=float)
+        dirs = np.stack([np.cos(angles), np.sin(angles), np.zeros_like(angles)], axis=1)
+        return (self.centered @ dirs.T).var(axis=0)
+
+    def best_angle(self, angles):
+        """The first angle of ``angles`` with the largest projected variance."""
+        return angles[int(np.argmax(self.variances(angles)))]
+
+    def extremes(self, angle):
+        """The two outermost feet on the line (lowest and highest scalar)."""
+        s = self.scalars(angle)
+        d = direction(angle)
+        return self.center + s.min() * d, self.center + s.max() * d
+
+
+def segment_points(starts, ends):
+    """
+    Points of one straight subpath per ``(start, end)`` pair, laid out as
+    ``start_new_path`` / ``add_line_to`` would build them: ManimGL's
+    quadratic ``s, m, e`` with ``e`` repeated as the handle that ends the
+    path, ManimCE's cubic ``s, s + d/3, s + 2d/3, e``.
+    """
+    starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 3)
+    if len(starts) == 0:
+        return np.zeros((0, 3))
+    if is_manimgl():
+        return np.stack([starts, (starts + ends) / 2, ends, ends], axis=1).reshape(-1, 3)[:-1]
+    d = ends - starts
+    return np.stack([starts, starts + d / 3, starts + 2 * d / 3, ends], axis=1).reshape(-1, 3)
+
+
+def set_segments(vmobject, starts, ends):
+    """Rewrite ``vmobject`` as one straight subpath per ``(start, end)`` pair."""
+    vmobject.set_points(segment_points(starts, ends))
+    return vmobject
+
+
+def projection_segments(engine, get_angle, color=None, stroke_width=4):
+    """
+    One ``VMobject`` holding every sample-to-foot segment, kept up to date
+    with ``get_angle()`` by an updater.
+    """
+    m = mn()
+    lines = set_segments(m.VMobject(), engine.points, engine.feet(get_angle()))
+    lines.set_stroke(color, width=stroke_width)
+    lines.add_updater(lambda mob: set_segments(mob, engine.points, engine.feet(get_angle())))
+    return lines
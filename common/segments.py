@@ -0,0 +1,120 @@
+"""
+Segmented full videos
+=====================
+The full-video scenes (``SequentialDataFullVideo``, ``ANNFailFullVideo``)
+play several independent parts back to back, fading everything out
+between them.  Rendered as one scene they take the sum of the parts.
+
+A full video instead lists its parts as ``segments`` (functions taking the
+scene) and plays them with ``play_segments``.  Rendered normally it is the
+same single scene as before; rendered through ``render_parallel`` every
+segment becomes its own ``manimgl`` process, selected with the
+``MANIM_SEGMENT`` environment variable, and the encoded parts are joined
+with ffmpeg's concat demuxer without re-encoding.  Each segment renders its
+own closing fade-out, so the seams are the same fades as in the one-process
+render, and the whole video takes about as long as its longest segment.
+
+    class SequentialDataFullVideo(InteractiveScene):
+        segments = [HookScene._build_hook, AudioScene._build_audio_scene]
+
+        def construct(self):
+            play_segments(self, self.segments, final_wait=1)
+
+    python -m common.segments 2026/RNN/code.py SequentialDataFullVideo --hd
+"""
+
+import argparse
+import glob
+import importlib.util
+import os
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+
+from common.backend import mn
+
+
+SEGMENT_ENV = "MANIM_SEGMENT"
+SEGMENT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           ".cache", "segments")
+
+
+def selected_segment():
+    """Index of the only segment to play, or ``None`` to play them all."""
+    value = os.environ.get(SEGMENT_ENV)
+    return None if value in (None, "") else int(value)
+
+
+def play_segments(scene, segments, fade_time=0.8, final_wait=0):
+    """Play ``segments`` in order, each followed by a fade-out of everything."""
+    m = mn()
+    only = selected_segment()
+    for index, build in enumerate(segments):
+        if only is not None and index != only:
+            continue
+        build(scene)
+        scene.play(*[m.FadeOut(mob) for mob in scene.mobjects], run_time=fade_time)
+    if final_wait and (only is None or only == len(segments) - 1):
+        scene.wait(final_wait)
+
+
+# ── Parallel rendering ────────────────────────────────────────────────────
+
+def segment_count(scene_file, scene_name):
+    spec = importlib.util.spec_from_file_location("_segmented_scene", scene_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return len(getattr(module, scene_name).segments)
+
+
+def _render_segment(scene_file, scene_name, index, out_dir, flags):
+    name = f"{scene_name}_{index:02d}"
+    env = dict(os.environ, **{SEGMENT_ENV: str(index)})
+    cmd = ["manimgl", scene_file, scene_name, "-w",
+           "--video_dir", out_dir, "--file_name", name, *flags]
+    subprocess.run(cmd, env=env, check=True)
+    found = glob.glob(os.path.join(out_dir, "**", f"{name}.mp4"), recursive=True)
+    if not found:
+        raise FileNotFoundError(f"segment {index} of {scene_name} produced no {name}.mp4")
+    return max(found, key=os.path.getmtime)
+
+
+def concat_videos(paths, output):
+    """Join encoded videos with identical settings, copying the streams."""
+    list_path = output + ".txt"
+    with open(list_path, "w") as f:
+        for path in paths:
+            f.write(f"file '{os.path.abspath(path)}'\n")
+    subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                    "-i", list_path, "-c", "copy", output], check=True)
+    os.remove(list_path)
+    return output
+
+
+def render_parallel(scene_file, scene_name, flags=(), processes=None, output=None):
+    """
+    Render every segment of ``scene_name`` in its own process (at most
+    ``processes`` at a time) and concatenate them into ``output``.
+    ``flags`` are passed on to ``manimgl`` (``--hd``, ``-l``, ...).
+    """
+    n = segment_count(scene_file, scene_name)
+    out_dir = os.path.join(SEGMENT_DIR, scene_name)
+    os.makedirs(out_dir, exist_ok=True)
+    if output is None:
+        output = os.path.join(os.path.dirname(os.path.abspath(scene_file)), "videos",
+                              f"{scene_name}.mp4")
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with ProcessPoolExecutor(max_workers=processes or n) as pool:
+        parts = list(pool.map(_render_segment, [scene_file] * n, [scene_name] * n,
+                              range(n), [out_dir] * n, [list(flags)] * n))
+    return concat_videos(parts, output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render a segmented full video in parallel.")
+    parser.add_argument("scene_file")
+    parser.add_argument("scene_name")
+    parser.add_argument("-j", "--processes", type=int, default=None)
+    parser.add_argument("-o", "--output", default=None)
+    args, manim_flags = parser.parse_known_args()
+    print(render_parallel(args.scene_file, args.scene_name, manim_flags,
+                          args.processes, args.output))
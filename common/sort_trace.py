@@ -0,0 +1,377 @@
+"""
+Sorting event traces
+====================
+Runs a sorting algorithm on a list of values and records what it did as a
+flat list of ``Event``s.  ``SortDriver`` turns that list into animations
+on a row of cells, merging consecutive events of one kind into a single
+``play``: every comparison of a partition pass is one recolour, disjoint
+swaps move together, and a subrange highlight is one stroke change.
+
+The scenes used to interleave the algorithm with ``self.play`` calls, one
+per comparison or recolour; with a trace the bookkeeping comes from one
+real run, and a row of a hundred bars costs a few plays per pass instead
+of a few per element.
+
+Event kinds
+-----------
+``pass``     outer pass started                 (step, lo, hi)
+``focus``    subrange being worked on            (lo, hi)
+``pivot``    element chosen as pivot / key       (i)
+``compare``  a[i] compared with a[j]             (i, j, less = a[i] < a[j])
+``swap``     a[i] and a[j] exchanged             (i, j)
+``permute``  a[lo:hi + 1] reordered              (lo, hi, order: old index per new slot)
+``sorted``   a[i] is in its final place          (i)
+
+Indices are slots in the array at the time of the event.
+
+    events, result = quicksort_trace([40, 20, 60, 10, 46])
+    driver = SortDriver(self, cells, fills=rects, less_color=BLUE, greater_color=RED)
+    driver.play(events, wait=0.4)
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from common.array_row import slide
+from common.backend import mn
+
+
+Event = namedtuple("Event", "kind i j lo hi less order step")
+Event.__new__.__defaults__ = (None,) * len(Event._fields)
+
+
+def _compare(a, i, j):
+    return Event("compare", i=i, j=j, less=a[i] < a[j])
+
+
+def _swap(a, events, i, j):
+    a[i], a[j] = a[j], a[i]
+    events.append(Event("swap", i=i, j=j))
+
+
+def bubble_sort_trace(values):
+    """``(events, sorted_values)``; stops after a pass without swaps."""
+    a, events = list(values), []
+    n = len(a)
+    done = n
+    for step in range(n - 1):
+        events.append(Event("pass", step=step, lo=0, hi=n - 1 - step))
+        swapped = False
+        for j in range(n - 1 - step):
+            events.append(_compare(a, j + 1, j))
+            if a[j] > a[j + 1]:
+                _swap(a, events, j, j + 1)
+                swapped = True
+        done = n - 1 - step
+        events.append(Event("sorted", i=done))
+        if not swapped:
+            break
+    events.extend(Event("sorted", i=k) for k in range(done))
+    return events, a
+
+
+def selection_sort_trace(values):
+    """``(events, sorted_values)``; the running minimum is the ``pivot``."""
+    a, events = list(values), []
+    n = len(a)
+    for i in range(n - 1):
+        events.append(Event("pass", step=i, lo=i, hi=n - 1))
+        events.append(Event("pivot", i=i))
+        smallest = i
+        for j in range(i + 1, n):
+            events.append(_compare(a, j, smallest))
+            if a[j] < a[smallest]:
+                smallest = j
+                events.append(Event("pivot", i=j))
+        if smallest != i:
+            _swap(a, events, i, smallest)
+        events.append(Event("sorted", i=i))
+    if n:
+        events.append(Event("sorted", i=n - 1))
+    return events, a
+
+
+def insertion_sort_trace(values):
+    """``(events, sorted_values)``; each insertion is one ``permute``."""
+    a, events = list(values), []
+    n = len(a)
+    for i in range(1, n):
+        events.append(Event("pass", step=i - 1, lo=0, hi=i))
+        events.append(Event("pivot", i=i))
+        pos = i
+        while pos > 0:
+            events.append(_compare(a, i, pos - 1))
+            if not a[i] < a[pos - 1]:
+                break
+            pos -= 1
+        if pos < i:
+            order = (i, *range(pos, i))
+            a[pos:i + 1] = [a[k] for k in order]
+            events.append(Event("permute", lo=pos, hi=i, order=order))
+    events.extend(Event("sorted", i=k) for k in range(n))
+    return events, a
+
+
+def quicksort_trace(values):
+    """
+    ``(events, sorted_values)`` for Lomuto quicksort with the last element
+    as pivot.  A partition compares every element with the pivot first and
+    then does its swaps, as the QuickSort scene shows it.
+    """
+    a, events = list(values), []
+
+    def partition(lo, hi):
+        events.append(Event("pivot", i=hi))
+        events.extend(_compare(a, j, hi) for j in range(lo, hi))
+        pivot, i = a[hi], lo - 1
+        for j in range(lo, hi):
+            if a[j] < pivot:
+                i += 1
+                if i != j:
+                    _swap(a, events, i, j)
+        if i + 1 != hi:
+            _swap(a, events, i + 1, hi)
+        events.append(Event("sorted", i=i + 1))
+        return i + 1
+
+    def sort(lo, hi):
+        if lo > hi:
+            return
+        if lo == hi:
+            events.append(Event("sorted", i=lo))
+            return
+        events.append(Event("focus", lo=lo, hi=hi))
+        p = partition(lo, hi)
+        sort(lo, p - 1)
+        sort(p + 1, hi)
+
+    sort(0, len(a) - 1)
+    return events, a
+
+
+def merge_sort_trace(values):
+    """``(events, sorted_values)``; every merge is a ``focus`` and one ``permute``."""
+    a, events = list(values), []
+
+    def sort(lo, hi):
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        sort(lo, mid)
+        sort(mid + 1, hi)
+        events.append(Event("focus", lo=lo, hi=hi))
+        left, right, order = lo, mid + 1, []
+        while left <= mid and right <= hi:
+            events.append(_compare(a, right, left))
+            if a[right] < a[left]:
+                order.append(right)
+                right += 1
+            else:
+                order.append(left)
+                left += 1
+        order += list(range(left, mid + 1)) + list(range(right, hi + 1))
+        if order != list(range(lo, hi + 1)):
+            a[lo:hi + 1] = [a[k] for k in order]
+            events.append(Event("permute", lo=lo, hi=hi, order=tuple(order)))
+
+    sort(0, len(a) - 1)
+    events.extend(Event("sorted", i=k) for k in range(len(a)))
+    return events, a
+
+
+def heap_sort_trace(values):
+    """``(events, sorted_values)`` for an in-place max-heap sort."""
+    a, events = list(values), []
+    n = len(a)
+
+    def sift_down(root, end):
+        while 2 * root + 1 <= end:
+            child = 2 * root + 1
+            if child + 1 <= end:
+                events.append(_compare(a, child, child + 1))
+                if a[child] < a[child + 1]:
+                    child += 1
+            events.append(_compare(a, root, child))
+            if not a[root] < a[child]:
+                return
+            _swap(a, events, root, child)
+            root = child
+
+    events.append(Event("focus", lo=0, hi=n - 1))
+    for root in range(n // 2 - 1, -1, -1):
+        sift_down(root, n - 1)
+    for end in range(n - 1, 0, -1):
+        events.append(Event("pass", step=n - 1 - end, lo=0, hi=end))
+        _swap(a, events, 0, end)
+        events.append(Event("sorted", i=end))
+        sift_down(0, end - 1)
+    if n:
+        events.append(Event("sorted", i=0))
+    return events, a
+
+
+TRACES = {
+    "bubble": bubble_sort_trace,
+    "selection": selection_sort_trace,
+    "insertion": insertion_sort_trace,
+    "quick": quicksort_trace,
+    "merge": merge_sort_trace,
+    "heap": heap_sort_trace,
+}
+
+
+def group_steps(events):
+    """
+    Split a trace into steps: each ``pass`` or ``focus`` starts a new step
+    that owns every event up to the next one.
+    """
+    steps, current = [], []
+    for ev in events:
+        if ev.kind in ("pass", "focus") and current:
+            steps.append(current)
+            current = []
+        current.append(ev)
+    if current:
+        steps.append(current)
+    return steps
+
+
+def _touched(ev):
+    if ev.kind == "permute":
+        return set(range(ev.lo, ev.hi + 1))
+    return {k for k in (ev.i, ev.j) if k is not None}
+
+
+def batch_runs(events, batch=True):
+    """
+    Consecutive events of one kind, as lists.  Moves (``swap`` /
+    ``permute``) only share a run while they touch disjoint slots, so every
+    run can be played at once.  ``batch=False`` gives one event per run.
+    """
+    runs = []
+    for ev in events:
+        run = runs[-1] if runs else None
+        if not batch or run is None or run[0].kind != ev.kind:
+            runs.append([ev])
+        elif ev.kind in ("swap", "permute") and set().union(*map(_touched, run)) & _touched(ev):
+            runs.append([ev])
+        else:
+            run.append(ev)
+    return runs
+
+
+class SortDriver:
+    """
+    Plays a trace on a row of ``cells`` (one mobject per element, in slot
+    order).  ``fills`` are the parts recoloured (the rectangles, when a
+    cell is a rectangle with a label); they default to the cells.
+
+    Cells only move along the row: slot ``k`` is the x coordinate cell
+    ``k`` had at the start, so bars of different heights keep their
+    baseline.  ``self.order[k]`` is the index of the cell now in slot ``k``.
+
+    Comparisons either colour ``a[i]`` by outcome and leave it
+    (``less_color`` / ``greater_color``, as a partition pass) or flash both
+    cells in ``compare_color`` and return them to ``base_color``.
+    """
+
+    RUN_TIMES = {"focus": 0.4, "pivot": 0.5, "compare": 0.4, "swap": 0.5,
+                 "permute": 0.6, "sorted": 0.4, "reset": 0.3}
+
+    def __init__(self, scene, cells, fills=None, base_color=None, compare_color=None,
+                 less_color=None, greater_color=None, pivot_color=None, sorted_color=None,
+                 focus_color=None, stroke_color=None, stroke_width=3, focus_width=5,
+                 fill_opacity=0.8, batch=True, run_times=None):
+        m = mn()
+        self.scene = scene
+        self.cells = list(cells)
+        self.fills = list(fills) if fills is not None else self.cells
+        self.slots = np.array([cell.get_x() for cell in self.cells])
+        self.order = list(range(len(self.cells)))
+        self.done = set()
+        self.base_color = m.BLUE if base_color is None else base_color
+        self.compare_color = m.PURPLE if compare_color is None else compare_color
+        self.less_color = less_color
+        self.greater_color = greater_color
+        self.pivot_color = m.PURPLE if pivot_color is None else pivot_color
+        self.sorted_color = m.GREEN if sorted_color is None else sorted_color
+        self.focus_color = m.YELLOW if focus_color is None else focus_color
+        self.stroke_color = m.WHITE if stroke_color is None else stroke_color
+        self.stroke_width = stroke_width
+        self.focus_width = focus_width
+        self.fill_opacity = fill_opacity
+        self.batch = batch
+        self.run_times = dict(self.RUN_TIMES, **(run_times or {}))
+
+    def fill(self, slot):
+        return self.fills[self.order[slot]]
+
+    def play(self, events, wait=0.3):
+        for step in group_steps(events):
+            self.play_step(step)
+            if wait:
+                self.scene.wait(wait)
+
+    def play_step(self, step):
+        head = step[0]
+        focused = []
+        if head.kind == "focus" and (head.lo > 0 or head.hi < len(self.cells) - 1):
+            focused = [self.fill(k) for k in range(head.lo, head.hi + 1) if k not in self.done]
+            self._play([f.animate.set_stroke(self.focus_color, width=self.focus_width)
+                        for f in focused], "focus")
+        body = step[1:] if head.kind in ("pass", "focus") else step
+        for run in batch_runs(body, self.batch):
+            getattr(self, "_play_" + run[0].kind)(run)
+        if focused:
+            self._play([f.animate.set_stroke(self.stroke_color, width=self.stroke_width)
+                        for f in focused], "reset")
+
+    # ── Event kinds ───────────────────────────────────────────────────────
+
+    def _play(self, animations, kind):
+        if animations:
+            self.scene.play(*animations, run_time=self.run_times[kind])
+
+    def _recolor(self, colors, kind):
+        """``colors``: ``{fill mobject: color}``; the last colour per fill wins."""
+        self._play([f.animate.set_fill(c, opacity=self.fill_opacity) for f, c in colors.items()],
+                   kind)
+
+    def _play_compare(self, run):
+        if self.less_color is not None:
+            self._recolor({self.fill(ev.i): self.less_color if ev.less else self.greater_color
+                           for ev in run}, "compare")
+            return
+        flashed = {self.fill(k): self.compare_color for ev in run for k in (ev.i, ev.j)}
+        self._recolor(flashed, "compare")
+        self._recolor({f: self.base_color for f in flashed}, "reset")
+
+    def _play_pivot(self, run):
+        self._recolor({self.fill(ev.i): self.pivot_color for ev in run}, "pivot")
+
+    def _play_sorted(self, run):
+        self.done.update(ev.i for ev in run)
+        self._recolor({self.fill(ev.i): self.sorted_color for ev in run}, "sorted")
+
+    def _move(self, new_order, kind):
+        moved = [(slot, cell) for slot, cell in enumerate(new_order) if self.order[slot] != cell]
+        self.order = new_order
+        if not moved:
+            return
+        mobs = [self.cells[cell] for _, cell in moved]
+        targets = np.array([mob.get_center() for mob in mobs])
+        targets[:, 0] = self.slots[[slot for slot, _ in moved]]
+        self.scene.play(slide(mobs, targets), run_time=self.run_times[kind])
+
+    def _play_swap(self, run):
+        order = list(self.order)
+        for ev in run:
+            order[ev.i], order[ev.j] = order[ev.j], order[ev.i]
+        self._move(order, "swap")
+
+    def _play_permute(self, run):
+        order = list(self.order)
+        for ev in run:
+            order[ev.lo:ev.hi + 1] = [self.order[k] for k in ev.order]
+        self._move(order, "permute")
@@ -0,0 +1,256 @@
+"""
+LaTeX formula bank
+==================
+A scene file's ``Tex`` strings are compiled one at a time, whenever
+``construct`` reaches them, so a cold render of the Transformer or RNN
+videos keeps stopping for LaTeX.  ``warm_up`` reads the scene file before
+any scene runs, collects every ``Tex`` / ``MathTex`` / ``TexText`` /
+``cached_tex`` string it can resolve statically, and compiles the missing
+ones in a process pool.  The compiled SVGs land in manim's own Tex cache
+(and, for ``persist=True``, ``cached_tex`` outlines in ``common.labels``),
+so the scene later finds every formula ready.
+
+Strings are resolved from literals, f-strings and ``+`` concatenations
+whose names are bound by enclosing ``for`` loops over ``range(...)`` or
+literal lists, or by literal assignments in the same function, e.g.
+``Tex(f"A(Z^{{[1]}}_{{{i+1}}})")`` inside ``for i in range(4)``.
+Anything else is left to compile at scene time as before.
+
+Formulas already compiled, and those LaTeX rejected, are listed in
+``BANK_PATH``, so later renders skip the pool entirely (``retry_failed``
+tries the rejected ones again).  The bank is merged with what other
+processes wrote meanwhile and replaced atomically, as several renders of
+one file may warm up at once.  At the top of a scene file:
+
+    from common import tex_bank
+    tex_bank.warm_up(__file__)
+
+or ahead of time for several files: ``python -m common.tex_bank 2026/RNN/code.py``.
+"""
+
+import ast
+import itertools
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from common import assets
+from common.backend import mn
+
+
+BANK_PATH = os.path.join(os.path.dirname(assets.CACHE_DIR), "tex_bank.json")
+TEX_CALLS = ("Tex", "MathTex", "TexText", "cached_tex")
+MAX_EXPANSION = 512
+
+_SAFE_NODES = (
+    ast.Expression, ast.Constant, ast.JoinedStr, ast.FormattedValue, ast.BinOp,
+    ast.Add, ast.Sub, ast.Mult, ast.Mod, ast.Name, ast.Load, ast.Subscript,
+    ast.Slice, ast.Tuple, ast.UnaryOp, ast.USub,
+)
+
+
+# ── Static collection ─────────────────────────────────────────────────────
+
+def _call_name(node):
+    func = node.func
+    if isinstance(func, ast.Name):
+        return func.id
+    if isinstance(func, ast.Attribute):
+        return func.attr
+    return None
+
+
+def _literal(node):
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+
+
+def _loop_values(node):
+    """Values a ``for`` loop iterates over, or ``None`` if not static."""
+    it = node.iter
+    if isinstance(it, ast.Call) and _call_name(it) == "range" and not it.keywords:
+        args = [_literal(a) for a in it.args]
+        if args and all(isinstance(a, int) for a in args):
+            return list(range(*args))
+        return None
+    if isinstance(it, ast.Call) and _call_name(it) == "enumerate" and len(it.args) == 1:
+        values = _literal(it.args[0])
+        return list(enumerate(values)) if isinstance(values, (list, tuple)) else None
+    values = _literal(it)
+    return list(values) if isinstance(values, (list, tuple)) else None
+
+
+def _bind(target, value, env):
+    if isinstance(target, ast.Name):
+        env[target.id] = value
+        return True
+    if isinstance(target, ast.Tuple) and isinstance(value, (list, tuple)) \
+            and len(target.elts) == len(value):
+        return all(_bind(t, v, env) for t, v in zip(target.elts, value))
+    return False
+
+
+def _names(node):
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)}
+
+
+def _evaluate(node, envs):
+    """Every string ``node`` takes over the loop bindings ``envs``."""
+    expr = ast.Expression(node)
+    if not all(isinstance(n, _SAFE_NODES) for n in ast.walk(expr)):
+        return []
+    code = compile(expr, "<tex>", "eval")
+    results = []
+    for env in envs:
+        try:
+            value = eval(code, {"__builtins__": {}}, env)
+        except Exception:
+            return []
+        if isinstance(value, str):
+            results.append(value)
+    return results
+
+
+class _Collector(ast.NodeVisitor):
+    def __init__(self):
+        self.scopes = [{}]   # literal assignments per function
+        self.loops = []      # (target, values) of enclosing for loops
+        self.found = []      # (call name, string, constant kwargs)
+
+    def _visit_scope(self, node):
+        self.scopes.append({})
+        self.generic_visit(node)
+        self.scopes.pop()
+
+    visit_FunctionDef = visit_AsyncFunctionDef = _visit_scope
+
+    def visit_Assign(self, node):
+        if len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            value = _literal(node.value)
+            if value is not None:
+                self.scopes[-1][node.targets[0].id] = value
+        self.generic_visit(node)
+
+    def visit_For(self, node):
+        self.loops.append((node.target, _loop_values(node)))
+        self.generic_visit(node)
+        self.loops.pop()
+
+    def visit_Call(self, node):
+        name = _call_name(node)
+        if name in TEX_CALLS and node.args:
+            kwargs = {}
+            for kw in node.keywords:
+                value = _literal(kw.value)
+                if kw.arg is not None and value is not None:
+                    kwargs[kw.arg] = value
+            for string in _evaluate(node.args[0], self._envs(_names(node.args[0]))):
+                self.found.append((name, string, kwargs))
+        self.generic_visit(node)
+
+    def _envs(self, needed):
+        base = {}
+        for scope in self.scopes:
+            base.update(scope)
+        loops = [(t, v) for t, v in self.loops if _names(t) & needed]
+        if any(v is None for _, v in loops):
+            return []
+        envs = []
+        for combo in itertools.islice(itertools.product(*(v for _, v in loops)), MAX_EXPANSION):
+            env = dict(base)
+            if all(_bind(t, value, env) for (t, _), value in zip(loops, combo)):
+                envs.append(env)
+        return envs
+
+
+def collect_tex(path):
+    """Unique ``(call, string, kwargs)`` triples resolvable in ``path``."""
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    collector = _Collector()
+    collector.visit(tree)
+    seen, unique = set(), []
+    for call, string, kwargs in collector.found:
+        key = _bank_key(call, string, kwargs)
+        if key not in seen:
+            seen.add(key)
+            unique.append((call, string, kwargs))
+    return unique
+
+
+# ── Compilation ───────────────────────────────────────────────────────────
+
+def _bank_key(call, string, kwargs):
+    return repr((call, string, sorted(kwargs.items())))
+
+
+def _load_bank():
+    try:
+        with open(BANK_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_bank(additions):
+    """Add ``{section: [keys]}`` to the bank on disk and replace it in one step."""
+    bank = _load_bank()
+    for section, keys in additions.items():
+        bank[section] = sorted(set(bank.get(section, [])) | set(keys))
+    directory = os.path.dirname(BANK_PATH)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(bank, f, indent=0)
+        os.replace(tmp, BANK_PATH)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+
+def _compile(backend, call, string, kwargs):
+    """Worker: build the mobject once so its SVG is cached; ``False`` on a LaTeX error."""
+    module = __import__(backend)
+    try:
+        if call == "cached_tex":
+            from common.labels import cached_tex
+            cached_tex(string, **kwargs)
+        else:
+            getattr(module, call)(string, **kwargs)
+    except Exception:
+        return False
+    return True
+
+
+def warm_up(path, processes=None, retry_failed=False):
+    """
+    Compile the statically known ``Tex`` strings of ``path`` that are not in
+    the bank yet, ``processes`` at a time (``os.cpu_count()`` by default).
+    Returns how many were compiled.
+    """
+    backend = mn().__name__
+    failed_section = backend + ":failed"
+    bank = _load_bank()
+    known = set(bank.get(backend, []))
+    if not retry_failed:
+        known.update(bank.get(failed_section, []))
+    todo = [t for t in collect_tex(path) if _bank_key(*t) not in known]
+    if not todo:
+        return 0
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        ok = list(pool.map(_compile, *zip(*((backend,) + t for t in todo))))
+    _save_bank({
+        backend: [_bank_key(*t) for t, good in zip(todo, ok) if good],
+        failed_section: [_bank_key(*t) for t, good in zip(todo, ok) if not good],
+    })
+    return sum(ok)
+
+
+if __name__ == "__main__":
+    for scene_file in sys.argv[1:]:
+        print(f"{scene_file}: compiled {warm_up(scene_file)} formulas")
@@ -1,5 +1,10 @@
 from manimlib import *
-import numpy as np
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import graph
+from common import graph_trace
 
 PURE_RED = '#FF0000'
 PURE_BLUE = PURE_RED
@@ -1929,23 +1934,8 @@ class Bellman(Scene):
     
 
     def align_text_parallel_to_line(self, text_str, line, offset=0.37):
-        # Create the TextMobject from the input string
-        text = Text(text_str).set_color(BLACK)
-    
-        # Get the angle of the line
-        angle = line.get_angle()
-
-        # Rotate the text to match the line's angle
-        text.rotate(angle)
+        return graph.align_text_parallel_to_line(text_str, line, offset)
 
-        # Calculate the perpendicular direction to offset the text from the line
-        normal_direction = rotate_vector(line.get_unit_vector(), PI / 2)
-
-        # Position the text at the center of the line with an offset
-        text.move_to(line.get_center() + normal_direction * offset)
-
-        return text.scale(0.6)
-    
     def reflect_mobject_across_line(self, mobject, line):
         # Get the center of the line as the point of reflection
         line_center = line.get_center()
@@ -1968,45 +1958,18 @@ class Bellman(Scene):
 
 
     def create_circle(self,node):
-        a = Circle(
-                radius=0.5,
-                fill_color=TEAL,  # Use TEAL in ManimGL (no TEAL_B)
-                fill_opacity=0,
-                stroke_color="#FF0000",  # Edge color for the circle
-                stroke_width=7
-            ).move_to(node)
-        return a.set_z_index(2)
-    
+        return graph.highlight_circle(node)
+
     def create_line(self, a,b):
-        line1 = Line(start=a.get_center(), end=b.get_center(), color=PURE_RED, stroke_width=6.6).set_z_index(-0.5)
-        return line1
-    
+        return graph.path_line(a, b, color=PURE_RED)
+
     def create_nodes(self, node_positions):
         """Create nodes at specified positions with labels."""
-        nodes = {}
-        for label, position in node_positions.items():
-            # Create a circle for the node
-            node_circle = Circle(
-                radius=0.5,
-                fill_color=TEAL,  # Use TEAL in ManimGL (no TEAL_B)
-                fill_opacity=1,
-                stroke_color=DARK_BLUE,  # Edge color for the circle
-                stroke_width=5.6
-            )
-            node_circle.move_to(position)
-
-            # Create the label (text) for the node with black color
-            node_label = Text(label,).move_to(position).set_color(BLACK).set_z_index(1)
-
-            # Group the circle and the text together
-            node_group = VGroup(node_circle, node_label)
-            nodes[label] = node_group  # Store with direct label access (e.g., "A")
-
-        return nodes
+        template = Circle(radius=0.5, fill_color=TEAL, fill_opacity=1, stroke_color=DARK_BLUE, stroke_width=5.6)
+        return graph.build_nodes(node_positions, template, label_color=BLACK, label_z_index=1)
 
     def create_edges(self, node_positions):
         """Create undirected edges between nodes."""
-        edge_list = []
         edge_pairs = [
             ("F", "A"),
             ("F", "B"),
@@ -2021,19 +1984,11 @@ class Bellman(Scene):
             ("C", "G"),
 
         ]
-
-        for node1, node2 in edge_pairs:
-            start_pos = node_positions[node1]
-            end_pos = node_positions[node2]
-            edge_line = Line(start_pos, end_pos, color=DARK_BLUE, stroke_width=5)
-            edge_line.set_z_index(-5)  # Set z-index lower than nodes
-            edge_list.append(edge_line)
-
-        return {}, edge_list
+        edges = graph.build_edges(node_positions, edge_pairs, z_index=-5, color=DARK_BLUE, stroke_width=5)
+        return {}, edges
 
     def create_edge_weights(self, node_positions):
         """Create weights for each edge and place them at the center of the edge, adjusting for orientation."""
-        weights = {}
         edge_pairs = [
             ("A", "F", '3'),
             ("F", "B", '-4'),
@@ -2047,40 +2002,10 @@ class Bellman(Scene):
             ("E", "G", '3'),
             ("C", "G", '4')
         ]
-    
-        for node1, node2, weight in edge_pairs:
-            start_pos = np.array(node_positions[node1])
-            end_pos = np.array(node_positions[node2])
-            edge_center = (start_pos + end_pos) / 2
-    
-            # Calculate the direction of the edge
-            direction = end_pos - start_pos
-            direction_norm = np.linalg.norm(direction)
-    
-            # Normalize the direction vector to get the unit vector for the edge
-            direction_unit = direction / direction_norm
-    
-            # Adjust the weight's position based on the edge's orientation with a larger offset
-            if abs(direction_unit[0]) > abs(direction_unit[1]):  # More horizontal
-                weight_offset = UP * 0.3  # Slightly more shift up for horizontal edges
-            else:  # More vertical
-                weight_offset = RIGHT * 0.3  # Slightly more shift right for vertical edges
-    
-            # For sloped edges, slightly shift the weight in the direction perpendicular to the edge
-            perpendicular_unit = np.array([-direction_unit[1], direction_unit[0], 0]) * 0.3
-    
-            # Create the weight label and apply the calculated offset
-            weight_label = Text(weight).move_to(edge_center + perpendicular_unit).scale(0.7).set_color(BLACK)
-    
-            # Store the weight
-            weights[f"weight_{node1}_{node2}"] = weight_label
-    
-        return weights
-    
+        return graph.build_edge_weights(node_positions, edge_pairs, offset=0.3, scale=0.7)
 
     def create_directed_edges(self, node_positions):
         """Transform undirected edges into directed edges."""
-        directed_edge_list = []
         edge_pairs = [
             ("A", "F"),
             ("F", "B"),
@@ -2094,23 +2019,52 @@ class Bellman(Scene):
             ("E", "C"),
             ("A", "B")
         ]
-    
-        for node1, node2 in edge_pairs:
-            start_pos = node_positions[node1]
-            end_pos = node_positions[node2]
-            directed_edge = Arrow(
-                start_pos, end_pos,
-                buff=0.59,  # Adjusted buff for better alignment with nodes
-                color=MAROON_C,
-                stroke_width=4,
-                fill_color=MAROON_C,  # Fill arrowhead with the same color
-                fill_opacity=1  # Make the arrowhead completely opaque
-            )
-            directed_edge.z_index = -1  # Set z-index lower than nodes
-            directed_edge_list.append(directed_edge)
-    
-        return {}, directed_edge_list
+        edges = graph.build_edges(node_positions, edge_pairs, directed=True,
+                                  z_index=-1, buff=0.59, color=MAROON_C, stroke_width=4, fill_color=MAROON_C, fill_opacity=1)
+        return {}, edges
+
 
 
+BELLMAN_POSITIONS = {
+    "F": [0, 3.5, 0],
+    "A": [-2.5, 1.5, 0],
+    "B": [2.8, 1.5, 0],
+    "D": [-2.5, -1.5, 0],
+    "E": [0.6, -0.5, 0],
+    "C": [3.5, -2.8, 0],
+    "G": [0, -3.5, 0],
+}
 
+BELLMAN_EDGES = [
+    ("A", "F", 3), ("F", "B", -4), ("B", "E", 1), ("E", "G", 3),
+    ("A", "D", 5), ("D", "E", 1), ("G", "D", -1), ("C", "G", 4),
+    ("C", "B", 7), ("E", "C", -3), ("A", "B", 2),
+]
 
+
+class BellmanFordTrace(Scene):
+    """Bellman-Ford on the Bellman graph, one batched play per relaxation pass."""
+
+    def construct(self):
+        self.camera.frame.scale(1.2).shift(RIGHT*2)
+        self.camera.background_color = "#111111"
+
+        template = Circle(radius=0.5, fill_color=TEAL, fill_opacity=1, stroke_color=DARK_BLUE, stroke_width=5.6)
+        parts = graph.build_graph(
+            BELLMAN_POSITIONS, BELLMAN_EDGES, template, directed=True, arrow_buff=0.59,
+            edge_style=dict(color=MAROON_C, stroke_width=4, fill_color=MAROON_C, fill_opacity=1),
+        )
+
+        events, dist, prev = graph_trace.bellman_ford_trace(BELLMAN_EDGES, "A")
+        table, labels = graph_trace.distance_table(list(BELLMAN_POSITIONS), source="A")
+        table.move_to(RIGHT*7)
+
+        self.play(*[GrowFromCenter(node) for node in parts.nodes.values()])
+        self.play(*[GrowFromCenter(edge) for edge in parts.edge_list])
+        self.play(*[Write(w) for w in parts.weights.values()], FadeIn(table))
+
+        graph_trace.TraceDriver(self, parts, dist_labels=labels).play(events)
+
+        if any(ev.kind == "negative_cycle" for ev in events):
+            self.play(Write(Text("Negative cycle").set_color(RED).next_to(table, UP)))
+        self.wait(2)
@@ -1,5 +1,11 @@
 from manimlib import *
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import graph
+from common import graph_trace
+
 BLUE_E = DARK_BLUE
 
 
@@ -1059,29 +1065,11 @@ class SimpleGraph(Scene):
 
     def create_nodes(self, node_positions):
         """Create nodes at specified positions with labels."""
-        nodes = {}
-        for label, position in node_positions.items():
-            node_circle = Circle(
-                radius=0.5,
-                fill_color=TEAL,
-                fill_opacity=1,
-                color=MAROON_C,
-                stroke_width=10
-            ).set_color(GREY_E)
-            node_circle.move_to(position)
-
-            node_label = Text(label, ).move_to(position).set_color(WHITE).set_z_index(2)
-
-            node_group = VGroup(node_circle, node_label)
-            nodes[label] = node_group
-
-        return nodes
-
-
+        template = Circle(radius=0.5, fill_color=TEAL, fill_opacity=1, color=MAROON_C, stroke_width=10).set_color(GREY_E)
+        return graph.build_nodes(node_positions, template, label_color=WHITE, label_z_index=2)
 
     def create_edges(self, node_positions):
         """Create undirected edges between nodes."""
-        edge_list = []
         edge_pairs = [
             ("A", "B"),
             ("B", "D"),
@@ -1089,21 +1077,11 @@ class SimpleGraph(Scene):
             ("C", "D"),
             
         ]
-
-        for node1, node2 in edge_pairs:
-            start_pos = node_positions[node1]
-            end_pos = node_positions[node2]
-            edge_line = Line(start_pos, end_pos, color=DARK_BLUE, stroke_width=5).set_z_index(-1)
-            edge_list.append(edge_line)
-
-        return edge_list
-
-
+        edges = graph.build_edges(node_positions, edge_pairs, z_index=-1, color=DARK_BLUE, stroke_width=5)
+        return edges
 
     def create_directed_edges(self, node_positions):
         """Transform undirected edges into directed edges."""
-        directed_edge_list = []
-
         edge_pairs = [
             ("A", "B"),
             ("D", "B"),
@@ -1113,26 +1091,12 @@ class SimpleGraph(Scene):
 
 
         ]
-    
-        for node1, node2 in edge_pairs:
-            start_pos = node_positions[node1]
-            end_pos = node_positions[node2]
-            directed_edge = Arrow(
-                start_pos, end_pos,
-                buff=0.59,  # Adjusted buff for better alignment with nodes
-                color=MAROON_C,
-                stroke_width=4,
-                fill_color=MAROON_C,  # Fill arrowhead with the same color
-                fill_opacity=1  # Make the arrowhead completely opaque
-            )
-            directed_edge.z_index = -1  # Set z-index lower than nodes
-            directed_edge_list.append(directed_edge)
-    
-        return {}, directed_edge_list
+        edges = graph.build_edges(node_positions, edge_pairs, directed=True,
+                                  z_index=-1, buff=0.59, color=MAROON_C, stroke_width=4, fill_color=MAROON_C, fill_opacity=1)
+        return {}, edges
 
     def create_edge_weights(self, node_positions):
         """Create weights for each edge and place them at the center of the edge, adjusting for orientation."""
-        weights = {}
         edge_pairs = [
             ("A", "B", "2"),
             ("B", "C", "2"),
@@ -1141,34 +1105,47 @@ class SimpleGraph(Scene):
             ("D", "C", "4"),
 
         ]
+        return graph.build_edge_weights(node_positions, edge_pairs, offset=0.2, scale=0.6)
 
-        for node1, node2, weight in edge_pairs:
-            start_pos = np.array(node_positions[node1])
-            end_pos = np.array(node_positions[node2])
-            edge_center = (start_pos + end_pos) / 2
 
-            # Calculate the direction of the edge
-            direction = end_pos - start_pos
-            direction_norm = np.linalg.norm(direction)
 
-            # Normalize the direction vector to get the unit vector for the edge
-            direction_unit = direction / direction_norm
+FLOYD_POSITIONS = {
+    "A": [-2, 2, 0],
+    "B": [2, 2, 0],
+    "C": [2, -2, 0],
+    "D": [-2, -2, 0],
+}
 
-            # Adjust the weight's position based on the edge's orientation
-            if abs(direction_unit[0]) > abs(direction_unit[1]):  # More horizontal
-                weight_offset = UP * 0.2  # Shift up for horizontal edges
-            else:  # More vertical
-                weight_offset = RIGHT * 0.2  # Shift right for vertical edges
+# The straight edges of SimpleGraph (the curved D -> A and B -> A are left out
+# because they would be drawn on top of A -> D and A -> B).
+FLOYD_EDGES = [
+    ("A", "B", 2), ("D", "B", 6), ("B", "C", 2), ("C", "D", 4), ("A", "D", 3),
+]
 
-            # For sloped edges, slightly shift the weight in the direction perpendicular to the edge
-            perpendicular_unit = np.array([-direction_unit[1], direction_unit[0], 0]) * 0.2
 
-            # Create the weight label and apply the calculated offset
-            weight_label = Text(weight, color=BLACK).move_to(edge_center + perpendicular_unit).scale(0.6).set_color(BLACK)
-
-            # Store the weight
-            weights[f"weight_{node1}_{node2}"] = weight_label
-
-        return weights
-    
+class FloydTrace(Scene):
+    """Floyd-Warshall with one batched matrix update per pivot node."""
 
+    def construct(self):
+        self.camera.frame.shift(RIGHT*3)
+
+        template = Circle(radius=0.5, fill_color=TEAL, fill_opacity=1, color=MAROON_C, stroke_width=10).set_color(GREY_E)
+        parts = graph.build_graph(
+            FLOYD_POSITIONS, FLOYD_EDGES, template, directed=True, arrow_buff=0.59,
+            label_color=WHITE, label_z_index=2, edge_z_index=-1,
+            edge_style=dict(color=MAROON_C, stroke_width=4, fill_color=MAROON_C, fill_opacity=1),
+            weight_offset=0.2, weight_scale=0.6,
+        )
+
+        nodes = list(FLOYD_POSITIONS)
+        events, dist, nxt = graph_trace.floyd_trace(FLOYD_EDGES, nodes)
+        start = graph_trace.initial_distances(dist, events)
+        matrix, labels = graph_trace.distance_matrix(nodes, start, color=BLACK)
+        matrix.move_to(RIGHT*6.5)
+
+        self.play(*[GrowFromCenter(node) for node in parts.nodes.values()])
+        self.play(*[GrowFromCenter(edge) for edge in parts.edge_list])
+        self.play(*[Write(w) for w in parts.weights.values()], FadeIn(matrix))
+
+        graph_trace.TraceDriver(self, parts, dist_labels=labels, label_scale=0.55).play(events)
+        self.wait(2)
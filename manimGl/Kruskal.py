@@ -1,6 +1,11 @@
 from manimlib import *
 import numpy as np
 
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import graph
+
 PURE_RED = '#FF0000'
 PURE_BLUE = '#0000FF'
 
@@ -203,23 +208,8 @@ class Krskl(Scene):
     
 
     def align_text_parallel_to_line(self, text_str, line, offset=0.37):
-        # Create the TextMobject from the input string
-        text = Text(text_str).set_color(BLACK)
-    
-        # Get the angle of the line
-        angle = line.get_angle()
-
-        # Rotate the text to match the line's angle
-        text.rotate(angle)
+        return graph.align_text_parallel_to_line(text_str, line, offset)
 
-        # Calculate the perpendicular direction to offset the text from the line
-        normal_direction = rotate_vector(line.get_unit_vector(), PI / 2)
-
-        # Position the text at the center of the line with an offset
-        text.move_to(line.get_center() + normal_direction * offset)
-
-        return text.scale(0.6)
-    
     def reflect_mobject_across_line(self, mobject, line):
         # Get the center of the line as the point of reflection
         line_center = line.get_center()
@@ -242,45 +232,18 @@ class Krskl(Scene):
 
 
     def create_circle(self,node):
-        a = Circle(
-                radius=0.5,
-                fill_color=TEAL,  # Use TEAL in ManimGL (no TEAL_B)
-                fill_opacity=0,
-                stroke_color="#FF0000",  # Edge color for the circle
-                stroke_width=7
-            ).move_to(node)
-        return a.set_z_index(2)
-    
+        return graph.highlight_circle(node)
+
     def create_line(self, a,b):
-        line1 = Line(start=a.get_center(), end=b.get_center(), color=PURE_RED, stroke_width=6.6).set_z_index(-0.5)
-        return line1
-    
+        return graph.path_line(a, b, color=PURE_RED)
+
     def create_nodes(self, node_positions):
         """Create nodes at specified positions with labels."""
-        nodes = {}
-        for label, position in node_positions.items():
-            # Create a circle for the node
-            node_circle = Circle(
-                radius=0.5,
-                fill_color=TEAL,  # Use TEAL in ManimGL (no TEAL_B)
-                fill_opacity=1,
-                stroke_color=DARK_BLUE,  # Edge color for the circle
-                stroke_width=8
-            )
-            node_circle.move_to(position)
-
-            # Create the label (text) for the node with black color
-            node_label = Text(label,).move_to(position).set_color(BLACK).set_z_index(1)
-
-            # Group the circle and the text together
-            node_group = VGroup(node_circle, node_label)
-            nodes[label] = node_group  # Store with direct label access (e.g., "A")
-
-        return nodes
+        template = Circle(radius=0.5, fill_color=TEAL, fill_opacity=1, stroke_color=DARK_BLUE, stroke_width=8)
+        return graph.build_nodes(node_positions, template, label_color=BLACK, label_z_index=1)
 
     def create_edges(self, node_positions):
         """Create undirected edges between nodes."""
-        edge_list = []
         edge_pairs = [
             ("F", "A"),
             ("F", "B"),
@@ -291,19 +254,11 @@ class Krskl(Scene):
             ("D", "C"),
 
         ]
-
-        for node1, node2 in edge_pairs:
-            start_pos = node_positions[node1]
-            end_pos = node_positions[node2]
-            edge_line = Line(start_pos, end_pos, color=DARK_BLUE, stroke_width=8)
-            edge_line.set_z_index(-5)  # Set z-index lower than nodes
-            edge_list.append(edge_line)
-
-        return {}, edge_list
+        edges = graph.build_edges(node_positions, edge_pairs, z_index=-5, color=DARK_BLUE, stroke_width=8)
+        return {}, edges
 
     def create_edge_weights(self, node_positions):
         """Create weights for each edge and place them at the center of the edge, adjusting for orientation."""
-        weights = {}
         edge_pairs = [
             ("F", "A", '3'),
             ("F", "B", '4'),
@@ -315,38 +270,7 @@ class Krskl(Scene):
             
 
         ]
-    
-        for node1, node2, weight in edge_pairs:
-            start_pos = np.array(node_positions[node1])
-            end_pos = np.array(node_positions[node2])
-            edge_center = (start_pos + end_pos) / 2
-    
-            # Calculate the direction of the edge
-            direction = end_pos - start_pos
-            direction_norm = np.linalg.norm(direction)
-    
-            # Normalize the direction vector to get the unit vector for the edge
-            direction_unit = direction / direction_norm
-    
-            # Adjust the weight's position based on the edge's orientation with a larger offset
-            if abs(direction_unit[0]) > abs(direction_unit[1]):  # More horizontal
-                weight_offset = UP * 0.3  # Slightly more shift up for horizontal edges
-            else:  # More vertical
-                weight_offset = RIGHT * 0.3  # Slightly more shift right for vertical edges
-    
-            # For sloped edges, slightly shift the weight in the direction perpendicular to the edge
-            perpendicular_unit = np.array([-direction_unit[1], direction_unit[0], 0]) * 0.3
-    
-            # Create the weight label and apply the calculated offset
-            weight_label = Text(weight).move_to(edge_center + perpendicular_unit).scale(0.7).set_color(BLACK)
-    
-            # Store the weight
-            weights[f"weight_{node1}_{node2}"] = weight_label
-    
-        return weights
-
-
-    
+        return graph.build_edge_weights(node_positions, edge_pairs, offset=0.3, scale=0.7)
 
 
 class cycle(Scene):
@@ -1,16 +1,15 @@
 from manimlib import *
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common.array_row import ArrayRow
+
 PURE_RED = "#FF0000"
 PURE_BLUE = "#00FF00"
 PURE_GREEN = "#0000FF"
 
-class Array(VGroup):
-    def __init__(self, array_size=5, **kwargs):
-        super().__init__(**kwargs)
-        self.array_size = array_size
-        self.square_contents = [None] * array_size
-        self.array_group = self.create_array()
-        self.add(self.array_group)
-
+class Array(ArrayRow, VGroup):
     def create_element(self, text):
         square = Square(side_length=1.22, fill_opacity=1, fill_color=BLACK, color=BLACK).set_color(BLACK)
         text = Text(text, font_size=44, color=BLACK).scale(0.8).set_color(BLACK)
@@ -34,77 +33,35 @@ class Array(VGroup):
                 scene.play(FadeIn(new_square))
             else:
                 scene.play(Transform(self.square_contents[index], new_square))
-            self.square_contents[index] = new_square
+            self.place(index, new_square)
         else:
             scene.play(Indicate(self.array_group, color=RED))
             print(f"Index {index} is out of bounds")
 
     def append_element(self, scene, value):
-        for i, square in enumerate(self.array_group[0]):
-            if self.square_contents[i] is None:
-                new_square = Square(side_length=1.22, fill_opacity=1, fill_color=YELLOW, color=BLACK,
-                                    stroke_width=6)
-                number = Text(str(value), color=BLACK).set_z_index(1).set_color(BLACK)
-                new_square1 = VGroup(new_square, number)
-                new_square1.move_to(square.get_center())
-                self.square_contents[i] = new_square1
-                break
-        else:
+        i = self.next_free_index()
+        if i is None:
             scene.play(Indicate(self.array_group, color=RED))
+            return
+        new_square = Square(side_length=1.22, fill_opacity=1, fill_color=YELLOW, color=BLACK,
+                            stroke_width=6)
+        number = Text(str(value), color=BLACK).set_z_index(1).set_color(BLACK)
+        new_square1 = VGroup(new_square, number)
+        new_square1.move_to(self.slot_center(i))
+        self.place(i, new_square1)
 
     def add_element(self, scene, value, color=YELLOW):
-        for i, square in enumerate(self.array_group[0]):
-            if self.square_contents[i] is None:
-                new_square = Square(side_length=1.22, fill_opacity=1, fill_color=color, color=BLACK,
-                                    stroke_width=6)
-                number = Text(str(value), color=BLACK, font_size=50).set_z_index(1).set_color(BLACK)
-                new_square1 = VGroup(new_square, number)
-                new_square1.move_to(square.get_center())
-                self.square_contents[i] = new_square1
-                scene.play(FadeIn(new_square1))
-                break
-        else:
+        i = self.next_free_index()
+        if i is None:
             scene.play(Indicate(self.array_group, color=RED))
-
-    def pop_element(self, scene):
-        for i in range(self.array_size - 1, -1, -1):
-            if self.square_contents[i] is not None:
-                scene.play(FadeOut(self.square_contents[i]))
-                self.square_contents[i] = None
-                break
-        else:
-            scene.play(Indicate(self.array_group, color=RED))
-
-    def delete_from_front(self, scene):
-        if self.square_contents[0] is not None:
-            scene.play(FadeOut(self.square_contents[0]))
-            self.square_contents[0] = None
-            animations = []
-            for i in range(1, self.array_size):
-                if self.square_contents[i] is not None:
-                    animations.append(
-                        self.square_contents[i].animate.move_to(self.array_group[0][i - 1].get_center())
-                    )
-                    self.square_contents[i - 1] = self.square_contents[i]
-                    self.square_contents[i] = None
-            if animations:
-                scene.play(*animations)
-        else:
-            scene.play(Indicate(self.array_group, color=RED))
-
-    def create_new_array(self, scene, new_size):
-        new_array = Array(array_size=new_size)
-        new_array.next_to(self, DOWN, buff=0.7)
-        scene.play(ShowCreation(new_array))
-        return new_array
-
-    def transfer_elements_to_new_array(self, scene, new_array):
-        for i, content in enumerate(self.square_contents):
-            if content is not None:
-                scene.play(Transform(content, new_array.array_group[0][i]))
-                new_array.square_contents[i] = content
-                self.square_contents[i] = None
-
+            return
+        new_square = Square(side_length=1.22, fill_opacity=1, fill_color=color, color=BLACK,
+                            stroke_width=6)
+        number = Text(str(value), color=BLACK, font_size=50).set_z_index(1).set_color(BLACK)
+        new_square1 = VGroup(new_square, number)
+        new_square1.move_to(self.slot_center(i))
+        self.place(i, new_square1)
+        scene.play(FadeIn(new_square1))
 
 
 class LeetCode1(Scene):
@@ -156,55 +113,13 @@ class LeetCode1(Scene):
 
         self.wait(2)
 
-        def create_parabola(start, end, direction="up", height=2.0):
-            """
-            Creates a smooth 3-point curve from `start` to `end`.
-              - direction = "up" or "down"
-              - height = how tall the parabola is
-            """
-            path = VMobject()
-            midpoint = (start + end) / 2
-            if direction == "up":
-                midpoint += height * UP
-            else:
-                midpoint += height * DOWN
-            
-            # Use set_points_smoothly to create a nice quadratic curve
-            path.set_points_smoothly([start, midpoint, end])
-            return path
-
-        # 4) We want to rotate the array by k=3
+        # 4) We want to rotate the array by k=3: elements that stay in order
+        # arc up, the three that wrap around to the front arc down, all in
+        # one animation (no vanish!)
         k = 3
-        move_animations = []
-        for i in range(7):
-            new_index = (i + k) % 7
-
-            start_pos = array.square_contents[i].get_center()
-            end_pos   = array.array_group[0][new_index].get_center()
-
-            # Decide if it goes "up" or "down"
-            direction = "up" if i < 4 else "down"
-
-            # Create the parabola path
-            path = create_parabola(start_pos, end_pos, direction=direction, height=1.5)
-
-            # Animate moving along that path
-            # We'll do all animations simultaneously, so we just collect them.
-            move_animations.append(
-                MoveAlongPath(array.square_contents[i], path, run_time=2)
-            )
-
-        # 5) Animate all moves at once (no vanish!)
-        self.play(*move_animations)
+        array.rotate_contents(self, k, arc_height=1.5, run_time=2)
         self.wait()
 
-        # 6) Update array.square_contents references
-        new_contents = [None] * 7
-        for i in range(7):
-            new_index = (i + k) % 7
-            new_contents[new_index] = array.square_contents[i]
-        array.square_contents = new_contents
-
         self.play(FadeOut(VGroup(brace, brace_label)),
                   array.square_contents[0][0].animate.set_fill(YELLOW),
                   array.square_contents[1][0].animate.set_fill(YELLOW),
@@ -258,61 +173,12 @@ class LeetCode2(Scene):
 
         #  AFTER THIS, WE REVERSE THE ARRAY IN A FANCY WAY
         # ---------------------------------------------------------------
-        # 1) We'll reuse the "create_parabola" approach from before:
-        def create_parabola(start, end, direction="up", height=2.0):
-            """
-            Creates a smooth 3-point curve from `start` to `end`.
-            direction = "up" or "down"
-            height = how tall the parabola arcs
-            """
-            path = VMobject()
-            midpoint = (start + end) / 2
-            if direction == "up":
-                midpoint += height * UP
-            else:
-                midpoint += height * DOWN
-            path.set_points_smoothly([start, midpoint, end])
-            return path
-
-        # 2) Reverse the array in place:
-        #    For each i in range(n//2), we swap element i with element (n-1 - i).
-        n = 7
-        reverse_animations = []
-        for i in range(n // 2):
-            j = n - 1 - i
-
-            # Current positions
-            start_i = array.square_contents[i].get_center()
-            start_j = array.square_contents[j].get_center()
-            
-            # We'll move i's object to j, and j's object to i
-            # Decide the path direction.  Let's do:
-            #  - "up" if i is in the lower half
-            #  - "down" if j is in the upper half
-            # Feel free to choose your own logic for direction.
-            path_i = create_parabola(start_i, start_j, direction="up",   height=1.5)
-            path_j = create_parabola(start_j, start_i, direction="down", height=1.5)
-
-            reverse_animations.append(
-                MoveAlongPath(array.square_contents[i], path_i, run_time=2)
-            )
-            reverse_animations.append(
-                MoveAlongPath(array.square_contents[j], path_j, run_time=2)
-            )
-
-        # 3) Animate these all at once
-        self.play(*reverse_animations)
+        # Reverse the array in place: element i and element (n-1 - i) trade
+        # places, the left one arcing up and the right one down, in one
+        # animation that also updates array.square_contents
+        array.reverse_contents(self, arc_height=1.5, run_time=2)
         self.wait()
 
-        # 4) Swap references in array.square_contents
-        #    We only need to do a simple Python-level in-place swap for i in [0..n//2)
-        for i in range(n // 2):
-            j = n - 1 - i
-            array.square_contents[i], array.square_contents[j] = (
-                array.square_contents[j],
-                array.square_contents[i]
-            )
-
         self.wait(2)
 
         brace = Brace(array.array_group[0][:3], DOWN, buff=0.1).set_color(BLACK).shift(DOWN*0.8)
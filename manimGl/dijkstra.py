@@ -1,6 +1,13 @@
 
 from manimlib import *
 import numpy as np
+import heapq
+
+import os
+import sys
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from common import graph
+from common import graph_trace
 
 PURE_RED = '#FF0000'
 PURE_BLUE = '#0000FF'
@@ -197,7 +204,7 @@ class GraphAnimation(Scene):
 
         self.wait(1)
 
-        queue.push("A,0", self)
+        queue.push("A", 0, self)
 
         self.wait(2)
 
@@ -234,7 +241,7 @@ class GraphAnimation(Scene):
         self.wait()
         self.play(FadeIn(rows[5][2]))
         self.wait()
-        queue.push("F,3",self )
+        queue.push("F", 3, self)
 
         self.play(FadeOut(text), Uncreate(rect))
 
@@ -271,7 +278,7 @@ class GraphAnimation(Scene):
         self.wait()
         self.play(FadeIn(rows[1][2]))
         self.wait()
-        queue.push("B,2",self )
+        queue.push("B", 2, self)
 
         self.play(FadeOut(text), Uncreate(rect))
 
@@ -308,7 +315,7 @@ class GraphAnimation(Scene):
         self.wait(1)
         self.play(FadeIn(rows[3][2]))
         self.wait(1)
-        queue.push("D,5",self )
+        queue.push("D", 5, self)
 
         self.play(FadeOut(text), Uncreate(rect))
 
@@ -420,7 +427,7 @@ class GraphAnimation(Scene):
         self.wait()
         self.play(FadeIn(rows[4][2]))
         self.wait()
-        queue.push("E,3",self )
+        queue.push("E", 3, self)
 
         self.play(FadeOut(text), Uncreate(rect))
 
@@ -457,7 +464,7 @@ class GraphAnimation(Scene):
         self.wait()
         self.play(FadeIn(rows[2][2]))
         self.wait(1)
-        queue.push("C,9",self )
+        queue.push("C", 9, self)
 
         self.play(FadeOut(text), Uncreate(rect))
 
@@ -504,7 +511,7 @@ class GraphAnimation(Scene):
         self.wait(1)
         self.play(FadeIn(rows[6][2]))
         self.wait(1)
-        queue.push("G,6",self )
+        queue.push("G", 6, self)
 
         self.play(FadeOut(text), Uncreate(rect))
 
@@ -554,7 +561,7 @@ class GraphAnimation(Scene):
 
 
 
-        queue.update_element1(index=1,value="D,4", scene=self)
+        queue.update_element(1, "D", 4, scene=self)
 
 
         self.play(FadeOut(text), Uncreate(rect))
@@ -636,7 +643,7 @@ class GraphAnimation(Scene):
 
 
 
-        queue.update_element(index=2, scene=self)
+        queue.update_element(2, "C", 6, scene=self)
 
 
 
@@ -848,7 +855,7 @@ class GraphAnimation(Scene):
         self.play(Uncreate(line))
         self.wait()
 
-        queue.update_element1(index=1, value="G,5", scene=self)
+        queue.update_element(1, "G", 5, scene=self)
         self.wait(1)
         queue.pop(self)
 
@@ -1197,23 +1204,8 @@ class GraphAnimation(Scene):
     
 
     def align_text_parallel_to_line(self, text_str, line, offset=0.37):
-        # Create the TextMobject from the input string
-        text = Text(text_str).set_color(BLACK)
-    
-        # Get the angle of the line
-        angle = line.get_angle()
-
-        # Rotate the text to match the line's angle
-        text.rotate(angle)
+        return graph.align_text_parallel_to_line(text_str, line, offset)
 
-        # Calculate the perpendicular direction to offset the text from the line
-        normal_direction = rotate_vector(line.get_unit_vector(), PI / 2)
-
-        # Position the text at the center of the line with an offset
-        text.move_to(line.get_center() + normal_direction * offset)
-
-        return text.scale(0.6)
-    
     def reflect_mobject_across_line(self, mobject, line):
         # Get the center of the line as the point of reflection
         line_center = line.get_center()
@@ -1236,45 +1228,18 @@ class GraphAnimation(Scene):
 
 
     def create_circle(self,node):
-        a = Circle(
-                radius=0.5,
-                fill_color=TEAL,  # Use TEAL in ManimGL (no TEAL_B)
-                fill_opacity=0,
-                stroke_color="#FF0000",  # Edge color for the circle
-                stroke_width=7
-            ).move_to(node)
-        return a.set_z_index(2)
-    
+        return graph.highlight_circle(node)
+
     def create_line(self, a,b):
-        line1 = Line(start=a.get_center(), end=b.get_center(), color=PURE_RED, stroke_width=6.6).set_z_index(-0.5)
-        return line1
-    
+        return graph.path_line(a, b, color=PURE_RED)
+
     def create_nodes(self, node_positions):
         """Create nodes at specified positions with labels."""
-        nodes = {}
-        for label, position in node_positions.items():
-            # Create a circle for the node
-            node_circle = Circle(
-                radius=0.5,
-                fill_color=TEAL,  # Use TEAL in ManimGL (no TEAL_B)
-                fill_opacity=1,
-                stroke_color=DARK_BLUE,  # Edge color for the circle
-                stroke_width=5.6
-            )
-            node_circle.move_to(position)
-
-            # Create the label (text) for the node with black color
-            node_label = Text(label,).move_to(position).set_color(BLACK).set_z_index(1)
-
-            # Group the circle and the text together
-            node_group = VGroup(node_circle, node_label)
-            nodes[label] = node_group  # Store with direct label access (e.g., "A")
-
-        return nodes
+        template = Circle(radius=0.5, fill_color=TEAL, fill_opacity=1, stroke_color=DARK_BLUE, stroke_width=5.6)
+        return graph.build_nodes(node_positions, template, label_color=BLACK, label_z_index=1)
 
     def create_edges(self, node_positions):
         """Create undirected edges between nodes."""
-        edge_list = []
         edge_pairs = [
             ("F", "A"),
             ("F", "B"),
@@ -1288,19 +1253,11 @@ class GraphAnimation(Scene):
             ("E", "G"),
             ("C", "G")
         ]
-
-        for node1, node2 in edge_pairs:
-            start_pos = node_positions[node1]
-            end_pos = node_positions[node2]
-            edge_line = Line(start_pos, end_pos, color=DARK_BLUE, stroke_width=5)
-            edge_line.set_z_index(-5)  # Set z-index lower than nodes
-            edge_list.append(edge_line)
-
-        return {}, edge_list
+        edges = graph.build_edges(node_positions, edge_pairs, z_index=-5, color=DARK_BLUE, stroke_width=5)
+        return {}, edges
 
     def create_edge_weights(self, node_positions):
         """Create weights for each edge and place them at the center of the edge, adjusting for orientation."""
-        weights = {}
         edge_pairs = [
             ("F", "A", '3'),
             ("F", "B", '4'),
@@ -1314,43 +1271,21 @@ class GraphAnimation(Scene):
             ("E", "G", '3'),
             ("C", "G", '4')
         ]
-    
-        for node1, node2, weight in edge_pairs:
-            start_pos = np.array(node_positions[node1])
-            end_pos = np.array(node_positions[node2])
-            edge_center = (start_pos + end_pos) / 2
-    
-            # Calculate the direction of the edge
-            direction = end_pos - start_pos
-            direction_norm = np.linalg.norm(direction)
-    
-            # Normalize the direction vector to get the unit vector for the edge
-            direction_unit = direction / direction_norm
-    
-            # Adjust the weight's position based on the edge's orientation with a larger offset
-            if abs(direction_unit[0]) > abs(direction_unit[1]):  # More horizontal
-                weight_offset = UP * 0.3  # Slightly more shift up for horizontal edges
-            else:  # More vertical
-                weight_offset = RIGHT * 0.3  # Slightly more shift right for vertical edges
-    
-            # For sloped edges, slightly shift the weight in the direction perpendicular to the edge
-            perpendicular_unit = np.array([-direction_unit[1], direction_unit[0], 0]) * 0.3
-    
-            # Create the weight label and apply the calculated offset
-            weight_label = Text(weight).move_to(edge_center + perpendicular_unit).scale(0.7).set_color(BLACK)
-    
-            # Store the weight
-            weights[f"weight_{node1}_{node2}"] = weight_label
-    
-        return weights
-
+        return graph.build_edge_weights(node_positions, edge_pairs, offset=0.3, scale=0.7)
 
-    
 
+class PriorityQueue(VGroup):
+    """
+    Min-priority queue drawn as a pipe of labelled boxes.
 
+    Keys live in a ``heapq`` next to the mobjects, so push / pop /
+    decrease-key never read text back.  Boxes stay in insertion order inside
+    the pipe and every realignment is a single ``play``.
+    """
 
+    element_width = 1.2
+    buffer = 0.2  # Spacing between elements
 
-class PriorityQueue(VGroup):
     def __init__(self):
         super().__init__()
 
@@ -1369,145 +1304,178 @@ class PriorityQueue(VGroup):
         self.elements = VGroup()
         self.add(self.pipe, self.elements)
 
-    def push(self, element_str, scene):
-        """Push an element into the priority queue with animation."""
-        label, value = element_str.split(',')
-        value = int(value)
-
-        # Create an element to add to the pipe, matching rectangle height and scaling width
-        element = Text(f"{label},{value}").scale(0.7).set_color(BLACK)
-        element.rect = Rectangle(
-            width=1.2,  # Keep width small for alignment
+        self._heap = []      # [key, tie, node, valid]
+        self._entries = {}   # node -> live heap entry
+        self._order = 0
+        self._slots = np.zeros(0)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, node):
+        return node in self._entries
+
+    def slot_offsets(self, n):
+        """x offsets of the first ``n`` slots from the pipe's left edge."""
+        if len(self._slots) < n:
+            size = max(n, 2 * len(self._slots), 8)
+            step = self.element_width + self.buffer
+            self._slots = np.arange(size) * step + 0.6 * self.element_width
+        return self._slots[:n]
+
+    def _make_element(self, node, key):
+        text = Text(f"{node},{key:g}").scale(0.7).set_color(BLACK)
+        rect = Rectangle(
+            width=self.element_width,
             height=self.pipe.get_height()*0.85,  # Match height to pipe
             fill_color=ORANGE,
             fill_opacity=1,
             stroke_color=GREY,
             stroke_width=1
         )
-        
-        # Group the text and rectangle together
-        element_group = VGroup(element.rect, element)
-        
-        # Position the element on the far right initially
-        element_group.next_to(self.pipe, RIGHT, buff=0.2)
-        
-        # Fade in on the right side of the pipe
-        scene.play(FadeIn(element_group))
-        
-        # Add the new element to the queue structure
+        group = VGroup(rect, text)
+        group.node, group.key = node, key
+        return group
+
+    def _push_entry(self, node, key, tie):
+        entry = [key, tie, node, True]
+        self._entries[node] = entry
+        heapq.heappush(self._heap, entry)
+
+    def push(self, node, key, scene):
+        """Push ``node`` with priority ``key`` and fade it into the next free slot."""
+        # Ties go to the most recently added element
+        self._order += 1
+        self._push_entry(node, key, -self._order)
+
+        element_group = self._make_element(node, key)
+        offset = self.slot_offsets(len(self.elements) + 1)[-1]
+        element_group.move_to(self.pipe.get_left() + RIGHT * offset)
         self.elements.add(element_group)
-
-        # Shift all elements to the left to ensure alignment
-        self.realign_elements(scene)
-
-    def pop(self, scene):
-        """Pop the element with the smallest value and shift remaining elements."""
-        # Find the element with the smallest value, prioritizing the last added element in case of ties
-        min_element = min(
-            enumerate(self.elements),
-            key=lambda e: (int(e[1][1].get_text().split(',')[1]), -e[0])  # Prioritize by value, then by last added
-        )[1]  # Extract the element itself
-    
-        # Move the minimum element upwards and fade it out
-        scene.play(min_element.animate.move_to(self.pipe.get_left() + LEFT))
-        
-    
-        # Remove the minimum element from the queue
-        self.elements.remove(min_element)
-    
-        # Shift remaining elements to the left to close the gap
-        self.realign_elements(scene)
-
-        scene.play(FadeOut(min_element))
-
-
-    def realign_elements(self, scene, simultaneous=False):
-        """Shift all elements to align to the left within the pipe, with a small buffer between them.
-        If `simultaneous` is True, all shifts occur at once (useful for pop operation)."""
-        buffer = 0.2  # Adjust this value to control the spacing between elements
-        animations = []
-        
-        for i, element in enumerate(self.elements):
-            target_position = self.pipe.get_left() + RIGHT * (i * element.get_width() + i * buffer + 0.6 * element.get_width())
-            anim = element.animate.move_to(target_position)
-            
-            if simultaneous:
-                animations.append(anim)
+        scene.play(FadeIn(element_group, shift=LEFT))
+        return element_group
+
+    def pop(self, scene, node=None):
+        """
+        Pop the smallest key, or ``node`` when given (a trace settles nodes in
+        its own tie order); the rest of the queue closes the gap in the same
+        ``play``.
+        """
+        if node is not None:
+            entry = self._entries[node]
+            entry[3] = False
+            key = entry[0]
+        else:
+            while self._heap:
+                key, _, node, valid = heapq.heappop(self._heap)
+                if valid:
+                    break
             else:
-                scene.play(anim)
-        
-        # Play all animations simultaneously if specified
-        if simultaneous:
-            scene.play(*animations)
-
-
-    def update_element(self, index, scene):
-        """Update the value to '^' and set the fill color to YELLOW for an element at a specified index."""
-        if index < 0 or index >= len(self.elements):
-            raise IndexError("Element index out of range.")
-
-        element_group = self.elements[index]
-        old_text = element_group[1].set_z_index(2)
-        old_rect = element_group[0]
-
-        # Create the new text with the "^" value
-        new_text = Text(f"C,6").scale(0.7).set_color(BLACK).move_to(self.elements[index]).set_z_index(2)
-
-        a = SurroundingRectangle(element_group, color=PURE_BLUE)
-
-        # Animate color change and text update
-        scene.play(
-            ShowCreation(a)
-
-        )
-        scene.wait(2)
-
-        scene.play(
-            Transform(old_text, new_text)  # Update the text to "^"
-        )
-
-        scene.wait(2)
+                raise IndexError("pop from an empty priority queue")
+        del self._entries[node]
 
+        min_element = next(e for e in self.elements if e.node == node)
+        self.elements.remove(min_element)
         scene.play(
-            Uncreate(a)
+            FadeOut(min_element, shift=self.pipe.get_left() + LEFT - min_element.get_center()),
+            *self._realign_animations(),
         )
+        return node, key
+
+    def _relabel(self, node, key):
+        """Lower ``node``'s key in the heap; returns its box and the relabel animation."""
+        entry = self._entries[node]
+        if key > entry[0]:
+            raise ValueError(f"new key {key} is larger than {entry[0]}")
+        entry[3] = False
+        self._push_entry(node, key, entry[1])
+
+        element_group = next(e for e in self.elements if e.node == node)
+        element_group.key = key
+        old_text = element_group[1].set_z_index(2)
+        new_text = Text(f"{node},{key:g}").scale(0.7).set_color(BLACK).move_to(old_text).set_z_index(2)
+        return element_group, Transform(old_text, new_text)
+
+    def decrease_key(self, node, key, scene, run_time=0.8):
+        """Lower the key of a queued ``node`` and relabel its box, flashing it, in one ``play``."""
+        element_group, relabel = self._relabel(node, key)
+        flash = ShowPassingFlash(SurroundingRectangle(element_group, color=PURE_BLUE), time_width=0.6)
+        scene.play(relabel, flash, run_time=run_time)
+
+    def _realign_animations(self):
+        left = self.pipe.get_left()
+        targets = left + np.outer(self.slot_offsets(len(self.elements)), RIGHT)
+        return [
+            element.animate.move_to(target)
+            for element, target in zip(self.elements, targets)
+            if not np.allclose(element.get_center(), target)
+        ]
 
+    def realign_elements(self, scene):
+        """Shift all elements to their slots inside the pipe in one ``play``."""
+        animations = self._realign_animations()
+        if animations:
+            scene.play(*animations)
 
-
-    def update_element1(self, index, value , scene):
-        """Update the value to '^' and set the fill color to YELLOW for an element at a specified index."""
+    def update_element(self, index, node, key, scene):
+        """
+        Narrated decrease-key of the box at ``index``, which must hold
+        ``node``: outline it, relabel it after a pause, then remove the
+        outline.
+        """
         if index < 0 or index >= len(self.elements):
             raise IndexError("Element index out of range.")
-
         element_group = self.elements[index]
-        old_text = element_group[1].set_z_index(2)
-        old_rect = element_group[0]
-
-        # Create the new text with the "^" value
-        new_text = Text(value).scale(0.7).set_color(BLACK).move_to(self.elements[index]).set_z_index(2)
+        if element_group.node != node:
+            raise ValueError(f"element {index} holds {element_group.node}, not {node}")
 
+        _, relabel = self._relabel(node, key)
         a = SurroundingRectangle(element_group, color=PURE_BLUE)
-
-        # Animate color change and text update
-        scene.play(
-            ShowCreation(a)
-
-        )
+        scene.play(ShowCreation(a))
         scene.wait(2)
-
-        scene.play(
-            Transform(old_text, new_text)  # Update the text to "^"
-        )
-
+        scene.play(relabel)
         scene.wait(2)
+        scene.play(Uncreate(a))
+
+DIJKSTRA_POSITIONS = {
+    "F": [0, 3.5, 0],
+    "A": [-2.5, 1.5, 0],
+    "B": [2.8, 1.5, 0],
+    "D": [-2.5, -1.5, 0],
+    "E": [0.6, -0.5, 0],
+    "C": [3.5, -2.8, 0],
+    "G": [0, -3.5, 0],
+}
+
+DIJKSTRA_EDGES = [
+    ("F", "A", 3), ("F", "B", 4), ("A", "B", 2), ("A", "D", 5),
+    ("B", "E", 1), ("D", "E", 1), ("B", "C", 7), ("E", "C", 3),
+    ("D", "G", 1), ("E", "G", 3), ("C", "G", 4),
+]
 
-        scene.play(
-            Uncreate(a)
-        )
 
+class DijkstraTrace(Scene):
+    """Same graph as GraphAnimation, but every step comes from a real Dijkstra run."""
 
+    def construct(self):
+        self.camera.frame.scale(1.2).shift(RIGHT*2)
+        self.camera.background_color = "#111111"
 
+        template = Circle(radius=0.5, fill_color=TEAL, fill_opacity=1, stroke_color=DARK_BLUE, stroke_width=5.6)
+        parts = graph.build_graph(DIJKSTRA_POSITIONS, DIJKSTRA_EDGES, template,
+                                  edge_style=dict(color=DARK_BLUE, stroke_width=5))
 
+        events, dist, prev = graph_trace.dijkstra_trace(DIJKSTRA_EDGES, "A")
+        table, labels = graph_trace.distance_table(list(DIJKSTRA_POSITIONS), source="A")
+        table.move_to(RIGHT*7)
+        queue = PriorityQueue().next_to(parts.nodes["G"], DOWN).shift(RIGHT*3.6).shift(DOWN*0.4)
 
+        self.play(*[GrowFromCenter(node) for node in parts.nodes.values()])
+        self.play(*[GrowFromCenter(edge) for edge in parts.edge_list])
+        self.play(*[Write(w) for w in parts.weights.values()], FadeIn(table), ShowCreation(queue))
 
+        graph_trace.TraceDriver(self, parts, dist_labels=labels, queue=queue).play(events)
 
+        path = [parts.edge(prev[n], n) for n in prev if prev[n] is not None]
+        self.play(*[e.animate.set_color(YELLOW).set_stroke(width=8) for e in path])
+        self.wait(2)